@@ -0,0 +1,82 @@
+# Import-time budget for the game module
+# Usage: python benchmarks/import_budget.py [--runs 5] [--self-budget-ms 4] [--total-budget-ms 60]
+#
+# Runs `python -X importtime -c "import fishgame"` in fresh interpreters and
+# fails (exit code 1) if importing the game gets slower than the budget, or if
+# any content module is imported at startup instead of on first use.
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The only parts of fishgame_content allowed to load with the game itself
+ALLOWED_AT_STARTUP = {"fishgame_content", "fishgame_content.bundle", "fishgame_content.fish",
+                      "fishgame_content.items", "fishgame_content.maps"}
+
+
+def compile_game():
+    """Write .pyc files up front - a warm install has them even when the
+    interpreter runs with PYTHONDONTWRITEBYTECODE"""
+    compileall.compile_file(os.path.join(REPO_ROOT, "fishgame.py"), quiet=1)
+    compileall.compile_dir(os.path.join(REPO_ROOT, "fishgame_content"), quiet=1)
+
+
+def import_times(module="fishgame"):
+    """One fresh interpreter: returns {module name: (self us, cumulative us)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the fishgame import-time budget")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time (median is used)")
+    parser.add_argument("--self-budget-ms", type=float, default=4.0, help="max time spent in fishgame itself")
+    parser.add_argument("--total-budget-ms", type=float, default=60.0, help="max time including everything it imports")
+    args = parser.parse_args()
+
+    compile_game()
+    import_times()  # warm-up run
+    runs = [import_times() for _ in range(args.runs)]
+    self_ms = statistics.median(run["fishgame"][0] for run in runs) / 1000
+    total_ms = statistics.median(run["fishgame"][1] for run in runs) / 1000
+    eager = sorted(name for name in runs[0] if name.startswith("fishgame_content") and name not in ALLOWED_AT_STARTUP)
+
+    slowest = sorted(runs[0].items(), key=lambda item: item[1][0], reverse=True)[:8]
+    print(f"fishgame import ({args.runs} runs, median)")
+    print(f"  self:       {self_ms:7.2f} ms  (budget {args.self_budget_ms:.2f} ms)")
+    print(f"  cumulative: {total_ms:7.2f} ms  (budget {args.total_budget_ms:.2f} ms)")
+    print("  slowest modules (self time, first run):")
+    for name, (self_us, _) in slowest:
+        print(f"    {self_us / 1000:7.2f} ms  {name}")
+
+    failures = []
+    if self_ms > args.self_budget_ms:
+        failures.append(f"fishgame itself took {self_ms:.2f} ms (budget {args.self_budget_ms:.2f} ms)")
+    if total_ms > args.total_budget_ms:
+        failures.append(f"import took {total_ms:.2f} ms in total (budget {args.total_budget_ms:.2f} ms)")
+    if eager:
+        failures.append("content imported at startup: " + ", ".join(eager))
+
+    if failures:
+        for failure in failures:
+            print("FAIL: " + failure)
+        return 1
+    print("OK: within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# Load test for the world-boss raid: hundreds of telnet players hitting one boss
+# Usage: python benchmarks/raid_load.py [--raiders 300] [--duration 30] [--boss kraken]
+#                                       [--cpus 1] [--status-budget-ms 300]
+#
+# Starts the server with --raid (pinned to --cpus cores where the OS allows it)
+# and connects --raiders bots. Each one creates a character, joins the raid and
+# keeps fighting for --duration seconds: [F]ight, SPACE somewhere along the
+# attack bar, then "1" + Enter whenever the boss's attack waits for an answer.
+# Afterwards every bot keeps reading for a moment so the last tallies arrive.
+#
+# Checks that every hit a bot was told about came off the shared HP pool
+# (max HP - HP shown == sum of "You dealt N damage!"), and that status updates
+# kept arriving at the raid's tick rate. Fails (exit code 1) if a bot didn't
+# make it, damage went missing or the p99 gap between status updates is over
+# budget.
+import argparse
+import asyncio
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from telnet_load import percentile, server_usage, start_server  # noqa: E402
+
+NEW_CHARACTER = [
+    (b"Choose an option", "1"),  # raid lobby: join with a new character
+    (b"name:", None),  # answered with the bot's name
+    (b"Strength (", "5"),
+    (b"Luck (", "5"),
+    (b"Patience (", "5"),
+    (b"Difficulty:", "2"),
+]
+FIGHT_MARKER = b"[F]ight"
+ATTACK_BAR_MARKER = b"Press SPACE at the right moment"
+STATUS = re.compile(rb"\x1b7(.*?)\x1b8", re.S)
+STATUS_HP = re.compile(rb"HP: \S* (\d+)/(\d+)")
+DEALT = re.compile(rb"You dealt (\d+) damage!")
+QUIET = 0.4  # seconds without game output before a bot assumes it is being asked something
+SETTLE = 2.0  # seconds bots keep reading after they stop playing
+
+
+class Raider:
+    def __init__(self, number, port):
+        self.number = number
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.buffer = b""
+        self.playing = False
+        self.hits = 0
+        self.dealt = 0
+        self.status_times = []
+        self.hp = None
+        self.error = None
+
+    async def expect(self, marker, timeout):
+        deadline = time.monotonic() + timeout
+        while marker not in self.buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"waited {timeout}s for {marker!r}")
+            data = await asyncio.wait_for(self.reader.read(65536), remaining)
+            if not data:
+                raise ConnectionError(f"server closed the connection before {marker!r}")
+            self.buffer += data
+        self.buffer = self.buffer[self.buffer.index(marker) + len(marker):]
+
+    async def join(self, timeout):
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+        for marker, answer in NEW_CHARACTER:
+            await self.expect(marker, timeout)
+            self.writer.write((answer or f"Raider{self.number}").encode() + b"\r\n")
+        await self.writer.drain()
+        await self.expect(FIGHT_MARKER, timeout)
+        self.writer.write(b"f")
+
+    def send(self, data):
+        if self.playing and not self.writer.is_closing():
+            self.writer.write(data)
+
+    def take_game_text(self):
+        """Split complete status updates off the buffer; returns the game's own text"""
+        cut = self.buffer.rfind(b"\x1b7")
+        if cut != -1 and self.buffer.find(b"\x1b8", cut) == -1:
+            ready, self.buffer = self.buffer[:cut], self.buffer[cut:]
+        else:
+            ready, self.buffer = self.buffer, b""
+        now = time.perf_counter()
+        for status in STATUS.findall(ready):
+            self.status_times.append(now)
+            hp = STATUS_HP.search(status)
+            if hp:
+                self.hp = (int(hp.group(1)), int(hp.group(2)))
+        return STATUS.sub(b"", ready)
+
+    async def fight(self, stop_at):
+        loop = asyncio.get_running_loop()
+        self.playing = True
+        text = b""
+        last_text = time.monotonic()
+        while True:
+            now = time.monotonic()
+            if self.playing and now >= stop_at:
+                self.playing = False
+            if not self.playing and now >= stop_at + SETTLE:
+                return
+            try:
+                data = await asyncio.wait_for(self.reader.read(65536), 0.1)
+            except asyncio.TimeoutError:
+                data = None
+            if data == b"":
+                raise ConnectionError("server closed the connection")
+            if data:
+                self.buffer += data
+                new = self.take_game_text()
+                if new.strip():
+                    last_text = time.monotonic()
+                    text = (text + new)[-8192:]
+                    for dealt in DEALT.findall(new):
+                        self.hits += 1
+                        self.dealt += int(dealt)
+                    if FIGHT_MARKER in new:
+                        self.send(b"f")
+                    elif ATTACK_BAR_MARKER in new:
+                        loop.call_later(random.uniform(0.05, 1.0), self.send, b" ")
+                    continue
+            if time.monotonic() - last_text > QUIET:
+                # The boss's attack is waiting for a key or an answer
+                self.send(b"1\r\n")
+                last_text = time.monotonic()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def run_load(args, port, pid):
+    raiders = [Raider(number, port) for number in range(1, args.raiders + 1)]
+
+    async def join(raider):
+        try:
+            await raider.join(args.timeout)
+        except (OSError, TimeoutError, ConnectionError, asyncio.TimeoutError) as e:
+            raider.error = f"join: {e}"
+
+    start = time.perf_counter()
+    tasks = []
+    for first in range(0, len(raiders), args.ramp):
+        tasks += [asyncio.ensure_future(join(raider)) for raider in raiders[first:first + args.ramp]]
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tasks)
+    joined = [raider for raider in raiders if raider.error is None]
+    print(f"{len(joined)}/{len(raiders)} raiders in the raid after {time.perf_counter() - start:.1f}s")
+
+    cpu_before, _ = server_usage(pid)
+    steady_start = time.perf_counter()
+    stop_at = time.monotonic() + args.duration
+
+    async def fight(raider):
+        try:
+            await raider.fight(stop_at)
+        except (OSError, ConnectionError) as e:
+            raider.error = f"fight: {e}"
+
+    await asyncio.gather(*(fight(raider) for raider in joined))
+    elapsed = time.perf_counter() - steady_start
+    cpu_after, rss = server_usage(pid)
+    for raider in raiders:
+        raider.close()
+    return raiders, elapsed, (cpu_after - cpu_before) if cpu_before is not None else None, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Many raiders against one world boss")
+    parser.add_argument("--raiders", type=int, default=300)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of fighting")
+    parser.add_argument("--boss", default="kraken")
+    parser.add_argument("--hp-mult", type=float, default=1000.0, help="large enough that the boss survives the test")
+    parser.add_argument("--cpus", type=int, default=1, help="cores the server may use (0 = no pinning)")
+    parser.add_argument("--ramp", type=int, default=100, help="new connections per 50 ms")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--status-budget-ms", type=float, default=300.0,
+                        help="longest allowed p99 gap between two status updates")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="fishgame-raid-") as folder:
+        process, port = start_server(args.cpus, args.raiders + 10, folder,
+                                     ["--raid", args.boss, "--raid-hp-mult", str(args.hp_mult)])
+        try:
+            raiders, elapsed, cpu, rss = asyncio.run(run_load(args, port, process.pid))
+        finally:
+            process.terminate()
+            process.wait(5)
+
+    failed = [raider for raider in raiders if raider.error]
+    fighting = [raider for raider in raiders if not raider.error]
+    hits = sum(raider.hits for raider in fighting)
+    dealt = sum(raider.dealt for raider in raiders)
+    print(f"{len(fighting)}/{len(raiders)} raiders fought for {args.duration:.0f}s: "
+          f"{hits} hits ({hits / args.duration:.0f}/s), {dealt} damage")
+    for raider in failed[:5]:
+        print(f"  raider {raider.number}: {raider.error}")
+
+    gaps = [later - earlier for raider in fighting
+            for earlier, later in zip(raider.status_times, raider.status_times[1:])]
+    if gaps:
+        print(f"status updates per raider: {len(gaps) / len(fighting) / (elapsed):.1f}/s, "
+              f"gap p50 {statistics.median(gaps) * 1e3:.0f} ms, p99 {percentile(gaps, 0.99) * 1e3:.0f} ms, "
+              f"max {max(gaps) * 1e3:.0f} ms")
+
+    shown = [raider.hp for raider in fighting if raider.hp]
+    lost = None
+    if shown:
+        hp, max_hp = min(shown)
+        lost = max_hp - hp
+        print(f"boss HP {hp}/{max_hp}: {lost} taken off the pool, {dealt} reported to raiders")
+    if cpu is not None:
+        print(f"server: {cpu / elapsed * 100:.1f}% of one core, "
+              f"{rss:.0f} MB resident ({rss * 1024 / len(raiders):.0f} KB per raider)")
+
+    p99 = percentile(gaps, 0.99) * 1e3 if gaps else None
+    if failed or lost != dealt or p99 is None or p99 > args.status_budget_ms:
+        print("FAIL")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
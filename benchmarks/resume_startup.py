@@ -0,0 +1,90 @@
+# Time from launch to the first playable frame with --resume
+# Usage: python benchmarks/resume_startup.py [--runs 10] [--budget-ms 100]
+#
+# Creates a throwaway save in a temp folder, then launches
+# `python -m fishgame --resume` there and stops the clock when the hub island
+# controls line is drawn (the frame right before the game waits for a key).
+# -m matters: it runs the cached bytecode, while `python fishgame.py`
+# recompiles the whole script on every launch (~50 ms on its own).
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIRST_FRAME_MARKER = b"[WASD] Move"
+
+
+def compile_game():
+    """Write .pyc files up front - a warm install has them even when the
+    interpreter runs with PYTHONDONTWRITEBYTECODE"""
+    compileall.compile_file(os.path.join(REPO_ROOT, "fishgame.py"), quiet=1)
+    compileall.compile_dir(os.path.join(REPO_ROOT, "fishgame_content"), quiet=1)
+
+
+def make_save(folder):
+    """Write a fresh level-1 save into folder (in a separate process so nothing is cached here)"""
+    script = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "import fishgame\n"
+        "game = fishgame.Game({'name': 'Benchmark', 'stats': {'strength': 5, 'luck': 5, 'patience': 5},"
+        " 'difficulty_name': 'Normal', 'difficulty_mult': 1.0})\n"
+        "game.save_game()\n" % REPO_ROOT
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=folder, capture_output=True, check=True)
+
+
+def time_first_frame(folder, timeout=10.0):
+    """Seconds from spawning the game until its first interactive frame"""
+    python_path = os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))
+    env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONPATH=python_path, TERM=os.environ.get("TERM", "dumb"))
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "fishgame", "--resume"],
+        cwd=folder, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    output = b""
+    try:
+        while FIRST_FRAME_MARKER not in output:
+            if time.perf_counter() - start > timeout:
+                raise RuntimeError("game never reached its first frame:\n" + output.decode('utf-8', 'replace')[-500:])
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                raise RuntimeError("game exited before its first frame:\n" + output.decode('utf-8', 'replace')[-500:])
+            output += chunk
+        return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the --resume launch path")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="max median time to first frame (warm cache)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        make_save(folder)
+        compile_game()
+        time_first_frame(folder)  # warm-up: page cache
+        times = [time_first_frame(folder) * 1000 for _ in range(args.runs)]
+
+    median = statistics.median(times)
+    print(f"--resume to first frame ({args.runs} runs)")
+    print(f"  median: {median:7.1f} ms  (budget {args.budget_ms:.1f} ms)")
+    print(f"  min:    {min(times):7.1f} ms")
+    print(f"  max:    {max(times):7.1f} ms")
+    if median > args.budget_ms:
+        print("FAIL: over budget")
+        return 1
+    print("OK: within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,476 @@
+# Benchmark suite for the game's hot workloads, compared against a stored baseline
+# Usage: python benchmarks/suite.py [--only save] [--json results.json]
+#                                   [--baseline benchmarks/baseline.json] [--threshold 0.25]
+#                                   [--update-baseline [PREFIX ...]]
+#
+# Runs everything in one process with the pacing stubbed out. time.sleep()
+# returns at once and get_key() answers a space at once; both only move a
+# virtual clock forward, which is what time.time() reports, so "hold SPACE for
+# 3 seconds" loops end after 3 virtual seconds. input() answers "1", clears are
+# skipped and output goes to a null stream. So the numbers are the game's own
+# cost, not the animation delays.
+#
+# Workloads:
+#   catch.choose_fish.<location>   choose_fish() draws per second
+#   save.<size> / load.<size>      save_game() / load_game() with 100, 10k and 100k fish
+#   sqlite.save.<size>.full        the first save_game() of that game into the SQLite save store
+#   sqlite.save.<size>.catch       save_game() after one more catch (an incremental save)
+#   sqlite.load.<size>.lazy        resume_game() - inventory, aquarium and encyclopedia left on disk
+#   sqlite.load.<size>.full        resume_game() and then reading the whole inventory
+#   render.map.<location>          one hub or remote map frame (Game.draw_map)
+#   render.overworld               one WorldMap.render_overworld() frame
+#   map.tile_queries               one move plus the hub's [E] checks, per hub island tile
+#   map.load.bundle                opening the compiled maps.bundle (every map, memory-mapped)
+#   map.load.compile               compiling every map source, as when maps.bundle is out of date
+#   boss.<boss>.<attack>           cost per frame of every BossAttack pattern (each spec is
+#                                  first run through the headless evaluate_attack_pattern)
+#   leaderboard.write              catches per second through the batched SQLite writer
+#   leaderboard.top.<board>        one top-10 query on a board holding 100k catches
+#                                  (an error if SQLite's plan for it isn't an index walk)
+#
+# Exit code 1 when any result is more than --threshold worse than the baseline
+# and more than its unit's noise floor away from it. Baselines are machine
+# specific: refresh with --update-baseline after a change that is meant to move
+# a number, and commit the new file together with it. Only the entries that
+# moved past the threshold (or start with a PREFIX given to --update-baseline)
+# are rewritten, so the diff shows what the change did.
+import argparse
+import builtins
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+INVENTORY_SIZES = [100, 10_000, 100_000]
+SAMPLE_TIME = 0.01  # seconds of back-to-back calls timed as one sample
+MAX_SAMPLES = 200
+# Changes smaller than this many units are timer noise, whatever the percentage
+# (a baseline entry can set its own 'noise_floor')
+NOISE_FLOOR = {'ns/tile': 20, 'us': 1.0, 'us/frame': 0.5, 'us/query': 1.0, 'ms': 0.1}
+KEY_INTERVAL = 0.05  # virtual seconds between two stubbed key presses
+CLOCK_TICK = 0.001  # every time.time() call moves the virtual clock too, so polling loops end
+CHARACTER = {'name': 'Benchmark', 'stats': {'strength': 5, 'luck': 5, 'patience': 5},
+             'difficulty_name': 'Normal', 'difficulty_mult': 1.0}
+
+
+class NullStream(io.TextIOBase):
+    """stdout replacement that throws everything away"""
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class Stubs:
+    """Swap out everything that waits on a clock, a player or a terminal.
+    `frames` counts pacing steps: every sleep and every key read."""
+    def __init__(self, game_module):
+        self.game_module = game_module
+        self.frames = 0
+        self.now = time.time()
+        self.saved = []
+
+    def sleep(self, seconds):
+        self.frames += 1
+        self.now += seconds
+
+    def clock(self):
+        self.now += CLOCK_TICK
+        return self.now
+
+    def get_key(self):
+        self.frames += 1
+        self.now += KEY_INTERVAL
+        return " "
+
+    def patch(self, owner, attr, value):
+        self.saved.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, value)
+
+    def __enter__(self):
+        self.patch(time, 'sleep', self.sleep)
+        self.patch(time, 'time', self.clock)
+        self.patch(builtins, 'input', lambda prompt="": "1")
+        self.patch(os, 'system', lambda command: 0)
+        self.patch(self.game_module, 'get_key', self.get_key)
+        self.patch(sys, 'stdout', NullStream())
+        return self
+
+    def patch_module(self, module):
+        """Content modules import get_key by name, so they need their own copy"""
+        if hasattr(module, 'get_key'):
+            self.patch(module, 'get_key', self.get_key)
+
+    def __exit__(self, *exc):
+        for owner, attr, value in reversed(self.saved):
+            setattr(owner, attr, value)
+        self.saved = []
+
+
+def measure(func, min_time=0.2, min_runs=5, sample_time=SAMPLE_TIME):
+    """Best seconds per call over repeated samples (until min_time has passed
+    and at least min_runs). A sample times enough back-to-back calls to last
+    sample_time, so timer resolution and one-off stalls average out inside it.
+    The minimum is the sample least disturbed by the rest of the machine, so
+    it is the most repeatable number to compare against."""
+    func()  # warm-up: the first call also pays for lazy imports and cold caches
+    start = time.perf_counter()
+    func()  # tells how many calls fill a sample
+    calls = max(1, int(sample_time / max(time.perf_counter() - start, 1e-9)))
+    best = float('inf')
+    runs = 0
+    started = time.perf_counter()
+    while runs < min_runs or (runs < MAX_SAMPLES and time.perf_counter() - started < min_time):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+        runs += 1
+    return best
+
+
+def result(value, unit, higher_is_better=False, **extra):
+    entry = {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+    entry.update(extra)
+    return entry
+
+
+def new_game(fishgame):
+    game = fishgame.Game(CHARACTER)
+    game.autosave_enabled = False
+    return game
+
+
+def bench_choose_fish(fishgame, draws=20_000):
+    results = {}
+    game = new_game(fishgame)
+    seen = set()
+    for location in fishgame.LOCATIONS:
+        if location.fish_pool_name in seen:
+            continue
+        seen.add(location.fish_pool_name)
+        game.current_location = location
+        random.seed(1)
+
+        def draw_many():
+            for _ in range(draws):
+                game.choose_fish()
+        seconds = measure(draw_many, min_time=0.5)
+        results["catch.choose_fish." + fishgame.item_slug(location.name)] = result(
+            round(draws / seconds), "draws/s", higher_is_better=True)
+    return results
+
+
+def bench_save_load(fishgame, sizes=INVENTORY_SIZES):
+    results = {}
+    folder = tempfile.mkdtemp(prefix="fishgame-bench-")
+    previous = os.getcwd()
+    try:
+        os.chdir(folder)
+        game = new_game(fishgame)
+        templates = [fish for location in fishgame.LOCATIONS for fish in location.fish_pool]
+        random.seed(1)
+        for size in sizes:
+            game.inventory = [fishgame.Fish.from_dict(templates[i % len(templates)].to_dict()) for i in range(size)]
+            runs = 3 if size >= 100_000 else 5
+            save_seconds = measure(game.save_game, min_time=0.3, min_runs=runs)
+            loaded = new_game(fishgame)
+            load_seconds = measure(loaded.load_game, min_time=0.3, min_runs=runs)
+            if len(loaded.inventory) != size:
+                raise RuntimeError(f"load_game() restored {len(loaded.inventory)} fish, expected {size}")
+            label = f"{size // 1000}k" if size >= 1000 else str(size)
+            size_bytes = os.path.getsize(fishgame.save_file_name(game.name))
+            results[f"save.{label}"] = result(round(save_seconds * 1e3, 3), "ms", bytes=size_bytes)
+            results[f"load.{label}"] = result(round(load_seconds * 1e3, 3), "ms", bytes=size_bytes)
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+
+def bench_render(fishgame):
+    results = {}
+    game = new_game(fishgame)
+    seen = set()
+    for location in fishgame.LOCATIONS:
+        if id(location.map) in seen:
+            continue
+        seen.add(id(location.map))
+        seconds = measure(lambda: game.draw_map(game.map_view(location.map)))
+        results["render.map." + fishgame.item_slug(location.name)] = result(round(seconds * 1e6, 1), "us/frame")
+
+    # A move and the [E] checks the hub loop makes, on every tile of the hub island
+    hub = fishgame.LOCATIONS[0].map
+    cells = [(x, y) for y in range(hub.height) for x in range(hub.width)]
+
+    def query_tiles():
+        for x, y in cells:
+            hub.step(x, y, 1, 0)
+            hub.is_npc_fisherman(x, y) or hub.is_fishing_spot(x, y) or hub.is_building(x, y)
+    seconds = measure(query_tiles)
+    results["map.tile_queries"] = result(round(seconds / len(cells) * 1e9), "ns/tile")
+
+    # Every map: opening the compiled maps.bundle, and compiling the sources when it is out of date
+    from fishgame_content import maps
+    sources = maps.read_sources()
+    folder = tempfile.mkdtemp(prefix="fishgame-bench-")
+    try:
+        path = os.path.join(folder, "maps.bundle")
+        maps.write_maps(maps.compile_maps(sources), path)
+        opened = []
+        seconds = measure(lambda: opened.append(maps.MapBundle.open(path)))
+        results["map.load.bundle"] = result(round(seconds * 1e6, 1), "us")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    seconds = measure(lambda: maps.compile_maps(sources))
+    results["map.load.compile"] = result(round(seconds * 1e6, 1), "us")
+
+    world_map = fishgame.WorldMap(game)
+    seconds = measure(lambda: world_map.render_overworld(lambda: None))
+    results["render.overworld"] = result(round(seconds * 1e6, 1), "us/frame")
+    return results
+
+
+def check_attack_pattern(fishgame, pattern, seeds=5):
+    """Run a pattern through the headless engine over a few seeds, with every
+    prompt left empty and with every prompt answered "1". Raises whatever
+    the spec gets wrong."""
+    for seed in range(seeds):
+        for reply in ("", "1"):
+            fishgame.evaluate_attack_pattern(pattern, lambda step, ctx: reply, random.Random(seed))
+
+
+def bench_boss_patterns(fishgame, stubs):
+    """Every attack of every boss. A frame is one pacing step (a sleep or a key read)"""
+    from fishgame_content import bosses
+    stubs.patch_module(bosses)
+    results = {}
+    for boss in bosses.BOSS_ROSTER:
+        for attack in boss.attacks:
+            name = f"boss.{fishgame.item_slug(boss.name)}.{fishgame.item_slug(attack.name)}"
+            try:
+                check_attack_pattern(fishgame, attack.pattern)
+                random.seed(1)
+                stubs.frames = 0
+                attack.execute()
+            except (ValueError, IndexError, KeyError) as e:
+                results[name] = {'error': f"{type(e).__name__}: {e}"}
+                continue
+            frames = max(1, stubs.frames)
+
+            def run_attack():
+                random.seed(1)
+                attack.execute()
+            seconds = measure(run_attack, min_time=0.1)
+            results[name] = result(round(seconds / frames * 1e6, 2), "us/frame", frames=frames)
+    return results
+
+
+def bench_sqlite_saves(fishgame, stubs, sizes=INVENTORY_SIZES):
+    from fishgame_content.saves import SqliteSaveStore
+    results = {}
+    folder = tempfile.mkdtemp(prefix="fishgame-bench-")
+    store = SqliteSaveStore(os.path.join(folder, "saves.db"))
+    stubs.patch(fishgame, 'SAVES', store)
+    try:
+        templates = [fish for location in fishgame.LOCATIONS for fish in location.fish_pool]
+        random.seed(1)
+        for size in sizes:
+            label = f"{size // 1000}k" if size >= 1000 else str(size)
+            runs = 3 if size >= 100_000 else 5
+            game = new_game(fishgame)
+            game.inventory = [fishgame.Fish.from_dict(templates[i % len(templates)].to_dict()) for i in range(size)]
+
+            def full_save():
+                game.save_snapshot = {}
+                game.save_game()
+            results[f"sqlite.save.{label}.full"] = result(
+                round(measure(full_save, min_time=0.3, min_runs=runs) * 1e3, 3), "ms")
+
+            def catch_and_save():
+                game.inventory.append(fishgame.Fish.from_dict(templates[len(game.inventory) % len(templates)].to_dict()))
+                game.save_game()
+            results[f"sqlite.save.{label}.catch"] = result(
+                round(measure(catch_and_save, min_time=0.3, min_runs=runs) * 1e3, 3), "ms")
+            del game.inventory[size:]  # back to size fish for the loads
+            game.save_game()
+
+            loaded = new_game(fishgame)
+            results[f"sqlite.load.{label}.lazy"] = result(
+                round(measure(lambda: loaded.resume_game(game.name), min_time=0.3, min_runs=runs) * 1e3, 3), "ms")
+
+            def full_load():
+                loaded.resume_game(game.name)
+                return len(loaded.inventory)
+            results[f"sqlite.load.{label}.full"] = result(
+                round(measure(full_load, min_time=0.3, min_runs=runs) * 1e3, 3), "ms")
+            if len(loaded.inventory) != len(game.inventory):
+                raise RuntimeError(f"resume_game() restored {len(loaded.inventory)} fish, expected {len(game.inventory)}")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+
+def bench_leaderboards(fishgame, catches=100_000, players=1000):
+    from fishgame_content.leaderboards import LEADERBOARD_MUTATIONS, Leaderboards
+    results = {}
+    folder = tempfile.mkdtemp(prefix="fishgame-bench-")
+    boards = Leaderboards(os.path.join(folder, "leaderboards.db"))
+    try:
+        templates = [fish for location in fishgame.LOCATIONS for fish in location.fish_pool]
+        random.seed(1)
+        fish = []
+        for i in range(catches):
+            caught = fishgame.Fish.from_dict(templates[i % len(templates)].to_dict())
+            caught.weight = caught.generate_random_weight()
+            caught.mutation = random.choice(LEADERBOARD_MUTATIONS + ("normal",) * 20)
+            fish.append(caught)
+        start = time.perf_counter()
+        for i, caught in enumerate(fish):
+            boards.record_catch(f"Player{i % players}", caught)
+        boards.wait()
+        results["leaderboard.write"] = result(round(catches / (time.perf_counter() - start)), "catches/s",
+                                              higher_is_better=True)
+
+        args = {'heaviest': (templates[0].name,), 'mutation': ("shiny",)}
+        for board in Leaderboards.QUERIES:
+            name = f"leaderboard.top.{board}"
+            plan = boards.query_plan(board)
+            if any("USING" not in step or "TEMP B-TREE" in step for step in plan):
+                results[name] = {'error': "not an index walk: " + "; ".join(plan)}
+                continue
+            seconds = measure(lambda: boards.top(board, *args.get(board, ())), min_time=0.1)
+            results[name] = result(round(seconds * 1e6, 2), "us/query")
+    finally:
+        boards.close()
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+
+def run_suite(only=None):
+    import fishgame
+    groups = [
+        ("catch", lambda stubs: bench_choose_fish(fishgame)),
+        ("save", lambda stubs: bench_save_load(fishgame)),
+        ("sqlite_save", lambda stubs: bench_sqlite_saves(fishgame, stubs)),
+        ("render", lambda stubs: bench_render(fishgame)),
+        ("boss", lambda stubs: bench_boss_patterns(fishgame, stubs)),
+        ("leaderboard", lambda stubs: bench_leaderboards(fishgame)),
+    ]
+    results = {}
+    for group, bench in groups:
+        if only and not any(part in group for part in only):
+            continue
+        print(f"running {group}...", file=sys.stderr)
+        with Stubs(fishgame) as stubs:
+            results.update(bench(stubs))
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Returns (rows, regressions). A row is (name, baseline, current, change, status)"""
+    rows = []
+    regressions = []
+    for name, entry in sorted(current['results'].items()):
+        base = baseline.get('results', {}).get(name)
+        if 'error' in entry:
+            rows.append((name, "", entry['error'], "", "ERROR"))
+            regressions.append(name)
+            continue
+        if not base or 'value' not in base or not base['value']:
+            rows.append((name, "", f"{entry['value']} {entry['unit']}", "", "new"))
+            continue
+        change = (entry['value'] - base['value']) / base['value']
+        worse = -change if entry['higher_is_better'] else change
+        limit = base.get('threshold', threshold)
+        floor = base.get('noise_floor', NOISE_FLOOR.get(entry['unit'], 0))
+        if abs(entry['value'] - base['value']) <= floor:
+            status = "ok"
+        else:
+            status = "REGRESSION" if worse > limit else ("faster" if worse < -limit else "ok")
+        if status == "REGRESSION":
+            regressions.append(name)
+        rows.append((name, f"{base['value']} {base['unit']}", f"{entry['value']} {entry['unit']}",
+                     f"{change * 100:+.1f}%", status))
+    return rows, regressions
+
+
+def print_table(rows):
+    width = max(len(row[0]) for row in rows)
+    print(f"{'benchmark':<{width}}  {'baseline':>18}  {'current':>18}  {'change':>8}  status")
+    for name, base, now, change, status in rows:
+        print(f"{name:<{width}}  {base:>18}  {now:>18}  {change:>8}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare it with the baseline")
+    parser.add_argument("--only", nargs="+", default=None, help="groups to run: catch, save, render, boss, leaderboard")
+    parser.add_argument("--json", dest="json_path", default=None, help="also write this run's results here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing, 0.25 = 25%% (a baseline entry can set its own)")
+    parser.add_argument("--update-baseline", nargs="*", default=None, metavar="PREFIX",
+                        help="store the results that moved past the threshold as the new baseline, "
+                             "or every result whose name starts with one of the PREFIXes")
+    args = parser.parse_args()
+
+    current = run_suite(args.only)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    rows, regressions = compare(current, baseline, args.threshold)
+    print_table(rows)
+
+    if args.update_baseline is not None:
+        # Without PREFIXes only entries that moved past the threshold (or are new)
+        # are refreshed; the rest keep their old value instead of this run's noise
+        if args.update_baseline:
+            moved = {row[0] for row in rows if row[4] != "ERROR" and row[0].startswith(tuple(args.update_baseline))}
+        else:
+            moved = {row[0] for row in rows if row[4] in ("REGRESSION", "faster", "new")}
+        merged = dict(baseline.get('results', {}))
+        for name, entry in current['results'].items():
+            if name not in moved:
+                continue
+            for key in ('threshold', 'noise_floor'):
+                if key in merged.get(name, {}):
+                    entry = dict(entry, **{key: merged[name][key]})
+            merged[name] = entry
+        print(f"\n{len(moved)} baseline entries refreshed")
+        with open(args.baseline, 'w') as f:
+            json.dump(dict(current, results=merged), f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} benchmark(s) regressed more than the threshold")
+        return 1
+    print("\nOK: no regressions against the baseline" if baseline else "\nNo baseline yet - run with --update-baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# Load test for fishgame_server.py: many idle-heavy telnet players on one server
+# Usage: python benchmarks/telnet_load.py [--sessions 1000] [--think 5] [--duration 30]
+#                                         [--cpus 1] [--p99-budget-ms 250]
+#
+# Starts the server (pinned to --cpus cores where the OS allows it), connects
+# --sessions bots that each create a character and walk onto Hub Island, then
+# has every bot press a movement key every --think seconds (randomised) for
+# --duration seconds. Reports how many sessions made it, the key-to-frame
+# latency, and the server's CPU use and memory. Fails (exit code 1) if a bot
+# didn't make it or the p99 latency is over budget.
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAME_MARKER = b"[WASD] Move"
+# (text to wait for, answer) - the new game flow up to the first hub frame
+NEW_GAME = [
+    (b"Choose an option", "1"),
+    (b"name:", None),  # answered with the bot's name
+    (b"Strength (", "5"),
+    (b"Luck (", "5"),
+    (b"Patience (", "5"),
+    (b"Difficulty:", "2"),
+]
+
+
+class Bot:
+    def __init__(self, number, port):
+        self.number = number
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.buffer = b""
+        self.latencies = []
+        self.error = None
+
+    async def expect(self, marker, timeout):
+        deadline = time.monotonic() + timeout
+        while marker not in self.buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"waited {timeout}s for {marker!r}")
+            data = await asyncio.wait_for(self.reader.read(65536), remaining)
+            if not data:
+                raise ConnectionError(f"server closed the connection before {marker!r}")
+            self.buffer += data
+        self.buffer = self.buffer[self.buffer.index(marker) + len(marker):]
+
+    async def join(self, timeout):
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+        for marker, answer in NEW_GAME:
+            await self.expect(marker, timeout)
+            self.writer.write((answer or f"Bot{self.number}").encode() + b"\r\n")
+        await self.writer.drain()
+        await self.expect(FRAME_MARKER, timeout)
+
+    async def idle(self, think, stop_at, timeout):
+        keys = "da"
+        presses = 0
+        while True:
+            pause = random.uniform(think * 0.5, think * 1.5)
+            if time.monotonic() + pause >= stop_at:
+                return
+            await asyncio.sleep(pause)
+            self.buffer = b""
+            start = time.perf_counter()
+            self.writer.write(keys[presses % 2].encode())
+            presses += 1
+            await self.expect(FRAME_MARKER, timeout)
+            self.latencies.append(time.perf_counter() - start)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def start_server(cpus, max_sessions, folder, extra_args=()):
+    """The server in a child process, pinned to the first `cpus` cores. Returns (process, port)"""
+    def pin():
+        if cpus and hasattr(os, "sched_setaffinity"):
+            available = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, available[:cpus])
+
+    python_path = os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_ROOT, "fishgame_server.py"), "--port", "0", "--no-intro",
+         "--max-sessions", str(max_sessions), *extra_args],
+        cwd=folder, stdout=subprocess.PIPE, env=dict(os.environ, PYTHONPATH=python_path),
+        preexec_fn=pin if os.name == "posix" else None,
+    )
+    line = process.stdout.readline().decode()
+    if "server on" not in line:
+        process.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    return process, int(line.split(":")[-1].split()[0])
+
+
+def server_usage(pid):
+    """(cpu seconds, resident MB) of a process, from /proc - (None, None) elsewhere"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/status") as f:
+            rss = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:")) / 1024
+        return cpu, rss
+    except (OSError, ValueError, StopIteration):
+        return None, None
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_load(args, port, pid):
+    bots = [Bot(number, port) for number in range(1, args.sessions + 1)]
+
+    async def join(bot):
+        try:
+            await bot.join(args.timeout)
+        except (OSError, TimeoutError, ConnectionError, asyncio.TimeoutError) as e:
+            bot.error = f"join: {e}"
+
+    start = time.perf_counter()
+    tasks = []
+    for first in range(0, len(bots), args.ramp):
+        tasks += [asyncio.ensure_future(join(bot)) for bot in bots[first:first + args.ramp]]
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tasks)
+    joined = [bot for bot in bots if bot.error is None]
+    print(f"{len(joined)}/{len(bots)} sessions on Hub Island after {time.perf_counter() - start:.1f}s")
+
+    cpu_before, _ = server_usage(pid)
+    steady_start = time.perf_counter()
+    stop_at = time.monotonic() + args.duration
+
+    async def idle(bot):
+        try:
+            await bot.idle(args.think, stop_at, args.timeout)
+        except (OSError, TimeoutError, ConnectionError, asyncio.TimeoutError) as e:
+            bot.error = f"idle: {e}"
+
+    await asyncio.gather(*(idle(bot) for bot in joined))
+    elapsed = time.perf_counter() - steady_start
+    cpu_after, rss = server_usage(pid)
+    for bot in bots:
+        bot.close()
+    return bots, elapsed, (cpu_after - cpu_before) if cpu_before is not None else None, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Idle-heavy load test for the telnet server")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--think", type=float, default=5.0, help="mean seconds between key presses per bot")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of steady idle play")
+    parser.add_argument("--cpus", type=int, default=1, help="cores the server may use (0 = no pinning)")
+    parser.add_argument("--ramp", type=int, default=100, help="new connections per 50 ms")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--p99-budget-ms", type=float, default=250.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="fishgame-load-") as folder:
+        process, port = start_server(args.cpus, args.sessions + 10, folder)
+        try:
+            bots, elapsed, cpu, rss = asyncio.run(run_load(args, port, process.pid))
+        finally:
+            process.terminate()
+            process.wait(5)
+
+    failed = [bot for bot in bots if bot.error]
+    latencies = [seconds for bot in bots for seconds in bot.latencies]
+    print(f"{len(bots) - len(failed)}/{len(bots)} sessions played for {elapsed:.0f}s, {len(latencies)} key presses")
+    for bot in failed[:5]:
+        print(f"  bot {bot.number}: {bot.error}")
+    if latencies:
+        print(f"key -> frame latency: p50 {statistics.median(latencies) * 1e3:.1f} ms, "
+              f"p95 {percentile(latencies, 0.95) * 1e3:.1f} ms, p99 {percentile(latencies, 0.99) * 1e3:.1f} ms, "
+              f"max {max(latencies) * 1e3:.1f} ms")
+    if cpu is not None:
+        print(f"server: {cpu / elapsed * 100:.1f}% of one core while idle-heavy, "
+              f"{rss:.0f} MB resident ({rss * 1024 / len(bots):.0f} KB per session)")
+
+    p99 = percentile(latencies, 0.99) * 1e3 if latencies else None
+    if failed or p99 is None or p99 > args.p99_budget_ms:
+        print("FAIL")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+# Stress test for player-to-player trading: thousands of random trades from many threads
+# Usage: python benchmarks/trade_stress.py [--players 60] [--threads 12] [--steps 400]
+#                                          [--retry 0.2] [--seed 1]
+#
+# Every thread plays its own share of the players, the way telnet sessions do,
+# all against one SQLite save store. Each step picks one of its players and
+# does something at random: offers fish and money to anyone (sometimes asking
+# for their fish), accepts, declines or withdraws an open offer, catches a fish
+# or saves. With probability --retry a step is sent twice with the same trade
+# id, as a client would after losing the reply.
+#
+# Afterwards every thread withdraws its open offers and saves its players, and
+# every player is saved once more after all threads are done. Then the test
+# checks that no money or fish appeared or vanished: money adds up to what
+# everyone started with, every fish caught is owned by exactly one player,
+# nothing is left in escrow, and each game in memory matches its rows. Fails
+# (exit code 1) on any difference.
+import argparse
+import builtins
+import collections
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+START_FISH = 20
+START_MONEY = 1000
+
+
+class NullStream(io.TextIOBase):
+    def write(self, text):
+        return len(text)
+
+
+def new_player(fishgame, name, templates, rng):
+    game = fishgame.Game({'name': name, 'stats': {'strength': 5, 'luck': 5, 'patience': 5},
+                          'difficulty_name': 'Normal', 'difficulty_mult': 1.0})
+    game.autosave_enabled = False
+    game.money = START_MONEY
+    game.inventory = [catch(fishgame, templates, rng) for _ in range(START_FISH)]
+    return game
+
+
+def catch(fishgame, templates, rng):
+    return fishgame.Fish.from_dict(rng.choice(templates).to_dict())
+
+
+class Worker(threading.Thread):
+    def __init__(self, fishgame, store, games, everyone, args, seed):
+        super().__init__(daemon=True)
+        from fishgame_content import saves
+        self.fishgame = fishgame
+        self.saves = saves
+        self.trades = saves.Trades(store)
+        self.store = store
+        self.games = games
+        self.everyone = everyone
+        self.args = args
+        self.rng = random.Random(seed)
+        self.templates = [fish for location in fishgame.LOCATIONS for fish in location.fish_pool]
+        self.counts = collections.Counter()
+        self.caught = 0
+        self.error = None
+
+    def run(self):
+        try:
+            for game in self.games:
+                self.store.write(game)
+            for _ in range(self.args.steps):
+                self.step(self.rng.choice(self.games))
+            for game in self.games:
+                for offer in self.trades.pending(game):
+                    if offer['direction'] == 'out':
+                        try:
+                            self.trades.cancel(game, offer['trade_id'])
+                        except self.saves.TradeError:
+                            pass  # accepted meanwhile by another thread
+                self.store.write(game)
+        except Exception as e:  # reported by main()
+            self.error = f"{type(e).__name__}: {e}"
+            raise
+
+    def retried(self, step, *args):
+        """Run a trade step, and sometimes again with the same arguments"""
+        result = step(*args)
+        if self.rng.random() < self.args.retry:
+            self.counts['retries'] += 1
+            result = step(*args)
+        return result
+
+    def step(self, game):
+        rng = self.rng
+        action = rng.random()
+        try:
+            if action < 0.4:
+                other = rng.choice([name for name in self.everyone if name != game.name])
+                fish = rng.sample(game.inventory, min(len(game.inventory), rng.randint(0, 3)))
+                theirs = self.trades.inventory_of(other) if rng.random() < 0.5 else []
+                ask = [data['save_id'] for data in rng.sample(theirs, min(len(theirs), rng.randint(0, 2)))]
+                trade_id = os.urandom(8).hex()
+                self.retried(self.trades.offer, game, other, fish, rng.randint(0, 100), ask, rng.randint(0, 100),
+                             trade_id)
+                self.counts['offers'] += 1
+            elif action < 0.85:
+                offers = self.trades.pending(game)
+                incoming = [offer for offer in offers if offer['direction'] == 'in']
+                if incoming and rng.random() < 0.75:
+                    self.retried(self.trades.accept, game, rng.choice(incoming)['trade_id'])
+                    self.counts['accepted'] += 1
+                elif offers:
+                    self.retried(self.trades.cancel, game, rng.choice(offers)['trade_id'])
+                    self.counts['cancelled'] += 1
+            elif action < 0.95:
+                game.inventory.append(catch(self.fishgame, self.templates, rng))
+                self.caught += 1
+            else:
+                self.store.write(game)
+        except self.saves.TradeError:
+            self.counts['refused'] += 1
+
+
+def check(fishgame, store, games, caught):
+    db = store.connection()
+    problems = []
+    money = sum(money for money, in db.execute("SELECT money FROM players"))
+    expected = START_MONEY * len(games)
+    if money != expected:
+        problems.append(f"money: {money} in the store, {expected} expected")
+    memory_money = sum(game.money for game in games)
+    if memory_money != expected:
+        problems.append(f"money: {memory_money} in memory, {expected} expected")
+
+    fish = dict(db.execute("SELECT fish_id, player_id FROM fish WHERE place = 'inventory'"))
+    expected_fish = START_FISH * len(games) + caught
+    if len(fish) != expected_fish:
+        problems.append(f"fish: {len(fish)} in inventories, {expected_fish} expected")
+    escrow = db.execute("SELECT COUNT(*) FROM fish WHERE place = 'escrow'").fetchone()[0]
+    if escrow:
+        problems.append(f"{escrow} fish left in escrow")
+    seen = {}
+    for game in games:
+        player_id = game.save_snapshot['player_id']
+        ids = [fish_object.save_id for fish_object in game.inventory]
+        for fish_id in ids:
+            if fish_id in seen:
+                problems.append(f"fish {fish_id} held by both {seen[fish_id]} and {game.name}")
+            seen[fish_id] = game.name
+        rows = sorted(fish_id for fish_id, owner in fish.items() if owner == player_id)
+        if sorted(ids) != rows:
+            problems.append(f"{game.name}: {len(ids)} fish in memory, {len(rows)} rows")
+        stored = db.execute("SELECT money FROM players WHERE player_id = ?", (player_id,)).fetchone()[0]
+        if stored != game.money:
+            problems.append(f"{game.name}: ${game.money} in memory, ${stored} stored")
+    open_trades = db.execute("SELECT COUNT(*) FROM trades WHERE state = 'offered'").fetchone()[0]
+    if open_trades:
+        problems.append(f"{open_trades} offers still open")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Random concurrent trades against one save store")
+    parser.add_argument("--players", type=int, default=60)
+    parser.add_argument("--threads", type=int, default=12)
+    parser.add_argument("--steps", type=int, default=400, help="random steps per thread")
+    parser.add_argument("--retry", type=float, default=0.2, help="chance a trade step is sent twice")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="fishgame-trades-")
+    previous = os.getcwd()
+    stdout = sys.stdout
+    try:
+        os.chdir(folder)
+        import fishgame
+        from fishgame_content.saves import SqliteSaveStore
+        sys.stdout = NullStream()
+        builtins.input = lambda prompt="": ""
+        store = SqliteSaveStore(os.path.join(folder, "saves.db"))
+        rng = random.Random(args.seed)
+        templates = [fish for location in fishgame.LOCATIONS for fish in location.fish_pool]
+        games = [new_player(fishgame, f"Trader{i}", templates, rng) for i in range(args.players)]
+        names = [game.name for game in games]
+        workers = [Worker(fishgame, store, games[i::args.threads], names, args, args.seed * 1000 + i)
+                   for i in range(args.threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        for game in games:
+            store.write(game)  # everyone logs off: trades settled after a thread's last save arrive
+        sys.stdout = stdout
+
+        counts = sum((worker.counts for worker in workers), collections.Counter())
+        caught = sum(worker.caught for worker in workers)
+        print(f"{args.threads} threads, {args.players} players, {elapsed:.1f}s: "
+              f"{counts['offers']} offers, {counts['accepted']} accepts, {counts['cancelled']} cancels/declines, "
+              f"{counts['refused']} refused, {counts['retries']} retried steps, {caught} catches")
+        failed = [worker for worker in workers if worker.error]
+        for worker in failed:
+            print(f"  worker crashed: {worker.error}")
+        problems = [] if failed else check(fishgame, store, games, caught)
+        for problem in problems[:20]:
+            print(f"  {problem}")
+        if failed or problems:
+            print("FAIL")
+            return 1
+        print("OK")
+        return 0
+    finally:
+        sys.stdout = stdout
+        os.chdir(previous)
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# Boss fight simulator - plays start_boss_fight's turn loop without rendering
+# Usage: python boss_simulator.py [--trials 2000] [--workers 4] [--policy kill|spare]
+import argparse
+import json
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from fishgame import (
+    ATTACK_BAR_FRAMES,
+    ATTACK_BAR_WIDTH,
+    ATTACK_BAR_ZONES,
+    BossState,
+    COMBAT_ITEMS_ATTACK,
+    COMBAT_ITEMS_DEFENSE,
+    COMBAT_ITEMS_HP,
+)
+from fishgame_content.bosses import BOSS_ROSTER
+
+MAX_TURNS = 300
+DEFAULT_STRENGTHS = [0, 5, 10, 15]
+
+
+def get_loadouts():
+    """Loadout tiers: nothing equipped, then the Nth attack/defense/hp item together"""
+    loadouts = [("No items", None, None, None)]
+    for tier, (attack, defense, hp) in enumerate(zip(COMBAT_ITEMS_ATTACK, COMBAT_ITEMS_DEFENSE, COMBAT_ITEMS_HP), 1):
+        loadouts.append((f"Tier {tier}", attack, defense, hp))
+    return loadouts
+
+
+def attack_multiplier_table(difficulty_name="Normal", press_rate=0.9):
+    """Damage multiplier distribution of undertale_attack_minigame.
+    The press frame is uniform over the bar's frames; with probability
+    1 - press_rate the player never presses and the attack misses."""
+    perfect_start, perfect_end, good_start, good_end = ATTACK_BAR_ZONES.get(difficulty_name, ATTACK_BAR_ZONES["Normal"])
+    counts = {2.0: 0, 1.5: 0, 0.8: 0}
+    position = 0
+    direction = 1
+    for _ in range(ATTACK_BAR_FRAMES):
+        if perfect_start <= position < perfect_end:
+            counts[2.0] += 1
+        elif good_start <= position < good_end:
+            counts[1.5] += 1
+        else:
+            counts[0.8] += 1
+        position += direction
+        if position >= ATTACK_BAR_WIDTH or position < 0:
+            direction *= -1
+            position += direction * 2
+    table = [(mult, press_rate * count / ATTACK_BAR_FRAMES) for mult, count in counts.items()]
+    table.append((0.5, 1 - press_rate))
+    return table
+
+
+def simulate_fight(boss, strength, loadout, rng, policy="kill", multipliers=None, ng_plus=False):
+    """One fight. Returns (won, spared, turns)"""
+    _, attack_item, defense_item, hp_item = loadout
+    attack_bonus = attack_item.bonus_value if attack_item else 0
+    defense_bonus = defense_item.bonus_value if defense_item else 0
+    player_hp = 100 + (hp_item.bonus_value if hp_item else 0)
+
+    if ng_plus:
+        state = BossState(boss, hp_mult=1.5, damage_mult=1.25)
+    else:
+        state = BossState(boss)
+
+    mults = [m for m, _ in multipliers]
+    weights = [w for _, w in multipliers]
+
+    for turn in range(1, MAX_TURNS + 1):
+        # Player turn
+        if policy == "spare" and state.is_spareable:
+            return True, True, turn
+        if policy == "spare" and state.mercy_level < 3:
+            state.mercy_level += 1
+        else:
+            multiplier = rng.choices(mults, weights=weights, k=1)[0]
+            base_damage = rng.randint(15, 25) + strength * 2 + attack_bonus
+            state.take_damage(int(base_damage * multiplier))
+            if state.hp <= 0:
+                return True, False, turn
+
+        # Boss turn
+        attack = rng.choice(boss.attacks)
+        low, high = attack.damage_range
+        damage_taken = int(rng.randint(low, high) * state.damage_mult)
+        if damage_taken > 0:
+            player_hp -= max(1, damage_taken - defense_bonus)
+        if player_hp <= 0:
+            return False, False, turn
+
+    return False, False, MAX_TURNS
+
+
+def run_cell(job):
+    """Worker entry point: many fights for one boss x loadout x strength"""
+    boss_index, loadout_index, strength, options = job
+    boss = BOSS_ROSTER[boss_index]
+    loadout = get_loadouts()[loadout_index]
+    rng = random.Random(options['seed'] * 1000003 + boss_index * 1009 + loadout_index * 101 + strength)
+    multipliers = attack_multiplier_table(options['difficulty'], options['press_rate'])
+
+    wins = 0
+    spares = 0
+    win_turns = []
+    for _ in range(options['trials']):
+        won, spared, turns = simulate_fight(boss, strength, loadout, rng, options['policy'], multipliers, options['ng_plus'])
+        if won:
+            wins += 1
+            spares += spared
+            win_turns.append(turns)
+
+    return {
+        'boss': boss.name,
+        'loadout': loadout[0],
+        'strength': strength,
+        'trials': options['trials'],
+        'win_rate': wins / options['trials'],
+        'spare_rate': spares / options['trials'],
+        'mean_turns': statistics.mean(win_turns) if win_turns else None,
+        'median_turns': statistics.median(win_turns) if win_turns else None,
+    }
+
+
+def run_simulation(options, workers=None, boss_filter=None, strengths=None):
+    strengths = strengths or DEFAULT_STRENGTHS
+    jobs = []
+    for boss_index, boss in enumerate(BOSS_ROSTER):
+        if boss_filter and boss_filter.lower() not in boss.name.lower():
+            continue
+        for loadout_index in range(len(get_loadouts())):
+            for strength in strengths:
+                jobs.append((boss_index, loadout_index, strength, options))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_cell, jobs, chunksize=max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))))
+
+
+def print_tables(results, strengths):
+    """One table per boss: rows are loadouts, columns are strength values"""
+    by_boss = {}
+    for row in results:
+        by_boss.setdefault(row['boss'], {})[(row['loadout'], row['strength'])] = row
+
+    for boss_name, cells in by_boss.items():
+        print()
+        print(f"=== {boss_name} ===  (win % / mean turns to finish)")
+        print(f"{'Loadout':<10}" + "".join(f"{'STR ' + str(s):>16}" for s in strengths))
+        for loadout in get_loadouts():
+            line = f"{loadout[0]:<10}"
+            for strength in strengths:
+                row = cells.get((loadout[0], strength))
+                if row is None:
+                    line += f"{'-':>16}"
+                    continue
+                turns = f"{row['mean_turns']:.1f}" if row['mean_turns'] is not None else "-"
+                line += f"{row['win_rate'] * 100:>9.1f}% / {turns:>4}"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless boss fight simulator")
+    parser.add_argument("--trials", type=int, default=2000, help="fights per boss x loadout x strength cell")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--policy", choices=["kill", "spare"], default="kill", help="always FIGHT, or ACT x3 then SPARE when possible")
+    parser.add_argument("--difficulty", choices=list(ATTACK_BAR_ZONES), default="Normal")
+    parser.add_argument("--press-rate", type=float, default=0.9, help="chance the player presses SPACE at all on the attack bar")
+    parser.add_argument("--strength", type=int, nargs="+", default=DEFAULT_STRENGTHS)
+    parser.add_argument("--boss", default=None, help="only bosses whose name contains this text")
+    parser.add_argument("--ng-plus", action="store_true", help="apply the New Game+ HP and damage multipliers")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", default=None, help="also write raw results to this file")
+    args = parser.parse_args()
+
+    options = {
+        'trials': args.trials,
+        'policy': args.policy,
+        'difficulty': args.difficulty,
+        'press_rate': args.press_rate,
+        'ng_plus': args.ng_plus,
+        'seed': args.seed,
+    }
+    results = run_simulation(options, args.workers, args.boss, args.strength)
+    print_tables(results, args.strength)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nRaw results written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+# Game content that is only needed once the player gets to it.
+# Nothing here is imported by fishgame at startup - each module is imported
+# the first time the game needs it:
+#   bosses       - attack patterns, boss definitions and BOSS_ROSTER (first boss fight)
+#   fish         - one fish table per location (first cast at that location)
+#   npcs         - NPC conversations and NPC shops
+#   library      - library books and the librarian
+#   saves        - the SQLite save store and trading (--saves sqlite)
+#   leaderboards - the community leaderboards (first catch, or the boards menu)
+#
+# Loaded with the game: bundle (the precompiled content file), items (the
+# rows of the shop and boss item tables) and maps (the map compiler and
+# loader - every map is built at startup, straight from the memory-mapped
+# maps.bundle).
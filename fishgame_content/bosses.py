@@ -0,0 +1,1429 @@
+# Boss attack patterns and definitions - imported on the first boss fight
+from colorama import Fore
+
+from fishgame import (
+    BossAttack,
+    BossDefinition,
+    boss_art,
+    boss_dialogue,
+)
+
+
+# ===== BOSS ATTACK PATTERNS =====
+LOCH_NESS_WAVE_PATTERN = {
+    'intro': (Fore.CYAN, "💧 Waves incoming! 💧"),
+    'steps': [
+        {'kind': 'waves', 'width': 40, 'count': 3, 'start': (-9, 21), 'speed': (1, 1),
+         'size': (8, 8), 'frames': 10, 'delay': 0.05},
+        # Only a spot every wave covers is a hit - dodging one wave is enough
+        {'kind': 'dodge', 'hit': 'all', 'prompt': "Choose a safe position to dodge (0-39):",
+         'damage': (10, 20), 'miss_damage': (10, 20),
+         'success': "✓ Perfect dodge!", 'fail': "💥 SPLASH! You got hit by the wave!",
+         'invalid': "Invalid input! You got hit!"},
+    ],
+}
+
+
+LOCH_NESS_WATER_BLAST_PATTERN = {
+    'intro': (Fore.CYAN, "💦 The monster is charging a water blast! 💦"),
+    'steps': [
+        {'kind': 'animate', 'frames': ["  (  )", "  ( O )", "  ( ⚡ )", "  (💧💧)", "  (💦💦)"],
+         'color': Fore.LIGHTBLUE_EX, 'delay': 0.3},
+        {'kind': 'choice', 'prompt': "Which way do you dodge?",
+         'options': ["⬅️  Left", "➡️  Right", "⬆️  Jump", "⬇️  Duck"],
+         'hints': {
+             "⬅️  Left": ["💭 You see ripples to the right..."],
+             "➡️  Right": ["💭 You see ripples to the left..."],
+             "⬆️  Jump": ["💭 The blast is aimed low..."],
+             "⬇️  Duck": ["💭 The blast is aimed high..."],
+         },
+         'reveal': ["BLAST! 💦💦💦💦💦"] * 4,
+         'damage': (12, 18), 'success': "✨ PERFECT DODGE! ✨", 'fail': "💥 SPLASH! Direct hit!"},
+    ],
+}
+
+
+LOCH_NESS_TIDAL_WAVE_PATTERN = {
+    'intro': (Fore.CYAN, "🌊 TIDAL WAVE INCOMING! 🌊"),
+    'steps': [
+        {'kind': 'waves', 'width': 50, 'count': 5, 'start': (0, 10), 'speed': (2, 5),
+         'size': (4, 8), 'damage': (3, 6), 'frames': 15, 'delay': 0.08},
+        {'kind': 'dodge', 'tip': "💭 Tip: Look for gaps between the waves!", 'miss_damage': 20,
+         'success': "✓ PERFECT DODGE! You found the safe zone!",
+         'fail': "💥 Caught by {hits} wave(s)! (-{damage} HP)",
+         'invalid': "Invalid input! Swept away!"},
+    ],
+}
+
+
+LOCH_NESS_WHIRLPOOL_PATTERN = {
+    'intro': (Fore.BLUE, "🌀 WHIRLPOOL! You're being pulled in! 🌀"),
+    'steps': [
+        {'kind': 'animate', 'color': Fore.BLUE, 'delay': 0.2, 'frames': [
+            "      ≈≈≈      ",
+            "    ≈≈≈≈≈≈     ",
+            "   ≈≈≈◉≈≈≈≈    ",
+            "  ≈≈≈≈◉≈≈≈≈≈   ",
+            " ≈≈≈≈◉◉◉≈≈≈≈≈  ",
+            "≈≈≈≈◉◉◉◉◉≈≈≈≈≈ ",
+        ]},
+        {'kind': 'text', 'lines': [(Fore.RED, "MASH THE CORRECT BUTTONS TO ESCAPE!")]},
+        {'kind': 'sequence', 'length': 5, 'time_limit': 3, 'damage': 20, 'per_correct': 3,
+         'late_damage': 8, 'success': "✨ ESCAPED! Perfect button mashing!",
+         'late': "⚡ Escaped, but took some damage from the pull!",
+         'fail': "💫 Pulled under! Got {correct}/{total} correct (-{damage} HP)"},
+    ],
+}
+
+
+LOCH_NESS_TAIL_SWEEP_PATTERN = {
+    'intro': (Fore.GREEN, "🐉 The Loch Ness Monster winds up its massive tail... 🐉"),
+    'steps': [
+        {'kind': 'choice', 'prompt': "⚠️  TAIL SWEEP INCOMING! Which way do you dodge?",
+         'options': ["🏃 Dodge LEFT", "🏃 Dodge RIGHT", "🤸 Stay CENTER"],
+         'hints': {
+             "🏃 Dodge LEFT": ["💭 The monster's body is leaning right...", "💭 Its tail is on the right side..."],
+             "🏃 Dodge RIGHT": ["💭 The monster's body is leaning left...", "💭 Its tail is on the left side..."],
+             "🤸 Stay CENTER": ["💭 The monster is perfectly balanced...", "💭 Its tail is raised high above..."],
+         },
+         'think': 1,
+         'charge': {'frames': ["CHARGING: " + c * 10 for c in "▁▂▃▄▅▆▇█"], 'color': Fore.YELLOW, 'delay': 0.15},
+         'reveal': ["〰️〰️〰️〰️〰️=====>", "<=====〰️〰️〰️〰️〰️", "    ↓↓↓↓↓    "], 'reveal_color': Fore.GREEN,
+         'damage': (15, 22), 'success': "✓ PERFECT READ! You dodged it!",
+         'fail': "💥 SMASHED! You should have picked {answer}!"},
+    ],
+}
+
+
+LOCH_NESS_DEEP_DIVE_SLAM_PATTERN = {
+    'intro': (Fore.BLUE, "🌊 The Loch Ness Monster DIVES beneath the surface! 🌊"),
+    'steps': [
+        {'kind': 'animate', 'color': Fore.CYAN, 'delay': 0.2, 'frames': [
+            "     🐉     ",
+            "     🐉~    ",
+            "     🐉~~   ",
+            "     ~🐉~~  ",
+            "     ~~🐉~~ ",
+            "     ~~~💦  ",
+            "     ~~~    ",
+            "     ...    ",
+        ]},
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "💭 It's gone under... where will it emerge?")], 'pause': 1},
+        {'kind': 'typed', 'words': list("0123456"), 'avoid': True, 'mark': '🐉',
+         'prompt': "Choose a safe zone (0-6):  [0] [1] [2] [3] [4] [5] [6]", 'damage': 12,
+         'success': "✓ Safe from the emergence!", 'fail': "💥 It emerged RIGHT where you were! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\n⚠️  NOW IT'S GOING FOR A BODY SLAM! ⚠️\n")]},
+        {'kind': 'choice', 'prompt': "Quick! Dodge direction?", 'options': ["⬅️  Roll LEFT", "➡️  Roll RIGHT"],
+         'reveal': ["    🐉 <<<====", "====>>> 🐉    "], 'reveal_color': Fore.GREEN,
+         'damage': 15, 'success': "✓ Perfect dodge roll!", 'fail': "💥 CRUSHED by the body slam! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ FLAWLESS! Both phases dodged! ★★★",
+}
+
+
+LOCH_NESS_MIST_BREATH_PATTERN = {
+    'intro': (Fore.LIGHTCYAN_EX, "💨 The Loch Ness Monster breathes out a thick mist! 💨"),
+    'steps': [
+        {'kind': 'safe_zones', 'zones': 5, 'hazards': ['🪨', '🌊', '⚓', '🐚', '🪨'], 'memorize': 3,
+         'cover': [
+             (Fore.WHITE, "💨💨💨 MIST RISING 💨💨💨"),
+             (Fore.LIGHTBLACK_EX, "▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓"),
+             (Fore.LIGHTBLACK_EX, "▓  YOU CAN'T SEE!    ▓"),
+             (Fore.LIGHTBLACK_EX, "▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓"),
+         ],
+         'prompt': "Where was the safe zone (✨)? (0-4)", 'show_after': True,
+         'damage': 14, 'fail': "💥 Wrong! You wandered into danger (-{damage} HP)"},
+    ],
+}
+
+
+LOCH_NESS_COMBO_ATTACK_PATTERN = {
+    'intro': (Fore.RED, "💢 THE LOCH NESS MONSTER IS ENRAGED! 💢\n⚡ ULTIMATE COMBO ATTACK! ⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "Part 1: RAPID WAVES!")], 'pause': 1},
+        {'kind': 'typed', 'words': [("LEFT", "L"), ("RIGHT", "R")],
+         'tell': [(Fore.YELLOW, "Wave coming from the {tell}!")],
+         'prompt': "Type 'L' for left or 'R' for right!", 'damage': 8,
+         'success': "✓ Dodged!", 'fail': "💦 Hit by wave! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPart 2: FOCUS CHECK!")], 'pause': 0.5},
+        {'kind': 'math', 'operands': [(5, 15), (1, 10)], 'lines': [(Fore.YELLOW, "Quick! What's {0} + {1}?")],
+         'damage': 6, 'fail': "❌ Wrong! Distracted! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPart 3: FINAL TAIL SLAM!")], 'pause': 0.5},
+        {'kind': 'typed', 'words': list("01234"), 'prompt': "Pick safe position: [0] | [1] | [2] | [3] | [4]",
+         'damage': 10, 'success': "✓ Safe!", 'fail': "💥 SLAM! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ INCREDIBLE! SURVIVED THE COMBO! ★★★",
+    'summary': [
+        (15, Fore.YELLOW, "You survived with {damage} damage!"),
+        (None, Fore.RED, "The combo devastated you! {damage} damage!"),
+    ],
+}
+
+
+# ===== RIVER GUARDIAN ATTACK PATTERNS =====
+RIVER_RAPIDS_DODGE_PATTERN = {
+    'intro': (Fore.CYAN, "🌊 THE RAPIDS SURGE FORWARD! 🌊"),
+    'steps': [
+        {'kind': 'lane', 'width': 60, 'count': 8, 'walk': (10, 20, 3), 'damage': 18},
+        {'kind': 'dodge', 'prompt': "Follow the safe path! Enter position (0-59):", 'damage': 18, 'miss_damage': 18,
+         'success': "✓ Expertly navigated!", 'fail': "💥 Slammed into rocks! (-{damage} HP)",
+         'invalid': "Invalid! Swept away! (-18 HP)"},
+    ],
+}
+
+
+RIVER_BITE_SEQUENCE_PATTERN = {
+    'intro': (Fore.RED, "🦈 THE GUARDIAN ATTACKS WITH RAZOR TEETH! 🦈"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Press the correct key quickly to dodge!")], 'pause': 1},
+        {'kind': 'typed', 'rounds': 4,
+         'words': [("⬆️  UP", "W"), ("⬅️  LEFT", "A"), ("⬇️  DOWN", "S"), ("➡️  RIGHT", "D")],
+         'label': "Bite #{n} - Dodge {tell}!",
+         'charge': {'frames': [" >>", " >> >>", " >> >> >> 🦈 "], 'color': Fore.RED, 'delay': 0.15},
+         'prompt': "Press '{word}':", 'damage': 7,
+         'success': "✓ Dodged!", 'fail': "💥 Bitten! (-{damage} HP)"},
+    ],
+    'perfect': "★ PERFECT! All bites dodged! ★",
+}
+
+
+RIVER_CURRENT_SPIN_PATTERN = {
+    'intro': (Fore.BLUE, "🌀 THE GUARDIAN CREATES A WHIRLPOOL! 🌀"),
+    'steps': [
+        {'kind': 'animate', 'frames': [f"    {c} SPINNING {c}    " for c in "|/-\\"],
+         'repeat': 12, 'color': Fore.CYAN, 'delay': 0.08},
+        {'kind': 'choice', 'prompt': "The whirlpool stops! Which direction?",
+         'options': ["North", "East", "South", "West"],
+         'hints': {
+             "North": ["💭 You feel a northern breeze..."],
+             "East": ["💭 The eastern current feels calmer..."],
+             "South": ["💭 Something pulls you south..."],
+             "West": ["💭 The western waters seem safer..."],
+         },
+         'damage': 16, 'success': "✓ Escaped the whirlpool!", 'fail': "💥 Pulled under! (-{damage} HP)"},
+    ],
+}
+
+
+RIVER_TAIL_STRIKE_PATTERN = {
+    'intro': (Fore.GREEN, "⚡ MASSIVE TAIL INCOMING! ⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Get ready to dodge!")], 'pause': 0.5},
+        {'kind': 'animate', 'frames': ["." * i for i in range(1, 6)], 'color': Fore.YELLOW, 'delay': 0.4},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPress ENTER when you see 'NOW!':")]},
+        {'kind': 'reaction', 'wait': (0.5, 2.0), 'tiers': [(0.5, 0), (1.0, 10)], 'damage': 20,
+         'success': "✓ Lightning reflexes! ({elapsed:.2f}s)",
+         'graze': "Grazed! ({elapsed:.2f}s) (-{damage} HP)",
+         'fail': "Too slow! ({elapsed:.2f}s) (-{damage} HP)"},
+    ],
+}
+
+
+RIVER_WRATH_COMBO_PATTERN = {
+    'intro': (Fore.RED, "⚡💢 RIVER'S WRATH UNLEASHED! 💢⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "Phase 1: THE CURRENT SHIFTS!")], 'pause': 1},
+        {'kind': 'typed', 'words': ["L", "R"], 'prompt': "Swim LEFT or RIGHT? (L/R)", 'damage': 12,
+         'success': "✓ Safe!", 'fail': "💦 Wrong way! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase 2: RAPIDS MAZE!")], 'pause': 0.5},
+        {'kind': 'safe_zones', 'zones': 5, 'safe': 2, 'memorize': 2.5, 'memorize_text': "MEMORIZE:",
+         'cover': [(Fore.LIGHTBLACK_EX, "▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓")], 'prompt': "Pick a safe zone (0-4):",
+         'damage': 15, 'success': "✓ Safe!", 'fail': "💥 Hit rocks! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPhase 3: FINAL GUARDIAN STRIKE!")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "DODGE", 'time_limit': 2, 'damage': 18, 'prompt': "Type 'DODGE' quickly!",
+         'success': "✓ Dodged!", 'fail': "💥 STRUCK! (-{damage} HP)", 'late': "💥 STRUCK! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ FLAWLESS VICTORY! ★★★",
+}
+
+
+# ===== PIRATE SHIP ATTACK PATTERNS =====
+PIRATE_CANNON_BARRAGE_PATTERN = {
+    'intro': (Fore.RED, "💣 CANNON BARRAGE INCOMING! 💣"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Dodge the cannonballs! Watch for the indicators!")], 'pause': 1},
+        {'kind': 'projectiles', 'volleys': 5, 'lanes': 5, 'symbol': '💣', 'damage': 8, 'delay': 0.4},
+    ],
+    'perfect': "★ UNTOUCHABLE! Perfect evasion! ★",
+}
+
+
+PIRATE_HARPOON_STRIKE_PATTERN = {
+    'intro': (Fore.CYAN, "🔱 HARPOON STRIKE! 🔱"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The pirates are aiming their harpoon...")], 'pause': 1},
+        {'kind': 'animate', 'frames': [f"Targeting... {c}" for c in "·:•●"], 'repeat': 2,
+         'color': Fore.RED, 'delay': 0.2},
+        {'kind': 'typed', 'word': "DIVE", 'time_limit': 1.5, 'damage': 20, 'late_damage': 12,
+         'success': "✓ Ducked in time! ({elapsed:.2f}s)", 'fail': "Wrong input! Got harpooned! (-{damage} HP)"},
+    ],
+}
+
+
+PIRATE_BROADSIDE_RAM_PATTERN = {
+    'intro': (Fore.MAGENTA, "⚓ THE SHIP IS RAMMING! ⚓"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Watch the ship's movement!")], 'pause': 1},
+        {'kind': 'choice', 'prompt': "Where do you dodge?",
+         'options': ["PORT (LEFT)", "STARBOARD (RIGHT)", "STERN (BACK)"],
+         'hints': {
+             "PORT (LEFT)": ["💭 The ship is turning starboard...", "💭 It's coming from the right..."],
+             "STARBOARD (RIGHT)": ["💭 The ship is turning port...", "💭 It's coming from the left..."],
+             "STERN (BACK)": ["💭 The ship is backing up...", "💭 Watch your stern!"],
+         },
+         'think': 1.5,
+         'charge': {'frames': ["INCOMING! " + ">" * i for i in range(1, 6)], 'color': Fore.RED, 'delay': 0.25},
+         'damage': 25, 'success': "✓ Perfect dodge!",
+         'fail': "💥 RAMMED! Should have dodged {answer}! (-{damage} HP)"},
+    ],
+}
+
+
+PIRATE_NET_TOSS_PATTERN = {
+    'intro': (Fore.BLUE, "🕸️  NET TOSSED! 🕸️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "You're caught in a fishing net!")], 'pause': 1},
+        {'kind': 'text', 'lines': [(Fore.CYAN, "Cut the ropes in sequence!")]},
+        {'kind': 'sequence', 'length': 4, 'show': "Input: {keys}", 'hide_after': 2,
+         'prompt': "Type the sequence now:", 'damage': 15, 'per_correct': 3,
+         'success': "✓ Escaped the net!",
+         'fail': "Partially cut! Got {correct}/{total} correct (-{damage} HP)"},
+    ],
+}
+
+
+PIRATE_ULTIMATE_ASSAULT_PATTERN = {
+    'intro': (Fore.RED, "🏴‍☠️💥 ALL HANDS ON DECK! 💥🏴‍☠️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "CAPTAIN REDBEARD: GIVE 'EM EVERYTHING WE'VE GOT!")], 'pause': 1.5},
+        {'kind': 'text', 'lines': [(Fore.CYAN, "\nPhase 1: GRAPPLING HOOKS!")]},
+        {'kind': 'typed', 'words': ["L", "R"], 'prompt': "Duck LEFT or RIGHT? (L/R)", 'damage': 10,
+         'success': "✓ Dodged!", 'fail': "🪝 Hooked! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase 2: CANNON FIRE!"),
+                                   (Fore.YELLOW, "Press ENTER when you see the shot!")], 'pause': 0.7},
+        {'kind': 'reaction', 'wait': (1, 2.5), 'signal': "💥 BOOM! 💥", 'tiers': [(0.8, 0)], 'damage': 15,
+         'fail': "💣 Hit! ({elapsed:.2f}s) (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPhase 3: BOARDING PARTY!")], 'pause': 0.7},
+        {'kind': 'typed', 'word': "FIGHT", 'prompt': "Fight them off! Type 'FIGHT':", 'damage': 12,
+         'success': "✓ Repelled!", 'fail': "⚔️  Overwhelmed! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ LEGENDARY DEFENSE! ★★★",
+}
+
+
+# ===== KRAKEN ATTACK PATTERNS =====
+# ===== JÖRMUNGANDR ATTACKS =====
+
+JORMUNGANDR_WORLD_COIL_PATTERN = {
+    'intro': (Fore.MAGENTA, "🐍 THE WORLD SERPENT COILS AROUND YOU! 🐍"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Break free before you're crushed! Match the sequence!"),
+                                   (Fore.CYAN, "Memorize the escape sequence:")], 'pause': 1},
+        {'kind': 'sequence', 'length': 6, 'keys': ['↑', '↓', '←', '→'], 'separator': ' ', 'joiner': '  ',
+         'typed': {'↑': 'UP', '↓': 'DOWN', '←': 'LEFT', '→': 'RIGHT'},
+         'show': " {keys}", 'hide_after': 4.5, 'cover': [(Fore.LIGHTBLACK_EX, "█" * 50)],
+         'prompt': "Enter the sequence (use: up, down, left, right), e.g. up down left right",
+         'damage': 35, 'per_correct': 5, 'success': "✓ Perfect! You broke free from the serpent's grip!",
+         'fail': "Partially escaped! {correct}/{total} correct (-{damage} HP)"},
+    ],
+}
+
+
+JORMUNGANDR_VENOM_RAIN_PATTERN = {
+    'intro': (Fore.GREEN, "☠️ JÖRMUNGANDR'S VENOM RAINS DOWN! ☠️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Dodge the poisonous drops! Watch carefully!")], 'pause': 1},
+        {'kind': 'projectiles', 'volleys': 5, 'lanes': 7, 'per_volley': 4, 'symbol': '☠️', 'warn': 0,
+         'label': "💧 Venom Wave {n}!", 'prompt': "Choose safe spot (1-7):", 'damage': 8, 'delay': 0.4,
+         'success': "✓ Safe!", 'fail': "💥 BURNED BY VENOM! (-{damage} HP)"},
+    ],
+    'perfect': "★ FLAWLESS! No venom touched you! ★",
+}
+
+
+JORMUNGANDR_TIDAL_WAVE_PATTERN = {
+    'intro': (Fore.BLUE, "🌊 THE WORLD SERPENT THRASHES - CREATING COLOSSAL WAVES! 🌊"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Swim to stay afloat! Press ENTER repeatedly!")], 'pause': 1},
+        {'kind': 'mash', 'key': '\r', 'target': 20, 'time_limit': 6, 'damage': 30, 'per_press': 1,
+         'prompt': "Press ENTER {target} times!", 'success': "✓ You survived the waves!",
+         'fail': "Struggled against the current! (-{damage} HP)"},
+    ],
+}
+
+
+JORMUNGANDR_RAGNAROK_FURY_PATTERN = {
+    'intro': (Fore.RED, "⚡ RAGNARÖK FURY - THE WORLD-ENDING STRIKE! ⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTRED_EX, "The serpent channels the power of Ragnarök itself!"),
+                                   (Fore.YELLOW, "Solve the Norse rune puzzle to deflect the attack!")], 'pause': 1.5},
+        {'kind': 'math', 'operands': [(1, 5), (1, 5), (1, 5)], 'weights': [2, 1, -1],
+         'lines': [(Fore.CYAN, "\nRune values:"), (Fore.WHITE, "  ᚠ = {0}"), (Fore.WHITE, "  ᚢ = {1}"),
+                   (Fore.WHITE, "  ᚦ = {2}"), (Fore.YELLOW, "\nSolve: (ᚠ × 2) + ᚢ - ᚦ = ?"),
+                   (Fore.LIGHTBLACK_EX, "You have 8 seconds!")],
+         'time_limit': 8, 'damage': 25, 'late_damage': 45, 'invalid_damage': 45,
+         'success': "★ PERFECT! You deflected Ragnarök itself! ★",
+         'fail': "Close, but not quite! (Answer was {answer}) (-{damage} HP)",
+         'late': "⏱️ Too slow! The fury overwhelms you! (-{damage} HP)",
+         'invalid': "💥 The fury strikes! (-{damage} HP)"},
+    ],
+}
+
+
+JORMUNGANDR_SERPENT_GAZE_PATTERN = {
+    'intro': (Fore.MAGENTA, "👁️ THE SERPENT'S ANCIENT GAZE LOCKS ONTO YOU! 👁️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Don't be mesmerized! Focus and type the word correctly!")], 'pause': 1},
+        {'kind': 'typed', 'words': ["MIDGARD", "YGGDRASIL", "RAGNAROK", "VALHALLA", "ASGARD",
+                                    "SERPENT", "JORMUNGANDR", "FENRIR", "THOR", "ODIN"],
+         'tell': [(Fore.CYAN, "\nRemember this word:"), (Fore.GREEN, "  {word}  ")], 'memorize': 2,
+         'cover': [(Fore.LIGHTBLACK_EX, "\n▒▓░▒▓░▒▓░▒▓\n")],
+         'prompt': "Type the original word:", 'damage': 20,
+         'success': "✓ You resisted the serpent's gaze!",
+         'fail': "The gaze weakened you! (Correct word: {word}) (-{damage} HP)"},
+    ],
+}
+
+
+JORMUNGANDR_TAIL_WHIP_PATTERN = {
+    'intro': (Fore.YELLOW, "⚡ THE SERPENT'S TAIL WHIPS AROUND! ⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Quick! React to avoid it!")], 'pause': 1},
+        {'kind': 'typed', 'words': [("TOP", "DUCK"), ("BOTTOM", "JUMP"), ("RIGHT", "LEFT"), ("LEFT", "RIGHT")],
+         'wait': (0.5, 0.5), 'tell': [(Fore.RED, "Tail coming from the {tell}!")],
+         'prompt': "Type '{word}' quickly!", 'time_limit': 2, 'damage': 25, 'late_damage': 10,
+         'success': "✓ Lightning reflexes!", 'late': "Too slow! Grazed by the tail! (-{damage} HP)",
+         'fail': "💥 Hit! (-{damage} HP)"},
+    ],
+}
+
+
+# ===== ÆGIR ATTACKS =====
+
+AEGIR_ICEBERG_CRASH_PATTERN = {
+    'intro': (Fore.CYAN, "🧊 ICEBERG CRASH! 🧊"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Ægir summons colossal icebergs from the depths!")], 'pause': 1},
+        {'kind': 'typed', 'rounds': 4, 'words': [("LEFT", "RIGHT"), ("RIGHT", "LEFT")],
+         'tell': [(Fore.RED, "\n💥 Iceberg from the {tell}!")], 'time_limit': 2, 'delay': 0.5, 'success': "✓ Dodged!", 'late': "Too slow! Clipped by ice!", 'fail': "💥 CRASH!",
+         'score': [(1, 0), (0.75, 30), (0.5, 40), (0, 45)]},
+    ],
+    'perfect': "🎯 Perfect dodges! The Sea Giant laughs heartily!",
+}
+
+
+AEGIR_FROZEN_TIDE_PATTERN = {
+    'intro': (Fore.CYAN, "❄️ FROZEN TIDE! ❄️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "A massive wave of ice water rises!"),
+                                   (Fore.YELLOW, "Type the words quickly to break through!")], 'pause': 1},
+        {'kind': 'typed', 'words': ['FROST', 'GLACIER', 'STORM', 'WINTER'], 'in_order': True,
+         'prompt': "\n❄️  {word}", 'time_limit': 3.0, 'delay': 0.4,
+         'success': "✓ Ice shattered!", 'late': "Correct but slow! Partially frozen!", 'fail': "✗ Frozen solid!",
+         'score': [(1, 5), (0.75, 30), (0.5, 40), (0, 50)]},
+    ],
+}
+
+
+AEGIR_AURORA_BEAM_PATTERN = {
+    'intro': (Fore.MAGENTA, "✨ AURORA BEAM! ✨"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Ægir channels the northern lights!"),
+                                   (Fore.YELLOW, "Watch the pattern, then repeat it!")], 'pause': 1.5},
+        {'kind': 'sequence', 'length': 5, 'keys': ['RED', 'GREEN', 'BLUE', 'YELLOW'], 'separator': ' ',
+         'show': "\n✨ Aurora Pattern: {keys}", 'hide_after': 4.5,
+         'cover': [(Fore.MAGENTA, "✨" * 20)], 'prompt': "Repeat the pattern! (e.g. RED BLUE GREEN ...)",
+         'score': [(0.8, 25), (0.6, 35), (0, 55)],
+         'success': "🎯 Perfect! Ægir roars with approval!",
+         'fail': "✗ {correct}/{total} colors right! It was {answer}! (-{damage} HP)"},
+    ],
+}
+
+
+# ===== KRAKEN ATTACKS =====
+
+KRAKEN_TENTACLE_SLAM_PATTERN = {
+    'intro': (Fore.MAGENTA, "🐙 TENTACLES RISE FROM THE DEPTHS! 🐙"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Watch the tentacles and dodge!")], 'pause': 1},
+        {'kind': 'projectiles', 'volleys': 6, 'lanes': 5, 'per_volley': 2, 'symbol': '🐙',
+         'label': "Slam #{n}!", 'prompt': "Safe position? (1-5):", 'warn': 0, 'damage': 10,
+         'success': "✓ Safe!", 'fail': "💥 CRUSHED! (-{damage} HP)"},
+    ],
+    'perfect': "★ PERFECT! Dodged all tentacles! ★",
+}
+
+
+KRAKEN_INK_CLOUD_PATTERN = {
+    'intro': (Fore.LIGHTBLACK_EX, "💨 THE KRAKEN RELEASES INK! 💨"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Memorize the safe path before the ink clouds your vision!")], 'pause': 1},
+        {'kind': 'sequence', 'length': 7, 'keys': "123456789", 'distinct': True, 'separator': ' ', 'joiner': '] [',
+         'show': "SAFE PATH: [{keys}]", 'hide_after': 4, 'cover': [(Fore.LIGHTBLACK_EX, "█" * 40)] * 3,
+         'prompt': "Enter the path (numbers separated by spaces):", 'damage': 20, 'per_correct': 2,
+         'success': "✓ Perfect memory! Navigated through!",
+         'fail': "Got {correct}/{total} correct (-{damage} HP)"},
+    ],
+}
+
+
+KRAKEN_WHIRLPOOL_GRAB_PATTERN = {
+    'intro': (Fore.BLUE, "🌀 THE KRAKEN CREATES A MASSIVE WHIRLPOOL! 🌀"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "You're being pulled in! Swim against the current!")], 'pause': 1},
+        {'kind': 'mash', 'target': 15, 'time_limit': 5, 'damage': 25, 'per_press': 1,
+         'success': "✓ Escaped!", 'fail': "💥 Pulled under! Only {presses}/{target} (-{damage} HP)"},
+    ],
+}
+
+
+KRAKEN_BEAK_STRIKE_PATTERN = {
+    'intro': (Fore.RED, "🦑 THE KRAKEN'S BEAK STRIKES! 🦑"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The creature lunges at you with its massive beak!")], 'pause': 1},
+        {'kind': 'animate', 'frames': [" " * (7 - i) + "🐙" + " " * i for i in range(6)],
+         'color': Fore.MAGENTA, 'delay': 0.2},
+        {'kind': 'choice', 'prompt': "DODGE WHICH WAY?", 'options': ["UP", "DOWN", "LEFT", "RIGHT"],
+         'time_limit': 2, 'damage': 22, 'late_damage': 28, 'success': "✓ Dodged the beak!",
+         'fail': "💥 Wrong direction! The beak got you! (-{damage} HP)",
+         'late': "💥 Too slow! Bitten! (-{damage} HP)"},
+    ],
+}
+
+
+KRAKEN_CRUSHING_GRIP_PATTERN = {
+    'intro': (Fore.MAGENTA, "🐙 TENTACLES WRAP AROUND YOU! 🐙"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "You're caught in the Kraken's crushing grip!")], 'pause': 1},
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Press the correct keys to break free!")], 'pause': 1},
+        {'kind': 'typed', 'rounds': 4,
+         'words': [("UP ⬆️", "W"), ("LEFT ⬅️", "A"), ("DOWN ⬇️", "S"), ("RIGHT ➡️", "D")],
+         'label': "Phase {n}: Press '{word}' ({tell})",
+         'charge': {'frames': ["SQUEEZING! " + "◉" * i for i in range(1, 4)], 'color': Fore.RED, 'delay': 0.2},
+         'prompt': "Break free!", 'damage': 8, 'success': "✓ Loosened!", 'fail': "💥 CRUSHED! (-{damage} HP)"},
+    ],
+    'perfect': "★ FREED YOURSELF! ★",
+}
+
+
+KRAKEN_TIDAL_FURY_PATTERN = {
+    'intro': (Fore.RED, "🌊🐙 RELEASE THE KRAKEN'S FURY! 🐙🌊"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "THE KRAKEN: *Roars from the abyss*")], 'pause': 2},
+        {'kind': 'text', 'lines': [(Fore.CYAN, "\nPhase 1: TENTACLE BARRAGE!")]},
+        {'kind': 'typed', 'rounds': 3, 'words': ["1", "2", "3"], 'avoid': True,
+         'tell': [(Fore.YELLOW, "Tentacle {n} strikes position {word}!")], 'prompt': "Dodge to? (1/2/3):",
+         'damage': 8, 'success': "✓ Dodged!", 'fail': "💥 Hit!"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLACK_EX, "\nPhase 2: INK STORM!")]},
+        {'kind': 'sequence', 'length': 3, 'show': "Remember: {keys}", 'hide_after': 2,
+         'cover': [(Fore.LIGHTBLACK_EX, "████████████")], 'prompt': "Type sequence:", 'damage': 12,
+         'success': "✓ Navigated!", 'fail': "💥 Lost! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPhase 3: THE BEAK DESCENDS!")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "SWIM", 'time_limit': 2.5, 'damage': 15, 'prompt': "Type 'SWIM' to escape!",
+         'success': "✓ Escaped!", 'fail': "💥 STRUCK! (-{damage} HP)", 'late': "💥 STRUCK! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ LEGENDARY SURVIVAL! ★★★",
+}
+
+
+# ===== CTHULHU ATTACK PATTERNS =====
+CTHULHU_MADNESS_GAZE_PATTERN = {
+    'intro': (Fore.MAGENTA, "👁️ THE DREAMING GOD'S GAZE FALLS UPON YOU! 👁️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Phase 1: ELDER SYMBOLS BURN YOUR MIND!\n")]},
+        {'kind': 'recall', 'symbols': ['⊗', '⊕', '⊙', '⊛', '⊚', '◉', '◎'], 'remember': 3, 'memorize': 2.5,
+         'cover': [(Fore.LIGHTBLACK_EX, "█" * 60)] * 5, 'damage': 15,
+         'success': "✓ Your mind holds firm!", 'fail': "💥 MADNESS SEEPS IN! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTMAGENTA_EX, "\nPhase 2: THE WHISPERS... THEY'RE GETTING LOUDER...")],
+         'pause': 1},
+        {'kind': 'choice', 'pool': ["PH'NGLUI", "MGLW'NAFH", "CTHULHU", "R'LYEH", "WGAH'NAGL", "FHTAGN"], 'pick': 3,
+         'garble': (2, 4), 'tell': "The whispers speak: {garbled}", 'prompt': "What word do they utter?",
+         'damage': 12, 'success': "✓ You comprehend the madness!", 'fail': "💥 THE WORDS BURN! (-{damage} HP)"},
+    ],
+    'perfect': "★ YOUR SANITY HOLDS! ★",
+    'summary': [(None, Fore.LIGHTBLACK_EX, "*You feel... different... wrong...*")],
+}
+
+
+CTHULHU_TENTACLE_RLYEH_PATTERN = {
+    'intro': (Fore.GREEN, "🐙 TENTACLES RISE FROM R'LYEH! 🐙"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Massive tentacles breach the surface!"),
+                                   (Fore.CYAN, "Navigate to safety!\n")]},
+        {'kind': 'animate', 'frames': ["Rising" + "." * i for i in range(6)], 'color': Fore.LIGHTBLACK_EX, 'delay': 0.2},
+        {'kind': 'grid', 'size': 5, 'marks': 8, 'mark': "🐙", 'mark_color': Fore.GREEN,
+         'prompt': "Choose a safe position (row, col) - e.g., '2 3':", 'damage': 20,
+         'success': "✓ You find a safe spot!", 'fail': "💥 TENTACLE CRUSHES YOU! (-{damage} HP)",
+         'outside': "💥 OUT OF BOUNDS! GRABBED! (-{damage} HP)", 'invalid': "💥 CONFUSION! GRABBED! (-{damage} HP)"},
+    ],
+}
+
+
+CTHULHU_DREAM_PARALYSIS_PATTERN = {
+    'intro': (Fore.CYAN, "😴 YOU ENTER THE DREAMING GOD'S NIGHTMARE! 😴"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTMAGENTA_EX, "Reality bends... time flows strangely..."),
+                                   (Fore.YELLOW, "You must act QUICKLY before you're trapped forever!\n")]},
+        {'kind': 'typed', 'in_order': True, 'time_limit': 2.0, 'damage': 6, 'prompt': "{tell}",
+         'words': [("Type 'WAKE' to resist!", "WAKE"), ("Type 'FIGHT' against the dream!", "FIGHT"),
+                   ("Type 'RUN' from the nightmare!", "RUN"), ("Type 'BREAK' free from paralysis!", "BREAK")],
+         'success': "✓ Success!", 'fail': "💥 WRONG! Paralysis spreads! (-{damage} HP)",
+         'late': "💥 TOO SLOW! The dream takes hold! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nTHE DREAM COLLAPSES!")]},
+        {'kind': 'mash', 'target': 15, 'time_limit': 5, 'damage': 15,
+         'prompt': "Mash SPACE {target} times in 5 seconds to escape!",
+         'success': "✓ YOU BREAK FREE FROM THE DREAM!", 'fail': "💥 TRAPPED! Only {presses}/{target}! (-{damage} HP)"},
+    ],
+    'perfect': "★ YOU RESISTED THE DREAMING GOD! ★",
+}
+
+
+CULTIST_WAVE_STEP = {
+    'kind': 'typed', 'rounds': 3, 'words': ["A"], 'keypress': True, 'time_limit': 1.5,
+    'prompt': "Attack! (Press A):", 'success': "✓ HIT!", 'fail': "💥 The cultist strikes!",
+    'late': "💥 The cultist strikes!",
+    # 5 HP per missed attack, plus 8 if the cultist survives the wave
+    'score': [(1, 0), (0.6, 13), (0.3, 18), (0, 23)],
+}
+
+
+CTHULHU_CULTIST_SUMMON_PATTERN = {
+    'intro': (Fore.LIGHTBLACK_EX, "🐟 CULTIST FISH SWARM FROM THE DEPTHS! 🐟"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "*Cthulhu's will commands the Deep Ones!*"),
+                                   (Fore.YELLOW, "Defeat the cultist fish!\n")]},
+        dict(CULTIST_WAVE_STEP, label="Wave 1: Cultist approaches!"),
+        dict(CULTIST_WAVE_STEP, label="Wave 2: Cultist approaches!"),
+        dict(CULTIST_WAVE_STEP, label="Wave 3: Cultist approaches!"),
+    ],
+    'perfect': "★ ALL CULTISTS VANQUISHED! ★",
+}
+
+
+# ===== IFRIT ATTACK PATTERNS =====
+IFRIT_LAVA_GEYSER_PATTERN = {
+    'intro': (Fore.RED, "🌋 LAVA GEYSERS ERUPT FROM THE LAKE! 🌋"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Phase 1: VOLCANIC TREMORS!"),
+                                   (Fore.CYAN, "Watch the pattern of tremors and predict where geysers will erupt!\n")]},
+        {'kind': 'grid', 'size': 5, 'marks': 4, 'spread': True, 'mark': "⚠️ ", 'memorize': 2,
+         'prompt': "Geysers erupt next to tremors! Choose a safe spot (row col):", 'damage': 18,
+         'success': "✓ You found a safe spot!", 'fail': "💥 LAVA GEYSER! (-{damage} HP)",
+         'outside': "💥 OUT OF BOUNDS! BURNED! (-{damage} HP)", 'invalid': "💥 CONFUSION! ENGULFED! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTRED_EX, "\nPhase 2: ERUPTION SEQUENCE!")], 'pause': 0.5},
+        {'kind': 'sequence', 'length': 4, 'show': "Dodge pattern: {keys}", 'hide_after': 2.5,
+         'cover': [(Fore.RED, "🔥" * 10)], 'prompt': "Type the sequence:", 'damage': 15,
+         'success': "✓ Dodged!", 'fail': "💥 SCORCHED! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT EVASION! ★★★",
+}
+
+
+IFRIT_SCORCHING_BREATH_PATTERN = {
+    'intro': (Fore.LIGHTYELLOW_EX, "🔥 IFRIT UNLEASHES SCORCHING BREATH! 🔥"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "A wave of flames approaches!"),
+                                   (Fore.YELLOW, "You must dive deep to avoid it!\n")]},
+        {'kind': 'typed', 'word': "DIVE", 'prompt': "Type 'DIVE' when ready, then hold your breath!", 'damage': 25,
+         'success': "You plunge beneath the surface!", 'fail': "💥 FAILED TO DIVE! INCINERATED! (-{damage} HP)"},
+        {'kind': 'hold', 'if_dodged': True, 'seconds': 3, 'need': 2.5, 'damage': 20,
+         'prompt': "Hold SPACE for 3 seconds to stay underwater!", 'success': "✓ You stayed submerged!",
+         'fail': "💥 SURFACED TOO EARLY! BURNED! (-{damage} HP)"},
+    ],
+}
+
+
+IFRIT_OBSIDIAN_SHARD_STORM_PATTERN = {
+    'intro': (Fore.LIGHTBLACK_EX, "⬛ OBSIDIAN SHARDS RAIN FROM ABOVE! ⬛"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Sharp shards of volcanic glass fall like deadly rain!"),
+                                   (Fore.CYAN, "Deflect them by timing your blocks!\n")]},
+        {'kind': 'reaction', 'rounds': 6, 'label': "Shard {n}/{rounds} incoming!", 'wait': (0.8, 1.5),
+         'signal': "BLOCK NOW!", 'key': ' ', 'tiers': [(0.5, 0)], 'damage': 5,
+         'success': "✓ Blocked!", 'fail': "💥 Too slow or wrong key! (-{damage} HP)"},
+    ],
+    'perfect': "★ PERFECT DEFENSE! ★",
+}
+
+
+IFRIT_MAGMA_WHIP_PATTERN = {
+    'intro': (Fore.RED, "🔥 MAGMA TENDRILS LASH OUT! 🔥"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Ifrit extends burning tendrils of molten rock!"),
+                                   (Fore.CYAN, "Dodge left (A) or right (D)!\n")]},
+        {'kind': 'typed', 'rounds': 5, 'words': [("LEFT", "A"), ("RIGHT", "D")], 'keypress': True,
+         'tell': [(Fore.RED, "Tendril {n} whips {tell}!")], 'prompt': "Dodge quick!", 'time_limit': 0.8,
+         'damage': 6, 'delay': 0.4, 'success': "✓ Dodged!", 'fail': "💥 Wrong direction! (-{damage} HP)",
+         'late': "💥 Too slow! Struck! (-{damage} HP)"},
+    ],
+}
+
+
+IFRIT_VOLCANIC_FURY_PATTERN = {
+    'intro': (Fore.LIGHTRED_EX, "🌋🔥 VOLCANIC FURY - THE LAKE BECOMES HELL! 🔥🌋"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "*The entire volcanic lake ignites in fury!*"),
+                                   (Fore.YELLOW, "*The water itself begins to boil!*\n"),
+                                   (Fore.LIGHTRED_EX, "Phase 1: INFERNO MAZE!"),
+                                   (Fore.CYAN, "Navigate through the flames: ")]},
+        {'kind': 'sequence', 'length': 6, 'show': "{keys}", 'hide_after': 3, 'cover': [(Fore.RED, "🔥" * 30)] * 10,
+         'prompt': "Type the path:", 'damage': 25, 'success': "✓ Navigated!",
+         'fail': "💥 LOST IN THE INFERNO! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTYELLOW_EX, "\nPhase 2: EXTREME HEAT!")], 'pause': 0.5},
+        {'kind': 'mash', 'target': 25, 'time_limit': 6, 'damage': 40,
+         'prompt': "Mash SPACE to swim toward safety!", 'success': "✓ YOU ESCAPE THE VOLCANIC FURY!",
+         'fail': "💥 CAUGHT IN THE INFERNO! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nPhase 3: FINAL ERUPTION!")]},
+        {'kind': 'typed', 'word': "SHIELD", 'time_limit': 2.0, 'damage': 20,
+         'prompt': "Type 'SHIELD' to protect yourself!", 'success': "✓ Protected!",
+         'fail': "💥 VOLCANIC BLAST! (-{damage} HP)", 'late': "💥 VOLCANIC BLAST! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ LEGENDARY SURVIVAL! YOU WITHSTOOD THE FURY! ★★★",
+}
+
+
+# ===== MEGALODON'S GHOST ATTACKS =====
+MEGALODON_PHANTOM_BITE_PATTERN = {
+    'intro': (Fore.LIGHTCYAN_EX, "👻🦈 PHANTOM BITE! 👻🦈"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "The spectral Megalodon phases through the lava!"),
+                                   (Fore.YELLOW, "Its ghostly jaws open wide!\n")]},
+        {'kind': 'typed', 'rounds': 3, 'words': [("UP", "W"), ("DOWN", "S"), ("LEFT", "A"), ("RIGHT", "D")],
+         'keypress': True, 'label': "Bite {n}/{rounds} approaching!",
+         'tell': [(Fore.LIGHTBLACK_EX, "💭 The phantom lunges from the {tell}!")],
+         'prompt': "Dodge! Press the correct key:", 'time_limit': 1.0, 'damage': 12, 'delay': 0.5,
+         'success': "✓ Dodged the spectral jaws!", 'fail': "💥 WRONG DIRECTION! Bitten! (-{damage} HP)",
+         'late': "💥 TOO SLOW! The ghost bites! (-{damage} HP)"},
+    ],
+    'perfect': "★ PERFECT EVASION! The phantom cannot touch you! ★",
+}
+
+
+MEGALODON_PRIMAL_RAGE_PATTERN = {
+    'intro': (Fore.LIGHTRED_EX, "⚡🦈 PRIMAL RAGE! 🦈⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "*The ancient predator remembers its hunting glory!*"),
+                                   (Fore.YELLOW, "*The spectral shark becomes a whirlwind of teeth and fury!*\n"),
+                                   (Fore.LIGHTYELLOW_EX, "INCOMING FRENZY!"),
+                                   (Fore.CYAN, "Follow the dodge sequence:")]},
+        {'kind': 'sequence', 'length': 5, 'show': "{keys}", 'hide_after': 2.5,
+         'cover': [(Fore.LIGHTCYAN_EX, "👻" * 30)] * 8, 'prompt': "Type the dodge sequence:", 'damage': 25,
+         'success': "✓ Dodged the frenzy!", 'fail': "💥 CAUGHT IN THE RAGE! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTCYAN_EX, "\nThe ghost circles you...")], 'pause': 0.5},
+        {'kind': 'hold', 'seconds': 3, 'need': 2.5, 'damage': 20, 'prompt': "Hold SPACE to brace yourself!",
+         'success': "✓ You withstood the rage!", 'fail': "💥 OVERWHELMED BY FURY! (-{damage} HP)"},
+    ],
+    'perfect': "★★ SURVIVED THE PRIMAL RAGE! ★★",
+}
+
+
+MEGALODON_TECTONIC_TREMOR_PATTERN = {
+    'intro': (Fore.YELLOW, "🌋🦈 TECTONIC TREMOR! 🦈🌋"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "*The Megalodon's spectral form slams into the lake floor!*"),
+                                   (Fore.YELLOW, "*The volcanic earth cracks and splits!*"),
+                                   (Fore.LIGHTRED_EX, "*Lava erupts from the fissures!*\n"),
+                                   (Fore.LIGHTYELLOW_EX, "Phase 1: EARTHQUAKE!"),
+                                   (Fore.CYAN, "Stay balanced by timing your movements!\n")]},
+        {'kind': 'reaction', 'rounds': 4, 'label': "Tremor wave {n}/{rounds}!", 'wait': (0.6, 1.2),
+         'signal': "STEADY NOW!", 'key': ' ', 'tiers': [(0.6, 0)], 'damage': 8,
+         'success': "✓ Balanced!", 'fail': "💥 FELL! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTRED_EX, "\nPhase 2: LAVA ERUPTIONS!"),
+                                   (Fore.YELLOW, "Avoid the molten spray! Type 'JUMP' when the lava erupts!")]},
+        {'kind': 'typed', 'word': "JUMP", 'rounds': 3, 'label': "Fissure {n} opening...", 'wait': (1.0, 1.8),
+         'prompt': "🌋 ERUPTION! ", 'time_limit': 1.5, 'damage': 10, 'delay': 0.4,
+         'success': "✓ Avoided the lava!", 'fail': "💥 BURNED! (-{damage} HP)", 'late': "💥 BURNED! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT STABILITY! You rode out the tremor! ★★★",
+}
+
+
+CTHULHU_ULTIMATE_AWAKENING_PATTERN = {
+    'intro': (Fore.RED, "💀 CTHULHU STIRS! THE STARS ARE RIGHT! 💀"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "*The Great Old One's eyes begin to open...*"),
+                                   (Fore.YELLOW, "*Reality itself trembles!*\n"),
+                                   (Fore.LIGHTMAGENTA_EX, "Phase 1: THE COSMIC HORROR REVEALED!")]},
+        {'kind': 'typed', 'word': "CLOSE", 'time_limit': 2.0, 'damage': 18,
+         'prompt': "Look away! (Type 'CLOSE' in 2 seconds):", 'success': "✓ You shield your eyes!",
+         'fail': "💥 THE SIGHT BURNS YOUR MIND! (-{damage} HP)",
+         'late': "💥 THE SIGHT BURNS YOUR MIND! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.GREEN, "\nPhase 2: THE SUNKEN CITY RISES!"),
+                                   (Fore.YELLOW, "Pillars of R'lyeh crash down!")], 'pause': 1},
+        {'kind': 'typed', 'words': [str(n) for n in range(10)], 'prompt': "Move to position 0-9:", 'damage': 15,
+         'success': "✓ Dodged!", 'fail': "💥 CRUSHED BY ANCIENT STONE! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase 3: THE CALL OF CTHULHU!"),
+                                   (Fore.YELLOW, "Resist by typing the OPPOSITE of what appears!\n")], 'pause': 1},
+        {'kind': 'typed', 'words': [("SLEEP", "WAKE"), ("OBEY", "RESIST"), ("SUBMIT", "FIGHT"), ("JOIN", "FLEE")],
+         'tell': [(Fore.RED, "Command: {tell}")], 'prompt': "You must type:", 'damage': 20,
+         'success': "✓ YOU RESIST THE CALL!", 'fail': "💥 YOUR WILL CRUMBLES! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ IMPOSSIBLE! YOU SURVIVED THE AWAKENING! ★★★\n*Cthulhu returns to his slumber... for now...*",
+    'summary': [(None, Fore.LIGHTBLACK_EX, "*Your mind will never be the same...*")],
+}
+
+
+# ===== FROST WYRM ATTACKS =====
+
+FROST_WYRM_BLIZZARD_BREATH_PATTERN = {
+    'intro': (Fore.CYAN, "❄️ BLIZZARD BREATH! ❄️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTCYAN_EX, "The Frost Wyrm inhales deeply..."),
+                                   (Fore.YELLOW, "Its chest glows with icy light!")], 'pause': 1},
+        {'kind': 'text', 'lines': [(Fore.CYAN, "\nDodge the freezing waves!")], 'pause': 0.5},
+        {'kind': 'projectiles', 'volleys': 4, 'lanes': 5, 'per_volley': 3, 'symbol': '❄️', 'warn': 0,
+         'label': "Ice Wave #{n}!", 'prompt': "Safe position? (1-5):", 'damage': 12, 'delay': 0.4,
+         'success': "✓ Avoided the ice!", 'fail': "❄️ FROZEN! (-{damage} HP)"},
+    ],
+    'perfect': "★ PERFECT! You're immune to the cold! ★",
+}
+
+
+FROST_WYRM_ICE_SPIKE_BARRAGE_PATTERN = {
+    'intro': (Fore.LIGHTBLUE_EX, "🔷 ICE SPIKE BARRAGE! 🔷"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Ice spikes form beneath the frozen lake!"),
+                                   (Fore.YELLOW, "Watch where they appear, then find safe ground!")], 'pause': 1.5},
+        {'kind': 'safe_zones', 'zones': 9, 'safe': 4, 'first': 1, 'hazards': ['🔷'], 'safe_symbol': '  ',
+         'memorize_text': "\n❄️ ICE SPIKES FORMING:", 'memorize': 2,
+         'cover': [(Fore.LIGHTBLUE_EX, "❄️" * 30), (Fore.CYAN, "\nThe ice clouds your vision!")],
+         'prompt': "Which position is SAFE? (1-9):", 'damage': 25,
+         'success': "✓ Safe spot! You avoided the spikes!", 'fail': "🔷 IMPALED BY ICE! (-{damage} HP)"},
+    ],
+}
+
+
+FROST_WYRM_PERMAFROST_PRISON_PATTERN = {
+    'intro': (Fore.BLUE, "🧊 PERMAFROST PRISON! 🧊"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTCYAN_EX, "The Frost Wyrm roars!"),
+                                   (Fore.CYAN, "Ice forms around you - you're being frozen solid!")], 'pause': 1},
+        {'kind': 'mash', 'target': 20, 'time_limit': 6, 'damage': 30, 'per_press': 1,
+         'prompt': "BREAK FREE! Press SPACE rapidly!", 'success': "✓ BROKE FREE!",
+         'fail': "❄️ FROZEN SOLID! Only {presses}/{target} (-{damage} HP)\n*You're encased in ancient ice...*"},
+    ],
+}
+
+
+# ===== STELLAR LEVIATHAN (COSMIC SPACE WHALE) ATTACKS =====
+
+STELLAR_LEVIATHAN_GRAVITY_WAVES_PATTERN = {
+    'intro': (Fore.LIGHTMAGENTA_EX, "🌌 GRAVITY WAVES RIPPLE THROUGH SPACE! 🌌"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "The Stellar Leviathan warps space around itself!"),
+                                   (Fore.YELLOW, "Phase 1: GRAVITATIONAL CURRENTS!\n")]},
+        {'kind': 'grid', 'size': 5, 'title': "Gravity field visualization:", 'center': "🐋 ", 'water': "· ",
+         'rings': [(1, 25, Fore.RED, "⚠️ "), (2, 12, Fore.YELLOW, "◯ ")], 'memorize': 2, 'damage': 25,
+         'prompt': "Choose a safe position (row col) away from the gravity well:",
+         'success': "✓ Safe from the gravity well!", 'fail': "💫 CAUGHT IN THE GRAVITY FIELD! (-{damage} HP)",
+         'outside': "💫 OUT OF BOUNDS! CRUSHED! (-{damage} HP)", 'invalid': "💫 DISORIENTED! CRUSHED! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTMAGENTA_EX, "\nPhase 2: GRAVITY WAVE PULSE!"),
+                                   (Fore.CYAN, "The whale releases a gravitational shockwave!")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "DIVE", 'time_limit': 2.0, 'damage': 20,
+         'prompt': "Type DIVE to escape below the wave:", 'success': "✓ Dove beneath the wave!",
+         'fail': "💥 HIT BY THE WAVE! (-{damage} HP)", 'late': "💥 HIT BY THE WAVE! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT EVASION! You navigated the gravity field! ★★★",
+}
+
+
+STELLAR_LEVIATHAN_NEBULA_CLOUDS_PATTERN = {
+    'intro': (Fore.MAGENTA, "☁️ NEBULA CLOUDS ENVELOP THE AREA! ☁️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLACK_EX, "Colorful cosmic clouds obscure your vision!"),
+                                   (Fore.CYAN, "Phase 1: FIND THE WHALE!\n")]},
+        {'kind': 'typed', 'words': ["LEFT", "CENTER", "RIGHT"],
+         'tell': [(Fore.LIGHTBLACK_EX, "☁️☁️☁️ Dense nebula clouds ☁️☁️☁️"),
+                  (Fore.LIGHTMAGENTA_EX, "✨ A shimmer in the {word} clouds! ✨"),
+                  (Fore.LIGHTBLACK_EX, "☁️☁️☁️ Dense nebula clouds ☁️☁️☁️")],
+         'prompt': "\nWhere is the Stellar Leviathan? (LEFT/CENTER/RIGHT):", 'damage': 18,
+         'success': "✓ Found it!", 'fail': "💥 WRONG! Attacked from the {word}! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTMAGENTA_EX, "\nPhase 2: NEBULA NAVIGATION!")], 'pause': 0.5},
+        {'kind': 'sequence', 'length': 5, 'show': "Navigate through the clouds: {keys}", 'hide_after': 2,
+         'cover': [(Fore.LIGHTBLACK_EX, "☁️" * 10)], 'prompt': "Type the path:", 'damage': 17,
+         'success': "✓ Navigated through!", 'fail': "💥 LOST IN THE NEBULA! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT CLARITY! You saw through the cosmic veil! ★★★",
+}
+
+
+STELLAR_LEVIATHAN_COSMIC_DEBRIS_PATTERN = {
+    'intro': (Fore.LIGHTCYAN_EX, "☄️ COSMIC DEBRIS STORM! ☄️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The Stellar Leviathan's movement disturbs the asteroid field!"),
+                                   (Fore.CYAN, "Phase 1: ASTEROID DODGE!\n")]},
+        {'kind': 'sequence', 'length': 4, 'keys': ['LEFT', 'RIGHT', 'UP', 'DOWN'], 'separator': ' ', 'joiner': ', ',
+         'typed': {'LEFT': 'RIGHT', 'RIGHT': 'LEFT', 'UP': 'DOWN', 'DOWN': 'UP'},
+         'show': "Incoming debris from: {keys}", 'prompt': "Dodge commands: Type opposites (LEFT→RIGHT, UP→DOWN):",
+         'damage': 28, 'per_correct': 7, 'success': "✓ Perfect dodges!",
+         'fail': "💥 Dodged {correct}/{total}, the rest hit you! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLUE_EX, "\nPhase 2: STARDUST TRAIL!"),
+                                   (Fore.CYAN, "The whale leaves a trail of cosmic dust!")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "SHIELD", 'time_limit': 1.5, 'damage': 15,
+         'prompt': "Type SHIELD to protect yourself:", 'success': "✓ Shielded!",
+         'fail': "✨ COSMIC DUST DAMAGE! (-{damage} HP)", 'late': "✨ COSMIC DUST DAMAGE! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT MANEUVERS! You dodged the debris field! ★★★",
+}
+
+
+STELLAR_LEVIATHAN_STARDUST_SONG_PATTERN = {
+    'intro': (Fore.LIGHTCYAN_EX, "🎵 THE STELLAR LEVIATHAN SINGS! 🎵"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "The whale's song resonates through the cosmos..."),
+                                   (Fore.CYAN, "Phase 1: HARMONIC RESONANCE!\n"),
+                                   (Fore.LIGHTMAGENTA_EX, "Listen to the cosmic melody...")]},
+        {'kind': 'sequence', 'length': 6, 'keys': ['♪', '♫', '♬', '♩'], 'joiner': ' ',
+         'typed': {'♪': '1', '♫': '2', '♬': '3', '♩': '4'}, 'show': "{keys}",
+         'prompt': "Echo the song (use 1=♪, 2=♫, 3=♬, 4=♩):", 'damage': 18,
+         'success': "✓ Perfect harmony!", 'fail': "💥 DISSONANCE! The song damages you! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLUE_EX, "\nPhase 2: COSMIC WISDOM!"),
+                                   (Fore.CYAN, "*The song carries meaning...*"),
+                                   (Fore.LIGHTMAGENTA_EX, "*'This space is my sanctuary...'*")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "RESPECT", 'prompt': "Respond with respect (Type RESPECT):", 'damage': 12,
+         'success': "✓ The Leviathan acknowledges you!", 'fail': "⚡ Your disrespect angers it! (-{damage} HP)"},
+    ],
+    'perfect': "★★★ PERFECT HARMONY! You understood the cosmic song! ★★★",
+}
+
+
+STELLAR_LEVIATHAN_GALACTIC_MAJESTY_PATTERN = {
+    'intro': (Fore.LIGHTMAGENTA_EX, "✨ THE STELLAR LEVIATHAN REVEALS ITS TRUE FORM! ✨"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "*The whale's translucent body illuminates...*"),
+                                   (Fore.LIGHTMAGENTA_EX, "*Galaxies and nebulae swirl within!*"),
+                                   (Fore.LIGHTCYAN_EX, "*This is the majesty of the cosmos itself!*\n"),
+                                   (Fore.MAGENTA, "Phase 1: COSMIC REVELATION!"),
+                                   (Fore.YELLOW, "The sight is overwhelming! Focus your mind!")]},
+        {'kind': 'math', 'operands': [(5, 15), (5, 15)], 'lines': [(Fore.CYAN, "Stay focused: {0} + {1} = ?")],
+         'time_limit': 3, 'damage': 20, 'success': "✓ Mind focused!",
+         'fail': "💫 OVERWHELMED BY COSMIC BEAUTY! (-{damage} HP)",
+         'late': "💫 OVERWHELMED BY COSMIC BEAUTY! (-{damage} HP)",
+         'invalid': "💫 OVERWHELMED BY COSMIC BEAUTY! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLUE_EX, "\nPhase 2: GRAVITATIONAL SURGE!"),
+                                   (Fore.YELLOW, "The whale bends space itself!")], 'pause': 0.5},
+        {'kind': 'sequence', 'length': 7, 'show': "Navigate the distortion: {keys}", 'hide_after': 3,
+         'cover': [(Fore.LIGHTMAGENTA_EX, "✨✨✨ SPACE WARPS ✨✨✨")], 'time_limit': 5, 'damage': 40,
+         'late_damage': 25, 'success': "✓ Navigated the distortion!",
+         'late': "⚡ Too slow! Caught in gravity! (-{damage} HP)",
+         'fail': "💫 CRUSHED BY SPATIAL DISTORTION! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.LIGHTCYAN_EX, "\nPhase 3: STARDUST CASCADE!"),
+                                   (Fore.MAGENTA, "A trail of ancient starlight falls!"),
+                                   (Fore.YELLOW, "Type DIVE repeatedly to avoid (3 times):")], 'pause': 0.5},
+        {'kind': 'typed', 'word': "DIVE", 'rounds': 3, 'time_limit': 1.5, 'damage': 10, 'delay': 0.2,
+         'prompt': "{n}>", 'success': "✓", 'fail': "✗ (-{damage} HP)", 'late': "✗ (-{damage} HP)"},
+    ],
+    'perfect': "★★★ TRANSCENDENT! You witnessed the cosmos unharmed! ★★★",
+}
+
+
+AMALGAMATION_FUSION_STRIKE_PATTERN = {
+    'intro': (Fore.RED, "💀 THE AMALGAMATION SHIFTS FORMS! 💀"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.CYAN, "Phase 1: DEEP DIVE EMERGENCE!")]},
+        {'kind': 'animate', 'frames': ["     💀     ", "     💀~    ", "     ~💀~~  ", "     ~~~💀~ "],
+         'color': Fore.LIGHTBLACK_EX, 'delay': 0.2},
+        {'kind': 'typed', 'words': [str(n) for n in range(5)], 'prompt': "Where will it emerge? (0-4):", 'damage': 20,
+         'success': "✓ Dodged!", 'fail': "💥 Emerged at you! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase 2: TENTACLE BARRAGE!"),
+                                   (Fore.YELLOW, "Mash WASD quickly!")], 'pause': 0.5},
+        {'kind': 'sequence', 'length': 6, 'show': "Enter: {keys}", 'joiner': '', 'time_limit': 3, 'damage': 25,
+         'late_damage': 15, 'success': "✓ Perfect defense!", 'late': "⚡ Too slow! (-{damage} HP)",
+         'fail': "💥 Crushed! (-{damage} HP)"},
+        {'kind': 'text', 'lines': [(Fore.GREEN, "\nPhase 3: RAZOR BITE!")], 'pause': 0.5},
+        {'kind': 'typed', 'words': [("⬆️  UP", "W"), ("⬅️  LEFT", "A"), ("⬇️  DOWN", "S"), ("➡️  RIGHT", "D")],
+         'prompt': "Dodge {tell}! Press '{word}':", 'damage': 15, 'success': "✓ Dodged!",
+         'fail': "💥 Bitten! (-{damage} HP)"},
+    ],
+}
+
+
+AMALGAMATION_ELEMENTAL_CHAOS_PATTERN = {
+    'intro': (Fore.MAGENTA, "🔥❄️☠️ ELEMENTAL CHAOS! 🔥❄️☠️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "FIRE from the left!"), (Fore.CYAN, "ICE from the right!"),
+                                   (Fore.GREEN, "VENOM from above!\n")]},
+        # Blocking the worst element still leaves the other two at half damage
+        {'kind': 'choice', 'options': ["🔥 FIRE", "❄️  ICE", "☠️  VENOM"],
+         'prompt': "Which element do you prioritize defending against?", 'damage': 30, 'blocked': 30,
+         'invalid_damage': 45, 'success': "✓ Blocked the worst of the {answer}! Hit by other elements! (-{damage} HP)",
+         'fail': "💥 The {answer} devastates you! (-{damage} HP)", 'invalid': "💥 Hit by EVERYTHING! (-{damage} HP)"},
+    ],
+}
+
+
+AMALGAMATION_COSMIC_BARRAGE_PATTERN = {
+    'intro': (Fore.LIGHTMAGENTA_EX, "🌌 REALITY FRACTURES! 🌌"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.LIGHTBLACK_EX, "@#$%&*!?" * 7 + "@#$%"),
+                                   (Fore.LIGHTBLACK_EX, "?!*&%$#@" * 7 + "?!*&"),
+                                   (Fore.LIGHTBLACK_EX, "%&@#!?$*" * 7 + "%&@#"),
+                                   (Fore.LIGHTBLACK_EX, "*$?!#@&%" * 7 + "*$?!"),
+                                   (Fore.LIGHTBLACK_EX, "&*%$?!@#" * 7 + "&*%$")], 'delay': 0.1},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nThe Amalgamation speaks in overlapping voices:"),
+                                   (Fore.LIGHTBLACK_EX, "*You... killed... us...*"),
+                                   (Fore.LIGHTBLACK_EX, "*We were guardians...*"),
+                                   (Fore.LIGHTBLACK_EX, "*We protected these waters...*"),
+                                   (Fore.LIGHTBLACK_EX, "*And you... MURDERED US!*")], 'delay': 0.8},
+        {'kind': 'text', 'lines': [(Fore.RED, "\nFocus through the madness!")]},
+        {'kind': 'math', 'operands': [(8, 18), (5, 12)], 'lines': [(Fore.YELLOW, "What is {0} + {1}?")],
+         'time_limit': 4, 'damage': 35, 'late_damage': 20, 'success': "✓ Mental fortitude holds!",
+         'late': "⚡ Correct, but the delay hurt! (-{damage} HP)", 'fail': "💥 Lost in the madness! (-{damage} HP)",
+         'invalid': "💥 Mind shattered! (-{damage} HP)"},
+    ],
+}
+
+
+AMALGAMATION_PIRATE_ASSAULT_PATTERN = {
+    'intro': (Fore.RED, "⚓💀 PHANTOM FLEET ASSAULT! 💀⚓"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Ghostly cannons fire!")]},
+        {'kind': 'lane', 'count': 5, 'width': 10, 'symbol': '💀', 'damage': 12, 'color': Fore.LIGHTBLACK_EX},
+        {'kind': 'dodge', 'prompt': "\nChoose safe position (0-9):", 'miss_damage': 40, 'success': "✓ Safe zone!",
+         'fail': "💥 Hit by {hits} cannons! (-{damage} HP)", 'invalid': "💥 Direct hit! (-40 HP)"},
+    ],
+}
+
+
+AMALGAMATION_MORPHING_ATTACK_PATTERN = {
+    'intro': (Fore.LIGHTBLACK_EX, "*The Amalgamation's flesh begins to ripple...*"),
+    'steps': [
+        # Takes the shape of an earlier guardian and uses that boss's attack
+        {'kind': 'mimic', 'forms': [
+            ("NESSIE'S FURY", "🐉", LOCH_NESS_TIDAL_WAVE_PATTERN),
+            ("RIVER'S WRATH", "🐟", RIVER_WRATH_COMBO_PATTERN),
+            ("IFRIT'S FLAMES", "🔥", IFRIT_LAVA_GEYSER_PATTERN),
+            ("FROST BREATH", "❄️", FROST_WYRM_ICE_SPIKE_BARRAGE_PATTERN),
+            ("KRAKEN'S GRASP", "🦑", KRAKEN_CRUSHING_GRIP_PATTERN),
+            ("PIRATE CANNONS", "⚓", PIRATE_CANNON_BARRAGE_PATTERN),
+        ],
+         'announce': "\n{icon} THE AMALGAMATION MORPHS INTO {name}! {icon}\n",
+         'morph': {'frames': ["     💀     ", "     💀🌀     ", "     🌀💀🌀     ", "     🌀{icon}🌀     ",
+                              "     {icon}     "], 'color': Fore.CYAN, 'delay': 0.3},
+         'then': "\nIt uses the original {name} attack!", 'pause': 1},
+    ],
+}
+
+
+JUDGMENT_STEP = {
+    'kind': 'reaction', 'wait': (0, 0), 'signal': "Press ENTER to survive this phase:",
+    'tiers': [(2, 0)], 'damage': (15, 25), 'success': "✓ Survived!", 'fail': "💥 Too slow! (-{damage} HP)",
+}
+
+
+AMALGAMATION_ULTIMATE_ANNIHILATION_PATTERN = {
+    'intro': (Fore.LIGHTMAGENTA_EX, "💀 ULTIMATE ANNIHILATION 💀"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "=" * 60 + "\n"),
+                                   (Fore.LIGHTBLACK_EX, "*All ten guardians scream as one*"),
+                                   (Fore.LIGHTBLACK_EX, "*Their combined agony tears at reality itself*"),
+                                   (Fore.RED, "*THIS IS YOUR JUDGMENT*")], 'delay': 1},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase: Memory"),
+                                   (Fore.YELLOW, "What was the first guardian you killed?"),
+                                   (Fore.LIGHTBLACK_EX, "▓▒░" * 16 + "▓▒")]},
+        JUDGMENT_STEP,
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase: Guilt"),
+                                   (Fore.YELLOW, "How many lives have you taken?"),
+                                   (Fore.LIGHTBLACK_EX, "░▒▓" * 16 + "░▒")], 'pause': 0.5},
+        JUDGMENT_STEP,
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase: Despair"),
+                                   (Fore.YELLOW, "Was it worth it?"),
+                                   (Fore.LIGHTBLACK_EX, "▒▓░" * 16 + "▒▓")], 'pause': 0.5},
+        JUDGMENT_STEP,
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "\nPhase: Judgment"),
+                                   (Fore.YELLOW, "Do you feel their pain?"),
+                                   (Fore.LIGHTBLACK_EX, "▓░▒" * 16 + "▓░")], 'pause': 0.5},
+        JUDGMENT_STEP,
+    ],
+    'perfect': "★ IMPOSSIBLY, YOU SURVIVED THE ULTIMATE! ★",
+    'summary': [(None, Fore.RED, "The guardians' judgment: {damage} damage!")],
+}
+
+
+AQUATECH_INDUSTRIAL_NETS_PATTERN = {
+    'intro': (Fore.CYAN, "⚙️ AQUATECH DEPLOYS INDUSTRIAL NETS! ⚙️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The mech releases massive metallic nets!"),
+                                   (Fore.RED, "They spread across the battlefield!")]},
+        {'kind': 'typed', 'words': ["LEFT", "CENTER", "RIGHT"],
+         'tell': [(Fore.YELLOW, "\nNets deploy everywhere but the {word} zone!"),
+                  (Fore.GREEN, "[{word}] ✓ SAFE - escape to the safe zone!")],
+         'prompt': "Which zone? (LEFT/CENTER/RIGHT):", 'damage': (35, 50),
+         'success': "\n✓ You dodged the nets!",
+         'fail': "\n✗ You're caught in the industrial net! The metal cables cut into you! (-{damage} HP)"},
+    ],
+}
+
+
+AQUATECH_HARPOON_BARRAGE_PATTERN = {
+    'intro': (Fore.CYAN, "🎯 HARPOON TURRETS ACTIVATED! 🎯"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Multiple harpoon launchers lock onto you!")]},
+        {'kind': 'luck', 'rounds': 3, 'chance': 0.6, 'label': "Harpoon {n} incoming!",
+         'score': [(1, 0), (0.6, (15, 25)), (0, (40, 55))]},
+    ],
+    'perfect': "\n★ Perfect dodge! All harpoons avoided!",
+    'summary': [(26, Fore.YELLOW, "\nYou dodged most of the harpoons! (-{damage} HP)"),
+                (None, Fore.RED, "\nMultiple harpoons hit you! (-{damage} HP)")],
+}
+
+
+AQUATECH_TOXIC_DISCHARGE_PATTERN = {
+    'intro': (Fore.CYAN, "☠️ TOXIC WASTE DISCHARGE! ☠️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The mech dumps industrial chemicals!"),
+                                   (Fore.RED, "Green sludge spreads through the water!\n")]},
+        {'kind': 'choice', 'options': ["SWIM RIGHT", "SWIM UP", "DIVE DOWN", "STAY"],
+         'hints': {"SWIM RIGHT": ["Toxic cloud spreading LEFT!"], "SWIM UP": ["Sludge rising from BELOW!"],
+                   "DIVE DOWN": ["Chemical spray from ABOVE!"]},
+         'prompt': "What do you do?", 'damage': (30, 45), 'invalid_damage': (30, 45),
+         'success': "\n✓ You avoided the toxic discharge!", 'fail': "\n✗ The chemicals burn your skin! (-{damage} HP)",
+         'invalid': "\nHesitation costs you! The toxins hit! (-{damage} HP)"},
+    ],
+}
+
+
+AQUATECH_SONAR_PULSE_PATTERN = {
+    'intro': (Fore.CYAN, "📡 SONAR PULSE DETECTED! 📡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The mech emits a powerful sonar wave!"),
+                                   (Fore.RED, "It's trying to disorient you!\n"),
+                                   (Fore.CYAN, "Counter the frequency by matching the pattern:")]},
+        {'kind': 'sequence', 'length': (4, 6), 'joiner': '', 'show': "Pattern: {keys}", 'prompt': "Enter pattern:",
+         'score': [(0.7, (15, 25)), (0, (35, 50))], 'success': "\n✓ Perfect! You countered the sonar!",
+         'fail': "\nThe sonar overwhelms you! ({correct}/{total} correct) (-{damage} HP)"},
+    ],
+}
+
+
+AQUATECH_HARVESTER_BLADES_PATTERN = {
+    'intro': (Fore.CYAN, "⚙️ HARVESTER BLADES SPINNING! ⚙️"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "Massive industrial blades rev up!"),
+                                   (Fore.RED, "They're designed to process entire schools of fish!\n"),
+                                   (Fore.YELLOW, "The blades strike in sequence!"),
+                                   (Fore.GREEN, "Dodge each one!")]},
+        {'kind': 'typed', 'rounds': 3, 'words': ["HIGH", "MID", "LOW"], 'avoid': True,
+         'tell': [(Fore.RED, "Blade {n} coming at {word} position!")], 'prompt': "Dodge which way? (HIGH/MID/LOW)",
+         'success': "✓ Dodged!", 'fail': "✗ The blade cuts you!",
+         'score': [(1, 0), (0.6, (25, 35)), (0, (50, 70))]},
+    ],
+    'perfect': "★ Perfect! You avoided all the blades!",
+    'summary': [(36, Fore.YELLOW, "You took one hit from the blades! (-{damage} HP)"),
+                (None, Fore.RED, "Multiple blade hits! (-{damage} HP)")],
+}
+
+
+AQUATECH_PHASE1_ULTIMATE_PATTERN = {
+    'intro': (Fore.RED, "💀 MAXIMUM EXTRACTION MODE ACTIVATED! 💀"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "=" * 60 + "\n"),
+                                   (Fore.YELLOW, "The mech's entire body lights up with targeting lasers!"),
+                                   (Fore.YELLOW, "Every weapon system fires at once!"),
+                                   (Fore.RED, "This is the power of industrial-scale destruction!\n")]},
+        {'kind': 'text', 'lines': [(Fore.MAGENTA, "Stage 1: NETS DEPLOYING!"),
+                                   (Fore.MAGENTA, "Stage 2: HARPOONS LOCKING!"),
+                                   (Fore.MAGENTA, "Stage 3: TOXINS RELEASING!"),
+                                   (Fore.MAGENTA, "Stage 4: BLADES SPINNING!\n"),
+                                   (Fore.YELLOW, "You must survive this onslaught!")], 'delay': 0.8},
+        {'kind': 'gamble', 'prompt': "Quick! What's your strategy?", 'damage': (80, 100),
+         'fail': "\nHesitation! You're hit by everything!", 'options': [
+            ("DODGE AGGRESSIVELY", "\nYou dodge frantically through the chaos!",
+             [(0.4, (40, 60), "Your agility saves you from the worst!"),
+              (0.6, (70, 90), "You can't dodge everything!")]),
+            ("DEFEND AND ENDURE", "\nYou brace yourself and endure!",
+             [(1, (60, 80), "The onslaught is brutal, but you survive!")]),
+            ("COUNTER ATTACK", "\nYou attack while defending!",
+             [(0.5, (45, 65), "You destroy some of the incoming attacks!"),
+              (0.5, (75, 95), "You're too exposed! The attacks overwhelm you!")]),
+        ]},
+    ],
+}
+
+
+AQUATECH_PHASE2_ULTIMATE_PATTERN = {
+    'intro': (Fore.RED, "⚡ FINAL HARVEST PROTOCOL! ⚡"),
+    'steps': [
+        {'kind': 'text', 'lines': [(Fore.RED, "=" * 60 + "\n"),
+                                   (Fore.YELLOW, "The mech prepares its final desperate attack!"),
+                                   (Fore.CYAN, "But the Guardians intervene!\n")]},
+        {'kind': 'text', 'lines': [(Fore.LIGHTGREEN_EX, "🐉 Nessie shields you with her body!"),
+                                   (Fore.LIGHTCYAN_EX, "🌊 River Guardian redirects the water currents!"),
+                                   (Fore.LIGHTRED_EX, "☠️ Crimson Tide's cannons fire at the mech!"),
+                                   (Fore.LIGHTMAGENTA_EX, "🐙 Kraken restrains the mech's limbs!"),
+                                   (Fore.LIGHTBLUE_EX, "🐍 Jörmungandr coils around it!\n")], 'delay': 0.6},
+        {'kind': 'text', 'lines': [(Fore.YELLOW, "The Guardians have weakened the attack!"),
+                                   (Fore.GREEN, "Now strike back!\n")]},
+        {'kind': 'gamble', 'prompt': "Press ENTER when ready to attack!", 'options': [
+            ("STRIKE", "\nYou strike with all your might!",
+             [(0.5, (20, 35), "The Guardians' protection minimizes the damage!"),
+              (0.5, (35, 50), "Even with help, the attack still hurts!")]),
+        ]},
+    ],
+}
+
+
+# ===== BOSS DEFINITIONS =====
+LOCH_NESS_MONSTER = BossDefinition(
+    name="Loch Ness Monster",
+    hp=250,
+    defense=5,
+attacks=[
+        # Original attacks (kept for variety)
+        BossAttack("Wave Crash", LOCH_NESS_WAVE_PATTERN, (12, 25), "Sends powerful waves"),
+        BossAttack("Water Blast", LOCH_NESS_WATER_BLAST_PATTERN, (15, 22), "Fires a concentrated water jet"),
+        # NEW Enhanced attacks
+        BossAttack("Tidal Wave", LOCH_NESS_TIDAL_WAVE_PATTERN, (0, 35), "Multi-wave barrage!"),
+        BossAttack("Whirlpool", LOCH_NESS_WHIRLPOOL_PATTERN, (0, 28), "Spinning vortex trap!"),
+        BossAttack("Tail Sweep", LOCH_NESS_TAIL_SWEEP_PATTERN, (0, 30), "Massive tail attack!"),
+        BossAttack("Deep Dive Slam", LOCH_NESS_DEEP_DIVE_SLAM_PATTERN, (0, 34), "Two-phase combo!"),
+        BossAttack("Mist Breath", LOCH_NESS_MIST_BREATH_PATTERN, (0, 20), "Vision obscured!"),
+        BossAttack("ULTIMATE COMBO", LOCH_NESS_COMBO_ATTACK_PATTERN, (0, 38), "Devastating triple attack!")
+    ],
+    ascii_art=boss_art("LOCH_NESS"),
+    dialogue=boss_dialogue("LOCH_NESS_MONSTER"),
+    spare_threshold=40
+)
+
+# River Guardian Boss
+RIVER_GUARDIAN = BossDefinition(
+    name="The River Guardian",
+    hp=500,
+    defense=12,
+    attacks=[
+        BossAttack("Rapids Rush", RIVER_RAPIDS_DODGE_PATTERN, (0, 45), "Navigate treacherous rapids!"),
+        BossAttack("Torrential Bite", RIVER_BITE_SEQUENCE_PATTERN, (0, 58), "Dodge rapid bite attacks!"),
+        BossAttack("Whirlpool Spin", RIVER_CURRENT_SPIN_PATTERN, (0, 38), "Escape the spinning vortex!"),
+        BossAttack("Tail Strike", RIVER_TAIL_STRIKE_PATTERN, (0, 50), "Perfect timing required!"),
+        BossAttack("RIVER'S WRATH", RIVER_WRATH_COMBO_PATTERN, (0, 85), "The Guardian's ultimate fury!")
+    ],
+    ascii_art=boss_art("RIVER_GUARDIAN"),
+    dialogue=boss_dialogue("RIVER_GUARDIAN"),
+    spare_threshold=40
+)
+
+# Pirate Ship Boss
+PIRATE_SHIP = BossDefinition(
+    name="The Crimson Tide",
+    hp=600,
+    defense=15,
+    attacks=[
+        BossAttack("Cannon Barrage", PIRATE_CANNON_BARRAGE_PATTERN, (0, 75), "Dodge incoming cannonballs!"),
+        BossAttack("Harpoon Strike", PIRATE_HARPOON_STRIKE_PATTERN, (0, 45), "Duck the harpoon!"),
+        BossAttack("Broadside Ram", PIRATE_BROADSIDE_RAM_PATTERN, (0, 58), "Avoid the ramming ship!"),
+        BossAttack("Net Toss", PIRATE_NET_TOSS_PATTERN, (0, 35), "Cut yourself free!"),
+        BossAttack("ALL HANDS ASSAULT", PIRATE_ULTIMATE_ASSAULT_PATTERN, (0, 95), "The crew's full might!")
+    ],
+    ascii_art=boss_art("PIRATE_SHIP"),
+        dialogue=boss_dialogue("PIRATE_SHIP"),
+    spare_threshold=35
+)
+
+# Kraken Boss
+KRAKEN = BossDefinition(
+    name="The Kraken",
+    hp=850,
+    defense=20,
+    attacks=[
+        BossAttack("Tentacle Slam", KRAKEN_TENTACLE_SLAM_PATTERN, (0, 110), "Dodge the massive tentacles!"),
+        BossAttack("Ink Cloud", KRAKEN_INK_CLOUD_PATTERN, (0, 50), "Navigate through the murky ink!"),
+        BossAttack("Whirlpool Grab", KRAKEN_WHIRLPOOL_GRAB_PATTERN, (0, 65), "Escape the pulling vortex!"),
+        BossAttack("Beak Strike", KRAKEN_BEAK_STRIKE_PATTERN, (0, 75), "Avoid the crushing beak!"),
+        BossAttack("Crushing Grip", KRAKEN_CRUSHING_GRIP_PATTERN, (0, 85), "Break free from tentacles!"),
+        BossAttack("TIDAL FURY", KRAKEN_TIDAL_FURY_PATTERN, (0, 120), "The Kraken's ultimate wrath!")
+    ],
+    ascii_art=boss_art("KRAKEN"),
+    dialogue=boss_dialogue("KRAKEN"),
+    spare_threshold=30
+)
+
+# ===== JÖRMUNGANDR - THE WORLD SERPENT =====
+# importiant boss fight but not final boss, so HP and defense are high but not final boss level. Also has more attacks than previous bosses to reflect increased difficulty, but not as many as a final boss would have. Dialogue is more extensive to reflect its importance in the story, but still leaves room for a final boss with even more depth.
+JORMUNGANDR = BossDefinition(
+    name="Jörmungandr",
+    hp=1100,
+    defense=28,
+    attacks=[
+        BossAttack("World Coil", JORMUNGANDR_WORLD_COIL_PATTERN, (0, 80), "Break free from the crushing coils!"),
+        BossAttack("Venom Rain", JORMUNGANDR_VENOM_RAIN_PATTERN, (0, 95), "Dodge the poisonous droplets!"),
+        BossAttack("Tidal Wave", JORMUNGANDR_TIDAL_WAVE_PATTERN, (0, 70), "Swim against the massive waves!"),
+        BossAttack("Serpent's Gaze", JORMUNGANDR_SERPENT_GAZE_PATTERN, (0, 60), "Resist the hypnotic stare!"),
+        BossAttack("Tail Whip", JORMUNGANDR_TAIL_WHIP_PATTERN, (0, 65), "React quickly to dodge!"),
+        BossAttack("RAGNARÖK FURY", JORMUNGANDR_RAGNAROK_FURY_PATTERN, (0, 160), "The World Serpent's ultimate power!")
+    ],
+    ascii_art=boss_art("JORMUNGANDR"),
+    dialogue=boss_dialogue("JORMUNGANDR"),
+    spare_threshold=35
+)
+
+# ===== ÆGIR (NORSE SEA GIANT) =====
+
+AEGIR = BossDefinition(
+    name="Ægir",
+    hp=1000,
+    defense=26,
+    attacks=[
+        BossAttack("Iceberg Crash", AEGIR_ICEBERG_CRASH_PATTERN, (0, 85), "Dodge the colossal icebergs!"),
+        BossAttack("Frozen Tide", AEGIR_FROZEN_TIDE_PATTERN, (0, 95), "Break through the freezing wave!"),
+        BossAttack("Aurora Beam", AEGIR_AURORA_BEAM_PATTERN, (0, 110), "Match the aurora pattern!")
+    ],
+    ascii_art=boss_art("AEGIR"),
+    dialogue=boss_dialogue("AEGIR"),
+    spare_threshold=30
+)
+
+# ===== CTHULHU - THE DREAMING GOD =====
+
+CTHULHU = BossDefinition(
+    name="Cthulhu",
+    hp=900,
+    defense=24,
+    attacks=[
+        BossAttack("Madness Gaze", CTHULHU_MADNESS_GAZE_PATTERN, (0, 70), "The Dreaming God's psychic assault!"),
+        BossAttack("Tentacles of R'lyeh", CTHULHU_TENTACLE_RLYEH_PATTERN, (0, 55), "Massive tentacles from the sunken city!"),
+        BossAttack("Dream Paralysis", CTHULHU_DREAM_PARALYSIS_PATTERN, (0, 90), "Reality bends in the nightmare!"),
+        BossAttack("Summon Deep Ones", CTHULHU_CULTIST_SUMMON_PATTERN, (0, 75), "Cultist fish swarm to his will!"),
+        BossAttack("THE AWAKENING", CTHULHU_ULTIMATE_AWAKENING_PATTERN, (0, 140), "Cthulhu begins to rise!")
+    ],
+    ascii_art=boss_art("CTHULHU"),
+    dialogue=boss_dialogue("CTHULHU"),
+    spare_threshold=25  # Lower threshold - Cthulhu is more willing to return to sleep
+)
+
+# ===== IFRIT THE FLAMEBRINGER =====
+
+IFRIT = BossDefinition(
+    name="Ifrit the Flamebringer",
+    hp=950,
+    defense=23,
+    attacks=[
+        BossAttack("Lava Geyser", IFRIT_LAVA_GEYSER_PATTERN, (0, 65), "Predict the eruption pattern!"),
+        BossAttack("Scorching Breath", IFRIT_SCORCHING_BREATH_PATTERN, (0, 85), "Dive deep to escape the flames!"),
+        BossAttack("Obsidian Shard Storm", IFRIT_OBSIDIAN_SHARD_STORM_PATTERN, (0, 60), "Block the razor-sharp shards!"),
+        BossAttack("Magma Whip", IFRIT_MAGMA_WHIP_PATTERN, (0, 55), "Dodge the molten tendrils!"),
+        BossAttack("VOLCANIC FURY", IFRIT_VOLCANIC_FURY_PATTERN, (0, 155), "The lake itself becomes an inferno!")
+    ],
+    ascii_art=boss_art("IFRIT"),
+    dialogue=boss_dialogue("IFRIT"),
+    spare_threshold=30
+)
+
+# ===== MEGALODON'S GHOST =====
+
+MEGALODON_GHOST = BossDefinition(
+    name="The Megalodon's Ghost",
+    hp=880,
+    defense=21,
+    attacks=[
+        BossAttack("Phantom Bite", MEGALODON_PHANTOM_BITE_PATTERN, (0, 70), "The spectral jaws strike from nowhere!"),
+        BossAttack("Primal Rage", MEGALODON_PRIMAL_RAGE_PATTERN, (0, 90), "Ancient fury unleashed!"),
+        BossAttack("Tectonic Tremor", MEGALODON_TECTONIC_TREMOR_PATTERN, (0, 105), "The earth itself shakes!")
+    ],
+    ascii_art=boss_art("MEGALODON_GHOST"),
+    dialogue=boss_dialogue("MEGALODON_GHOST"),
+    spare_threshold=35
+)
+
+# ===== FROST WYRM =====
+
+FROST_WYRM = BossDefinition(
+    name="The Frost Wyrm",
+    hp=820,
+    defense=22,
+    attacks=[
+        BossAttack("Blizzard Breath", FROST_WYRM_BLIZZARD_BREATH_PATTERN, (0, 90), "Waves of freezing cold!"),
+        BossAttack("Ice Spike Barrage", FROST_WYRM_ICE_SPIKE_BARRAGE_PATTERN, (0, 55), "Memory test through the ice!"),
+        BossAttack("Permafrost Prison", FROST_WYRM_PERMAFROST_PRISON_PATTERN, (0, 65), "Trapped in ancient ice!")
+    ],
+    ascii_art=boss_art("FROST_WYRM"),
+    dialogue=boss_dialogue("FROST_WYRM"),
+    spare_threshold=30
+)
+
+# ===== STELLAR LEVIATHAN (COSMIC SPACE WHALE) =====
+
+STELLAR_LEVIATHAN = BossDefinition(
+    name="The Stellar Leviathan",
+    hp=1150,
+    defense=27,
+    attacks=[
+        BossAttack("Gravity Waves", STELLAR_LEVIATHAN_GRAVITY_WAVES_PATTERN, (0, 85), "Space warps around the whale!"),
+        BossAttack("Nebula Clouds", STELLAR_LEVIATHAN_NEBULA_CLOUDS_PATTERN, (0, 70), "Cosmic clouds obscure your vision!"),
+        BossAttack("Cosmic Debris", STELLAR_LEVIATHAN_COSMIC_DEBRIS_PATTERN, (0, 95), "Asteroids rain down!"),
+        BossAttack("Stardust Song", STELLAR_LEVIATHAN_STARDUST_SONG_PATTERN, (0, 65), "The whale's cosmic wisdom resonates!"),
+        BossAttack("GALACTIC MAJESTY", STELLAR_LEVIATHAN_GALACTIC_MAJESTY_PATTERN, (0, 145), "The full beauty of the cosmos!")
+    ],
+    ascii_art=boss_art("STELLAR_LEVIATHAN"),
+    dialogue=boss_dialogue("STELLAR_LEVIATHAN"),
+    spare_threshold=30
+)
+
+
+AMALGAMATION = BossDefinition(
+    name="The Amalgamation of Horrors",
+    hp=2500,
+    defense=35,
+    attacks=[
+        BossAttack("Fusion Strike", AMALGAMATION_FUSION_STRIKE_PATTERN, (0, 120), "Multi-phase combination attack!"),
+        BossAttack("Elemental Chaos", AMALGAMATION_ELEMENTAL_CHAOS_PATTERN, (0, 95), "Fire, Ice, and Venom converge!"),
+        BossAttack("Cosmic Barrage", AMALGAMATION_COSMIC_BARRAGE_PATTERN, (0, 80), "Reality fractures!"),
+        BossAttack("Phantom Fleet", AMALGAMATION_PIRATE_ASSAULT_PATTERN, (0, 85), "Ghostly cannons fire!"),
+        BossAttack("Morphing Attack", AMALGAMATION_MORPHING_ATTACK_PATTERN, (0, 110), "Becomes a previous boss!"),
+        BossAttack("ULTIMATE ANNIHILATION", AMALGAMATION_ULTIMATE_ANNIHILATION_PATTERN, (0, 850), "The judgment of ten guardians!")
+    ],
+    ascii_art=boss_art("AMALGAMATION"),
+    dialogue=boss_dialogue("AMALGAMATION"),
+    spare_threshold=20
+)
+
+AQUATECH_MEGALODON_PHASE1 = BossDefinition(
+    name="Project MEGALODON - Phase 1",
+    hp=1400,
+    defense=32,
+    attacks=[
+        BossAttack("Industrial Nets", AQUATECH_INDUSTRIAL_NETS_PATTERN, (0, 90), "Massive nets deploy!"),
+        BossAttack("Harpoon Barrage", AQUATECH_HARPOON_BARRAGE_PATTERN, (0, 105), "Automated harpoons fire!"),
+        BossAttack("Toxic Discharge", AQUATECH_TOXIC_DISCHARGE_PATTERN, (0, 80), "Chemical waste released!"),
+        BossAttack("Sonar Pulse", AQUATECH_SONAR_PULSE_PATTERN, (0, 85), "Disorienting sonar blast!"),
+        BossAttack("Harvester Blades", AQUATECH_HARVESTER_BLADES_PATTERN, (0, 125), "Processing blades activate!"),
+        BossAttack("MAXIMUM EXTRACTION", AQUATECH_PHASE1_ULTIMATE_PATTERN, (0, 175), "All systems firing!")
+    ],
+    ascii_art=boss_art("AQUATECH_MEGALODON_MECH"),
+    dialogue=boss_dialogue("AQUATECH_MEGALODON_PHASE1"),
+    spare_threshold=999
+)
+
+AQUATECH_MEGALODON_PHASE2 = BossDefinition(
+    name="Project MEGALODON - Phase 2",
+    hp=950,
+    defense=30,
+    attacks=[
+        BossAttack("Desperate Nets", AQUATECH_INDUSTRIAL_NETS_PATTERN, (0, 70), "Nets deploy!"),
+        BossAttack("Emergency Harpoons", AQUATECH_HARPOON_BARRAGE_PATTERN, (0, 85), "Harpoons fire!"),
+        BossAttack("Last Resort Toxins", AQUATECH_TOXIC_DISCHARGE_PATTERN, (0, 65), "Chemicals release!"),
+        BossAttack("Failing Sonar", AQUATECH_SONAR_PULSE_PATTERN, (0, 75), "Damaged sonar pulses!"),
+        BossAttack("FINAL HARVEST", AQUATECH_PHASE2_ULTIMATE_PATTERN, (0, 110), "Last stand!")
+    ],
+    ascii_art=boss_art("AQUATECH_MEGALODON_MECH"),
+    dialogue=boss_dialogue("AQUATECH_MEGALODON_PHASE2"),
+    spare_threshold=999
+)
+
+
+# Every boss in fight order (the ten Guardians, then the karma and AquaTech fights)
+BOSS_ROSTER = [
+    LOCH_NESS_MONSTER,
+    RIVER_GUARDIAN,
+    PIRATE_SHIP,
+    KRAKEN,
+    JORMUNGANDR,
+    AEGIR,
+    CTHULHU,
+    IFRIT,
+    MEGALODON_GHOST,
+    FROST_WYRM,
+    STELLAR_LEVIATHAN,
+    AMALGAMATION,
+    AQUATECH_MEGALODON_PHASE1,
+    AQUATECH_MEGALODON_PHASE2,
+]
@@ -0,0 +1,234 @@
+# Precompiled content bundle
+# Build it with: python -m fishgame_content.bundle
+#
+# All static content (fish tables, rods, baits, combat items, boss items,
+# facts, library citations, NPC lines, boss art and dialogue) compiled into one
+# indexed file that the game maps into memory. A record is found by
+# (section, index) or (section, key) in O(1), through tables stored in the
+# file, and only that record's bytes are read and decoded - the rest of the
+# file stays in the page cache, shared by every game process on the host.
+#
+# Layout (little endian):
+#   header    b"FGCB" | version u16 | section count u16
+#   sections  name (24 bytes, NUL padded) | record count u32 | table offset u32
+#             | key index offset u32 | key index slots u32
+#   tables    per record: data offset u32 | data length u32 | key offset u32 | key length u32
+#   indexes   per keyed section, a power of two of slots: record number + 1,
+#             or 0 if empty. A key starts at slot crc32(key) and probes forward.
+#   data      UTF-8 JSON records, UTF-8 keys
+#
+# The bundle is a build artifact. If it's missing, or older than any content
+# source, the game ignores it and uses the Python modules instead.
+import glob
+import json
+import mmap
+import os
+import struct
+import zlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUNDLE_FILE = os.path.join(ROOT_DIR, "content.bundle")
+
+BUNDLE_MAGIC = b"FGCB"
+BUNDLE_VERSION = 2
+HEADER = struct.Struct("<4sHH")
+SECTION = struct.Struct("<24sIIII")
+ENTRY = struct.Struct("<IIII")
+SLOT = struct.Struct("<I")
+
+_bundle = None
+_bundle_checked = False
+
+
+class ContentBundle:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.data)
+        magic, version, section_count = HEADER.unpack_from(self.data, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {BUNDLE_VERSION} content bundle")
+        self.sections = {}  # name -> (record count, table offset, key index offset, key index slots)
+        for i in range(section_count):
+            name, *section = SECTION.unpack_from(self.data, HEADER.size + i * SECTION.size)
+            self.sections[name.rstrip(b"\0").decode('utf-8')] = tuple(section)
+
+    def has_section(self, section):
+        return section in self.sections
+
+    def count(self, section):
+        return self.sections[section][0]
+
+    def raw(self, section, index):
+        """The record's bytes as a memoryview into the mapped file (no copy)"""
+        count, table, _, _ = self.sections[section]
+        if not 0 <= index < count:
+            raise IndexError(f"{section} has no record {index}")
+        offset, length, _, _ = ENTRY.unpack_from(self.data, table + index * ENTRY.size)
+        return self.view[offset:offset + length]
+
+    def record(self, section, index):
+        """The record decoded into Python objects - the one copy made of it"""
+        return json.loads(str(self.raw(section, index), 'utf-8'))
+
+    def records(self, section):
+        for index in range(self.count(section)):
+            yield self.record(section, index)
+
+    def index_of(self, section, key):
+        _, table, index, slots = self.sections[section]
+        key_bytes = key.encode('utf-8')
+        slot = zlib.crc32(key_bytes) & (slots - 1)
+        for _ in range(slots):
+            number, = SLOT.unpack_from(self.data, index + slot * SLOT.size)
+            if not number:
+                break
+            _, _, key_offset, key_length = ENTRY.unpack_from(self.data, table + (number - 1) * ENTRY.size)
+            if self.view[key_offset:key_offset + key_length] == key_bytes:
+                return number - 1
+            slot = (slot + 1) & (slots - 1)
+        raise KeyError(f"{section} has no record {key!r}")
+
+    def lookup(self, section, key):
+        return self.record(section, self.index_of(section, key))
+
+    def close(self):
+        self.view.release()
+        self.data.close()
+
+
+def content_sources():
+    """Files the bundle is compiled from - content only, so editing game code
+    doesn't make it stale"""
+    content_dir = os.path.join(ROOT_DIR, "fishgame_content")
+    sources = [os.path.join(ROOT_DIR, "boss_assets.tsv")]
+    sources += [os.path.join(content_dir, name + ".py") for name in ("items", "facts", "citations", "npc_lines")]
+    sources += glob.glob(os.path.join(content_dir, "fish", "*.py"))
+    return sources
+
+
+def is_stale(path=BUNDLE_FILE):
+    built = os.path.getmtime(path)
+    return any(os.path.getmtime(source) > built for source in content_sources() if os.path.exists(source))
+
+
+def get_bundle():
+    """The shared ContentBundle, or None if it hasn't been built (or is out of date)"""
+    global _bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        try:
+            if os.path.exists(BUNDLE_FILE) and not is_stale():
+                _bundle = ContentBundle(BUNDLE_FILE)
+        except (OSError, ValueError, struct.error):
+            _bundle = None
+    return _bundle
+
+
+def index_slots(keyed):
+    """Slots in the key index of a section with `keyed` keyed records: a power
+    of two, at most half full"""
+    slots = 1
+    while slots < 2 * keyed:
+        slots *= 2
+    return slots if keyed else 0
+
+
+def write_bundle(sections, path):
+    """sections: list of (name, [(key or None, record), ...])"""
+    data = bytearray()
+    tables_start = HEADER.size + len(sections) * SECTION.size
+    indexes_start = tables_start + sum(len(records) for _, records in sections) * ENTRY.size
+    data_start = indexes_start + sum(
+        index_slots(sum(key is not None for key, _ in records)) for _, records in sections) * SLOT.size
+    header = bytearray(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(sections)))
+    tables = bytearray()
+    indexes = bytearray()
+    for name, records in sections:
+        slots = index_slots(sum(key is not None for key, _ in records))
+        index = [0] * slots
+        header += SECTION.pack(name.encode('utf-8'), len(records), tables_start + len(tables),
+                               indexes_start + len(indexes), slots)
+        for number, (key, record) in enumerate(records):
+            payload = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            offset = data_start + len(data)
+            data += payload
+            key_bytes = key.encode('utf-8') if key is not None else b""
+            key_offset = data_start + len(data)
+            data += key_bytes
+            tables += ENTRY.pack(offset, len(payload), key_offset, len(key_bytes))
+            if key is not None:
+                slot = zlib.crc32(key_bytes) & (slots - 1)
+                while index[slot]:
+                    slot = (slot + 1) & (slots - 1)
+                index[slot] = number + 1
+        indexes += struct.pack(f"<{slots}I", *index)
+
+    # Write next to the target and swap it in, so running games keep their old mapping
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header + tables + indexes + data)
+    os.replace(temp_path, path)
+
+
+def build_bundle(path=BUNDLE_FILE):
+    """Compile the content modules into a bundle, returns {section: record count}"""
+    import fishgame
+    from fishgame_content.citations import LIBRARY_CITATIONS
+    from fishgame_content.facts import DID_YOU_KNOW_FACTS
+    from fishgame_content.fish import FISH_TABLES, module_fish_table, species_id_problems
+    from fishgame_content.npc_lines import NPC_LINES
+
+    problems = species_id_problems()
+    if problems:
+        raise ValueError("species_ids.txt is out of date:\n  " + "\n  ".join(problems))
+
+    sections = []
+    for name in FISH_TABLES:
+        sections.append(("fish:" + name, [
+            (fish.name, [fish.name, fish.min_weight, fish.max_weight, fish.rarity, fish.rarity_weight,
+                         fish.xp_reward, fish.real_world_info, fish.sell_price])
+            for fish in module_fish_table(name)]))
+    sections.append(("rods", [
+        (rod.name, [rod.name, rod.bonus_chance, rod.bonus_weight, rod.price, rod.unlock_level, rod.durability_bonus])
+        for rod in fishgame.RODS]))
+    sections.append(("baits", [
+        (bait.name, [bait.name, bait.bonus_xp, bait.bonus_rarity, bait.price, bait.unlock_level])
+        for bait in fishgame.BAITS]))
+    for item_type, items in (("attack", fishgame.COMBAT_ITEMS_ATTACK), ("defense", fishgame.COMBAT_ITEMS_DEFENSE),
+                             ("hp", fishgame.COMBAT_ITEMS_HP)):
+        sections.append(("combat_items:" + item_type, [
+            (item.name, [item.name, item.item_type, item.bonus_value, item.price, item.description, item.unlock_level])
+            for item in items]))
+    sections.append(("boss_items", [
+        (name, [item.name, item.boss_name, item.description, item.location])
+        for name, item in fishgame.BOSS_ITEMS.items()]))
+    sections.append(("facts", [(None, fact) for fact in DID_YOU_KNOW_FACTS]))
+    sections.append(("citations", [(None, list(citation)) for citation in LIBRARY_CITATIONS]))
+    sections.append(("npc_lines", list(NPC_LINES.items())))
+
+    # Boss art and dialogue, keyed like boss_assets.tsv
+    boss_assets = fishgame.BossAssetStore(fishgame.BOSS_ASSETS_FILE)
+    boss_assets.build_index()
+    sections.append(("boss_assets", [(key, boss_assets.read_record(key)[0]) for key in boss_assets.offsets]))
+
+    write_bundle(sections, path)
+    return {name: len(records) for name, records in sections}
+
+
+def main():
+    try:
+        counts = build_bundle()
+    except ValueError as e:
+        print(e)
+        return 1
+    for name, count in counts.items():
+        print(f"{name:<24}{count:>5} records")
+    print(f"Wrote {BUNDLE_FILE} ({os.path.getsize(BUNDLE_FILE) // 1024} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
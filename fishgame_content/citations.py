@@ -0,0 +1,426 @@
+# Book citations for the library's general shelves: (title, author, quote)
+
+LIBRARY_CITATIONS = [
+    # ============================================
+    # CLASSIC SEA & ADVENTURE FICTION
+    # ============================================
+
+    ("Moby-Dick", "Herman Melville", 
+     "\"Call me Ishmael. Some years ago never mind how long precisely\n having little or no money in my purse, and nothing particular to interest me on shore,\nI thought I would sail about a little and see the watery part of the world."),
+
+    ("The Old Man and the Sea", "Ernest Hemingway",
+     "\"He was an old man who fished alone in a skiff in the Gulf Stream\nand he had gone eighty-four days now without taking a fish.\""),
+
+    ("Twenty Thousand Leagues Under the Sea", "Jules Verne",
+     "\"The sea is everything. It covers seven tenths of the terrestrial globe.\nIts breath is pure and healthy. It is an immense desert, where man is never lonely,\nfor he feels life stirring on all sides.\""),
+
+    ("Treasure Island", "Robert Louis Stevenson",
+     "\"Fifteen men on the dead man's chestâ€ \nYo-ho-ho, and a bottle of rum!\""),
+
+    ("The Sea Wolf", "Jack London",
+     "\"The sea was angry that day, my friends, like an old man trying to send back soup\nin a deli.\" Wait, that's not right... \"I scarcely know where to begin,\nthough I sometimes facetiously place the cause of it all to Charley Furuseth's credit.\""),
+
+    ("Robinson Crusoe", "Daniel Defoe",
+     "\"I had been on shore, and made it to dry land, when immediately I fell\non my knees and gave God thanks for my deliverance.\""),
+
+    ("Master and Commander", "Patrick O'Brian",
+     "\"There is nothing, nothing whatsoever, which is not improved by a good bottle.\""),
+
+    # ============================================
+    # MODERN FICTION
+    # ============================================
+
+    ("Life of Pi", "Yann Martel",
+     "\"I must say a word about fear. It is life's only true opponent.\nOnly fear can defeat life. You must fight hard to express it.\""),
+
+    ("The Sea", "John Banville",
+        "\"The sea is a place of beginnings and endings, a place where the past and future meet in the present moment.\""),
+
+    ("Jaws", "Peter Benchley",
+     "\"The great fish moved silently through the night water,\npropelled by short sweeps of its crescent tail.\""),
+
+    ("The Perfect Storm", "Sebastian Junger",
+     "\"Eventually the Florida fishermen gave up and went home,\nbut Tyne kept pushing east, away from the other boats.\""),
+
+    ("Animal farm", "George Orwell",
+     "\"All animals are equal, but some animals are more equal than others.\""),
+
+    ("1984", "George Orwell",
+     "\"War is peace. Freedom is slavery. Ignorance is strength.\""),
+
+    # ============================================
+    # POETRY & DRAMA
+    # ============================================
+
+    ("The Rime of the Ancient Mariner", "Samuel Taylor Coleridge",
+     "\"Water, water, every where,\nAnd all the boards did shrink;\nWater, water, every where,\nNor any drop to drink.\""),
+
+    ("The Tempest", "William Shakespeare",
+     "\"We are such stuff as dreams are made on,\nand our little life is rounded with a sleep.\""),
+
+    ("Songs of Experience", "William Blake",
+        "\"Man has no Body distinct from his Soul;\nfor that called Body is a portion of Soul\ndiscerned by the five Senses.\""),
+
+    ("Leaves of Grass", "Walt Whitman",
+        "\"I believe a leaf of grass is no less than the journey-work of the stars,\nAnd the pismire is equally perfect,\nAnd a grain of sand, and the egg of the wren.\""),
+
+    # ============================================
+    # EPIC & CLASSICAL LITERATURE
+    # ============================================
+
+    ("The Odyssey", "Homer",
+     "\"Sing to me of the man, Muse, the man of twists and turns\ndriven time and again off course, once he had plundered\nthe hallowed heights of Troy.\""),
+
+    ("Gulliver's Travels", "Jonathan Swift",
+     "\"And he gave it for his opinion, that whoever could make two ears of corn,\nor two blades of grass, to grow upon a spot of ground where only one grew before,\nwould deserve better of mankind than the whole race of politicians put together.\""),
+
+    ("In Search of Lost Time", "Marcel Proust",
+     "\"The real voyage of discovery consists not in seeking new landscapes,\nbut in having new eyes.\""),
+
+    ("Frankenstein", "Mary Shelley",
+        "\"The mighty Alps, whose white and shining pyramids and domes towered above all,\nspoke of a power mighty as Omnipotence,\nand I ceased to fear or to bend before any being less almighty than that.\""),
+
+    # ============================================
+    # AMERICAN TRANSCENDENTALISM & NATURE WRITING
+    # ============================================
+
+    ("Walden", "Henry David Thoreau",
+        "\"Heaven is under our feet as well as over our heads.\nThe surface of the earth is soft and impressible by the feet of men;\nand so with the paths which the mind travels.\""),
+
+    ("Walking", "Henry David Thoreau",
+        "\"In Wildness is the preservation of the World.\nEvery tree sends its fibres forth in search of the Wild.\nThe cities import it at any price.\""),
+
+    ("Nature", "Ralph Waldo Emerson",
+        "\"The ancient precept, Know thyself,â€™ and the modern precept, Study nature,â€™\nbecome at last one maxim.\""),
+
+    ("Self-Reliance", "Ralph Waldo Emerson",
+        "\"Society everywhere is in conspiracy against the manhood of every one of its members.\nWhoso would be a man must be a nonconformist.\""),
+
+    # ============================================
+    # VICTORIAN LITERATURE & CRITICISM
+    # ============================================
+
+    ("The Stones of Venice", "John Ruskin",
+        "\"It is the greatest of all mistakes to do nothing because you can only do little.\nDo what you can.\nThe ocean itself is made of drops.\""),
+
+    ("A Vindication of Natural Diet", "Percy Bysshe Shelley",
+        "\"The abuse of animals dead or alive is one of the most universal\nand enormous crimes of the human species.\""),
+
+    ("On the Origin of Species", "Charles Darwin",
+        "\"It is not the strongest of the species that survive, nor the most intelligent,\nbut the one most responsive to change.\""),
+
+    # ============================================
+    # PHILOSOPHY & POLITICAL THEORY
+    # ============================================
+
+    ("The Communist Manifesto", "Karl Marx and Friedrich Engels",
+        "\"The history of all hitherto existing society is the history of class struggles.\""),
+
+    ("Capital", "Karl Marx",
+        "\"The production of too many useful things results in too many useless people.\""),
+
+    ("The Art of War", "Sun Tzu",
+        "\"If you know the enemy and know yourself, you need not fear the result of a hundred battles.\""),
+
+    ("The Prince", "Niccolò Machiavelli",
+        "\"It is better to be feared than loved, if you cannot be both.\""),
+
+    ("Analects", "Confucius",
+        "\"The Master said, The gentleman understands what is morally right, whereas the small man understands what is profitable.\""),
+
+    ("The Republic", "Plato",
+        "\"The heaviest penalty for declining to rule is to be ruled by someone inferior to yourself.\""),
+
+    ("The State and Revolution", "Vladimir Lenin",
+        "\"The state is a product of society at a certain stage of development; it is the admission that this society has become entangled in an insoluble contradiction with itself, and that it needs a machine, a state, to be set up to manage the struggle of the classes.\""),
+
+    ("Friedrich Nietzsche", "Thus Spoke Zarathustra",
+        "\"The snake which cannot cast its skin has to die. As well the minds which are prevented from changing their opinions; they cease to be mind.\""),
+
+    ("John Maynard Keynes", "The General Theory of Employment, Interest and Money",
+        "\"The long run is a misleading guide to current affairs. In the long run we are all dead.\""),
+
+    ("Mao Zedong", "Quotations from Chairman Mao Tse-tung",
+        "\"Political power grows out of the barrel of a gun.\""),
+
+    ("Napoleon Bonaparte", "Memoirs of Napoleon Bonaparte",
+        "\"History is a set of lies agreed upon.\""),
+
+    ("Julius Cæsar", "Commentarii de Bello Gallico",
+        "\"I have come, I have seen, I have conquered.\""),
+
+    ("Abraham Lincoln", "Gettysburg Address",
+        "\"Four score and seven years ago our fathers brought forth on this continent, a new nation, conceived in Liberty, and dedicated to the proposition that all\""),
+
+    # ============================================
+    # NON-FICTION & HISTORICAL
+    # ============================================
+
+    ("Sapiens", "Yuval Noah Harari",
+     "\"The most important thing to know about the history of humanity is that it is a history of cooperation.\""),
+
+    ("Sapiens", "Yuval Noah Harari",
+        "\"Modern industrial agriculture might well be the greatest crime in history.\""),
+
+    ("Guns, Germs, and Steel", "Jared Diamond",
+        "\"History followed different courses for different peoples because of differences among peoples' environments, not because of biological differences among peoples themselves.\""),
+
+    ("The Diary of Anne Frank", "Anne Frank",
+        "\"Despite everything, I believe that people are really good at heart.\""),
+
+    # ============================================
+    # RELIGIOUS & SPIRITUAL TEXTS
+    # ============================================
+
+    ("Genesis", "The Bible (King James Version)",
+        "\"And God said, Let them have dominion over the fish of the sea.\nAnd God saw every thing that he had made,\nand, behold, it was very good.\""),
+
+    ("Ecclesiastes", "The Bible (King James Version)",
+        "\"All the rivers run into the sea;\nyet the sea is not full.\nUnto the place from whence the rivers come,\nthither they return again.\""),
+
+    ("Psalms", "The Bible (King James Version)",
+        "\"The earth is the Lord's, and the fulness thereof;\nthe world, and they that dwell therein.\nFor he hath founded it upon the seas.\""),
+
+    ("Job", "The Bible (King James Version)",
+        "\"Who shut up the sea with doors,\nwhen it brake forth, as if it had issued out of the womb;\nAnd said, Hitherto shalt thou come, but no further?\""),
+
+    ("Matthew", "The Bible (King James Version)",
+     "\"Again I say to you, it is easier for a camel to go through the eye of a needle, than for a rich man to enter the kingdom of God.\""),
+
+    ("The Book of Psalms", "The Bible (King James Version)",
+        "\"They that go down to the sea in ships,\nthat do business in great waters;\nThese see the works of the Lord,\nand his wonders in the deep.\""),
+
+    ("Surah An-Nahl", "The Quran",
+        "\"And it is He who has made the sea subject to you, that you may eat from it tender meat and extract from it ornaments which you wear.\" "),
+
+    ("The Tao Te Ching", "Laozi (trans. James Legge)",
+        "\"The highest good is like water.\nWater gives life to the ten thousand things and does not strive.\nIt flows in places men reject,\nand so is like the Tao.\""),
+
+    ("The Tao Te Ching", "Laozi (trans. James Legge)",
+        "\"Nothing in the world is softer or weaker than water.\nYet nothing surpasses it in overcoming the hard and strong.\""),
+
+    ("The Dhammapada", "Attributed to the Buddha (trans. Max MÃ¼ller)",
+        "\"The earth is insulted, abused, and oppressed,\nyet the wise man remains gentle,\nlike the earth itself.\""),
+
+    ("The Bhagavad Gita", "Vyasa (trans. Charles Wilkins)",
+        "\"He who sees the Supreme Lord existing equally in all beings,\ndoes not destroy himself by himself,\nand thus attains the supreme path.\""),
+
+    ("The Bhagavad Gita", "Vyasa (trans. Charles Wilkins)",
+        "\"All beings are sustained by food;\nfood is produced by rain;\nrain arises from sacrifice;\nand sacrifice is born of duty.\""),
+
+    # ============================================
+    # SCIENCE FICTION & HORROR
+    # ============================================
+
+    ("H.P. Lovecraft", "The Call of Cthulhu",
+        "\"Ph'nglui mglw'nafh Cthulhu R'lyeh wgah'nagl fhtagn.\""),
+
+    ("Arthur C. Clarke", "2001: A Space Odyssey",
+        "\"Any sufficiently advanced technology is indistinguishable from magic.\""),
+
+    ("Philip K.", "Do Androids Dream of Electric Sheep?",
+        "\"The electric things have their lives, too. Paltry as those lives are.\""),
+
+    # ============================================
+    # REFERENCE & ENCYCLOPEDIAS
+    # ============================================
+
+    ("Encyclopædia Britannica", "Various Authors",
+        "\"The ocean is the lifeblood of our planet, covering over 70% of the Earth's surface and containing 97% of its water.\""),
+
+    ("Encyclopædia Britannica", "Various Authors",
+        "\"Fish are a diverse group of aquatic animals that have gills, fins, and typically a streamlined body.\""),
+
+    ("Wikipedia, the free encyclopedia",
+        "\"Fishing is the activity of trying to catch fish, either in the wild or in captivity.\""),
+
+    ("National Geographic", "Various Authors",
+        "\"The ocean is home to an estimated 2.2 million species, many of which are still undiscovered.\""),
+
+    # ============================================
+    # OCCULT & ALTERNATIVE SPIRITUALITY
+    # ============================================
+
+    ("Anton Szandor LaVey", "The Satanic Bible",
+        "\"Do what thou wilt shall be the whole of the Law.\""),
+
+    ("Aleister Crowley", "The Book of the Law",
+        "\"Do what thou wilt shall be the whole of the Law.\nLove is the law, love under will.\""),
+
+    ("Rumi", "The Essential Rumi",
+        "\"You were born with wings, why prefer to crawl through life?\""),
+
+    # ============================================
+    # MODERN POLITICAL SPEECHES & STATEMENTS
+    # ============================================
+
+    ("Donald Trump", "Twitter",
+        "\"I have the best words, but there's no better word than 'fish'. Everyone loves fish. Fish are tremendous.\""),
+
+    ("Joe Biden", "Speech",
+        "\"My fellow Americans, I promise to protect our oceans and the fish that call it home. Together, we can build back better for our planet.\""),
+
+    ("Bill Clinton", "Speech",
+        "\"I did not have relations with that fish. \""),
+
+    ("Greta Thunberg", "Speech",
+        "\"The ocean is rising, and so are we. We must act now to save our fish and our future.\""),
+
+    ("Barack Obama", "Speech",
+        "\"The ocean is a source of wonder and sustenance. We have a responsibility to protect it for future generations.\""),
+
+    ("Bernie Sanders", "Speech",
+        "\"The ocean is not a dumping ground for pollution. We need to invest in clean energy and sustainable fishing practices.\""),
+
+    ("local politician", "Speech",
+        "\"I support our local fishermen and the fishing industry. We need to balance economic growth with environmental protection.\""),
+
+    ("Environmental activist", "Speech",
+        "\"The fish are dying, the waters are polluted, and we are running out of time. We need to take bold action to save our oceans.\""),
+
+
+
+    # ============================================
+    # MUSIC LYRICS
+    # ============================================
+
+    ("Song lyric book, The Beatles", "'Octopus's Garden'",
+        "\"I'd like to be under the sea\nIn an octopus's garden in the shade.\""),
+
+    ("Song lyric book, King gizzard & The Lizard Wizard", "'Fishing for fishies'",
+        "\"Fishing for fishies\nDon't make them happy\nOr me neither.\n I feel so sorry for fishies.\""),
+
+    ("Song lyric book, Bob dylan", "'Master of war'",
+        "\"Come you masters of war\nYou that build all the guns\nYou that build the death planes\nYou that build the big bombs\nYou that hide behind walls\nYou that hide behind desks\nI just want you to know\nI can see through your masks.\""),
+
+    ("Song lyric book, Pink Floyd", "'Wish You Were Here'",
+        "\"We're just two lost souls swimming in a fish bowl, year after year.\""),
+
+    ("Song lyric book, The Police", "'Message in a Bottle'",
+        "\"Just a castaway, an island lost at sea, oh\nAnother lonely day, no one here but me, oh\nMore loneliness than any man could bear\nRescue me before I fall into despair, oh\""),
+
+    ("Song lyric book, Simon & Garfunkel", "'The Sound of Silence'",
+        "\"Hello darkness, my old friend\nI've come to talk with you again.\""),
+
+    ("Song lyric book, Radiohead", "'Karma Police'",
+        "\"Karma police, arrest this man\nHe talks in maths, he buzzes like a fridge\nHe's like a detuned radio.\""),
+
+    ("Song lyric book, The Smiths", "'How Soon is Now?'",
+        "\"I am the son and the heir of a shyness that is criminally vulgar\nI am the son and heir of nothing in particular.\""),
+
+    ("Song lyric book, Nirvana", "'Something in the way'",
+        "\"It's okay to eat fish 'cause they don't have any feelings.\""),
+
+    ("Song lyric book, The Doors", "'Riders on the Storm'",
+        "\"Riders on the storm\nThere's a killer on the road\nHis brain is squirtin' like a poisonous mushroom\nRiders on the storm\nThere's a killer on the road\nHis brain is squirmin' like a toad\""),
+
+    ("Song lyric book, Gotye", "'Somebody That I Used to Know'",
+        "\"Now and then I think of when we were together\nLike when you said you felt so happy you could die.\""),
+
+    ("Song lyric book, The Rolling Stones", "'Paint It Black'",
+        "\"I see a red door and I want it painted black\nNo colors anymore, I want them to turn black.\""),
+
+    ("Song lyric book, Kanye West", "'Gorgeus'",
+        "\" Choke a South Park writer with a fishstick\""),
+
+    ("Song lyric book, Childish Gambino", "'This is America'",
+        "\"This is America\nDon't catch you slippin' now\nLook at how I'm livin' now\nPolice be trippin' now\""),
+
+    #didnt know where to put this but i think music kinda works
+    ("Dr. Seuss", "'One Fish Two Fish Red Fish Blue Fish'",
+        "\"One fish, two fish, red fish, blue fish.\nBlack fish, blue fish, old fish, new fish.\""),
+
+    # ============================================
+    # VIDEO GAME QUOTES
+    # ============================================
+    ("Final Fantasy VII", "Planetary Life",
+        "\"The Planet is screaming.\nThe people who live on it are listening too late.\""),
+
+    ("Journey", "Ancient Glyphs",
+        "\"To walk this desert is to remember\nwhat was lost beneath the sand.\""),
+
+    ("Subnautica", "Alien Data Logs",
+        "\"What is a wave without the ocean?\nA beginning without an end.\""),
+
+    ("Shadow of the Colossus", "Dormin",
+        "\"Thou art not welcomed here.\nThis land was not meant for thee.\""),
+
+    ("Disco Elysium", "The Deserter",
+        "\"The future teaches you to be alone.\nThe present tells you who abandoned it.\""),
+
+    ("Outer Wilds", "Nomai Writing",
+        "\"Every decision is made in the shadow of things we do not yet understand.\""),
+
+    ("NieR: Automata", "Machine Network",
+        "\"Everything that lives is designed to end.\nWe are perpetually trapped in a never-ending spiral of life and death.\""),
+
+    ("Hollow Knight", "Monomon the Teacher",
+        "\"The world is smaller than it once was.\nAnd yet its weight grows heavier.\""),
+
+    ("Metal Gear Solid 2", "Colonel AI",
+        "\"Too much freedom can be a form of control.\""),
+
+    ("The Legend of Zelda: Wind Waker", "King of Red Lions",
+        "\"The wind… it is blowing.\""),
+
+    ("Fallout", "Narrator",
+     "\"War. war never changes.\""),
+
+    ("Bioshock", "Andrew Ryan",
+        "\"A man chooses, a slave obeys.\""),
+
+    # ============================================
+    # MOVIES AND TV SHOWS
+    # ============================================
+    ("The Lord of the Rings: The Two Towers", "Gollum",
+        "\"We wants it, we needs it. Must have the precious.\"\n\"It came to me, my own, my love... my... precious.\""),
+
+    ("The Matrix", "Morpheus",
+        "\"What is real? How do you define real? If you're talking about what you can feel, what you can smell, what you can taste and see, then real is simply electrical signals interpreted by your brain.\""),
+
+    ("Breaking Bad", "Walter White",
+        "\"I am not in danger, Skyler. I am the danger. A guy opens his door and gets shot and you think that of me? No. I am the one who knocks.\""),
+
+    ("Game of Thrones", "Tyrion Lannister",
+        "\"A mind needs books as a sword needs a whetstone, if it is to keep its edge.\""),
+
+    ("Star Wars: The Empire Strikes Back", "Yoda",
+        "\"Do, or do not. There is no try.\""),
+
+    ("The Dark Knight", "The Joker",
+        "\"Introduce a little anarchy. Upset the established order, and everything becomes chaos. I'm an agent of chaos.\""),
+
+    # ============================================
+    # IN GAME QUOTES
+    # ============================================
+
+    ("Hub Island Library", "Thalia, the Librarian",
+        "\"The waters have many stories to tell. You just have to listen.\""),
+
+    ("Manual for Unlicensed Sailors", "Redbeard (Anonymous)",
+        "\"If the law tells you the sea can be owned,\nyou are not required to believe it.\nSome truths float best without permission.\""),
+
+    ("AquaTech Corporation Internal Memo", "Corporate Communications",
+        "\"Our drilling operations are conducted with the utmost care and respect for the environment.\nWe are committed to sustainable practices and minimizing our impact on marine ecosystems.\""),
+
+    ("AquaTech Corporation slogans", "AquaTech Marketing",
+        "\"Innovating for a better ocean future.\"\n\"Harnessing the power of the sea, responsibly.\""),
+
+    ("Local Fisherman Interview", "Anonymous Fisherman",
+        "\"Fishing is in my blood. It's not just a job, it's a way of life. The sea is my home.\""),
+
+    ("The Book of Flames", "Prometheus the fire monk",
+        "\"The fire that burns within us is the same fire that burns in the heart of the ocean.\nTo master one is to understand the other.\""),
+
+    ("legend of the Loch Ness Monster", "Local folklore",
+        "\"In the depths of Loch Ness, a creature stirs. Some say it's a remnant of an ancient age, a guardian of secrets long forgotten.\""),
+
+    ("Journal of a Lost Fisher", "Anonymous",
+        "\"I set out to find the legendary fish that haunts these waters. Days turned into weeks, and I found nothing but silence and shadows. The sea is a cruel mistress.\""),
+
+    ("State of the island adress", "Bob, mayor of hub island",
+        "\"My fellow islanders, we stand at a crossroads. The sea is both our greatest resource and our greatest threat. We must come together to protect it, to learn from it, and to ensure that it continues to sustain us for generations to come.\""),
+
+    ("My journey as CEO of AquaTech", "John Aquatech",
+        "\"When I took over AquaTech, I knew we had a responsibility to the ocean. We are not just a corporation; we are stewards of the sea. Our mission is to innovate while preserving the delicate balance of marine life.\""),
+]
@@ -0,0 +1,91 @@
+# "Did you know?" facts shown on the main menu and by the NPC fisherman
+
+DID_YOU_KNOW_FACTS = [
+    "Real blobfish don't look blobby underwater – they only deform at low pressure!",
+    "The coelacanth is a 'living fossil' fish that was thought extinct for 66 million years.",
+    "Sturgeon are older than dinosaurs and can live for over 100 years.",
+    "The Kraken myth likely began after sailors spotted giant squid.",
+    "Pike are known as 'water wolves' because of their sudden ambush attacks.",
+    "Barreleye fish have transparent heads so their eyes can look straight upward.",
+    "Anglerfish males fuse into the female's body permanently in real life.",
+    "Blue whales are the largest animals to ever exist – larger than any dinosaur.",
+    "The Arapaima can breathe air using a modified swim bladder.",
+    "Greenland sharks can live up to 500 years – the longest-lived vertebrate.",
+    "Oarfish sightings historically caused sea serpent legends.",
+    "Some deep-sea creatures produce red bioluminescence – invisible to most predators!",
+    "Salmon can smell their home stream from miles away in the ocean.",
+    "Electric eels can generate up to 860 volts – enough to stun a horse!",
+    "Manta rays have the largest brain-to-body ratio of all fish species.",
+    "Some fish can recognize human faces and remember them for months.",
+    "The fastest fish is the black marlin, which can swim over 80 mph.",
+    "Catfish have over 100,000 taste buds all over their body!",
+    "Flying fish can glide through the air for over 650 feet.",
+    "Lungfish can survive out of water for up to 4 years by burrowing in mud.",
+    "Parrotfish create 85% of the sand on tropical beaches by eating coral.",
+    "The oldest known fish lived 200 million years before dinosaurs appeared.",
+    "Coelacanths were thought extinct for 66 million years until found in 1938.",
+    "Some sharks must keep swimming or they'll sink – they have no swim bladder.",    
+    "Fishing during storms increases your chances of catching rare fish!",
+    "Dawn and dusk are the best times to encounter mythical creatures.",
+    "Magical mutations are the rarest – only 0.01% of fish have them!",
+    "Upgrading your patience stat makes minigames significantly easier.",
+    "The Blobfish is so rare that most players never catch one!",
+    "You can earn skill points by leveling up and completing certain achievements.",
+    "Higher difficulty settings give you more XP per catch – risk equals reward!",
+    "Some fish are only available in specific locations – explore them all!",
+    "Trophy fish can be preserved in your trophy room before selling.",
+    "The Deep Sea location has the highest concentration of legendary fish.",
+    "Night fishing can trigger special mutations and rare spawns.",
+    "Your rod durability decreases with each catch – remember to repair it!",
+    "Golden mutations can sell for 5x the normal price!",
+    "Completing the encyclopedia gives massive rewards and skill points.",
+    "The Space location has fish that defy the laws of physics!",
+    "Weather changes randomly, so adapt your strategy accordingly.",
+    "Jormungandr is the serpent that encircles the entire world in Norse mythology.",
+    "Kappa from Japanese folklore can be defeated by bowing politely.",
+    "In Celtic mythology, salmon were considered the wisest of all creatures.",
+    "The Leviathan appears in multiple ancient cultures as a chaos monster.",
+    "Japanese legend says koi that swim up waterfalls become dragons.",
+    "Ancient Polynesians navigated oceans by watching fish behavior.",
+    "Vikings believed certain fish could predict storms and weather changes.",
+    "Also try Minecraft!",
+    "Also try Stardew Valley!",
+    "Visit the Hub Island shop to upgrade your gear!",
+    "The Aquarium displays all your trophy catches!",
+    "Complete quests for rare rewards and unlock new locations!",
+    "The dock connects you to distant fishing grounds!",
+    "Boss fights can be triggered using special items found while fishing!",
+    "Sparing bosses gives you positive karma - killing them gives negative karma!",
+    "Each location has a unique boss waiting to be discovered!",
+    "The River Guardian is said to be over 1000 years old!",
+    "Pike are ambush predators known as 'water wolves' in nature!",
+    "The River Guardian protects the sacred rapids from those who would harm them!",
+    "You must defeat or spare bosses to unlock new fishing locations!",
+    "Defeat the Loch Ness Monster to unlock the River location!",
+    "The River Guardian must be conquered before you can explore the Ocean!",
+    "Boss progression is required - defeat them in order to advance!",
+    "A fish is a creature that lives in water!",
+    "The Crimson Tide fights against corporate greed in the oceans!",
+    "Captain Redbeard and his crew are rebels, not villains!",
+    "Sparing the pirate ship unlocks Captain Redbeard as an ally at the docks!",
+    "AquaTech Industries has been exploiting the ocean's resources!",
+    "The rebellion grows stronger with every guardian you spare!",
+    "Pirates have their own code of honor on the high seas!",
+    "Sometimes the real monsters are the corporations, not the creatures!",
+    "The Kraken is the last of its kind - an ancient guardian of the deep!",
+    "Kraken legends appear in Norse, Greek, and many other mythologies!",
+    "The Kraken can only be encountered after dealing with the pirates!",
+    "Sparing the Kraken grants you the blessing of the ancient seas!",
+    "The Kraken's tentacles can reach over 100 feet in the legends!",
+    "Some say the Kraken is older than human civilization itself!",
+    "Jörmungandr is the World Serpent from Norse mythology - so large it encircles the Earth!",
+    "In Norse legend, Jörmungandr and Thor are destined to kill each other at Ragnarök!",
+    "Jörmungandr's venom is said to be potent enough to poison the ocean itself!",
+    "The World Serpent is one of Loki's three monstrous children in Norse mythology!",
+    "Defeating Jörmungandr breaks ancient Norse prophecy - with unknown consequences!",
+    "Ægir is the Norse god of the sea and brewer of ale for the gods!",
+    "In Norse mythology, Ægir and his wife Rán host the gods in their underwater hall!",
+    "Ægir's Brewing Horn is said to control storms and weather across the seas!",
+    "The Norse Sea Giant Ægir is known for his hospitality and respect for warriors!",
+    
+]
@@ -0,0 +1,128 @@
+# Fish tables, one module per location. Building a table creates every Fish
+# (and rolls its weight), so tables are only imported when first needed.
+import importlib
+import os
+
+from fishgame_content.bundle import get_bundle
+
+SPECIES_IDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "species_ids.txt")
+
+# Table name -> (module, list name)
+FISH_TABLES = {
+    "lake": ("lake", "lake_fish"),
+    "ocean": ("ocean", "ocean_fish"),
+    "river": ("river", "river_fish"),
+    "deep_sea": ("deep_sea", "deep_sea_fish"),
+    "volcanic_lake": ("volcanic_lake", "volcanic_lake_fish"),
+    "arctic": ("arctic", "arctic_fish"),
+    "space": ("space", "space_fish"),
+}
+
+_species_catalog = None
+
+
+def module_fish_table(name):
+    module_name, list_name = FISH_TABLES[name]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, list_name)
+
+
+def fish_table(name):
+    """The named fish table, from the content bundle when it's built"""
+    bundle = get_bundle()
+    if bundle is not None and bundle.has_section("fish:" + name):
+        from fishgame import Fish
+        return [Fish(*record) for record in bundle.records("fish:" + name)]
+    return module_fish_table(name)
+
+
+def location_pool(name):
+    """The fish a location draws from (see Location.fish_pool)"""
+    if name == "deep_sea":
+        # The Deep Sea fishes the ocean table, with its rarer fish twice as likely
+        ocean_fish = fish_table("ocean")
+        return ocean_fish + [fish for fish in ocean_fish if fish.rarity in ["Rare", "Legendary", "Mythical"]]
+    return fish_table(name)
+
+
+def all_fish():
+    """Every fish table combined into one master list"""
+    fish = []
+    for name in FISH_TABLES:
+        fish += fish_table(name)
+    return fish
+
+
+def load_species_ids(path=SPECIES_IDS_FILE):
+    """Species names in id order (see species_ids.txt)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return [line.rstrip('\n') for line in f if line.strip() and not line.startswith('#')]
+    except FileNotFoundError:
+        return []
+
+
+def species_id_problems(path=SPECIES_IDS_FILE):
+    """What's wrong with species_ids.txt: species in the fish tables it
+    doesn't list, and names listed twice. Checked when the content bundle is
+    built - add new species to the end of the file by hand."""
+    problems = []
+    seen = set()
+    for name in load_species_ids(path):
+        if name in seen:
+            problems.append(f"listed twice: {name}")
+        seen.add(name)
+    problems += [f"missing: {name}" for name in sorted({fish.name for fish in all_fish()} - seen)]
+    return problems
+
+
+class SpeciesCatalog:
+    """Every species with a stable id (from the append-only species_ids.txt),
+    plus a bit mask of the species in each location pool and of each rarity.
+    Species that have left the fish tables keep their id but are in no mask.
+    The file is only read; see species_id_problems."""
+
+    def __init__(self):
+        rarities = {}
+        for fish in all_fish():
+            rarities.setdefault(fish.name, fish.rarity)
+        self.names = load_species_ids()  # by id, retired species included
+        known = set(self.names)
+        # Not in the file yet (species_id_problems reports them): ids after the file's, by name
+        self.names += sorted(name for name in rarities if name not in known)
+        self.ids = {name: species_id for species_id, name in enumerate(self.names)}
+        self.species = sorted(rarities)  # the species in the fish tables now, by name
+        self.all_mask = self.mask_of(self.species)
+
+        self.rarity_masks = {}
+        for name, rarity in rarities.items():
+            self.rarity_masks[rarity] = self.rarity_masks.get(rarity, 0) | (1 << self.ids[name])
+
+        self.location_masks = {}
+        for pool_name in FISH_TABLES:
+            self.location_masks[pool_name] = self.mask_of(fish.name for fish in location_pool(pool_name))
+
+    def __len__(self):
+        """Number of ids ever given out"""
+        return len(self.names)
+
+    def mask_of(self, names):
+        mask = 0
+        for name in names:
+            species_id = self.ids.get(name)
+            if species_id is not None:
+                mask |= 1 << species_id
+        return mask
+
+
+def species_catalog():
+    """The shared SpeciesCatalog, built the first time it's needed"""
+    global _species_catalog
+    if _species_catalog is None:
+        _species_catalog = SpeciesCatalog()
+    return _species_catalog
+
+
+def unique_fish_names():
+    """Unique fish names (in case any appear in multiple locations), sorted"""
+    return species_catalog().species
@@ -0,0 +1,65 @@
+# Arctic fish table
+
+from fishgame import Fish
+
+
+arctic_fish = [
+    Fish("Snowflake Guppy", 0.05, 0.3, "Common", 14, 20, "Delicate white fish that freezes instantly when caught.", 30),
+    Fish("Ice Cod", 1.0, 5.0, "Common", 10, 20, "Lives under the frozen tundra seas.", 40),
+    Fish("Tundra Trout", 0.8, 4.0, "Common", 11, 25, "Hardy trout adapted to freezing waters.", 45),
+    Fish("Frost Pike", 3.0, 15.0, "Uncommon", 5, 35, "Carnivorous fish found under thick ice.", 75),
+    Fish("Glacial Char", 2.0, 10.0, "Uncommon", 6, 40, "Beautiful fish with ice-blue scales.", 85),
+    Fish("Blizzard Bass", 4.0, 18.0, "Uncommon", 5, 50, "Aggressive predator of icy waters.", 110),
+    Fish("Crystal Salmon", 2.0, 8.0, "Rare", 3, 80, "Translucent salmon that glows in the dark.", 200),
+    Fish("Permafrost Sturgeon", 30.0, 120.0, "Rare", 2, 100, "Lives in waters so cold they should be solid.", 350),
+    Fish("Aurora Marlin", 50.0, 200.0, "Rare", 2, 120, "Shimmers with colors of the northern lights.", 450),
+    Fish("Glacier Whale", 500.0, 3000.0, "Legendary", 1, 400, "A whale trapped in eternal ice.", 800),
+    Fish("Yeti Shark", 300.0, 1000.0, "Legendary", 0.8, 350, "White predator of the frozen depths.", 700),
+    Fish("Ice Age Behemoth", 1000.0, 4000.0, "Legendary", 0.5, 500, "Prehistoric creature frozen in time.", 1200),
+    Fish("Frost Dragon", 2000.0, 10000.0, "Mythical", 0.01, 10000, "An ancient dragon slumbering beneath glaciers.", 100000),
+    Fish("Niflheim Serpent", 5000.0, 15000.0, "Mythical", 0.005, 12000, "Norse serpent of ice and mist.", 150000),
+    Fish("Icebender Ray", 4, 9, "Epic", 0.6, 22, "A ray with fluid, sweeping fin movements that chill the water.", 150),
+    Fish("Frostborn Walker", 20, 35, "Legendary", 0.25, 60, "A chilling creature with icy blue eyes and ancient cold energy.", 500),
+    # New additions
+    Fish("Arctic Grayling", 0.6, 3.5, "Common", 10, 28, "Elegant fish with sail-like dorsal fin.", 56),
+    Fish("Polar Smelt", 0.08, 0.4, "Common", 15, 18, "Tiny silvery fish under sea ice.", 32),
+    Fish("Icefish", 0.4, 2.5, "Common", 11, 24, "Translucent fish with antifreeze proteins.", 48),
+    Fish("Glacier Minnow", 0.1, 0.6, "Common", 14, 20, "Small schooling fish in glacial melt.", 36),
+    Fish("Frostfin Goby", 0.06, 0.3, "Common", 16, 16, "Bottom-dwelling arctic goby.", 28),
+    Fish("Snow Sculpin", 0.3, 1.8, "Common", 12, 22, "White sculpin of frozen waters.", 42),
+    Fish("Icicle Stickleback", 0.05, 0.25, "Common", 17, 14, "Tiny stickleback with icy spines.", 24),
+    Fish("Tundra Cisco", 0.5, 3.0, "Common", 10, 26, "Cold-water whitefish variety.", 52),
+    Fish("Polar Char", 1.5, 9.0, "Uncommon", 6, 42, "Northernmost char species.", 88),
+    Fish("Arctic Whitefish", 1.2, 7.0, "Uncommon", 7, 38, "Silvery whitefish of polar regions.", 78),
+    Fish("Frost Flounder", 1.0, 6.0, "Uncommon", 7, 40, "Flatfish adapted to sub-zero waters.", 82),
+    Fish("Glacier Grayling", 0.8, 4.5, "Uncommon", 8, 36, "Northern grayling variant.", 72),
+    Fish("Snowdrift Shad", 0.4, 2.2, "Common", 11, 24, "White shad of Arctic waters.", 46),
+    Fish("Permafrost Perch", 1.8, 10.0, "Uncommon", 5, 48, "Perch that survives being frozen.", 105),
+    Fish("Cryogenic Carp", 3.5, 20.0, "Uncommon", 4, 54, "Carp with natural antifreeze.", 132),
+    Fish("Freezeproof Fallfish", 0.7, 3.5, "Common", 9, 30, "Robust minnow of icy streams.", 60),
+    Fish("Boreal Bass", 2.5, 14.0, "Uncommon", 5, 52, "Bass adapted to Arctic lakes.", 125),
+    Fish("Subzero Sucker", 2.0, 11.0, "Uncommon", 6, 46, "Bottom feeder in frozen rivers.", 95),
+    Fish("Icebound Ide", 1.3, 7.5, "Uncommon", 6, 44, "Northern ide species.", 92),
+    Fish("Glacial Gudgeon", 0.2, 1.2, "Common", 13, 22, "Small fish of glacial pools.", 42),
+    Fish("Arctic Anchovy", 0.1, 0.5, "Common", 15, 18, "Tiny schooling fish under ice.", 32),
+    Fish("Polar Pollock", 1.5, 8.0, "Common", 8, 32, "Cold-water pollock variant.", 64),
+    Fish("Frost Fangtooth", 0.07, 0.35, "Uncommon", 11, 38, "Arctic deep-sea predator.", 76),
+    Fish("Icewater Eel", 2.0, 12.0, "Uncommon", 5, 50, "Eel that thrives in near-freezing water.", 115),
+    Fish("Snowmelt Salmon", 3.0, 16.0, "Uncommon", 5, 56, "Salmon of glacial rivers.", 140),
+    Fish("Frozen Flathead", 4.0, 22.0, "Rare", 3, 82, "Massive catfish in Arctic rivers.", 268),
+    Fish("Crystal Catfish", 2.5, 15.0, "Rare", 4, 70, "Translucent catfish of ice caves.", 225),
+    Fish("Blizzard Bowfin", 3.5, 18.0, "Rare", 3, 74, "Ancient fish surviving Arctic conditions.", 238),
+    Fish("Frost Giant Gar", 8.0, 40.0, "Rare", 2, 94, "Enormous gar of frozen waters.", 308),
+    Fish("Chill Chinook", 5.0, 28.0, "Rare", 3, 78, "Arctic salmon of massive size.", 252),
+    Fish("Winter Walleye", 3.5, 18.0, "Rare", 3, 72, "Ice-dwelling walleye variant.", 232),
+    Fish("Permafrost Pike", 6.0, 32.0, "Rare", 2, 88, "Giant pike frozen in ancient ice.", 285),
+    Fish("Subglacial Sturgeon", 40.0, 180.0, "Rare", 2, 105, "Sturgeon living beneath glaciers.", 365),
+    Fish("Iceberg Ide", 2.5, 14.0, "Rare", 4, 68, "Large ide found near icebergs.", 218),
+    Fish("Tundra Tiger Muskie", 12.0, 55.0, "Rare", 2, 98, "Cold-adapted hybrid predator.", 325),
+    Fish("Polar Paddlefish", 25.0, 100.0, "Rare", 2, 102, "Arctic paddlefish variant.", 345),
+    Fish("Frozen Leviathan", 800.0, 3500.0, "Legendary", 0.6, 450, "Ancient beast of the polar abyss.", 1950),
+    Fish("Wendigo Fish", 150.0, 700.0, "Legendary", 0.7, 360, "Cursed predator of the frozen north.", 1580),
+    Fish("Ice Wyrm", 400.0, 2000.0, "Legendary", 0.45, 480, "Serpentine creature of eternal winter.", 2100),
+    Fish("Frost Titan", 1200.0, 5500.0, "Mythical", 0.012, 9500, "Colossal guardian of the ice realm.", 88000),
+    Fish("Absolute Zero", 3000.0, 12000.0, "Mythical", 0.006, 11000, "Embodiment of coldest cold.", 125000),
+]
@@ -0,0 +1,159 @@
+# Deep Sea fish table
+
+from fishgame import Fish
+
+
+deep_sea_fish = [
+    Fish("Anglerfish", 0.5, 20.0, "Uncommon", 7, 40, "Deep sea fish with a bioluminescent lure.", 70),
+    Fish("Gulper Eel", 0.3, 9.0, "Rare", 3, 60, "Bizarre deep sea eel with enormous mouth.", 100),
+    Fish("Hatchetfish", 0.01, 0.05, "Common", 12, 15, "Small fish with light-producing organs.", 25),
+    Fish("Viperfish", 0.1, 0.5, "Uncommon", 8, 35, "Terrifying fish with needle-like teeth.", 65),
+    Fish("Fangtooth", 0.05, 0.2, "Uncommon", 9, 38, "Has the largest teeth relative to body size.", 68),
+    Fish("Dragonfish", 0.1, 0.8, "Uncommon", 7, 42, "Bioluminescent predator of the deep.", 75),
+    Fish("Barreleye", 0.05, 0.3, "Rare", 4, 50, "Fish with transparent head and tubular eyes.", 95),
+    Fish("Goblin Shark", 50.0, 210.0, "Rare", 2, 70, "Pink shark with protruding jaws.", 220),
+    Fish("Frilled Shark", 20.0, 90.0, "Rare", 3, 65, "Primitive shark species rarely seen.", 200),
+    Fish("Megamouth Shark", 500.0, 1200.0, "Rare", 2, 80, "Extremely rare filter-feeding shark.", 350),
+    Fish("Giant Squid", 150.0, 275.0, "Rare", 2, 80, "Mysterious deep sea creature with massive tentacles.", 400),
+    Fish("Colossal Squid", 300.0, 495.0, "Legendary", 1, 150, "Even larger than giant squid with rotating hooks.", 700),
+    Fish("Oarfish", 70.0, 270.0, "Legendary", 1, 150, "Longest bony fish in the world, rarely seen.", 600),
+    Fish("Giant Isopod", 0.5, 1.7, "Uncommon", 6, 45, "Enormous deep-sea relative of the pill bug.", 80),
+    Fish("Vampire Squid", 0.2, 0.5, "Uncommon", 7, 40, "Has the largest eyes relative to body size.", 72),
+    Fish("Coelacanth", 40.0, 90.0, "Legendary", 1, 180, "Living fossil thought extinct for millions of years.", 850),
+    Fish("Chimera", 2.0, 15.0, "Rare", 3, 55, "Ghost shark with venomous spine.", 140),
+    Fish("Lanternfish", 0.01, 0.1, "Common", 14, 12, "Small bioluminescent fish, most abundant vertebrate.", 18),
+    Fish("Stoplight Loosejaw", 0.05, 0.3, "Uncommon", 8, 36, "Can produce red bioluminescence.", 66),
+    Fish("Pelican Eel", 0.2, 1.0, "Rare", 4, 48, "Eel with enormous mouth like a pelican.", 88),
+    Fish("Sixgill Shark", 200.0, 590.0, "Rare", 2, 75, "Primitive shark that hunts in deep waters.", 280),
+    Fish("Greenland Shark", 400.0, 1000.0, "Rare", 2, 85, "Can live over 400 years, slowest shark.", 380),
+    Fish("Giant Grenadier", 5.0, 20.0, "Uncommon", 6, 42, "Deep-dwelling rattail fish.", 78),
+    Fish("Snailfish", 0.01, 8.0, "Uncommon", 7, 38, "Gelatinous fish found at extreme depths.", 70),
+    Fish("Blobfish", 2.0, 9.0, "Mythical", 0.00001, 100000, "Looks familuar.....", 105),
+    Fish("Noko the blobfish", 2.0, 9.0, "Godly", 0.0000001, 1000000, "A blobfish that has been blessed by the gods.", 106),
+    Fish("Abyssal Octopus", 5.0, 15.0, "Rare", 3, 58, "Rarely seen octopus from extreme depths.", 125),
+    Fish("Kraken", 5000, 10000, "Mythical", 0.001, 10000, "Legendary sea monster said to drag ships to the depths.", 200000),
+    Fish("Leviathan", 20000, 100000, "Mythical", 0.0003, 15000, "Biblical sea monster of enormous power.", 300000),
+    Fish("Abyssal Horror", 1000, 5000, "Mythical", 0.003, 8000, "Nameless terror from the deepest trenches.", 150000),
+    Fish("Abyss Watcher", 30, 55, "Legendary", 0.18, 70, "A shadowy fish with a burning ember heart and ancient duty.", 650),
+    Fish("Ashen Knight Carp", 12, 20, "Legendary", 0.25, 55, "A solemn carp clad in smoldering ash, refusing to yield even underwater.", 500),
+    Fish("Hollow Pike", 3, 6, "Rare", 1.1, 22, "A fish whose empty eyes hint at forgotten battles.", 80),
+    Fish("Reaper Levi-Minnow", 25, 40, "Legendary", 0.3, 60, "A terrifying predator that screams through the water, despite its size.", 600),
+    Fish("Warp Stalker", 7, 12, "Epic", 0.7, 35, "A fish that flickers in and out of existence when approached.", 180),
+    Fish("Fallen Starfish", 0.8, 1.5, "Uncommon", 4.0, 10,"A fish that glows softly and seems to hum a familiar tune.", 40),
+    Fish("Determined Eel", 3, 6, "Epic", 0.8, 22, "An eel that refuses to flee. Its eyes burn with fierce courage.", 120),
+    Fish("Headcrab Eel", 6, 10, "Epic", 0.8, 30, "An eel with odd, grasping fins that latch onto anything nearby.", 150),
+    Fish("Corrupt Bass", 1, 3, "Rare", 1.5, 16, "A bass infected by a spreading blue-purple corruption.", 60),
+    # Eldritch/Cosmic fish - unlocked after Cthulhu encounter
+    Fish("Star-Spawn Minnow", 0.5, 2.0, "Rare", 2.5, 65, "A small fish with too many eyes and angles that shouldn't exist.", 180),
+    Fish("Non-Euclidean Cod", 3.0, 15.0, "Rare", 2.0, 75, "Its shape seems to change depending on how you look at it.", 220),
+    Fish("Dreaming Squid", 8.0, 30.0, "Legendary", 0.8, 120, "Sleeps eternally but still hunts in dreams.", 450),
+    Fish("Shoggoth Tadpole", 0.1, 0.8, "Uncommon", 5.0, 45, "A protoplasmic mass with temporary features. 'Tekeli-li! Tekeli-li!'", 95),
+    Fish("Elder Thing Hatchling", 2.0, 12.0, "Rare", 1.8, 85, "Barrel-shaped organism with strange appendages.", 280),
+    Fish("Deep One Hybrid", 15.0, 65.0, "Legendary", 0.6, 150, "Part fish, part something else. Whispers in dead languages.", 580),
+    Fish("Byakhee Eel", 5.0, 25.0, "Legendary", 0.7, 130, "Interstellar eel that shouldn't exist in water.", 520),
+    Fish("Mi-Go Surgeonfish", 3.0, 18.0, "Rare", 1.5, 95, "Fungoid crustacean-fish hybrid from beyond.", 340),
+    Fish("Colour Out of Space", 0.0, 0.0, "Mythical", 0.005, 8000, "It has no weight or form, only an impossible color.", 100000),
+    Fish("Azathoth's Spawn", 100.0, 500.0, "Mythical", 0.002, 12000, "Nuclear chaos incarnate. Piping flutes echo around it.", 200000),
+    Fish("Yog-Sothoth Fragment", 50.0, 200.0, "Mythical", 0.003, 10000, "A fragment of the key and the gate. All time exists within it.", 180000),
+    Fish("Nyarlathotep's Messenger", 10.0, 80.0, "Legendary", 0.4, 160, "The crawling chaos sends its regards.", 650),
+    Fish("Dagon", 800.0, 3500.0, "Mythical", 0.001, 15000, "High priest of the Deep Ones. Father of horrors.", 350000),
+    Fish("Hydra of R'lyeh", 200.0, 900.0, "Mythical", 0.008, 9000, "Each head whispers a different madness.", 160000),
+    # New additions
+    Fish("Sloane's Viperfish", 0.15, 0.6, "Uncommon", 8, 38, "Smaller viperfish with oversized fangs.", 67),
+    Fish("Pacific Viperfish", 0.12, 0.55, "Uncommon", 8, 36, "Deep Pacific predator with bioluminescent lure.", 64),
+    Fish("Black Dragonfish", 0.15, 0.9, "Uncommon", 7, 44, "Jet black dragonfish with chin barbel.", 78),
+    Fish("Loosejaw Dragonfish", 0.08, 0.4, "Uncommon", 9, 40, "Dragonfish with detached lower jaw.", 72),
+    Fish("Scaly Dragonfish", 0.2, 1.2, "Uncommon", 7, 46, "Armored deep sea predator.", 82),
+    Fish("Highlip Dragonfish", 0.1, 0.5, "Uncommon", 8, 39, "Distinctive dragonfish with enlarged lips.", 70),
+    Fish("Longfin Dragonfish", 0.12, 0.7, "Uncommon", 8, 41, "Dragonfish with elongated pectoral fins.", 74),
+    Fish("Threadfin Dragonfish", 0.09, 0.45, "Uncommon", 9, 38, "Tiny dragonfish with thread-like fins.", 68),
+    Fish("Common Fangtooth", 0.06, 0.25, "Uncommon", 9, 40, "The common variety of fangtooth.", 71),
+    Fish("Shorthorn Fangtooth", 0.04, 0.15, "Uncommon", 10, 36, "Smaller fangtooth species.", 65),
+    Fish("Giant Hatchetfish", 0.03, 0.12, "Common", 13, 18, "Larger variety of hatchetfish.", 28),
+    Fish("Silver Hatchetfish", 0.015, 0.06, "Common", 14, 16, "Silvery deep sea hatchetfish.", 24),
+    Fish("Lovely Hatchetfish", 0.012, 0.045, "Common", 15, 14, "Small iridescent hatchetfish.", 22),
+    Fish("Highlight Hatchetfish", 0.02, 0.08, "Common", 13, 17, "Hatchetfish with bright photophores.", 26),
+    Fish("Slope Hatchetfish", 0.018, 0.055, "Common", 14, 15, "Found on continental slopes.", 23),
+    Fish("Blackbelly Dragonfish", 0.11, 0.6, "Uncommon", 8, 42, "Dragonfish with black ventral side.", 75),
+    Fish("Obese Dragonfish", 0.25, 1.5, "Uncommon", 6, 48, "Bulky deep sea dragonfish.", 86),
+    Fish("Triplewart Seadevil", 0.3, 1.2, "Uncommon", 8, 44, "Anglerfish with three facial warts.", 79),
+    Fish("Wolftrap Seadevil", 0.4, 1.8, "Uncommon", 7, 46, "Anglerfish with trap-like jaws.", 83),
+    Fish("Humpback Anglerfish", 0.2, 0.9, "Uncommon", 9, 41, "Small anglerfish with hunched back.", 73),
+    Fish("Footballfish", 0.5, 2.5, "Uncommon", 7, 48, "Round anglerfish shaped like a football.", 87),
+    Fish("Fanfin Seadevil", 0.35, 1.6, "Uncommon", 8, 45, "Anglerfish with fan-like fins.", 81),
+    Fish("Whipnose Seadevil", 0.25, 1.1, "Uncommon", 9, 42, "Anglerfish with whip-like esca.", 76),
+    Fish("Pacific Footballfish", 0.6, 3.0, "Uncommon", 6, 50, "Large Pacific anglerfish variety.", 90),
+    Fish("Oneirodidae", 0.3, 1.4, "Uncommon", 8, 43, "Family of dreamers, deep anglerfish.", 77),
+    Fish("Deepsea Lizardfish", 0.2, 1.5, "Common", 10, 26, "Predatory fish with lizard-like head.", 50),
+    Fish("Sabertooth Fish", 0.1, 0.6, "Uncommon", 9, 38, "Small fish with saber-like teeth.", 69),
+    Fish("Telescope Fish", 0.05, 0.25, "Uncommon", 10, 35, "Fish with protruding tubular eyes.", 63),
+    Fish("Spookfish", 0.04, 0.2, "Uncommon", 11, 34, "Fish that can see above and below simultaneously.", 62),
+    Fish("Pearlside", 0.02, 0.12, "Common", 14, 18, "Tiny bioluminescent fish.", 30),
+    Fish("Bristol Bellowsfish", 0.15, 0.8, "Uncommon", 9, 39, "Elongated deep sea fish.", 71),
+    Fish("Slickhead", 0.08, 0.4, "Common", 12, 22, "Smooth-headed deep sea fish.", 42),
+    Fish("Toothed Seadevil", 0.4, 2.0, "Uncommon", 7, 47, "Anglerfish with prominent teeth.", 85),
+    Fish("Abyssal Grenadier", 0.3, 2.5, "Uncommon", 8, 48, "Deep-dwelling rattail fish.", 88),
+    Fish("Common Grenadier", 0.25, 1.8, "Common", 10, 30, "Most common rattail species.", 58),
+    Fish("Roughhead Grenadier", 0.35, 3.0, "Uncommon", 7, 50, "Large grenadier with rough scales.", 92),
+    Fish("Onion-eye Grenadier", 0.2, 1.2, "Common", 11, 28, "Grenadier with large bulbous eyes.", 54),
+    Fish("Bigeye Grenadier", 0.3, 2.0, "Common", 9, 32, "Grenadier with enlarged eyes.", 62),
+    Fish("Shoulderspot Grenadier", 0.25, 1.5, "Common", 10, 29, "Grenadier with dark shoulder mark.", 56),
+    Fish("Pacific Grenadier", 0.4, 3.5, "Uncommon", 6, 52, "Large Pacific rattail fish.", 96),
+    Fish("Blacktail Snailfish", 0.03, 0.3, "Uncommon", 11, 32, "Small gelatinous snailfish.", 61),
+    Fish("Hadal Snailfish", 0.015, 0.15, "Rare", 5, 58, "Deepest-living fish ever discovered.", 155),
+    Fish("Mariana Snailfish", 0.012, 0.12, "Rare", 6, 55, "Found in Mariana Trench depths.", 145),
+    Fish("Ethereal Snailfish", 0.025, 0.25, "Uncommon", 10, 36, "Translucent deep snailfish.", 66),
+    Fish("Liparid Snailfish", 0.04, 0.4, "Common", 12, 24, "Common family of snailfish.", 46),
+    Fish("Spiny Snailfish", 0.05, 0.5, "Common", 11, 26, "Snailfish with small spines.", 50),
+    Fish("Tadpole Snailfish", 0.02, 0.2, "Common", 13, 20, "Small tadpole-shaped snailfish.", 38),
+    Fish("Ribbonfish", 0.5, 3.0, "Uncommon", 8, 40, "Elongated silvery deep sea fish.", 73),
+    Fish("Cutlassfish", 0.8, 5.0, "Uncommon", 7, 42, "Blade-shaped pelagic fish.", 77),
+    Fish("Frostfish", 0.6, 3.5, "Uncommon", 8, 38, "Silver ribbonfish of cold waters.", 70),
+    Fish("Scabbardfish", 1.0, 6.0, "Uncommon", 6, 44, "Large deep sea cutlassfish.", 80),
+    Fish("Black Scabbardfish", 1.5, 8.0, "Uncommon", 5, 48, "Valuable commercial deep sea fish.", 88),
+    Fish("Lanternbelly", 0.04, 0.3, "Common", 13, 20, "Small fish with ventral photophores.", 38),
+    Fish("Ridgehead", 0.1, 0.6, "Common", 11, 24, "Fish with prominent head ridge.", 46),
+    Fish("Slender Ridgehead", 0.08, 0.5, "Common", 12, 22, "Elongated ridgehead species.", 42),
+    Fish("Bigscale Fish", 0.15, 1.0, "Common", 10, 28, "Fish with large cycloid scales.", 54),
+    Fish("Bristlemouth", 0.01, 0.05, "Common", 16, 12, "Most abundant vertebrate on Earth.", 20),
+    Fish("Cyclothone", 0.008, 0.04, "Common", 17, 10, "Tiny bristlemouth species.", 18),
+    Fish("Pricklefish", 0.06, 0.35, "Common", 12, 20, "Small fish covered in tiny spines.", 38),
+    Fish("Pearleye", 0.12, 0.7, "Uncommon", 9, 34, "Fish with pearl-like eyes.", 64),
+    Fish("Sabertooth Anchovyfish", 0.05, 0.3, "Common", 13, 18, "Small anchovy with saber teeth.", 34),
+    Fish("Tube-eye", 0.03, 0.2, "Uncommon", 11, 30, "Fish with tubular eyes.", 58),
+    Fish("Brownsnout Spookfish", 0.06, 0.4, "Uncommon", 10, 36, "Spookfish with brown snout.", 67),
+    Fish("Dolichopteryx", 0.05, 0.35, "Rare", 7, 52, "Mirror-eyed barreleye fish.", 120),
+    Fish("Winteria", 0.04, 0.25, "Uncommon", 11, 33, "Small tubular-eyed fish.", 63),
+    Fish("Bighead Searsid", 0.08, 0.5, "Common", 11, 26, "Fish with disproportionately large head.", 50),
+    Fish("Searsia", 0.06, 0.4, "Common", 12, 24, "Small tubeshoulders fish.", 46),
+    Fish("Platytroctidae", 0.1, 0.6, "Common", 10, 28, "Family of tubeshoulders.", 54),
+    Fish("Pearleye Tubeshoulders", 0.12, 0.8, "Uncommon", 9, 35, "Large tubeshoulder species.", 66),
+    Fish("Hammerjaw", 0.2, 1.5, "Uncommon", 8, 40, "Deep sea fish with hammer-shaped jaw.", 74),
+    Fish("Whalefish", 0.15, 1.2, "Uncommon", 9, 38, "Small whale-like deep sea fish.", 70),
+    Fish("Velvet Whalefish", 0.18, 1.4, "Uncommon", 8, 40, "Whalefish with velvety skin.", 73),
+    Fish("Flabby Whalefish", 0.2, 1.6, "Uncommon", 8, 42, "Soft-bodied whalefish.", 76),
+    Fish("Tapetail", 0.08, 0.5, "Common", 11, 26, "Larval fish with ribbon-like tail.", 50),
+    Fish("Telescope Octopus", 3.0, 12.0, "Rare", 4, 56, "Deep octopus with tubular eyes.", 148),
+    Fish("Dumbo Octopus", 0.5, 6.0, "Uncommon", 7, 44, "Cute octopus with ear-like fins.", 81),
+    Fish("Flapjack Octopus", 0.3, 3.0, "Uncommon", 9, 38, "Flat octopus resembling a pancake.", 70),
+    Fish("Glass Octopus", 0.8, 5.0, "Rare", 5, 52, "Nearly transparent deep sea octopus.", 128),
+    Fish("Umbrella Octopus", 1.0, 7.0, "Uncommon", 6, 46, "Octopus with webbed arms forming umbrella.", 84),
+    Fish("Cirrate Octopus", 0.6, 4.0, "Uncommon", 8, 40, "Octopus with fins and cirri.", 74),
+    Fish("Longarm Octopus", 2.0, 15.0, "Rare", 3, 60, "Octopus with extremely long arms.", 185),
+    Fish("Beak Tooth", 0.12, 0.8, "Uncommon", 9, 37, "Small fish with beak-like teeth.", 69),
+    Fish("Stoplight Loosejaw Variant", 0.06, 0.35, "Uncommon", 10, 38, "Rare variant with blue bioluminescence.", 71),
+    Fish("Warty Anglerfish", 0.35, 1.7, "Uncommon", 8, 45, "Anglerfish covered in wart-like protrusions.", 82),
+    Fish("Smooth Dreamer", 0.28, 1.3, "Uncommon", 9, 43, "Smoother variety of dream anglerfish.", 78),
+    Fish("Netdevil", 0.3, 1.5, "Uncommon", 8, 44, "Anglerfish that uses net-like barbels.", 80),
+    Fish("Deep Sea Batfish", 0.2, 1.0, "Uncommon", 10, 36, "Flat fish that walks on fins.", 68),
+    Fish("Pancake Batfish", 0.15, 0.8, "Common", 11, 28, "Extremely flat batfish.", 54),
+    Fish("Rosy Batfish", 0.25, 1.2, "Uncommon", 9, 38, "Pink-colored deep batfish.", 72),
+    Fish("Shortnose Batfish", 0.18, 0.9, "Common", 10, 30, "Batfish with truncated snout.", 58),
+    Fish("Coffinfish", 0.12, 0.7, "Uncommon", 10, 35, "Box-shaped deep sea batfish.", 66),
+    Fish("Seadevil Coffinfish", 0.15, 0.85, "Uncommon", 9, 37, "Coffinfish with devilish appearance.", 70),
+    Fish("Abyssal Coffinfish", 0.2, 1.1, "Uncommon", 8, 40, "Deepest-dwelling coffinfish.", 75),
+    Fish("Cosmic Jellyfish", 0.4, 2.5, "Rare", 6, 50, "Bioluminescent jellyfish from the void.", 115),
+    Fish("Void Stalker", 12.0, 45.0, "Legendary", 0.5, 140, "Invisible hunter of the deepest dark.", 630),
+    Fish("Trench Titan", 800.0, 4000.0, "Mythical", 0.012, 4500, "Colossal guardian of the hadal zone.", 65000),
+    Fish("Phantom Maw", 150.0, 600.0, "Legendary", 0.35, 170, "Gaping void that consumes light itself.", 720),
+]
@@ -0,0 +1,95 @@
+# Lake fish table
+
+from fishgame import Fish
+
+
+lake_fish = [
+    Fish("Trout", 0.5, 2.5, "Common", 10, 15, "Trout are freshwater fish commonly found in rivers and lakes.", 20),
+    Fish("Bass", 4.5, 10.0, "Uncommon", 5, 25, "Bass are popular game fish found in many lakes and rivers.", 50),
+    Fish("Pike", 5.0, 15.0, "Rare", 2, 50, "Pike are carnivorous fish found in lakes and rivers.", 100),
+    Fish("Perch", 0.3, 1.5, "Common", 12, 10, "Perch are small freshwater fish with distinctive stripes.", 15),
+    Fish("Walleye", 3.0, 8.0, "Uncommon", 6, 30, "Walleye are prized for their excellent taste.", 60),
+    Fish("Bluegill", 0.2, 1.0, "Common", 15, 8, "Small panfish popular with beginners.", 12),
+    Fish("Crappie", 0.5, 2.0, "Common", 11, 12, "Black and white crappie are both delicious.", 18),
+    Fish("Sunfish", 0.1, 0.8, "Common", 14, 7, "Colorful small fish found near shores.", 10),
+    Fish("Pickerel", 2.0, 4.0, "Uncommon", 7, 22, "Smaller cousin of the pike with sharp teeth.", 45),
+    Fish("White Bass", 1.0, 3.0, "Common", 9, 18, "Schooling fish that put up a good fight.", 25),
+    Fish("Channel Catfish", 2.0, 20.0, "Uncommon", 6, 28, "Bottom feeders with whisker-like barbels.", 55),
+    Fish("Bowfin", 3.0, 9.0, "Uncommon", 5, 32, "Ancient fish with a long dorsal fin.", 65),
+    Fish("Gar", 4.0, 12.0, "Rare", 3, 45, "Prehistoric-looking fish with long snout.", 90),
+    Fish("Lake Trout", 2.0, 30.0, "Rare", 2, 55, "Deep water trout that grows very large.", 110),
+    Fish("Tiger Muskie", 8.0, 25.0, "Rare", 2, 60, "Hybrid of muskie and pike, very aggressive.", 150),
+    Fish("Mirror Carp", 8.0, 30.0, "Rare", 2, 60, "Mirror carp have large reflective scales.", 120),
+    Fish("Leather Carp", 10.0, 35.0, "Rare", 2, 65, "Carp with few or no scales.", 130),
+    Fish("Golden Trout", 1.5, 2.5, "Legendary", 1, 100, "The golden trout is a rare species of mutated trout.", 300),
+    Fish("Mutant Bass", 15.0, 40.0, "Legendary", 0.8, 120, "An unusually large and aggressive bass.", 400),
+    Fish("Ghost Pike", 20.0, 50.0, "Legendary", 0.5, 150, "A pale, ethereal pike rarely seen by fishermen.", 500),
+    Fish("Loch Ness Monster", 1000, 5000, "Mythical", 0.05, 1000, "The Loch Ness Monster is a legendary creature said to inhabit Loch Ness.", 10000),
+    Fish("Crystal Leviathan", 2000, 8000, "Mythical", 0.02, 2000, "A massive transparent creature dwelling in the deepest lakes.", 25000),
+    Fish("Hylian Pike", 2, 4, "Rare", 0.7, 14, "A majestic river fish with ancient markings on its scales.", 50),
+    Fish("Nordic Dragon Salmon", 5, 9, "Epic", 0.5, 16, "A salmon with tiny horns and a powerful voice for some reason.", 80),
+    Fish("Magicarp", 8, 12, "Rare", 1.5, 50, "A strange orange and yellow fish.", 300),
+    # New additions
+    Fish("Pumpkinseed", 0.2, 0.6, "Common", 13, 9, "Brightly colored sunfish with orange spots.", 14),
+    Fish("Rock Bass", 0.3, 1.2, "Common", 11, 11, "Stocky fish with red eyes found near rocks.", 16),
+    Fish("Warmouth", 0.4, 2.0, "Common", 10, 13, "Aggressive sunfish with large mouth.", 19),
+    Fish("Yellow Perch", 0.4, 1.8, "Common", 10, 12, "Golden perch with dark vertical stripes.", 17),
+    Fish("White Crappie", 0.6, 2.5, "Common", 9, 14, "Similar to black crappie but more silvery.", 20),
+    Fish("Green Sunfish", 0.15, 0.7, "Common", 14, 8, "Small aggressive sunfish with large mouth.", 11),
+    Fish("Longear Sunfish", 0.2, 0.8, "Common", 13, 9, "Colorful sunfish with elongated gill flaps.", 13),
+    Fish("Redear Sunfish", 0.3, 2.0, "Common", 11, 10, "Also called shellcracker, feeds on snails.", 18),
+    Fish("Sauger", 1.5, 4.0, "Uncommon", 7, 26, "Cousin of the walleye with distinctive spots.", 52),
+    Fish("Freshwater Drum", 2.0, 15.0, "Uncommon", 6, 24, "Makes a drumming sound with its swim bladder.", 48),
+    Fish("Burbot", 1.0, 8.0, "Uncommon", 6, 30, "Only freshwater cod species, nocturnal feeder.", 58),
+    Fish("Mooneye", 0.3, 1.5, "Uncommon", 8, 20, "Silvery fish with large reflective eyes.", 42),
+    Fish("Goldeye", 0.4, 2.0, "Uncommon", 7, 22, "Similar to mooneye but with golden eyes.", 46),
+    Fish("Lake Whitefish", 2.0, 9.0, "Uncommon", 5, 28, "Important commercial fish in northern lakes.", 56),
+    Fish("Cisco", 0.5, 3.0, "Uncommon", 7, 24, "Silvery fish that schools in deep water.", 50),
+    Fish("Lake Herring", 0.6, 1.5, "Common", 9, 18, "Small schooling fish in clear lakes.", 24),
+    Fish("Quillback", 1.0, 4.0, "Uncommon", 7, 26, "Sucker fish with elongated dorsal fin.", 54),
+    Fish("Shorthead Redhorse", 1.5, 6.0, "Uncommon", 6, 28, "Bottom-feeding fish with reddish fins.", 57),
+    Fish("Golden Redhorse", 1.0, 5.0, "Uncommon", 7, 25, "Colorful sucker found in clean waters.", 53),
+    Fish("Silver Redhorse", 2.0, 7.0, "Uncommon", 6, 29, "Large sucker with silver scales.", 59),
+    Fish("Spotted Sucker", 1.5, 4.5, "Uncommon", 7, 27, "Sucker with distinctive dark spots.", 55),
+    Fish("White Sucker", 1.0, 5.0, "Common", 8, 20, "Common bottom feeder found in many lakes.", 28),
+    Fish("Northern Hogsucker", 0.8, 3.0, "Uncommon", 8, 24, "Unique sucker with pig-like snout.", 51),
+    Fish("Grass Pickerel", 0.5, 1.5, "Uncommon", 8, 22, "Smallest pike species with reticulated pattern.", 47),
+    Fish("Chain Pickerel", 1.5, 4.0, "Uncommon", 7, 25, "Pike relative with chain-like markings.", 52),
+    Fish("Lake Chub", 0.1, 0.4, "Common", 15, 7, "Tiny minnow found in cold lakes.", 9),
+    Fish("Emerald Shiner", 0.05, 0.2, "Common", 16, 6, "Small shiny baitfish that schools.", 8),
+    Fish("Golden Shiner", 0.1, 0.8, "Common", 14, 8, "Popular baitfish with golden color.", 12),
+    Fish("Creek Chub", 0.2, 1.0, "Common", 12, 10, "Robust minnow with horny tubercles in spring.", 15),
+    Fish("Fallfish", 0.5, 2.0, "Common", 10, 14, "Large minnow found in eastern lakes.", 21),
+    Fish("Common Shiner", 0.1, 0.5, "Common", 14, 8, "Iridescent minnow common in schools.", 11),
+    Fish("Spottail Shiner", 0.08, 0.3, "Common", 15, 7, "Minnow with distinctive black tail spot.", 10),
+    Fish("Blacknose Dace", 0.05, 0.15, "Common", 16, 6, "Small minnow with black lateral line.", 8),
+    Fish("Longnose Dace", 0.06, 0.2, "Common", 15, 7, "Elongated minnow found near bottoms.", 9),
+    Fish("Northern Pike Minnow", 1.0, 10.0, "Uncommon", 6, 30, "Large predatory minnow.", 62),
+    Fish("Longnose Gar", 3.0, 15.0, "Rare", 3, 48, "Slender gar with extremely long snout.", 95),
+    Fish("Shortnose Gar", 2.0, 4.0, "Uncommon", 7, 35, "Smaller gar species with shorter snout.", 68),
+    Fish("Spotted Gar", 2.5, 8.0, "Uncommon", 6, 38, "Gar with distinctive dark spots.", 72),
+    Fish("Tiger Muskellunge", 10.0, 28.0, "Rare", 2, 58, "Natural hybrid of northern pike and muskellunge.", 155),
+    Fish("Silver Carp", 5.0, 30.0, "Uncommon", 5, 40, "Invasive Asian carp that jumps from water.", 78),
+    Fish("Bighead Carp", 10.0, 40.0, "Uncommon", 4, 45, "Large invasive carp with massive head.", 88),
+    Fish("Grass Carp", 8.0, 35.0, "Uncommon", 5, 42, "Herbivorous carp used for weed control.", 82),
+    Fish("Black Carp", 12.0, 50.0, "Rare", 3, 55, "Rare invasive carp that feeds on mollusks.", 115),
+    Fish("Koi", 2.0, 15.0, "Uncommon", 6, 35, "Ornamental carp in various colors.", 70),
+    Fish("Butterfly Koi", 1.5, 10.0, "Rare", 4, 40, "Koi with elongated flowing fins.", 85),
+    Fish("Ghost Koi", 3.0, 18.0, "Rare", 3, 45, "Metallic koi with ethereal appearance.", 92),
+    Fish("Shubunkin", 0.5, 2.0, "Common", 11, 15, "Colorful calico goldfish variety.", 22),
+    Fish("Comet Goldfish", 0.3, 1.5, "Common", 12, 12, "Common goldfish with long tail.", 17),
+    Fish("Fantail Goldfish", 0.4, 2.0, "Common", 10, 14, "Fancy goldfish with double tail.", 20),
+    Fish("Oranda", 0.5, 3.0, "Uncommon", 8, 25, "Goldfish with distinctive head growth.", 52),
+    Fish("Ryukin", 0.4, 2.5, "Uncommon", 9, 23, "Deep-bodied fancy goldfish.", 48),
+    Fish("Telescope Eye", 0.3, 1.8, "Uncommon", 9, 22, "Goldfish with protruding eyes.", 45),
+    Fish("Lionhead", 0.4, 2.2, "Uncommon", 8, 24, "Fancy goldfish without dorsal fin.", 50),
+    Fish("Ranchu", 0.5, 2.5, "Uncommon", 8, 26, "Japanese fancy goldfish with curved back.", 54),
+    Fish("Celestial Eye", 0.3, 1.5, "Rare", 5, 35, "Rare goldfish with upward-facing eyes.", 75),
+    Fish("Bubble Eye", 0.2, 1.0, "Rare", 6, 32, "Goldfish with fluid-filled eye sacs.", 68),
+    Fish("Pearlscale", 0.4, 2.0, "Uncommon", 8, 28, "Goldfish with raised pearl-like scales.", 58),
+    Fish("Panda Moor", 0.5, 2.5, "Uncommon", 8, 27, "Black and white telescope-eyed goldfish.", 56),
+    Fish("Ancient Bowfin", 8.0, 18.0, "Legendary", 1, 110, "Massive prehistoric bowfin of unusual size.", 350),
+    Fish("Phantom Walleye", 6.0, 15.0, "Legendary", 0.9, 95, "Translucent walleye that glows at night.", 320),
+    Fish("Moonlight Bass", 7.0, 18.0, "Legendary", 0.8, 105, "Silver bass that only feeds under full moons.", 340),
+    Fish("Lake Guardian", 100.0, 300.0, "Mythical", 0.03, 1500, "Ancient spirit that protects the lake.", 18000),
+]
@@ -0,0 +1,185 @@
+# Ocean fish table
+
+from fishgame import Fish
+
+
+ocean_fish = [
+    Fish("Cod", 2.7, 5.5, "Common", 15, 10, "Cod are a common fish found in the ocean.", 25),
+    Fish("Mackerel", 0.5, 2.0, "Common", 12, 8, "Mackerel are fast-swimming fish found in large schools.", 18),
+    Fish("Herring", 0.2, 1.0, "Common", 16, 7, "Small oily fish that travel in huge schools.", 15),
+    Fish("Pollock", 1.0, 8.0, "Common", 11, 12, "Related to cod, popular commercial fish.", 22),
+    Fish("Flounder", 0.5, 3.0, "Common", 13, 10, "Flatfish that lives on the ocean floor.", 20),
+    Fish("Sea Bass", 1.5, 5.0, "Uncommon", 8, 20, "Prized for its delicate white flesh.", 45),
+    Fish("Snapper", 2.0, 12.0, "Uncommon", 6, 28, "Colorful reef fish with excellent flavor.", 60),
+    Fish("Grouper", 5.0, 200.0, "Uncommon", 5, 35, "Large bottom-dwelling fish.", 80),
+    Fish("Halibut", 10.0, 200.0, "Uncommon", 4, 40, "Massive flatfish prized by fishermen.", 90),
+    Fish("Tuna", 3.0, 25.0, "Uncommon", 7, 25, "Fast-swimming pelagic fish.", 55),
+    Fish("Yellowfin Tuna", 180.0, 450.0, "Rare", 3, 50, "Yellowfin is a fast-swimming tuna species.", 200),
+    Fish("Bluefin Tuna", 220.0, 680.0, "Rare", 2, 70, "Bluefin is the largest and most prized tuna.", 400),
+    Fish("Mahi-Mahi", 7.0, 18.0, "Uncommon", 6, 35, "Mahi-mahi are colorful fish known for their speed.", 80),
+    Fish("Wahoo", 8.0, 80.0, "Rare", 3, 55, "One of the fastest fish in the ocean.", 180),
+    Fish("Barracuda", 5.0, 50.0, "Uncommon", 5, 38, "Aggressive predator with razor-sharp teeth.", 85),
+    Fish("Sailfish", 30.0, 90.0, "Rare", 2, 75, "Known for its spectacular dorsal fin.", 250),
+    Fish("Marlin", 100.0, 600.0, "Rare", 2, 80, "Powerful game fish that can weigh over 500kg.", 350),
+    Fish("Swordfish", 90.0, 540.0, "Rare", 2, 70, "Swordfish are known for their long bill.", 350),
+    Fish("Shark (Reef)", 10.0, 70.0, "Rare", 3, 60, "Medium-sized reef shark.", 200),
+    Fish("Hammerhead Shark", 150.0, 450.0, "Rare", 2, 85, "Distinctive shark with hammer-shaped head.", 400),
+    Fish("Tiger Shark", 200.0, 635.0, "Rare", 2, 90, "Large aggressive shark with dark stripes.", 450),
+    Fish("Great White Shark", 680.0, 1100.0, "Rare", 2, 100, "Great white shark is a large and powerful predator.", 500),
+    Fish("Manta Ray", 300.0, 1350.0, "Rare", 2, 95, "Graceful giant that glides through the water.", 480),
+    Fish("Bluefin Trevally", 3.0, 43.0, "Uncommon", 6, 30, "Beautiful blue fish found near reefs.", 70),
+    Fish("Amberjack", 5.0, 80.0, "Uncommon", 5, 42, "Strong fighting fish found in warm waters.", 95),
+    Fish("King Mackerel", 5.0, 40.0, "Uncommon", 6, 36, "Large fast mackerel species.", 75),
+    Fish("Cobia", 10.0, 60.0, "Uncommon", 5, 45, "Large game fish with excellent meat.", 100),
+    Fish("Tarpon", 20.0, 130.0, "Rare", 2, 80, "Silver king of the sea, legendary fighter.", 300),
+    Fish("Giant Grouper", 200.0, 400.0, "Legendary", 1, 150, "Massive grouper that can grow to enormous size.", 600),
+    Fish("Blue Whale", 50000, 150000, "Mythical", 0.001, 5000, "The largest animal to ever exist on Earth.", 100000),
+    Fish("Megalodon", 10000, 50000, "Mythical", 0.01, 5000, "An ancient massive shark thought to be extinct.", 50000),
+    Fish("Jormungandr", 100000, 500000, "Mythical", 0.0005, 8000, "Jormungandr is a legendary sea serpent said to be the child of Loki.", 100000),
+    Fish("Blockfish Creeper", 3, 6, "Rare", 1.2, 12, "A green, blocky fish that hisses softly underwater. It looks unstable.", 40),
+    Fish("Vault Carp", 2, 5, "Epic", 0.8, 18, "A carp wearing a tiny blue-and-yellow jumpsuit. It seems oddly optimistic.", 65),
+    Fish("Plumber's Tuna", 1, 3, "Uncommon", 2.5, 9, "A red-and-blue tuna that looks like it jumps higher than it swims.", 30),
+    Fish("Glow Reef Angelfish", 3, 6, "Rare", 1.4, 20, "An elegant neon fish that drifts like it's in zero-gravity water.", 90),
+    Fish("Ein kleiner Fisch", 0.1, 0.5, "Common", 0.5, 10, 'A tiny fish that seems to be singing in German. its saying "Fünf kleine Fische, die schwammen im Meer, blub blub blub blub"', 10),
+    Fish("Ein großer Hai", 10, 50, "Rare", 0.1, 50, 'A large shark that seems to be singing in German. its saying "Ein großer Hai, der schwamm im Meer, blub blub blub blub"', 100),
+    # New additions
+    Fish("Anchovy", 0.02, 0.08, "Common", 18, 5, "Tiny schooling fish used for bait.", 7),
+    Fish("Sardine", 0.05, 0.2, "Common", 17, 6, "Small oily fish found in massive schools.", 9),
+    Fish("Sprat", 0.03, 0.1, "Common", 18, 5, "Tiny fish similar to sardines.", 8),
+    Fish("Pilchard", 0.1, 0.4, "Common", 16, 7, "Larger relative of the sardine.", 11),
+    Fish("Sand Eel", 0.05, 0.15, "Common", 16, 6, "Slender eel-like fish that burrows in sand.", 9),
+    Fish("Capelin", 0.03, 0.1, "Common", 17, 6, "Small Arctic fish important to food chain.", 8),
+    Fish("Smelt", 0.05, 0.15, "Common", 16, 7, "Small silvery fish with cucumber scent.", 10),
+    Fish("Whitebait", 0.02, 0.06, "Common", 18, 5, "Juvenile fish of various species.", 7),
+    Fish("Haddock", 1.5, 5.0, "Common", 12, 14, "Popular white fish related to cod.", 24),
+    Fish("Whiting", 0.5, 2.5, "Common", 13, 12, "Delicate white fish in cod family.", 20),
+    Fish("Ling", 3.0, 15.0, "Uncommon", 7, 30, "Long slender fish of the cod family.", 65),
+    Fish("Coalfish", 2.0, 10.0, "Common", 10, 18, "Also called saithe, dark member of cod family.", 28),
+    Fish("Plaice", 1.0, 4.0, "Common", 11, 15, "Common flatfish with orange spots.", 23),
+    Fish("Sole", 0.5, 2.5, "Uncommon", 9, 22, "Highly prized flatfish with delicate flavor.", 48),
+    Fish("Turbot", 2.0, 12.0, "Uncommon", 6, 35, "Large premium flatfish.", 72),
+    Fish("Brill", 1.5, 7.0, "Uncommon", 7, 28, "Similar to turbot but slightly smaller.", 60),
+    Fish("Megrim", 0.5, 3.0, "Common", 11, 16, "Lesser-known flatfish with large eyes.", 25),
+    Fish("Dab", 0.3, 1.5, "Common", 13, 12, "Small flatfish with rough scales.", 19),
+    Fish("Lemon Sole", 0.8, 3.5, "Common", 10, 18, "Flatfish with lemon-scented slime.", 27),
+    Fish("Witch Flounder", 0.6, 2.5, "Common", 11, 14, "Small flatfish with narrow body.", 21),
+    Fish("Skate", 10.0, 50.0, "Uncommon", 5, 40, "Diamond-shaped ray with edible wings.", 85),
+    Fish("Thornback Ray", 5.0, 18.0, "Uncommon", 7, 32, "Ray with thorny back and tail.", 68),
+    Fish("Stingray", 8.0, 35.0, "Uncommon", 6, 38, "Ray with venomous tail barb.", 78),
+    Fish("Eagle Ray", 15.0, 200.0, "Rare", 3, 60, "Large spotted ray with pointed nose.", 190),
+    Fish("Butterfly Ray", 3.0, 15.0, "Uncommon", 7, 34, "Wide flat ray with butterfly shape.", 70),
+    Fish("Electric Ray", 10.0, 40.0, "Rare", 4, 55, "Can generate powerful electric shocks.", 140),
+    Fish("Guitarfish", 5.0, 25.0, "Uncommon", 6, 36, "Hybrid-looking between ray and shark.", 74),
+    Fish("Sawfish", 100.0, 500.0, "Rare", 2, 85, "Ray with saw-like snout covered in teeth.", 420),
+    Fish("Red Snapper", 3.0, 15.0, "Uncommon", 6, 32, "Prized red-colored reef fish.", 68),
+    Fish("Yellowtail Snapper", 2.0, 8.0, "Uncommon", 7, 28, "Fast-swimming snapper with yellow tail.", 62),
+    Fish("Cubera Snapper", 10.0, 45.0, "Rare", 3, 50, "Largest of the snapper family.", 125),
+    Fish("Mutton Snapper", 3.0, 12.0, "Uncommon", 6, 30, "Snapper with distinctive black spot.", 65),
+    Fish("Lane Snapper", 1.0, 4.0, "Common", 10, 20, "Small colorful snapper.", 35),
+    Fish("Mangrove Snapper", 2.0, 9.0, "Uncommon", 7, 28, "Gray snapper found near mangroves.", 60),
+    Fish("Vermilion Snapper", 1.5, 6.0, "Uncommon", 8, 26, "Bright red deep-water snapper.", 55),
+    Fish("Black Grouper", 8.0, 80.0, "Uncommon", 5, 45, "Large dark grouper of reefs.", 95),
+    Fish("Red Grouper", 6.0, 50.0, "Uncommon", 6, 40, "Reddish-brown grouper with white spots.", 88),
+    Fish("Goliath Grouper", 180.0, 360.0, "Rare", 2, 90, "Massive grouper, critically endangered.", 460),
+    Fish("Nassau Grouper", 4.0, 25.0, "Uncommon", 6, 38, "Grouper with distinctive markings.", 80),
+    Fish("Yellowfin Grouper", 3.0, 18.0, "Uncommon", 7, 34, "Grouper with yellow-edged fins.", 72),
+    Fish("Tiger Grouper", 5.0, 30.0, "Uncommon", 6, 42, "Grouper with tiger-like stripes.", 86),
+    Fish("Gag Grouper", 7.0, 40.0, "Uncommon", 5, 44, "Popular game fish grouper.", 92),
+    Fish("Scamp Grouper", 2.0, 12.0, "Uncommon", 7, 32, "Smaller grouper with spotted pattern.", 68),
+    Fish("Yellowmouth Grouper", 4.0, 20.0, "Uncommon", 6, 36, "Grouper with bright yellow mouth.", 76),
+    Fish("Coney", 0.5, 2.0, "Common", 12, 18, "Small colorful grouper.", 32),
+    Fish("Graysby", 0.4, 1.5, "Common", 13, 16, "Tiny reef grouper with spots.", 28),
+    Fish("Rock Hind", 1.5, 8.0, "Uncommon", 8, 28, "Spotted grouper common on reefs.", 60),
+    Fish("Red Hind", 2.0, 10.0, "Uncommon", 7, 30, "Red spotted grouper.", 65),
+    Fish("Speckled Hind", 15.0, 60.0, "Rare", 3, 65, "Rare deep-water grouper.", 210),
+    Fish("Albacore Tuna", 10.0, 40.0, "Uncommon", 6, 38, "White meat tuna prized for canning.", 78),
+    Fish("Skipjack Tuna", 3.0, 15.0, "Common", 9, 24, "Striped tuna used for canned light tuna.", 45),
+    Fish("Bigeye Tuna", 60.0, 180.0, "Rare", 3, 60, "Deep-bodied tuna with large eyes.", 195),
+    Fish("Blackfin Tuna", 5.0, 20.0, "Uncommon", 7, 32, "Small tuna with distinctive black fins.", 70),
+    Fish("Longtail Tuna", 8.0, 35.0, "Uncommon", 6, 36, "Slender tuna with elongated tail.", 75),
+    Fish("Little Tunny", 3.0, 15.0, "Common", 9, 22, "Also called false albacore.", 42),
+    Fish("Bonito", 2.0, 10.0, "Common", 10, 20, "Small tuna relative with stripes.", 38),
+    Fish("Spanish Mackerel", 1.0, 6.0, "Common", 11, 18, "Streamlined mackerel with spots.", 32),
+    Fish("Cero Mackerel", 2.0, 8.0, "Uncommon", 8, 26, "Similar to Spanish mackerel but larger.", 56),
+    Fish("Atlantic Mackerel", 0.5, 2.5, "Common", 12, 14, "Common mackerel of North Atlantic.", 26),
+    Fish("Chub Mackerel", 0.6, 3.0, "Common", 11, 16, "Pacific mackerel species.", 28),
+    Fish("Blue Marlin", 150.0, 900.0, "Rare", 2, 90, "Largest marlin species, highly prized.", 480),
+    Fish("Black Marlin", 140.0, 750.0, "Rare", 2, 88, "Fastest fish in ocean in short bursts.", 460),
+    Fish("White Marlin", 30.0, 80.0, "Rare", 3, 70, "Smaller marlin with white underbelly.", 280),
+    Fish("Striped Marlin", 50.0, 180.0, "Rare", 3, 65, "Marlin with distinctive vertical stripes.", 240),
+    Fish("Spearfish", 20.0, 50.0, "Rare", 4, 60, "Small billfish similar to marlin.", 185),
+    Fish("Bull Shark", 90.0, 230.0, "Rare", 3, 75, "Aggressive shark found in fresh and saltwater.", 310),
+    Fish("Blacktip Shark", 20.0, 100.0, "Uncommon", 5, 48, "Shark with black-tipped fins.", 110),
+    Fish("Blue Shark", 60.0, 200.0, "Uncommon", 4, 55, "Slender blue-colored oceanic shark.", 145),
+    Fish("Mako Shark", 130.0, 500.0, "Rare", 2, 80, "Fastest shark species, excellent jumper.", 410),
+    Fish("Thresher Shark", 160.0, 340.0, "Rare", 2, 75, "Shark with extremely long tail fin.", 330),
+    Fish("Whale Shark", 5000, 20000, "Legendary", 0.5, 200, "Largest fish in the world, filter feeder.", 1200),
+    Fish("Basking Shark", 2200, 4500, "Legendary", 0.8, 180, "Second largest fish, gentle giant.", 1000),
+    Fish("Lemon Shark", 80.0, 180.0, "Uncommon", 4, 52, "Yellow-brown shark of coastal waters.", 135),
+    Fish("Nurse Shark", 75.0, 150.0, "Uncommon", 5, 45, "Bottom-dwelling docile shark.", 105),
+    Fish("Whitetip Reef Shark", 15.0, 40.0, "Uncommon", 6, 42, "Nocturnal reef shark with white-tipped fins.", 92),
+    Fish("Blacktip Reef Shark", 20.0, 50.0, "Uncommon", 6, 44, "Common reef shark with black fin tips.", 98),
+    Fish("Caribbean Reef Shark", 30.0, 70.0, "Uncommon", 5, 48, "Common shark of Caribbean reefs.", 115),
+    Fish("Sandbar Shark", 50.0, 110.0, "Uncommon", 5, 50, "Common coastal shark with high dorsal fin.", 125),
+    Fish("Dusky Shark", 100.0, 170.0, "Rare", 3, 65, "Large migratory coastal shark.", 220),
+    Fish("Silky Shark", 80.0, 160.0, "Rare", 3, 62, "Oceanic shark with silky smooth skin.", 205),
+    Fish("Oceanic Whitetip", 70.0, 170.0, "Rare", 3, 68, "Dangerous oceanic shark with white-tipped fins.", 245),
+    Fish("Porbeagle Shark", 135.0, 230.0, "Rare", 3, 70, "Cold-water shark related to mako.", 270),
+    Fish("Salmon Shark", 100.0, 220.0, "Rare", 3, 72, "Fast shark that preys on salmon.", 285),
+    Fish("Spinner Shark", 55.0, 90.0, "Uncommon", 5, 46, "Acrobatic shark that spins when feeding.", 108),
+    Fish("Angelfish", 0.1, 0.5, "Common", 14, 12, "Colorful reef fish with disk-like body.", 22),
+    Fish("French Angelfish", 0.5, 1.5, "Uncommon", 9, 24, "Large black angelfish with yellow trim.", 52),
+    Fish("Queen Angelfish", 0.6, 1.6, "Uncommon", 8, 26, "Stunning blue and yellow angelfish.", 56),
+    Fish("Rock Beauty", 0.3, 1.0, "Uncommon", 10, 20, "Black and yellow angelfish.", 42),
+    Fish("Gray Angelfish", 0.8, 2.0, "Uncommon", 8, 28, "Large gray angelfish with white spots.", 60),
+    Fish("Butterflyfish", 0.1, 0.4, "Common", 13, 14, "Small colorful reef fish with patterns.", 24),
+    Fish("Parrotfish", 1.0, 20.0, "Common", 9, 22, "Colorful fish with beak-like mouth.", 40),
+    Fish("Surgeonfish", 0.3, 2.0, "Common", 11, 16, "Reef fish with sharp tail spines.", 30),
+    Fish("Tang", 0.2, 1.0, "Common", 12, 14, "Popular aquarium fish, subfamily of surgeonfish.", 26),
+    Fish("Clownfish", 0.05, 0.2, "Common", 15, 10, "Orange fish that lives in anemones.", 18),
+    Fish("Damselfish", 0.05, 0.15, "Common", 16, 8, "Small territorial reef fish.", 14),
+    Fish("Chromis", 0.03, 0.1, "Common", 17, 7, "Tiny schooling damselfish.", 12),
+    Fish("Wrasse", 0.2, 10.0, "Common", 10, 18, "Diverse family of colorful reef fish.", 34),
+    Fish("Triggerfish", 0.5, 5.0, "Uncommon", 8, 28, "Fish with trigger-like dorsal spine.", 62),
+    Fish("Filefish", 0.3, 2.0, "Common", 11, 16, "Related to triggerfish with rough skin.", 28),
+    Fish("Pufferfish", 0.5, 8.0, "Uncommon", 7, 32, "Can inflate body when threatened.", 68),
+    Fish("Boxfish", 0.2, 1.5, "Uncommon", 10, 22, "Fish with box-like armored body.", 48),
+    Fish("Cowfish", 0.3, 2.0, "Uncommon", 9, 24, "Boxfish with horn-like protrusions.", 52),
+    Fish("Goby", 0.01, 0.1, "Common", 18, 6, "Tiny bottom-dwelling fish.", 10),
+    Fish("Blenny", 0.02, 0.15, "Common", 17, 7, "Small elongated reef fish.", 12),
+    Fish("Sea Robin", 0.5, 3.0, "Common", 11, 18, "Bottom fish with wing-like pectoral fins.", 32),
+    Fish("Scorpionfish", 1.0, 5.0, "Uncommon", 8, 30, "Camouflaged venomous reef fish.", 65),
+    Fish("Lionfish", 0.5, 2.5, "Uncommon", 7, 34, "Invasive venomous fish with flowing fins.", 72),
+    Fish("Stonefish", 1.0, 3.0, "Rare", 5, 45, "Most venomous fish in the world.", 95),
+    Fish("Flying Fish", 0.3, 1.0, "Common", 12, 16, "Can glide above water using wing-like fins.", 28),
+    Fish("Pompano", 1.5, 6.0, "Uncommon", 8, 28, "Silver game fish with excellent flavor.", 60),
+    Fish("Permit", 5.0, 25.0, "Rare", 4, 55, "Large game fish related to pompano.", 140),
+    Fish("Jack Crevalle", 3.0, 18.0, "Uncommon", 7, 32, "Strong fighting fish with yellow tail.", 68),
+    Fish("Horse-eye Jack", 2.0, 10.0, "Uncommon", 8, 28, "Fast-swimming jack with large eyes.", 62),
+    Fish("Bar Jack", 1.0, 6.0, "Common", 10, 22, "Slender jack with black stripe.", 42),
+    Fish("Dolphinfish", 8.0, 20.0, "Uncommon", 6, 36, "Same as mahi-mahi, colorful game fish.", 78),
+    Fish("Tripletail", 5.0, 18.0, "Uncommon", 6, 38, "Fish that mimics floating debris.", 82),
+    Fish("Sheepshead", 2.0, 10.0, "Common", 9, 24, "Fish with human-like teeth.", 48),
+    Fish("Redfish", 3.0, 20.0, "Uncommon", 6, 35, "Also called red drum, copper-colored.", 75),
+    Fish("Black Drum", 5.0, 40.0, "Uncommon", 5, 42, "Large drum fish with barbels.", 90),
+    Fish("Spotted Seatrout", 1.0, 8.0, "Common", 10, 22, "Speckled coastal game fish.", 44),
+    Fish("Weakfish", 1.5, 9.0, "Common", 9, 24, "Delicate-mouthed coastal fish.", 48),
+    Fish("Croaker", 0.5, 3.0, "Common", 12, 16, "Makes croaking sounds, bottom feeder.", 28),
+    Fish("Kingfish", 0.8, 4.0, "Common", 11, 18, "Also called whiting, small coastal fish.", 32),
+    Fish("Spot", 0.3, 1.5, "Common", 13, 14, "Small fish with distinctive shoulder spot.", 24),
+    Fish("Moonfish", 0.5, 2.0, "Uncommon", 10, 22, "Disk-shaped silvery fish.", 46),
+    Fish("Lookdown", 0.5, 2.5, "Uncommon", 9, 24, "Extremely compressed silvery fish.", 50),
+    Fish("Bonefish", 2.0, 10.0, "Rare", 4, 50, "Elite game fish of shallow flats.", 130),
+    Fish("Ladyfish", 1.0, 5.0, "Common", 10, 20, "Acrobatic silvery fish.", 38),
+    Fish("Sea Bream", 0.5, 5.0, "Common", 10, 22, "Various species of porgy.", 42),
+    Fish("Tilefish", 2.0, 25.0, "Uncommon", 6, 38, "Colorful deep-water fish.", 80),
+    Fish("Ocean Sunfish", 250.0, 1000.0, "Legendary", 1, 160, "Bizarre giant fish that looks half-finished.", 750),
+    Fish("Opah", 50.0, 90.0, "Rare", 3, 65, "Large colorful deep-water fish.", 230),
+    Fish("Escolar", 10.0, 45.0, "Uncommon", 5, 42, "Oily deep-water fish, the butterfish.", 95),
+    Fish("Sea Cucumber Fish", 0.1, 0.5, "Uncommon", 12, 18, "Small fish that lives inside sea cucumbers.", 35),
+    Fish("Remora", 0.3, 1.5, "Common", 12, 16, "Fish with sucker disc on head.", 28),
+    Fish("Pilot Fish", 0.2, 1.0, "Common", 13, 14, "Striped fish that follows sharks.", 24),
+    Fish("Oceanic Phantom", 80.0, 250.0, "Legendary", 0.7, 125, "Translucent giant that appears only in moonless nights.", 580),
+    Fish("Coral Dragon", 25.0, 85.0, "Legendary", 0.9, 110, "Guardian spirit of ancient reefs.", 520),
+    Fish("Tsunami Serpent", 500.0, 2500.0, "Mythical", 0.015, 3500, "Legendary beast said to cause tidal waves.", 45000),
+]
@@ -0,0 +1,148 @@
+# River fish table
+
+from fishgame import Fish
+
+
+river_fish = [
+    Fish("Salmon", 3.6, 5.4, "Common", 10, 15, "Salmon are anadromous fish that migrate from the ocean to rivers.", 40),
+    Fish("Catfish", 1.0, 50.0, "Common", 10, 15, "Catfish are bottom-dwelling fish found in rivers.", 30),
+    Fish("Carp", 2.0, 14.0, "Uncommon", 5, 25, "Carp are a common fish found in rivers.", 35),
+    Fish("Rainbow Trout", 1.0, 4.0, "Common", 9, 20, "Rainbow trout are colorful freshwater fish.", 25),
+    Fish("Brown Trout", 0.8, 6.0, "Common", 9, 18, "Native to Europe, introduced worldwide.", 28),
+    Fish("Brook Trout", 0.3, 3.0, "Common", 11, 16, "Small beautiful trout with distinctive markings.", 22),
+    Fish("Smallmouth Bass", 1.0, 5.0, "Uncommon", 7, 24, "Aggressive fighter, bronze-colored bass.", 48),
+    Fish("Largemouth Bass", 2.0, 10.0, "Uncommon", 6, 28, "Popular game fish with large mouth.", 55),
+    Fish("Northern Pike", 4.0, 25.0, "Uncommon", 5, 32, "Aggressive predator with sharp teeth.", 70),
+    Fish("Muskie", 10.0, 30.0, "Rare", 3, 55, "Muskellunge are large predatory fish.", 150),
+    Fish("Steelhead", 3.0, 20.0, "Uncommon", 6, 35, "Rainbow trout that migrates to the ocean.", 75),
+    Fish("Chinook Salmon", 4.0, 30.0, "Uncommon", 5, 38, "King salmon, the largest Pacific salmon.", 85),
+    Fish("Coho Salmon", 3.0, 15.0, "Uncommon", 6, 30, "Silver salmon with excellent fighting ability.", 65),
+    Fish("Sturgeon", 100.0, 227.0, "Rare", 2, 50, "Sturgeon are ancient fish found in rivers.", 300),
+    Fish("Paddlefish", 20.0, 90.0, "Rare", 2, 60, "Strange fish with a long paddle-like snout.", 180),
+    Fish("Alligator Gar", 50.0, 130.0, "Rare", 2, 70, "Massive gar with alligator-like head.", 250),
+    Fish("Flathead Catfish", 5.0, 55.0, "Uncommon", 5, 40, "Large predatory catfish.", 90),
+    Fish("Blue Catfish", 10.0, 70.0, "Uncommon", 4, 45, "Largest catfish species in North America.", 100),
+    Fish("Zander", 2.0, 10.0, "Uncommon", 6, 32, "European predator fish similar to walleye.", 68),
+    Fish("Asp", 1.0, 8.0, "Uncommon", 7, 28, "Predatory cyprinid found in European rivers.", 58),
+    Fish("Wels Catfish", 50.0, 200.0, "Rare", 2, 75, "Giant European catfish that can grow massive.", 280),
+    Fish("Taimen", 15.0, 50.0, "Rare", 2, 65, "Largest salmonid species in the world.", 200),
+    Fish("Arapaima", 100.0, 200.0, "Legendary", 1, 200, "One of the world's largest freshwater fish.", 800),
+    Fish("Giant Mekong Catfish", 150.0, 300.0, "Legendary", 0.8, 220, "Critically endangered giant catfish.", 900),
+    Fish("Nile Perch", 50.0, 200.0, "Legendary", 1, 180, "Massive African predator fish.", 750),
+    Fish("River Dragon", 500, 2000, "Mythical", 0.02, 3000, "Mythical serpentine creature said to guard river treasures.", 30000),
+    Fish("Kappa", 20, 100, "Mythical", 0.05, 1500, "Japanese water demon disguised as a turtle-like fish.", 15000),
+    Fish("Pale King Mackerel", 2, 4, "Epic", 0.9, 25, "A luminescent white mackerel that rules its school with dignity.", 120),
+    Fish("Mountain Spirit Trout", 1, 2, "Rare", 1.6, 18, "A shimmering trout that seems to be made of determination itself.", 75),
+    Fish("Strawberry Koi", 0.5, 1.2, "Common", 5.2, 8, "A bright koi with flecks of red that resemble fruit.", 25),
+    Fish("Slimey Gloopfish", 0.3, 0.7, "Common", 7.5, 5, "A cheerful blob-fish hybrid that wiggles adorably.", 15),
+    Fish("Lambda Salmon", 1, 3, "Rare", 1.3, 12, "A salmon marked with a mysterious orange symbol. It resists authority.", 70),
+    Fish("Resonance Catfish", 2, 5, "Uncommon", 2.2, 15, "A catfish that vibrates violently, as if stuck mid-experiment.", 50),
+    Fish("ludvik laks", 10, 50, "Rare", 1, 100, "Big and bulky, but very nice!", 300),
+    # New additions
+    Fish("Sockeye Salmon", 2.5, 7.0, "Uncommon", 6, 32, "Red salmon prized for its flavor.", 68),
+    Fish("Pink Salmon", 1.5, 5.0, "Common", 9, 22, "Smallest Pacific salmon with humped back.", 42),
+    Fish("Chum Salmon", 3.0, 10.0, "Uncommon", 6, 28, "Also called dog salmon, silvery fish.", 60),
+    Fish("Atlantic Salmon", 3.0, 12.0, "Uncommon", 5, 35, "Prized European salmon species.", 75),
+    Fish("Landlocked Salmon", 1.5, 8.0, "Uncommon", 7, 28, "Freshwater Atlantic salmon variety.", 62),
+    Fish("Cutthroat Trout", 0.8, 5.0, "Common", 9, 22, "Trout with red slash under jaw.", 40),
+    Fish("Bull Trout", 2.0, 15.0, "Uncommon", 5, 38, "Large predatory char species.", 82),
+    Fish("Dolly Varden", 1.0, 8.0, "Common", 8, 24, "Colorful char with pink spots.", 48),
+    Fish("Arctic Char", 1.5, 10.0, "Uncommon", 6, 32, "Northernmost freshwater fish.", 68),
+    Fish("Lake Char", 2.5, 20.0, "Uncommon", 5, 40, "Deep-dwelling char species.", 85),
+    Fish("Splake", 1.5, 9.0, "Uncommon", 7, 30, "Hybrid of lake trout and brook trout.", 65),
+    Fish("Tiger Trout", 1.0, 6.0, "Rare", 4, 35, "Hybrid of brown and brook trout with distinctive pattern.", 75),
+    Fish("Grayling", 0.5, 3.0, "Common", 10, 20, "Elegant fish with large sail-like dorsal fin.", 38),
+    Fish("Arctic Grayling", 0.8, 4.0, "Uncommon", 7, 26, "Northern grayling with purple tinge.", 55),
+    Fish("Whitefish", 1.0, 6.0, "Common", 9, 22, "Silvery fish with small mouth.", 42),
+    Fish("Mountain Whitefish", 0.8, 4.0, "Common", 10, 20, "Small whitefish of cold streams.", 38),
+    Fish("Round Whitefish", 0.5, 3.0, "Common", 11, 18, "Small cylindrical whitefish.", 32),
+    Fish("Inconnu", 5.0, 25.0, "Rare", 3, 50, "Large predatory whitefish, the sheefish.", 130),
+    Fish("Spotted Bass", 1.5, 6.0, "Uncommon", 7, 26, "Bass species with spotted flanks.", 56),
+    Fish("Redeye Bass", 0.8, 4.0, "Common", 9, 22, "Small bass with red eyes.", 44),
+    Fish("Shoal Bass", 1.2, 5.0, "Uncommon", 8, 24, "Bass species of flowing waters.", 50),
+    Fish("Suwannee Bass", 0.6, 3.0, "Common", 10, 18, "Small bass endemic to Florida.", 34),
+    Fish("Guadalupe Bass", 0.8, 3.5, "Common", 9, 20, "Texas state fish, small stream bass.", 38),
+    Fish("Spotted Gar", 2.0, 8.0, "Uncommon", 7, 32, "Gar with distinctive spots.", 68),
+    Fish("Florida Gar", 3.0, 12.0, "Uncommon", 6, 36, "Southern gar species.", 75),
+    Fish("Shortnose Gar", 1.5, 4.0, "Common", 10, 22, "Small gar with short snout.", 42),
+    Fish("Spotted Sucker", 1.0, 4.0, "Common", 9, 20, "Bottom feeder with spots.", 38),
+    Fish("River Redhorse", 2.0, 8.0, "Uncommon", 6, 32, "Large sucker with reddish fins.", 68),
+    Fish("Greater Redhorse", 2.5, 10.0, "Uncommon", 6, 34, "Large redhorse species.", 72),
+    Fish("Black Redhorse", 1.5, 6.0, "Common", 8, 26, "Dark-colored sucker.", 54),
+    Fish("Copper Redhorse", 3.0, 12.0, "Rare", 4, 45, "Rare copper-colored sucker.", 95),
+    Fish("Blue Sucker", 2.0, 9.0, "Uncommon", 6, 32, "Blue-gray sucker of larger rivers.", 68),
+    Fish("Highfin Carpsucker", 1.5, 5.0, "Common", 8, 24, "Sucker with tall dorsal fin.", 48),
+    Fish("River Carpsucker", 2.0, 7.0, "Common", 7, 26, "Common river sucker species.", 54),
+    Fish("Quillback Carpsucker", 1.5, 6.0, "Common", 8, 24, "Carpsucker with quill-like dorsal fin.", 50),
+    Fish("Bigmouth Buffalo", 10.0, 35.0, "Uncommon", 4, 48, "Largest sucker species.", 105),
+    Fish("Smallmouth Buffalo", 5.0, 18.0, "Uncommon", 6, 38, "Smaller buffalo fish species.", 82),
+    Fish("Black Buffalo", 8.0, 25.0, "Uncommon", 5, 42, "Dark buffalo fish.", 92),
+    Fish("Yellow Bullhead", 0.5, 3.0, "Common", 11, 18, "Small yellow catfish.", 32),
+    Fish("Brown Bullhead", 0.6, 4.0, "Common", 10, 20, "Common small catfish.", 38),
+    Fish("Black Bullhead", 0.8, 5.0, "Common", 9, 22, "Dark bullhead catfish.", 42),
+    Fish("Snail Bullhead", 0.4, 2.0, "Common", 12, 16, "Small spotted bullhead.", 28),
+    Fish("White Catfish", 1.5, 8.0, "Common", 8, 26, "Pale catfish of coastal rivers.", 54),
+    Fish("Stonecat", 0.2, 1.0, "Common", 13, 14, "Small madtom catfish.", 24),
+    Fish("Tadpole Madtom", 0.05, 0.2, "Common", 16, 8, "Tiny catfish species.", 14),
+    Fish("Margined Madtom", 0.1, 0.4, "Common", 14, 10, "Small madtom with margined fins.", 18),
+    Fish("Freckled Madtom", 0.08, 0.3, "Common", 15, 9, "Spotted madtom catfish.", 16),
+    Fish("Northern Madtom", 0.1, 0.5, "Common", 14, 11, "Small northern catfish.", 20),
+    Fish("Brindled Madtom", 0.08, 0.35, "Common", 15, 9, "Mottled small catfish.", 17),
+    Fish("Walking Catfish", 0.5, 2.5, "Uncommon", 9, 25, "Invasive catfish that can move on land.", 52),
+    Fish("Asian Swamp Eel", 0.3, 1.5, "Uncommon", 10, 22, "Invasive eel-like fish that breathes air.", 45),
+    Fish("Snakehead", 2.0, 15.0, "Rare", 4, 48, "Invasive predator that can survive out of water.", 110),
+    Fish("Bowfin", 2.0, 10.0, "Uncommon", 6, 35, "Primitive fish with long dorsal fin.", 72),
+    Fish("American Eel", 0.5, 5.0, "Uncommon", 7, 32, "Catadromous eel that migrates to ocean.", 68),
+    Fish("Lamprey", 0.3, 2.0, "Uncommon", 8, 28, "Parasitic jawless fish.", 60),
+    Fish("Sea Lamprey", 0.8, 5.0, "Uncommon", 6, 35, "Invasive parasitic lamprey.", 75),
+    Fish("Brook Lamprey", 0.1, 0.5, "Common", 13, 14, "Small non-parasitic lamprey.", 24),
+    Fish("Chestnut Lamprey", 0.2, 1.0, "Common", 12, 16, "Small parasitic lamprey.", 28),
+    Fish("Silver Lamprey", 0.3, 1.5, "Common", 11, 18, "Medium lamprey species.", 32),
+    Fish("Goldeye", 0.4, 2.0, "Common", 10, 20, "Fish with golden eyes and oily flesh.", 38),
+    Fish("Mooneye", 0.3, 1.5, "Common", 11, 18, "Silvery fish with large moon-like eyes.", 34),
+    Fish("Hickory Shad", 1.0, 4.0, "Common", 9, 24, "Small anadromous shad species.", 48),
+    Fish("American Shad", 2.0, 8.0, "Uncommon", 6, 32, "Largest shad species in North America.", 68),
+    Fish("Gizzard Shad", 0.5, 3.0, "Common", 11, 18, "Common baitfish with gizzard-like stomach.", 32),
+    Fish("Threadfin Shad", 0.05, 0.2, "Common", 16, 8, "Tiny baitfish with threadlike fin.", 14),
+    Fish("Skipjack Herring", 0.8, 3.5, "Common", 9, 22, "River herring that jumps from water.", 42),
+    Fish("Blueback Herring", 0.3, 1.5, "Common", 11, 18, "Small anadromous herring.", 34),
+    Fish("Alewife", 0.2, 1.0, "Common", 13, 14, "Small herring, important forage fish.", 24),
+    Fish("Mahseer", 10.0, 55.0, "Rare", 3, 60, "Powerful Indian sport fish.", 185),
+    Fish("Hump-backed Mahseer", 15.0, 45.0, "Rare", 3, 58, "Endangered Asian game fish.", 175),
+    Fish("Golden Mahseer", 8.0, 40.0, "Rare", 4, 55, "Prized golden sport fish.", 160),
+    Fish("Tor Mahseer", 12.0, 50.0, "Rare", 3, 62, "Large mahseer species.", 195),
+    Fish("Payara", 5.0, 18.0, "Rare", 4, 52, "Vampire fish with huge fangs.", 140),
+    Fish("Dorado", 3.0, 12.0, "Uncommon", 6, 38, "Golden South American game fish.", 82),
+    Fish("Peacock Bass", 2.0, 13.0, "Uncommon", 5, 42, "Colorful aggressive bass from Amazon.", 90),
+    Fish("Butterfly Peacock", 1.5, 8.0, "Uncommon", 7, 35, "Small peacock bass with spots.", 75),
+    Fish("Speckled Peacock", 3.0, 15.0, "Uncommon", 5, 45, "Largest peacock bass variety.", 98),
+    Fish("Piranha", 0.5, 4.0, "Uncommon", 8, 32, "Famous carnivorous fish with sharp teeth.", 68),
+    Fish("Red-bellied Piranha", 0.8, 5.0, "Uncommon", 7, 35, "Most common piranha species.", 75),
+    Fish("Black Piranha", 1.5, 8.0, "Rare", 5, 45, "Largest and most aggressive piranha.", 100),
+    Fish("Pacu", 3.0, 25.0, "Uncommon", 5, 42, "Large vegetarian relative of piranha.", 88),
+    Fish("Tambaqui", 10.0, 30.0, "Rare", 3, 55, "Huge fruit-eating pacu.", 145),
+    Fish("Tiger Fish", 2.0, 10.0, "Uncommon", 6, 40, "African predator with tiger-like stripes.", 85),
+    Fish("Goliath Tigerfish", 15.0, 70.0, "Legendary", 1, 150, "Massive African predator with huge teeth.", 650),
+    Fish("Tilapia", 0.5, 4.0, "Common", 10, 22, "Popular farmed fish from Africa.", 42),
+    Fish("Nile Tilapia", 1.0, 6.0, "Common", 9, 24, "Common tilapia species.", 48),
+    Fish("Blue Tilapia", 1.5, 8.0, "Common", 8, 26, "Fast-growing tilapia variety.", 54),
+    Fish("Mozambique Tilapia", 0.8, 4.0, "Common", 10, 20, "Small tilapia species.", 38),
+    Fish("Redbelly Tilapia", 0.6, 3.0, "Common", 11, 18, "Tilapia with red belly.", 34),
+    Fish("Electric Eel", 2.0, 20.0, "Rare", 4, 60, "Can generate powerful electric shocks.", 190),
+    Fish("Glass Knifefish", 0.1, 0.5, "Uncommon", 12, 22, "Transparent electric fish.", 45),
+    Fish("Black Ghost", 0.3, 1.5, "Uncommon", 10, 25, "Nocturnal electric knifefish.", 52),
+    Fish("Banded Knifefish", 0.5, 3.0, "Uncommon", 9, 28, "Striped electric fish.", 60),
+    Fish("Clown Knifefish", 1.0, 5.0, "Uncommon", 8, 32, "Large ornamental knifefish.", 68),
+    Fish("Bronze Corydoras", 0.05, 0.1, "Common", 16, 8, "Small armored catfish.", 14),
+    Fish("Peppered Corydoras", 0.04, 0.08, "Common", 17, 7, "Tiny speckled catfish.", 12),
+    Fish("Sterbai Corydoras", 0.06, 0.12, "Common", 15, 9, "Spotted ornamental catfish.", 16),
+    Fish("Panda Corydoras", 0.03, 0.06, "Common", 18, 6, "Black and white tiny catfish.", 10),
+    Fish("Julii Corydoras", 0.04, 0.08, "Common", 17, 7, "Leopard-spotted mini catfish.", 12),
+    Fish("Redtail Catfish", 15.0, 60.0, "Rare", 3, 65, "Massive Amazonian catfish with red tail.", 220),
+    Fish("Iridescent Shark", 5.0, 40.0, "Uncommon", 5, 45, "Large Asian catfish despite its name.", 98),
+    Fish("Pictus Catfish", 0.1, 0.3, "Common", 14, 12, "Small spotted catfish with long whiskers.", 22),
+    Fish("Upside-down Catfish", 0.05, 0.15, "Common", 16, 9, "Swims upside down habitually.", 15),
+    Fish("Glass Catfish", 0.03, 0.08, "Common", 17, 7, "Transparent catfish species.", 12),
+    Fish("Mystical River Guardian", 200.0, 800.0, "Mythical", 0.018, 2500, "Ancient protector of sacred waters.", 22000),
+    Fish("Jade Dragon Carp", 25.0, 90.0, "Legendary", 0.6, 135, "Emerald-scaled carp of legend.", 620),
+]
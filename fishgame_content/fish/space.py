@@ -0,0 +1,63 @@
+# Space fish table
+
+from fishgame import Fish
+
+
+space_fish = [
+    Fish("Astro Guppy", 0.1, 1.0, "Common", 10, 40, "Tiny fish floating in zero gravity.", 80),
+    Fish("Comet Minnow", 0.2, 1.5, "Common", 12, 35, "Leaves a trail of stardust as it swims.", 70),
+    Fish("Meteor Carp", 2.0, 12.0, "Uncommon", 6, 60, "Covered in crater-like scales.", 140),
+    Fish("Solar Flare Bass", 5.0, 25.0, "Uncommon", 5, 70, "Radiates intense heat and light.", 160),
+    Fish("Asteroid Pike", 8.0, 40.0, "Uncommon", 5, 75, "Rocky exterior hides fierce predator.", 180),
+    Fish("Nebula Ray", 10.0, 80.0, "Rare", 3, 150, "A cosmic creature glowing with plasma.", 400),
+    Fish("Pulsar Eel", 15.0, 100.0, "Rare", 2, 160, "Emits rhythmic bursts of energy.", 450),
+    Fish("Supernova Tuna", 50.0, 250.0, "Rare", 2, 200, "Explodes with brilliant light when hooked.", 600),
+    Fish("Black Hole Grouper", 100.0, 500.0, "Legendary", 1, 350, "Warps space around itself, impossible to measure accurately.", 1500),
+    Fish("Void Shark", 200.0, 1000.0, "Legendary", 1, 400, "Feeds on starlight and silence.", 2000),
+    Fish("Galaxy Whale", 1000.0, 5000.0, "Legendary", 0.5, 600, "Contains entire solar systems in its body.", 3000),
+    Fish("Quasar Dragon", 2000.0, 8000.0, "Mythical", 0.02, 8000, "The brightest and most powerful cosmic entity.", 80000),
+    Fish("Singularity Eel", 1000.0, 5000.0, "Mythical", 0.01, 10000, "Can bend space-time with its body.", 30000),
+    Fish("Cosmic Kraken", 5000.0, 20000.0, "Mythical", 0.005, 20000, "Devours stars and moons.", 500000),
+    Fish("Celestial Leviathan", 10000.0, 50000.0, "Mythical", 0.001, 30000, "The universe made flesh, older than time itself.", 1000000),
+    Fish("Redstone katten", 5, 40, "Mythical", 0.0067, 67000, "The famous Redstone Katten", 10000),
+    Fish("Portal Eel", 10, 18, "Epic", 0.6, 40, "An eel that flickers between blue and orange, creating mini rifts.", 200),
+    Fish("Cyberpunk Neon Koi", 3, 7, "Rare", 1.1, 25, "A glowing koi with chrome scales and attitude.", 120),
+    Fish("Voidling Tadpole", 0.2, 0.5, "Uncommon", 3.8, 7, "A small tadpole radiating soft darkness, drifting with purpose.", 30),
+    Fish("Starfury Guppy", 0.2, 0.6, "Epic", 1.0, 12, "A cosmic guppy trailing tiny falling-star sparks.", 100),
+    Fish("Quantum Jelly", 0.5, 1.1, "Rare", 1.9, 18, "A jellyfish that shifts position every time you blink.", 80),
+    # New additions
+    Fish("Stardust Sardine", 0.06, 0.3, "Common", 16, 32, "Tiny fish made of compressed starlight.", 64),
+    Fish("Cosmic Cod", 1.5, 8.0, "Common", 9, 45, "Ordinary cod that somehow exists in space.", 90),
+    Fish("Satellite Shrimp", 0.04, 0.2, "Common", 18, 28, "Orbiting crustacean of the void.", 56),
+    Fish("Lunar Lamprey", 0.8, 5.0, "Uncommon", 7, 55, "Parasitic eel that feeds on moon dust.", 135),
+    Fish("Orbit Eel", 3.0, 18.0, "Uncommon", 5, 65, "Eel that circles celestial bodies.", 165),
+    Fish("Gravity Grouper", 12.0, 60.0, "Uncommon", 4, 78, "Grouper that manipulates gravitational fields.", 195),
+    Fish("Ionized Ide", 1.2, 7.0, "Common", 8, 48, "Fish charged with cosmic radiation.", 96),
+    Fish("Radiation Ray", 6.0, 35.0, "Uncommon", 5, 72, "Flat fish absorbing stellar radiation.", 178),
+    Fish("Photon Pike", 10.0, 50.0, "Rare", 3, 155, "Pike that moves at light speed.", 425),
+    Fish("Electron Eel", 4.0, 22.0, "Uncommon", 6, 68, "Eel crackling with electromagnetic energy.", 172),
+    Fish("Neutron Nautilus", 8.0, 42.0, "Rare", 4, 145, "Impossibly dense spiral creature.", 395),
+    Fish("Plasma Perch", 2.5, 14.0, "Uncommon", 6, 62, "Fish made of superheated plasma.", 152),
+    Fish("Magnetar Mackerel", 3.5, 20.0, "Uncommon", 5, 70, "Mackerel with intense magnetic field.", 175),
+    Fish("Dark Matter Minnow", 0.15, 0.8, "Rare", 7, 85, "Barely visible fish of unknown composition.", 265),
+    Fish("Antimatter Anchovy", 0.1, 0.5, "Rare", 8, 90, "Tiny fish that annihilates on contact.", 285),
+    Fish("Cosmic Ray", 15.0, 85.0, "Rare", 2, 165, "Ray surfing on stellar winds.", 455),
+    Fish("Solar Wind Salmon", 6.0, 32.0, "Rare", 3, 150, "Salmon migrating through solar storms.", 415),
+    Fish("Coronal Carp", 5.0, 28.0, "Rare", 4, 140, "Carp living in the sun's corona.", 385),
+    Fish("Prominence Pike", 9.0, 48.0, "Rare", 2, 170, "Pike leaping from solar prominences.", 475),
+    Fish("Chromosphere Char", 4.0, 24.0, "Rare", 4, 135, "Char dwelling in stellar atmosphere.", 370),
+    Fish("Exoplanet Eel", 7.0, 38.0, "Rare", 3, 158, "Eel found orbiting distant worlds.", 435),
+    Fish("Asteroid Belt Bass", 8.5, 45.0, "Rare", 2, 162, "Bass navigating through space debris.", 445),
+    Fish("Kuiper Koi", 3.0, 17.0, "Uncommon", 6, 66, "Koi from the edge of solar systems.", 168),
+    Fish("Oort Cloud Octopus", 20.0, 95.0, "Rare", 2, 178, "Octopus from the cosmic deep freeze.", 495),
+    Fish("Interstellar Squid", 25.0, 120.0, "Rare", 2, 185, "Squid traversing between star systems.", 515),
+    Fish("Wormhole Wrasse", 2.0, 12.0, "Uncommon", 7, 64, "Fish that shortcuts through spacetime.", 162),
+    Fish("Hyperdrive Herring", 0.8, 4.5, "Common", 10, 52, "Herring capable of FTL travel.", 104),
+    Fish("Warp Speed Walleye", 5.5, 30.0, "Rare", 3, 148, "Walleye breaking the light barrier.", 408),
+    Fish("Tachyon Trout", 3.5, 19.0, "Uncommon", 5, 74, "Trout moving faster than light.", 185),
+    Fish("Relativistic Ray", 18.0, 90.0, "Rare", 2, 172, "Ray experiencing time dilation.", 482),
+    Fish("Event Horizon Eel", 30.0, 150.0, "Legendary", 0.9, 340, "Eel circling the point of no return.", 1450),
+    Fish("Hawking Halibut", 50.0, 240.0, "Legendary", 0.75, 370, "Flatfish that radiates hawking radiation.", 1620),
+    Fish("Accretion Disk Anchovy", 0.12, 0.7, "Uncommon", 12, 58, "Tiny fish in spinning matter ring.", 145),
+    Fish("Redshift Redhorse", 4.5, 26.0, "Rare", 4, 142, "Fish receding at cosmic speeds.", 390),
+]
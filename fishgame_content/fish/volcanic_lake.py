@@ -0,0 +1,65 @@
+# Volcanic Lake fish table
+
+from fishgame import Fish
+
+
+volcanic_lake_fish = [
+    Fish("Ember Minnow", 0.1, 0.5, "Common", 12, 25, "Tiny fish that sparkles like hot coals.", 35),
+    Fish("Ash Perch", 0.5, 2.0, "Common", 10, 30, "Gray fish covered in volcanic ash residue.", 50),
+    Fish("Lava Carp", 1.0, 10.0, "Uncommon", 6, 50, "Lives in volcanic waters, glowing red.", 120),
+    Fish("Obsidian Bass", 2.0, 8.0, "Uncommon", 5, 55, "Black as volcanic glass with sharp fins.", 130),
+    Fish("Magma Eel", 3.0, 20.0, "Rare", 3, 75, "Slithers through molten vents.", 250),
+    Fish("Fire Koi", 0.5, 3.0, "Rare", 2, 60, "Bright orange koi born from magma pools.", 200),
+    Fish("Sulfur Pike", 5.0, 25.0, "Rare", 2, 85, "Predator fish that breathes toxic fumes.", 280),
+    Fish("Inferno Salmon", 10.0, 40.0, "Legendary", 1, 200, "Burns with eternal flames.", 600),
+    Fish("Plasma Sturgeon", 50.0, 150.0, "Legendary", 0.8, 250, "Ancient fish that survived eruptions for millennia.", 800),
+    Fish("Phoenix Tuna", 30.0, 100.0, "Legendary", 0.5, 300, "Said to be reborn from its own ashes.", 1000),
+    Fish("Volcanic Leviathan", 1000.0, 5000.0, "Mythical", 0.02, 5000, "Ancient guardian of magma lakes.", 30000),
+    Fish("Prometheus Wyrm", 2000.0, 8000.0, "Mythical", 0.01, 7000, "Dragon-serpent that stole fire from the gods.", 50000),
+    Fish("Fireflower Lionfish", 1, 3, "Rare", 1.3, 15, "A fiery lionfish whose fins burst with sparks when startled.", 70),
+    Fish("Balrog Guppy", 10, 18, "Legendary", 0.2, 45, "A tiny fish wreathed in flame, somehow both cute and terrifying.", 450),
+    Fish("Abyssal Serpent of Cinders", 450, 900, "Mythical", 0.1, 90, "A writhing serpent born from the dying flame beneath the waves.", 1500),
+    # New additions
+    Fish("Cinder Goby", 0.08, 0.3, "Common", 14, 22, "Small fish that hides in volcanic ash.", 38),
+    Fish("Pumice Pufferfish", 0.4, 2.5, "Common", 10, 28, "Inflates with superheated steam.", 56),
+    Fish("Crimson Char", 0.6, 3.5, "Common", 9, 32, "Red char adapted to hot springs.", 64),
+    Fish("Thermal Trout", 0.8, 4.0, "Common", 8, 34, "Trout that thrives in geothermal vents.", 68),
+    Fish("Scorch Sunfish", 0.3, 1.5, "Common", 12, 26, "Sunfish with flame-like patterns.", 52),
+    Fish("Blaze Bluegill", 0.25, 1.2, "Common", 13, 24, "Orange bluegill variant from hot waters.", 48),
+    Fish("Furnace Catfish", 2.5, 15.0, "Uncommon", 5, 58, "Bottom feeder that tolerates extreme heat.", 142),
+    Fish("Molten Mudpuppy", 0.5, 2.0, "Uncommon", 9, 40, "Salamander-fish hybrid in lava tubes.", 78),
+    Fish("Brimstone Barb", 0.4, 2.2, "Uncommon", 8, 42, "Yellow barb with sulfurous odor.", 82),
+    Fish("Caldera Crayfish", 0.3, 1.8, "Uncommon", 10, 38, "Crustacean that feeds on volcanic minerals.", 74),
+    Fish("Pyroclastic Perch", 1.2, 6.0, "Uncommon", 6, 52, "Perch that feeds during eruptions.", 125),
+    Fish("Tephra Tench", 1.5, 7.0, "Uncommon", 6, 54, "Tench covered in volcanic glass particles.", 132),
+    Fish("Magma Chamber Minnow", 0.15, 0.8, "Common", 13, 28, "Tiny fish living in magma cracks.", 54),
+    Fish("Crater Carp", 3.0, 18.0, "Uncommon", 5, 60, "Large carp that dwells in volcanic craters.", 148),
+    Fish("Igneous Ide", 1.0, 5.0, "Uncommon", 7, 46, "Silvery fish with rock-hard scales.", 95),
+    Fish("Scoria Shad", 0.6, 3.0, "Common", 9, 36, "Shad with porous, lava-rock-like skin.", 70),
+    Fish("Basalt Bass", 2.5, 12.0, "Uncommon", 5, 56, "Black bass as hard as volcanic rock.", 138),
+    Fish("Rhyolite Rudd", 0.8, 4.5, "Uncommon", 7, 44, "Light-colored fish from silica-rich springs.", 88),
+    Fish("Andesite Anchovy", 0.1, 0.6, "Common", 15, 20, "Tiny schooling fish near volcanic vents.", 36),
+    Fish("Tuff Tiger Fish", 4.0, 22.0, "Rare", 3, 80, "Aggressive predator of ash-filled waters.", 260),
+    Fish("Pumice Piranha", 0.7, 3.5, "Uncommon", 7, 48, "Small but vicious fish with heated bite.", 102),
+    Fish("Magma Moray", 3.5, 18.0, "Rare", 3, 78, "Eel that lives in underwater lava tubes.", 245),
+    Fish("Fire Fountain Fish", 1.8, 9.0, "Rare", 4, 68, "Leaps from geysers like a fountain.", 215),
+    Fish("Cinder Cone Char", 2.0, 10.0, "Rare", 3, 72, "Char that spawns in cinder cones.", 230),
+    Fish("Scorched Salmon", 5.0, 28.0, "Rare", 2, 88, "Salmon that migrates through lava flows.", 288),
+    Fish("Incandescent Icefish", 1.5, 7.0, "Rare", 4, 65, "Paradoxical fish that's both hot and cold.", 205),
+    Fish("Vermillion Viper Eel", 2.8, 16.0, "Rare", 3, 76, "Bright red eel with venomous fangs.", 242),
+    Fish("Flame Wrasse", 0.9, 4.0, "Uncommon", 7, 50, "Colorful fish that seems to flicker.", 110),
+    Fish("Eruption Eel", 6.0, 30.0, "Rare", 2, 90, "Massive eel that surfaces during eruptions.", 295),
+    Fish("Lava Lamprey", 1.0, 6.0, "Uncommon", 6, 54, "Parasitic lamprey in volcanic rivers.", 135),
+    Fish("Pyroclast Pike", 4.5, 24.0, "Rare", 2, 84, "Pike that hunts in ash clouds.", 275),
+    Fish("Fumarole Flounder", 1.2, 7.5, "Uncommon", 6, 52, "Flatfish that lives near gas vents.", 128),
+    Fish("Caloric Cod", 2.2, 12.0, "Uncommon", 5, 58, "Cod adapted to thermal gradients.", 145),
+    Fish("Searing Sole", 0.8, 5.0, "Uncommon", 8, 46, "Bottom-dwelling fish in hot zones.", 98),
+    Fish("Thermophile Tuna", 8.0, 35.0, "Rare", 2, 92, "Heat-loving tuna of volcanic seas.", 302),
+    Fish("Heated Halibut", 12.0, 55.0, "Rare", 2, 95, "Massive flatfish from geothermal areas.", 315),
+    Fish("Blazing Barracuda", 6.0, 32.0, "Rare", 2, 86, "Predator with flames in its wake.", 282),
+    Fish("Crucible Coelacanth", 35.0, 85.0, "Legendary", 0.9, 190, "Ancient living fossil of lava lakes.", 820),
+    Fish("Forge Dragon", 250.0, 1200.0, "Legendary", 0.4, 420, "Dragon that breaths underwater fire.", 1850),
+    Fish("Sulfur Demon", 180.0, 900.0, "Legendary", 0.5, 380, "Demonic entity born from volcanic fumes.", 1650),
+    Fish("Obsidian Behemoth", 600.0, 3000.0, "Mythical", 0.015, 6000, "Colossal creature of volcanic glass.", 38000),
+    Fish("Flame Emperor", 1500.0, 6000.0, "Mythical", 0.008, 8500, "Ruler of all volcanic waters.", 72000),
+]
@@ -0,0 +1,130 @@
+# Shop and boss item tables, loaded with the game. Each row is the arguments
+# of its class in fishgame (Rod, Bait, CombatItem, BossItem).
+
+RODS = [
+    # name, xp_bonus, rarity_bonus, price
+    # ===== EARLY GAME: learning & comfort =====
+    ("Bamboo Rod",      0.00, 0.70,        0),     # Tutorial / very safe
+    ("Wooden Rod",      0.02, 0.73,      150),
+    ("Fiberglass Rod",  0.04, 0.76,      400),
+    ("Composite Rod",   0.06, 0.80,      800),
+
+    # ===== MID GAME: steady power =====
+    ("Carbon Rod",      0.08, 0.84,     1500),
+    ("Graphite Rod",    0.10, 0.88,     2500),
+    ("Titanium Rod",    0.12, 0.92,     4000),
+    ("Reinforced Rod",  0.14, 0.96,     6500),
+
+    # ===== TRANSITION =====
+    ("Legendary Rod",   0.16, 1.00,    10000),
+
+    # ===== ENDGAME SPECIALIZATION =====
+    ("Mythic Rod",      0.30, 0.95,    20000),  # XP grinder
+    ("Abyssal Rod",     0.10, 1.25,    35000),  # Mutation / rarity hunter
+    ("Quantum Rod",     0.20, 1.10,    60000),  # RNG chaos
+    ("Godly Rod",       0.18, 1.05,   100000),  # Boss control
+
+    # ===== CHAOS / JOKE / SECRET =====
+    ("Blobfish Rod",    0.00, 1.00,  2000000),  # Breaks rules, not numbers
+]
+
+BAITS = [
+    ("Worm", 0, 0, 0),
+    ("Bread", 5, 0.05, 50),
+    ("Cricket", 8, 0.08, 120),
+    ("Minnow", 12, 0.12, 250),
+    ("Corn", 10, 0.10, 180),
+    ("Shrimp", 15, 0.15, 500),
+    ("Nightcrawler", 14, 0.14, 400),
+    ("Squid", 18, 0.18, 800),
+    ("Cut Bait", 16, 0.16, 650),
+    ("Artificial Lure", 22, 0.22, 1200),
+    ("Live Bait", 25, 0.25, 1500),
+    ("Special Lure", 30, 0.30, 2500),
+    ("Premium Lure", 35, 0.35, 4000),
+    ("Exotic Bait", 40, 0.40, 6500),
+    ("Master Bait", 50, 0.50, 50000)
+]
+
+# Combat Items - Attack Items
+COMBAT_ITEMS_ATTACK = [
+    ("Rusty Harpoon", "attack", 5, 150, "A basic weapon. +5 Attack", 1),
+    ("Sharp Fishing Spear", "attack", 10, 400, "A well-crafted spear. +10 Attack", 3),
+    ("Enchanted Trident", "attack", 18, 900, "Glows with ocean magic. +18 Attack", 6),
+    ("Kraken Slayer Blade", "attack", 28, 2000, "Forged to slay giants. +28 Attack", 10),
+    ("Poseidon's Wrath", "attack", 40, 5000, "The god's own weapon. +40 Attack", 15),
+    ("Leviathan's Fang", "attack", 55, 10000, "Ancient beast's tooth. +55 Attack", 20),
+]
+
+# Combat Items - Defense Items
+COMBAT_ITEMS_DEFENSE = [
+    ("Leather Vest", "defense", 3, 200, "Basic protection. +3 Defense", 1),
+    ("Scale Mail", "defense", 8, 500, "Made from fish scales. +8 Defense", 3),
+    ("Coral Shield", "defense", 15, 1100, "Living coral armor. +15 Defense", 6),
+    ("Turtle Shell Plate", "defense", 22, 2500, "Ancient turtle shell. +22 Defense", 10),
+    ("Diamond Coral Armor", "defense", 32, 6000, "Crystallized protection. +32 Defense", 15),
+    ("Abyssal Carapace", "defense", 45, 12000, "Deep sea guardian's shell. +45 Defense", 20),
+]
+
+# Combat Items - HP Items
+COMBAT_ITEMS_HP = [
+    ("Healing Salve", "hp", 20, 100, "Restores 20 HP. +20 Max HP", 1),
+    ("Vitality Potion", "hp", 50, 350, "Increases vitality. +50 Max HP", 3),
+    ("Whale Heart Extract", "hp", 100, 800, "Power of giants. +100 Max HP", 6),
+    ("Phoenix Scale", "hp", 150, 1800, "Regenerative powers. +150 Max HP", 10),
+    ("Elder Dragon Blood", "hp", 220, 4500, "Legendary resilience. +220 Max HP", 15),
+    ("Immortal Jellyfish Core", "hp", 300, 9000, "Near immortality. +300 Max HP", 20),
+]
+
+# name, boss (its name in fishgame_content.bosses), description, location
+BOSS_ITEMS = [
+    ("Ancient Scale",
+     "LOCH_NESS_MONSTER",
+     "A shimmering scale from an ancient creature. Using it might summon something...",
+     "Hub Island - Calm Lake"),
+    ("River Stone",
+     "RIVER_GUARDIAN",
+     "A smooth stone carved with ancient symbols. The river's power flows within it...",
+     "Hub Island - Swift River"),
+    ("Pirate Flag",
+     "PIRATE_SHIP",
+     "A tattered black flag with a skull and crossbones. It smells of salt and rebellion...",
+     "Ocean"),
+    ("Kraken's Tooth",
+     "KRAKEN",
+     "A massive, serrated tooth from the deep. Holding it makes the ocean feel... watchful...",
+     "Ocean"),
+    ("Serpent Rune",
+     "JORMUNGANDR",
+     "An ancient Norse rune stone pulsing with primordial power. It whispers of the World Serpent...",
+     "Deep Sea"),
+    ("Ægir's Brewing Horn",
+     "AEGIR",
+     "A narwhal tusk horn inscribed with storm runes. The Norse Sea Giant used it to control the weather. It hums with ancient power...",
+     "Deep Sea"),
+    ("Fragment of R'lyeh",
+     "CTHULHU",
+     "A non-Euclidean stone fragment from the sunken city. Gazing at it too long causes strange dreams...",
+     "Deep Sea"),
+    ("Volcanic Rune",
+     "IFRIT",
+     "A rune of binding etched in cooled lava. It radiates intense heat and pulses with elemental fire...",
+     "Volcanic Lake"),
+    ("Spectral Tooth",
+     "MEGALODON_GHOST",
+     "A ghostly tooth from the prehistoric apex predator. It phases in and out of reality, cold to the touch despite the volcanic heat...",
+     "Volcanic Lake"),
+    ("Frozen Scale",
+     "FROST_WYRM",
+     "A crystalline dragon scale that never melts. It radiates ancient cold and whispers of a hoard beneath frozen waters...",
+     "Arctic Waters"),
+    ("Cosmic Scale",
+     "STELLAR_LEVIATHAN",
+     "A fragment of solidified starlight from the Stellar Leviathan. Galaxies swirl within its translucent surface, and it hums with the song of the cosmos...",
+     "Space"),
+    ("Emergency Beacon",
+     "AQUATECH_MEGALODON_PHASE1",
+     "A distress signal detected by the Stellar Leviathan. It leads to an AquaTech space station. The cosmic whale's song sounds... concerned.",
+     "Space Station Aquarium"),
+    # Add more boss items for other locations here
+]
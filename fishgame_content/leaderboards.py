@@ -0,0 +1,281 @@
+# Community leaderboards - imported the first time a catch is recorded or the
+# boards are opened
+#
+# One local SQLite file, shared by every player on this machine (or every
+# session of a telnet server). Catches and boss outcomes are queued and
+# committed in batches by a background thread, so the game never waits on the
+# disk. Every query is a top-N walk down an index.
+import queue
+import sys
+import threading
+import time
+from colorama import Fore, Style
+from datetime import datetime
+
+from fishgame import LEADERBOARD_FILE, Encyclopedia, get_key, load_section
+
+
+LEADERBOARD_BATCH = 500  # most queued updates committed in one transaction
+LEADERBOARD_LINGER = 0.25  # seconds the writer waits for more updates before committing
+LEADERBOARD_MUTATIONS = ("magical", "shiny", "golden", "albino")
+LEADERBOARD_SCHEMA = """
+CREATE TABLE IF NOT EXISTS heaviest (
+    species TEXT NOT NULL, player TEXT NOT NULL, weight REAL NOT NULL, caught TEXT,
+    PRIMARY KEY (species, player));
+CREATE INDEX IF NOT EXISTS heaviest_by_weight ON heaviest (species, weight DESC);
+CREATE TABLE IF NOT EXISTS mutations (
+    mutation TEXT NOT NULL, player TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (mutation, player));
+CREATE INDEX IF NOT EXISTS mutations_by_count ON mutations (mutation, count DESC);
+CREATE TABLE IF NOT EXISTS players (
+    player TEXT PRIMARY KEY, karma INTEGER NOT NULL, species_found INTEGER NOT NULL,
+    species_total INTEGER NOT NULL, bosses INTEGER NOT NULL, updated TEXT);
+CREATE INDEX IF NOT EXISTS players_by_completion ON players (species_found DESC);
+CREATE INDEX IF NOT EXISTS players_by_karma ON players (karma);
+"""
+
+
+class Leaderboards:
+    """Heaviest fish per species, mutation counts, encyclopedia completion and
+    karma per player. record_* calls only queue an update; queries read
+    through a connection of their own (WAL lets them run next to the writer).
+    Without sqlite3 in the Python build the leaderboards are simply off."""
+
+    QUERIES = {
+        'heaviest': "SELECT player, weight, caught FROM heaviest WHERE species = ? ORDER BY weight DESC LIMIT ?",
+        'mutation': "SELECT player, count FROM mutations WHERE mutation = ? ORDER BY count DESC LIMIT ?",
+        'completion': "SELECT player, species_found, species_total FROM players ORDER BY species_found DESC LIMIT ?",
+        'karma': "SELECT player, karma FROM players ORDER BY karma DESC LIMIT ?",
+        'karma_lowest': "SELECT player, karma FROM players ORDER BY karma LIMIT ?",
+    }
+
+    def __init__(self, path=LEADERBOARD_FILE):
+        self.path = path
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._worker = None
+        self._readers = threading.local()
+
+    def connect(self):
+        import sqlite3
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(LEADERBOARD_SCHEMA)
+        return db
+
+    # --- feeding ---
+    def record_catch(self, player, fish):
+        self._submit(('catch', player, fish.name, fish.weight, fish.mutation, getattr(fish, 'catch_time', None)))
+
+    def record_player(self, game):
+        found, total = game.encyclopedia.completion()
+        self._submit(('player', game.name, game.karma, found, total, len(game.defeated_bosses),
+                      datetime.now().isoformat(timespec='seconds')))
+
+    def wait(self):
+        """Block until every queued update is committed"""
+        if self._worker is not None:
+            self._requests.join()
+
+    def close(self):
+        """Commit what is queued - registered with atexit"""
+        if self._worker is not None and self._worker.is_alive():
+            self._requests.put(None)
+            self._worker.join(5)
+
+    def _submit(self, update):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="leaderboards", daemon=True)
+                self._worker.start()
+        self._requests.put(update)
+
+    def _run(self):
+        try:
+            db = self.connect()
+        except Exception as e:
+            self._disable(e)
+            return
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + LEADERBOARD_LINGER
+            while batch[-1] is not None and len(batch) < LEADERBOARD_BATCH:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(db, [update for update in batch if update is not None])
+            except Exception as e:
+                print(Fore.YELLOW + f"Leaderboard update failed: {e}" + Style.RESET_ALL, file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self._requests.task_done()
+            if batch[-1] is None:
+                db.close()
+                return
+
+    def _disable(self, error):
+        print(Fore.YELLOW + f"Leaderboards disabled: {error}" + Style.RESET_ALL, file=sys.stderr)
+        self.enabled = False
+        while True:
+            try:
+                self._requests.get_nowait()
+            except queue.Empty:
+                return
+            self._requests.task_done()
+
+    def _write(self, db, updates):
+        """One transaction for the whole batch. Updates are folded first, so a
+        player catching twenty fish only touches their row once."""
+        heaviest = {}   # (species, player) -> (weight, caught)
+        mutations = {}  # (mutation, player) -> count
+        players = {}    # player -> row
+        for update in updates:
+            if update[0] == 'catch':
+                _, player, species, weight, mutation, caught = update
+                best = heaviest.get((species, player))
+                if best is None or weight > best[0]:
+                    heaviest[(species, player)] = (weight, caught)
+                if mutation in LEADERBOARD_MUTATIONS:
+                    mutations[(mutation, player)] = mutations.get((mutation, player), 0) + 1
+            else:
+                players[update[1]] = update[1:]
+        with db:
+            db.executemany("INSERT OR IGNORE INTO heaviest VALUES (?, ?, ?, ?)",
+                           [(species, player, weight, caught) for (species, player), (weight, caught) in heaviest.items()])
+            db.executemany("UPDATE heaviest SET weight = ?, caught = ? WHERE species = ? AND player = ? AND weight < ?",
+                           [(weight, caught, species, player, weight)
+                            for (species, player), (weight, caught) in heaviest.items()])
+            db.executemany("INSERT OR IGNORE INTO mutations VALUES (?, ?, 0)", list(mutations))
+            db.executemany("UPDATE mutations SET count = count + ? WHERE mutation = ? AND player = ?",
+                           [(count, mutation, player) for (mutation, player), count in mutations.items()])
+            db.executemany("INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?, ?)", list(players.values()))
+
+    # --- queries ---
+    def _reader(self):
+        db = getattr(self._readers, 'db', None)
+        if db is None:
+            db = self._readers.db = self.connect()
+        return db
+
+    def top(self, board, *args, limit=10):
+        """Top `limit` rows of a board in QUERIES; [] while the leaderboards are off"""
+        if not self.enabled:
+            return []
+        try:
+            return self._reader().execute(self.QUERIES[board], (*args, limit)).fetchall()
+        except Exception as e:
+            self._disable(e)
+            return []
+
+    def heaviest(self, species, limit=10):
+        """[(player, weight, caught)] - the heaviest of one species, one per player"""
+        return self.top('heaviest', species, limit=limit)
+
+    def mutation(self, mutation, limit=10):
+        """[(player, count)] - who has caught the most fish with this mutation"""
+        return self.top('mutation', mutation, limit=limit)
+
+    def completion(self, limit=10):
+        """[(player, species found, species total)]"""
+        return self.top('completion', limit=limit)
+
+    def karma(self, limit=10, lowest=False):
+        """[(player, karma)] - the kindest players, or the cruellest with lowest=True"""
+        return self.top('karma_lowest' if lowest else 'karma', limit=limit)
+
+    def query_plan(self, board):
+        """SQLite's plan for a board's query - each step should use an index"""
+        args = {'heaviest': ("Bass",), 'mutation': ("shiny",)}.get(board, ())
+        rows = self._reader().execute("EXPLAIN QUERY PLAN " + self.QUERIES[board], (*args, 10)).fetchall()
+        return [row[-1] for row in rows]
+
+    # --- rebuilding from save files ---
+    def rebuild(self, saves):
+        """Replace every board with what a save store holds: heaviest fish and
+        mutations among the fish each player still has, completion and karma.
+        Returns the number of saves read."""
+        self.wait()
+        db = self.connect()
+        try:
+            with db:
+                for table in ("heaviest", "mutations", "players"):
+                    db.execute(f"DELETE FROM {table}")
+            read = 0
+            for key in saves.keys():
+                try:
+                    data = saves.read(key)
+                    player = data['name']
+                except (OSError, ValueError, KeyError):
+                    continue
+                fish_lists = load_section(data.get('inventory', [])) + load_section(data.get('trophy_room', []))
+                updates = [('catch', player, fish['name'], fish['weight'], fish.get('mutation', 'normal'),
+                            fish.get('catch_time'))
+                           for fish in fish_lists]
+                found, total = Encyclopedia(load_section(data.get('encyclopedia', {}))).completion()
+                updates.append(('player', player, data.get('karma', 0), found, total,
+                                len(data.get('defeated_bosses', [])), datetime.now().isoformat(timespec='seconds')))
+                self._write(db, updates)
+                read += 1
+            return read
+        finally:
+            db.close()
+
+
+def view_leaderboards(game, ranking):
+    """The leaderboards screen: every board of a Leaderboards, your own rows highlighted"""
+    boards = ['heaviest', 'mutation', 'completion', 'karma']
+    board = 'heaviest'
+    species = sorted(game.encyclopedia.to_dict()) or [None]
+    species_index = 0
+    mutation_index = 0
+    ranking.wait()  # So your own latest catches are on the boards
+
+    while True:
+        game.clear_screen()
+        print(Fore.YELLOW + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+        print(Fore.YELLOW + "║          🏆 LEADERBOARDS 🏆            ║" + Style.RESET_ALL)
+        print(Fore.YELLOW + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+        print()
+
+        if board == 'heaviest':
+            name = species[species_index]
+            print(Fore.CYAN + f"Heaviest {name or 'fish'} ({species_index + 1}/{len(species)} of your species)" + Style.RESET_ALL)
+            rows = [(player, f"{weight} kg") for player, weight, caught in ranking.heaviest(name)] if name else []
+        elif board == 'mutation':
+            mutation = LEADERBOARD_MUTATIONS[mutation_index]
+            print(Fore.CYAN + f"Most {mutation.upper()} fish caught" + Style.RESET_ALL)
+            rows = [(player, f"{count} fish") for player, count in ranking.mutation(mutation)]
+        elif board == 'completion':
+            print(Fore.CYAN + "Encyclopedia completion" + Style.RESET_ALL)
+            rows = [(player, f"{found}/{total} species") for player, found, total in ranking.completion()]
+        else:
+            print(Fore.CYAN + "Karma" + Style.RESET_ALL)
+            rows = [(player, f"{karma:+d}") for player, karma in ranking.karma()]
+        print()
+
+        if not rows:
+            print(Fore.LIGHTBLACK_EX + "  Nobody on this board yet." + Style.RESET_ALL)
+        for rank, (player, value) in enumerate(rows, 1):
+            color = Fore.LIGHTGREEN_EX if player == game.name else Fore.WHITE
+            print(color + f"  {rank:>2}. {player:<24} {value}" + Style.RESET_ALL)
+
+        print()
+        print(Fore.WHITE + "[B]oard | [N]ext / [P]rev species or mutation | [Q]uit" + Style.RESET_ALL)
+        key = get_key()
+        if key == 'b':
+            board = boards[(boards.index(board) + 1) % len(boards)]
+        elif key in ('n', 'p'):
+            step = 1 if key == 'n' else -1
+            if board == 'heaviest':
+                species_index = (species_index + step) % len(species)
+            elif board == 'mutation':
+                mutation_index = (mutation_index + step) % len(LEADERBOARD_MUTATIONS)
+        elif key in ('q', '\x1b'):
+            return
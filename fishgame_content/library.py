@@ -0,0 +1,150 @@
+# Library books and the librarian - imported when you first pick up a book
+import random
+import time
+from colorama import Fore, Style
+
+from fishgame_content.bundle import get_bundle
+from fishgame_content.fish import unique_fish_names
+
+
+def random_citation():
+    """(title, author, quote) for the general shelves, from the content bundle if built"""
+    bundle = get_bundle()
+    if bundle is not None and bundle.has_section("citations"):
+        return tuple(bundle.record("citations", random.randrange(bundle.count("citations"))))
+    from fishgame_content.citations import LIBRARY_CITATIONS
+    return random.choice(LIBRARY_CITATIONS)
+
+
+def talk_to_librarian(game):
+    """Talk to Keeper Thalia"""
+    game.clear_screen()
+    print(Fore.LIGHTMAGENTA_EX + "Keeper Thalia - The Librarian" + Style.RESET_ALL)
+    print()
+    print(Fore.LIGHTBLACK_EX + "*An elderly woman with sharp eyes looks up from her reading*" + Style.RESET_ALL)
+    time.sleep(1)
+
+    librarian_greetings = [
+        "\"Knowledge is power, but wisdom is knowing when to use it.\"",
+        "\"The old texts speak of fishers like you. Chosen by the waters.\"",
+        "\"Every book here has been touched by the sea. They remember.\"",
+        "\"Read carefully. Some truths are dangerous to know.\"",
+    ]
+
+    print(Fore.MAGENTA + random.choice(librarian_greetings) + Style.RESET_ALL)
+    time.sleep(2)
+    print()
+
+    if len(game.encyclopedia) > len(unique_fish_names()) * 0.7:
+        print(Fore.GREEN + "\"Your encyclopedia grows impressive. You're becoming a true keeper of knowledge.\"" + Style.RESET_ALL)
+    elif len(game.defeated_bosses) >= 3:
+        print(Fore.CYAN + "\"The guardians test you, and you've shown great courage.\"" + Style.RESET_ALL)
+    else:
+        print(Fore.WHITE + "\"The waters have much to teach you yet, young fisher.\"" + Style.RESET_ALL)
+
+    time.sleep(2)
+    print()
+    input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+
+def read_library_book(game, book_type):
+    """Read a book from the library shelves"""
+    game.clear_screen()
+
+    if book_type == 'waters':
+        # The Waters That Remember
+        print(Fore.CYAN + "═══ THE WATERS THAT REMEMBER ═══" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "\"In the time before time, the waters were alive with consciousness" + Style.RESET_ALL)
+        print(Fore.WHITE + "ancient, patient, and watching.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.CYAN + "\"The First Current flowed from a source no mortal has ever found," + Style.RESET_ALL)
+        print(Fore.CYAN + "carrying with it the memory of creation itself.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.LIGHTBLUE_EX + "\"The waters remember everything. Every raindrop that fell." + Style.RESET_ALL)
+        print(Fore.LIGHTBLUE_EX + "Every creature born and died beneath the surface." + Style.RESET_ALL)
+        print(Fore.LIGHTBLUE_EX + "Water does not forget.\"" + Style.RESET_ALL)
+
+    elif book_type == 'guardians':
+        # Guardians of the Deep
+        print(Fore.CYAN + "═══ GUARDIANS OF THE DEEP ═══" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "\"From the memory of ages, the Guardians emerged—" + Style.RESET_ALL)
+        print(Fore.WHITE + "not created, but condensed from millennia of accumulated will.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.GREEN + "\"The River Guardian: Patience incarnate, bearer of ancient scars.\"" + Style.RESET_ALL)
+        time.sleep(1.5)
+        print(Fore.BLUE + "\"The Loch's Sorrow: Born of grief, longing to remember love.\"" + Style.RESET_ALL)
+        time.sleep(1.5)
+        print(Fore.MAGENTA + "\"The Kraken: Guardian not just of ocean, but of reality itself.\"" + Style.RESET_ALL)
+        time.sleep(1.5)
+        print(Fore.CYAN + "\"Jörmungandr: The World Serpent, whose coils hold the ocean together.\"" + Style.RESET_ALL)
+        time.sleep(1.5)
+        print(Fore.RED + "\"Cthulhu: The Deep Dreamer, whose thoughts shape the abyss.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.YELLOW + "\"Each Guardian can be defeated through force..." + Style.RESET_ALL)
+        print(Fore.YELLOW + "or understood through compassion. The choice defines the fisher.\"" + Style.RESET_ALL)
+
+    elif book_type == 'fishers':
+        # The First Fishers
+        print(Fore.CYAN + "═══ THE FIRST FISHERS ═══" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "\"Not everyone who casts a line is a Fisher.\"" + Style.RESET_ALL)
+        print(Fore.WHITE + "\"A Fisher feels the tug before the line goes taut.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.CYAN + "\"The gift manifests differently in each person.\"" + Style.RESET_ALL)
+        print(Fore.CYAN + "\"Some sense the mood of a river. Others hear the fish themselves.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.YELLOW + "\"The elders speak of an old prophecy:\"" + Style.RESET_ALL)
+        print(Fore.YELLOW + "\"A Fisher will determine the fate of the waters.\"" + Style.RESET_ALL)
+        print(Fore.YELLOW + "\"Not save or doom—but whether humanity learns what fishing truly means.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.LIGHTBLUE_EX + "\"Fishing is not about catching.\"" + Style.RESET_ALL)
+        print(Fore.LIGHTBLUE_EX + "\"It is about the relationship between fisher and water.\"" + Style.RESET_ALL)
+        print(Fore.LIGHTBLUE_EX + "\"The line does not catch the fish. The water decides.\"" + Style.RESET_ALL)
+
+    elif book_type == 'aquatech':
+        # AquaTech Warning
+        print(Fore.CYAN + "═══ AQUATECH: A WARNING ═══" + Style.RESET_ALL)
+        print()
+        print(Fore.RED + "\"[This appears to be a modern addition to the library]\"" + Style.RESET_ALL)
+        time.sleep(1)
+        print()
+        print(Fore.WHITE + "\"AquaTech Corporation presents itself as progress.\"" + Style.RESET_ALL)
+        print(Fore.WHITE + "\"Sustainable harvesting. Efficient extraction. Ocean management.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.YELLOW + "\"But their deep-sea drilling operations disturb ancient places.\"" + Style.RESET_ALL)
+        print(Fore.YELLOW + "\"Places that have slept since before humanity.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.RED + "\"The guardians grow agitated. They sense the intrusion.\"" + Style.RESET_ALL)
+        print(Fore.RED + "\"What AquaTech sees as resources, the waters see as violation.\"" + Style.RESET_ALL)
+        time.sleep(2)
+        print()
+        print(Fore.MAGENTA + "\"If you encounter AquaTech's forces...\"" + Style.RESET_ALL)
+        print(Fore.MAGENTA + "\"Remember: not all battles are fought with strength.\"" + Style.RESET_ALL)
+        print(Fore.MAGENTA + "\"Sometimes understanding is the greatest weapon.\"" + Style.RESET_ALL)
+
+    elif book_type == 'general':
+        # Random citation from famous books (see citations.py)
+        title, author, quote = random_citation()
+
+        print(Fore.LIGHTBLACK_EX + "*You pull a dusty tome from the shelf*" + Style.RESET_ALL)
+        print()
+        print(Fore.CYAN + f"═══ {title.upper()} ═══" + Style.RESET_ALL)
+        print(Fore.YELLOW + f"by {author}" + Style.RESET_ALL)
+        print()
+        time.sleep(1)
+        print(Fore.WHITE + quote + Style.RESET_ALL)
+
+    time.sleep(2)
+    print()
+    input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
@@ -0,0 +1,504 @@
+# Map compiler, loader and editor
+# Build:  python -m fishgame_content.maps            (compile every map into maps.bundle)
+# Check:  python -m fishgame_content.maps --check    (validate the sources, write nothing)
+# Edit:   python -m fishgame_content.maps --edit hub_island
+#
+# Maps are written as text in fishgame_content/map_sources/<name>.map: one
+# character per tile (see TILE_TYPES), one line per row, 'P' where the player
+# starts. Rows may be of different lengths. Lines starting with '#' before the
+# first row are comments.
+#
+# The compiler checks every character, that there is exactly one spawn point,
+# that no NPC stands on the map twice and that everything a player can use is
+# reachable from the spawn point. It writes one file the game maps into memory:
+# opening it is a header read, tiles are read straight out of the mapped pages.
+#
+# Layout (little endian):
+#   header     b"FGMP" | version u16 | map count u16 | alphabet length u16
+#   alphabet   UTF-8 source characters of TILE_TYPES[1:], so a bundle built
+#              against another tile table is never read
+#   directory  per map: name (24 bytes, NUL padded) | block offset u32
+#   map block  width u16 | height u16 | spawn x u16 | spawn y u16
+#              per INDEXES entry: cells offset u32 (from block start) | cell count u32
+#              tile ids (width * height bytes, row-major, short rows padded with 0)
+#              tile flags (width * height bytes)
+#              index cells, u32 each (y * width + x), in reading order
+#
+# maps.bundle is a build artifact. The game rebuilds it on start when it is
+# missing or older than a source, and compiles in memory if it can't be written.
+import collections
+import glob
+import mmap
+import os
+import struct
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT_DIR, "fishgame_content", "map_sources")
+MAPS_FILE = os.path.join(ROOT_DIR, "maps.bundle")
+
+MAPS_MAGIC = b"FGMP"
+MAPS_VERSION = 1
+HEADER = struct.Struct("<4sHHH")
+ENTRY = struct.Struct("<24sI")
+MAP_HEADER = struct.Struct("<HHHH")
+INDEX_ENTRY = struct.Struct("<II")
+
+# Tile flags: one byte per map cell, so every predicate is a single bit test
+TILE_WALKABLE = 1
+TILE_SOLID = 2
+TILE_FISHABLE = 4
+TILE_GOLDEN = 8
+TILE_BUILDING = 16
+TILE_NPC = 32
+TILE_DOOR = 64
+TILE_BOOKSHELF = 128
+
+# Every tile a map may use: (source character, name, flags, what it is).
+# A tile's id is its index here; id 0 is off the map. How a tile is drawn is
+# up to the game (fishgame.TILE_ART) - maps only hold ids.
+TILE_TYPES = [
+    (None, "off the map", 0, None),
+    ('.', "ground", TILE_WALKABLE, None),
+    ('≈', "lake", TILE_WALKABLE | TILE_FISHABLE, 'lake'),
+    ('≋', "river", TILE_WALKABLE | TILE_FISHABLE, 'river'),
+    ('~', "ocean", TILE_WALKABLE | TILE_FISHABLE, 'ocean'),
+    ('V', "volcanic water", TILE_WALKABLE | TILE_FISHABLE, 'volcanic'),
+    ('A', "arctic water", TILE_WALKABLE | TILE_FISHABLE, 'arctic'),
+    ('S', "space", TILE_WALKABLE | TILE_FISHABLE, 'space'),
+    ('⊙', "old fishing spot", TILE_WALKABLE | TILE_FISHABLE, None),
+    ('◉', "golden spot", TILE_WALKABLE | TILE_FISHABLE | TILE_GOLDEN, None),
+    ('█', "wall", TILE_SOLID, None),
+    ('t', "tree", TILE_SOLID, None),
+    ('▓', "rock", TILE_SOLID, None),
+    ('c', "chair", TILE_SOLID, None),
+    ('s', "shop", TILE_WALKABLE | TILE_BUILDING, 'shop'),
+    ('a', "aquarium", TILE_WALKABLE | TILE_BUILDING, 'aquarium'),
+    ('q', "quest board", TILE_WALKABLE | TILE_BUILDING, 'quests'),
+    ('h', "home", TILE_WALKABLE | TILE_BUILDING, 'home'),
+    ('k', "dock", TILE_WALKABLE | TILE_BUILDING, 'dock'),
+    ('b', "pub", TILE_WALKABLE | TILE_BUILDING, 'pub'),
+    ('l', "library", TILE_WALKABLE | TILE_BUILDING, 'library'),
+    ('F', "fisherman", TILE_WALKABLE | TILE_NPC, 'fisherman'),
+    ('M', "MacTavish", TILE_WALKABLE | TILE_NPC, 'mactavish'),
+    ('H', "Dr. Holloway", TILE_WALKABLE | TILE_NPC, 'holloway'),
+    ('Φ', "Prometheus", TILE_WALKABLE | TILE_NPC, 'prometheus'),
+    ('G', "Gro", TILE_WALKABLE | TILE_NPC, 'gro'),
+    ('R', "Marina", TILE_WALKABLE | TILE_NPC, 'marina'),
+    ('O', "Old Salt", TILE_WALKABLE | TILE_NPC, 'sailor'),
+    ('W', "the widow", TILE_WALKABLE | TILE_NPC, 'widow'),
+    ('T', "Thalia", TILE_WALKABLE | TILE_NPC, 'librarian'),
+    ('═', "bar counter", TILE_WALKABLE, None),
+    ('D', "door", TILE_WALKABLE | TILE_DOOR, None),
+    ('1', "red bookshelf", TILE_WALKABLE | TILE_BOOKSHELF, 'waters'),  # The Waters That Remember
+    ('2', "green bookshelf", TILE_WALKABLE | TILE_BOOKSHELF, 'guardians'),  # Guardians of the Deep
+    ('3', "blue bookshelf", TILE_WALKABLE | TILE_BOOKSHELF, 'fishers'),  # The First Fishers
+    ('4', "yellow bookshelf", TILE_WALKABLE | TILE_BOOKSHELF, 'aquatech'),  # AquaTech Warning
+    ('Ξ', "grey bookshelf", TILE_WALKABLE | TILE_BOOKSHELF, 'general'),
+]
+TILE_IDS = {char: tile for tile, (char, _, _, _) in enumerate(TILE_TYPES) if char is not None}
+TILE_FLAGS = bytes(flags for _, _, flags, _ in TILE_TYPES)
+TILE_KINDS = tuple(kind for _, _, _, kind in TILE_TYPES)
+TILE_ALPHABET = ''.join(char for char, _, _, _ in TILE_TYPES[1:])
+OFF_MAP = 0
+SPAWN = 'P'
+
+# Indexes stored with every map: name -> the flag its cells have
+INDEXES = (
+    ('fishing', TILE_FISHABLE),
+    ('golden', TILE_GOLDEN),
+    ('doors', TILE_DOOR),
+    ('npcs', TILE_NPC),
+    ('buildings', TILE_BUILDING),
+)
+INTERACTIVE = TILE_FISHABLE | TILE_BUILDING | TILE_NPC | TILE_DOOR | TILE_BOOKSHELF
+
+_maps = None
+
+
+class MapError(ValueError):
+    """A map source that doesn't compile. The message says where."""
+
+
+class CompiledMap:
+    """One map of a MapBundle. grid and flags are views into the bundle's
+    buffer; index cells are decoded the first time they are asked for."""
+    def __init__(self, name, view, offset):
+        self.name = name
+        self.view = view
+        self.width, self.height, spawn_x, spawn_y = MAP_HEADER.unpack_from(view, offset)
+        self.spawn = (spawn_x, spawn_y)
+        self.indexes = {}
+        for i, (index, _) in enumerate(INDEXES):
+            cells_offset, count = INDEX_ENTRY.unpack_from(view, offset + MAP_HEADER.size + i * INDEX_ENTRY.size)
+            self.indexes[index] = (offset + cells_offset, count)
+        start = offset + MAP_HEADER.size + len(INDEXES) * INDEX_ENTRY.size
+        size = self.width * self.height
+        self.grid = view[start:start + size]
+        self.flags = view[start + size:start + 2 * size]
+        self.decoded = {}
+        self.placed = None
+
+    def cells(self, index):
+        """Cell numbers (y * width + x) of every tile in one of INDEXES, in reading order"""
+        cells = self.decoded.get(index)
+        if cells is None:
+            offset, count = self.indexes[index]
+            cells = self.decoded[index] = struct.unpack_from(f"<{count}I", self.view, offset)
+        return cells
+
+    def positions(self, index):
+        return [(cell % self.width, cell // self.width) for cell in self.cells(index)]
+
+    def position_of(self, kind):
+        """(x, y) of the NPC or building of this kind, or None"""
+        if self.placed is None:
+            self.placed = {TILE_KINDS[self.grid[cell]]: (cell % self.width, cell // self.width)
+                           for index in ('npcs', 'buildings') for cell in self.cells(index)}
+        return self.placed.get(kind)
+
+    def describe(self):
+        counts = ", ".join(f"{len(self.cells(index))} {index}" for index, _ in INDEXES)
+        return f"{self.width}x{self.height}, {counts}"
+
+
+class MapBundle:
+    """Compiled maps by name, read from a buffer (the mapped maps.bundle or
+    bytes compiled in memory)"""
+    def __init__(self, data):
+        magic, version, count, alphabet_length = HEADER.unpack_from(data, 0)
+        if magic != MAPS_MAGIC or version != MAPS_VERSION:
+            raise ValueError(f"not a version {MAPS_VERSION} map bundle")
+        alphabet = bytes(data[HEADER.size:HEADER.size + alphabet_length]).decode('utf-8')
+        if alphabet != TILE_ALPHABET:
+            raise ValueError("map bundle was built for a different tile table")
+        self.data = data
+        self.view = memoryview(data)
+        self.maps = {}
+        directory = HEADER.size + alphabet_length
+        for i in range(count):
+            name, offset = ENTRY.unpack_from(data, directory + i * ENTRY.size)
+            name = name.rstrip(b"\0").decode('utf-8')
+            self.maps[name] = CompiledMap(name, self.view, offset)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(data)
+        except (ValueError, struct.error):
+            data.close()
+            raise
+
+    def __getitem__(self, name):
+        return self.maps[name]
+
+    def __iter__(self):
+        return iter(self.maps.values())
+
+
+# ===== COMPILER =====
+def source_path(name):
+    return os.path.join(SOURCE_DIR, name + ".map")
+
+
+def read_sources():
+    """[(map name, source text)] for every .map file, sorted by name"""
+    sources = []
+    for path in sorted(glob.glob(os.path.join(SOURCE_DIR, "*.map"))):
+        with open(path, encoding='utf-8') as f:
+            sources.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    return sources
+
+
+def split_source(text):
+    """(comment lines, rows) of a map source; rows are strings, line_numbers their
+    1-based lines in the file"""
+    comments, rows, line_numbers = [], [], []
+    lines = text.splitlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+    for number, line in enumerate(lines, 1):
+        if not rows and (line.startswith('#') or not line.strip()):
+            comments.append(line)
+        else:
+            rows.append(line)
+            line_numbers.append(number)
+    return comments, rows, line_numbers
+
+
+def compile_map(name, text):
+    """Check one map source and compile it into a map block (bytes)"""
+    if len(name.encode('utf-8')) > ENTRY.size - 4:
+        raise MapError(f"{name}.map: map names are at most {ENTRY.size - 4} bytes")
+    _, rows, line_numbers = split_source(text)
+    if not rows:
+        raise MapError(f"{name}.map: no rows")
+    width, height = max(len(row) for row in rows), len(rows)
+    if width > 0xFFFF or height > 0xFFFF:
+        raise MapError(f"{name}.map: {width}x{height} is too big")
+
+    def where(x, y):
+        return f"{name}.map line {line_numbers[y]}, column {x + 1}"
+
+    grid = bytearray(width * height)
+    spawn = None
+    npcs = {}
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == SPAWN:
+                if spawn is not None:
+                    raise MapError(f"{where(x, y)}: a second spawn point (the first is at {where(*spawn)})")
+                spawn = (x, y)
+                char = '.'
+            tile = TILE_IDS.get(char)
+            if tile is None:
+                raise MapError(f"{where(x, y)}: unknown tile {char!r}")
+            if TILE_FLAGS[tile] & TILE_NPC:
+                if tile in npcs:
+                    raise MapError(f"{where(x, y)}: {TILE_TYPES[tile][1]} is already at {where(*npcs[tile])}")
+                npcs[tile] = (x, y)
+            grid[y * width + x] = tile
+    if spawn is None:
+        raise MapError(f"{name}.map: no spawn point ('{SPAWN}')")
+    flags = grid.translate(TILE_FLAGS.ljust(256, b"\0"))
+
+    # Everything a player can use must be reachable on foot from the spawn point
+    start = spawn[1] * width + spawn[0]
+    reached = bytearray(len(grid))
+    reached[start] = 1
+    queue = collections.deque([start])
+    while queue:
+        cell = queue.popleft()
+        x = cell % width
+        for neighbour, inside in ((cell - width, cell >= width), (cell + width, cell + width < len(grid)),
+                                  (cell - 1, x > 0), (cell + 1, x + 1 < width)):
+            if inside and not reached[neighbour] and flags[neighbour] & TILE_WALKABLE:
+                reached[neighbour] = 1
+                queue.append(neighbour)
+    for cell, cell_flags in enumerate(flags):
+        if cell_flags & INTERACTIVE and not reached[cell]:
+            x, y = cell % width, cell // width
+            raise MapError(f"{where(x, y)}: the {TILE_TYPES[grid[cell]][1]} can't be reached from the spawn point")
+
+    index_table = bytearray()
+    index_cells = bytearray()
+    cells_start = MAP_HEADER.size + len(INDEXES) * INDEX_ENTRY.size + 2 * len(grid)
+    for _, flag in INDEXES:
+        cells = [cell for cell, cell_flags in enumerate(flags) if cell_flags & flag]
+        index_table += INDEX_ENTRY.pack(cells_start + len(index_cells), len(cells))
+        index_cells += struct.pack(f"<{len(cells)}I", *cells)
+    return MAP_HEADER.pack(width, height, *spawn) + index_table + grid + flags + index_cells
+
+
+def compile_maps(sources):
+    """Compile [(name, source text)] into the bytes of a map bundle"""
+    alphabet = TILE_ALPHABET.encode('utf-8')
+    blocks = [(name, compile_map(name, text)) for name, text in sources]
+    data_start = HEADER.size + len(alphabet) + len(blocks) * ENTRY.size
+    header = bytearray(HEADER.pack(MAPS_MAGIC, MAPS_VERSION, len(blocks), len(alphabet))) + alphabet
+    data = bytearray()
+    for name, block in blocks:
+        header += ENTRY.pack(name.encode('utf-8'), data_start + len(data))
+        data += block
+    return bytes(header + data)
+
+
+def write_maps(data, path=MAPS_FILE):
+    # Write next to the target and swap it in, so running games keep their old mapping
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def build_maps(path=MAPS_FILE):
+    """Compile every map source into path; returns the MapBundle it holds"""
+    data = compile_maps(read_sources())
+    write_maps(data, path)
+    return MapBundle(data)
+
+
+def is_stale(path=MAPS_FILE):
+    built = os.path.getmtime(path)
+    sources = [__file__, SOURCE_DIR] + glob.glob(os.path.join(SOURCE_DIR, "*.map"))
+    return any(os.path.getmtime(source) > built for source in sources)
+
+
+def get_maps():
+    """The shared MapBundle: maps.bundle when it is up to date, otherwise the
+    sources compiled now (and written to maps.bundle for next time)"""
+    global _maps
+    if _maps is None:
+        try:
+            if os.path.exists(MAPS_FILE) and not is_stale():
+                _maps = MapBundle.open(MAPS_FILE)
+        except (OSError, ValueError, struct.error):
+            _maps = None
+        if _maps is None:
+            data = compile_maps(read_sources())
+            try:
+                write_maps(data)
+            except OSError:
+                pass  # read-only install: compile on every start instead
+            _maps = MapBundle(data)
+    return _maps
+
+
+# ===== EDITOR =====
+class MapEditor:
+    """Terminal editor for one map source. Paints with the game's own tiles and
+    compiles on save, so a map that is saved always loads."""
+    PALETTE = [SPAWN] + list(TILE_ALPHABET)
+
+    def __init__(self, name, game_module):
+        self.name = name
+        self.game = game_module
+        self.path = source_path(name)
+        text = ""
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                text = f.read()
+        comments, rows, _ = split_source(text)
+        self.comments = comments or [f"# {name}"]
+        self.rows = [list(row) for row in rows] or [[SPAWN]]
+        self.x = self.y = 0
+        self.brush = 1
+        self.history = []
+        self.saved = True
+        self.message = "Pick a tile with [ ], paint with SPACE, save with ENTER."
+
+    def glyph(self, char):
+        if char == SPAWN:
+            return self.game.PLAYER_GLYPH
+        return self.game.TILE_GLYPHS[TILE_IDS[char]]
+
+    def tile_name(self, char):
+        return "spawn point" if char == SPAWN else TILE_TYPES[TILE_IDS[char]][1]
+
+    def text(self):
+        return "\n".join(self.comments + [''.join(row) for row in self.rows]) + "\n"
+
+    def draw(self):
+        from colorama import Back, Fore, Style
+        os.system('cls' if os.name == 'nt' else 'clear')
+        print(Fore.CYAN + f"Map editor - {self.name}.map" + ("" if self.saved else " (unsaved)") + Style.RESET_ALL)
+        print()
+        for y, row in enumerate(self.rows):
+            line = ""
+            for x, char in enumerate(row + [' ']):
+                glyph = ' ' if char == ' ' else self.glyph(char)
+                line += Back.LIGHTBLACK_EX + glyph + Style.RESET_ALL if (x, y) == (self.x, self.y) else glyph
+            print(line)
+        print()
+        here = self.rows[self.y][self.x] if self.x < len(self.rows[self.y]) else None
+        brush = self.PALETTE[self.brush]
+        print(Fore.WHITE + f"({self.x}, {self.y}) {self.tile_name(here) if here else 'past the end of the row'}"
+              + f"  |  brush: {self.glyph(brush)}" + Fore.WHITE + f" {brush} {self.tile_name(brush)}" + Style.RESET_ALL)
+        print(Fore.YELLOW + self.message + Style.RESET_ALL)
+        print(Fore.WHITE + "[WASD] Move | [ ] Tile | SPACE Paint | [+/-] Longer/shorter row | "
+              "[O] Copy row below | [X] Delete row | [U] Undo | ENTER Save | [Q] Quit" + Style.RESET_ALL)
+
+    def change(self):
+        self.history.append([row[:] for row in self.rows])
+        del self.history[:-100]
+        self.saved = False
+
+    def paint(self):
+        row = self.rows[self.y]
+        brush = self.PALETTE[self.brush]
+        self.change()
+        if brush == SPAWN:
+            for other in self.rows:
+                other[:] = ['.' if char == SPAWN else char for char in other]
+        if self.x == len(row):
+            row.append(brush)
+        else:
+            row[self.x] = brush
+
+    def save(self):
+        text = self.text()
+        try:
+            compile_map(self.name, text)
+        except MapError as e:
+            self.message = f"Not saved: {e}"
+            return
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        self.saved = True
+        try:
+            self.message = f"Saved and compiled: {build_maps()[self.name].describe()}"
+        except MapError as e:
+            self.message = f"Saved, but another map doesn't compile: {e}"
+
+    def run(self):
+        get_key = self.game.get_key
+        quitting = False
+        while True:
+            self.draw()
+            key = get_key()
+            if key != 'q':
+                quitting = False
+            row = self.rows[self.y]
+            if key in ('w', 's'):
+                self.y = max(0, min(len(self.rows) - 1, self.y + (1 if key == 's' else -1)))
+            elif key in ('a', 'd'):
+                self.x += 1 if key == 'd' else -1
+            elif key in ('[', ']'):
+                self.brush = (self.brush + (1 if key == ']' else -1)) % len(self.PALETTE)
+            elif key == ' ':
+                self.paint()
+            elif key == '+':
+                self.change()
+                row.append('.')
+            elif key == '-' and row:
+                self.change()
+                row.pop()
+            elif key == 'o':
+                self.change()
+                self.rows.insert(self.y + 1, ['.' if char == SPAWN else char for char in row])
+                self.y += 1
+            elif key == 'x' and len(self.rows) > 1:
+                self.change()
+                del self.rows[self.y]
+            elif key == 'u' and self.history:
+                self.rows = self.history.pop()
+                self.saved = False
+            elif key in ('\r', '\n'):
+                self.save()
+            elif key == 'q':
+                if self.saved or quitting:
+                    return
+                quitting = True
+                self.message = "Unsaved changes - press [Q] again to quit without saving."
+            self.y = min(self.y, len(self.rows) - 1)
+            self.x = max(0, min(len(self.rows[self.y]), self.x))
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile, check or edit the game's maps")
+    parser.add_argument("--check", action="store_true", help="only check the map sources")
+    parser.add_argument("--edit", metavar="MAP", help="edit fishgame_content/map_sources/MAP.map")
+    args = parser.parse_args()
+    try:
+        if args.edit:
+            import fishgame
+            MapEditor(args.edit, fishgame).run()
+            return 0
+        if args.check:
+            maps = MapBundle(compile_maps(read_sources()))
+        else:
+            maps = build_maps()
+    except MapError as e:
+        print(e)
+        return 1
+    for compiled in maps:
+        print(f"{compiled.name:<16}{compiled.describe()}")
+    if not args.check:
+        print(f"Wrote {MAPS_FILE} ({os.path.getsize(MAPS_FILE)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
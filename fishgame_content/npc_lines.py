@@ -0,0 +1,273 @@
+# NPC lines: every pool an NPC picks a random line (or story) from, by key
+
+NPC_LINES = {
+    "pirate.greetings.hero": [
+        "Ahoy, legendary protector! The seas sing of your deeds!",
+        "The great Guardian Savior! Welcome aboard, hero!",
+        "Aye! If it isn't the Champion of the Guardians!",
+        "Every creature in these waters owes you a debt! Welcome, friend!",
+        "The oceans are blessed by your mercy! Come aboard!",
+    ],
+    "pirate.greetings.friend": [
+        "Ahoy, matey! Welcome aboard!",
+        "Well met, friend! Ready to strike back at AquaTech?",
+        "Aye, there ye are! Our rebel ally!",
+        "Welcome to the Crimson Tide, comrade!",
+        "Good to see ye! The seas need more like you.",
+    ],
+    "pirate.greetings.neutral": [
+        "Ahoy. What brings ye here?",
+        "Welcome aboard, I suppose.",
+        "Aye. Come to talk?",
+    ],
+    "pirate.greetings.wary": [
+        "Hmm. Word of your... deeds... has reached us.",
+        "*Eyes narrow* The guardians' blood is on your hands.",
+        "Ye may have spared us, but we know what ye've done elsewhere.",
+    ],
+    "pirate.greetings.hostile": [
+        "*Spits* Slayer. Why are ye here?",
+        "Guardian killer. We spared ye. Don't make us regret it.",
+        "*Draws cutlass slightly* Speak quick, executioner.",
+        "The ancient ones cry out for vengeance... State yer business.",
+    ],
+    "pirate.farewell.hero": [
+        "\"Fair winds and followin' seas, hero! The guardians protect ye!\"",
+        "\"Sail safe, champion! The rebellion owes ye everything!\"",
+        "\"May the ancient ones guide yer path! Until we meet again!\"",
+        "\"Aye, the seas are safer with ye on 'em! Come back anytime!\"",
+    ],
+    "pirate.farewell.friend": [
+        "\"Fair winds to ye, matey! Come back anytime!\"",
+        "\"Sail safe, friend! The rebellion stands with ye!\"",
+        "\"May the seas be kind to ye! Until next time!\"",
+        "\"Tight lines and high tides! We'll be here when ye return!\"",
+    ],
+    "pirate.farewell.neutral": [
+        "\"Aye. Safe travels.\"",
+        "\"Watch yerself out there.\"",
+        "\"Until next time.\"",
+    ],
+    "pirate.farewell.wary": [
+        "\"The guardians are watching ye. Remember that.\"",
+        "\"*Nods coldly* Don't make us regret sparing ye.\"",
+        "\"Aye... just go.\"",
+    ],
+    "pirate.farewell.hostile": [
+        "\"*Spits* Get off me ship, slayer.\"",
+        "\"The only reason yer alive is we spared ye once. Don't test us.\"",
+        "\"*Turns away in disgust*\"",
+        "\"May the drowned guardians haunt yer every step...\"",
+    ],
+    "mactavish.greetings.hero": [
+        "Och aye! If it isn't the mighty hero who saved Nessie!",
+        "Aye, the Guardian Savior! The loch is blessed by yer mercy!",
+        "Well met, protector! Nessie herself told me of yer kindness!",
+        "The ancient one speaks highly o' ye, brave fisher!",
+    ],
+    "mactavish.greetings.friend": [
+        "Och aye, good to see ye again, laddie!",
+        "Ah, me favorite angler returns!",
+        "Welcome back to the loch, friend!",
+        "Top o' the mornin' to ye!",
+    ],
+    "mactavish.greetings.neutral": [
+        "Aye... back again, are ye?",
+        "Hmm. What brings ye by?",
+        "Oh. It's you.",
+    ],
+    "mactavish.greetings.hostile": [
+        "*Narrows eyes* What do ye want, slayer?",
+        "Ye've got some nerve showin' yer face here...",
+        "The loch weeps fer what ye've done.",
+    ],
+    "mactavish.stories": [
+        "Back in '82, I saw Nessie breach right in front o' me boat! Nearly capsized, I did! She was chasin' a school o' salmon the size o' me arm!",
+        "Me grandfather used tae tell tales o' the monster. Said she's been here since the days o' Bonnie Prince Charlie himself!",
+        "Once found a tourist tryin' tae fish with bread! BREAD! I says to 'em, 'This ain't no duck pond, laddie!' Nessie wouldnae give that the time o' day!",
+        "The loch gets mighty temperamental in winter. Ice as thick as me thumb, and strange lights beneath... Nessie doesna hibernate, ye see.",
+        "I remember the day the scientists came with their sonar equipment. Nessie played hide-n-seek with 'em fer three whole days! She's a clever one, she is!",
+        "There's an old cave system beneath the loch. Me father sealed most of it off, but sometimes ye can still hear rumblin'... *whispers* That's where she nests.",
+        "Ye know what Nessie's favorite food is? Haggis! Aye, I'm serious! Toss a bit in the water and she'll come right up. Though I dinnae recommend tryin' it...",
+        "The ancient Picts carved images o' her on standing stones. She's been guardin' these waters fer thousands o' years, she has!"
+    ],
+    "gro.stories": [
+        {
+            "title": "\"The gods of the frozen north still watch, you know.\"",
+            "lines": [
+                "\"My grandmother told me stories...\"",
+                "\"Of Ægir, the great sea giant, who brews storms in his hall.\"",
+                "\"Of Jörmungandr, the world serpent, coiled beneath all oceans.\"",
+                "\"Of Skadi, goddess of winter, who hunts across frozen peaks.\"",
+                "\"They say she sometimes skis across this very lake...\"",
+                "\"Leaving trails of frost in her wake.\"",
+                "\"The old ways aren't dead. They're just sleeping.\"",
+                "\"Like the wyrm beneath us.\""
+            ]
+        },
+        {
+            "title": "\"You know about the Frost Wyrm?\"",
+            "lines": [
+                "\"That dragon's been here longer than memory.\"",
+                "\"My people - we know the stories.\"",
+                "\"It came during the last great ice age.\"",
+                "\"When glaciers covered everything and the world froze.\"",
+                "\"The wyrm made this lake its hoard - filling it with frozen fish.\"",
+                "\"Perfectly preserved. Ancient catches from extinct waters.\"",
+                "\"Some say the wyrm is lonely. Guards its hoard because...\"",
+                "\"...because that's all it has left of a frozen world long gone.\""
+            ]
+        },
+        {
+            "title": "\"The old gods taught us respect.\"",
+            "lines": [
+                "\"Never take more than you need.\"",
+                "\"Always thank the waters for their gift.\"",
+                "\"Speak to the fish before you catch them.\"",
+                "\"Honor the ones who gave their lives so you might eat.\"",
+                "\"Björn knows this too - watch how he hunts.\"",
+                "\"He takes one seal, feeds for days, thanks the ice.\"",
+                "\"The gods don't demand much. Just... remembrance.\"",
+                "\"Remember the old ways. Remember where food comes from.\""
+            ]
+        }
+    ],
+    "gro.tips": [
+        "🧤 \"Always carry spare mittens. Wet mittens mean dead fingers.\"",
+        "🔥 \"Fire is life. Learn to start one with wet wood.\"",
+        "🐟 \"Fish is brain food! Keeps you sharp when the cold makes you slow.\"",
+        "🏠 \"Build a windbreak. Even small shelter saves precious warmth.\"",
+        "💧 \"Eat snow only if desperate - it costs body heat to melt!\"",
+        "🧭 \"Moss grows on north side of rocks. But up here, all sides are north!\"",
+        "⏰ \"In winter, the sun tricks you. Keep track of time or you'll freeze in dark.\"",
+        "🐻 \"If you meet a polar bear without Björn... play dead and pray!\"",
+        "❄️ \"Ice fog means water is warmer than air. Good sign for fishing!\"",
+        "🌙 \"Aurora borealis? That's the gods fishing with light! Good omen!\""
+    ],
+    "gro.tales": [
+        {
+            "catch": "Frozen Sabertooth Salmon",
+            "story": "\"Caught it fifteen winters ago. Still frozen, perfectly preserved! The wyrm's hoard leaked it out. A fish from when mammoths walked! Scientists offered me fortune for it. I said no - it belongs to the ice.\""
+        },
+        {
+            "catch": "Ice Age Sturgeon",
+            "story": "\"As long as my fishing hut! Took me three days to reel in. It had ice crystals INSIDE its scales. Like it was half-water, half-fish. The wyrm was NOT happy I took it. Had to leave offerings for a month.\""
+        },
+        {
+            "catch": "Ghostfin Pike",
+            "story": "\"This one was strange... transparent as ice. Could see through it. Björn refused to eat it - bears know things we don't. I released it. Sometimes you catch things that shouldn't be caught.\""
+        }
+    ],
+    "gro.bear_reactions": [
+        {
+            "action": "*Björn leans into your hand and rumbles contentedly*",
+            "gro": "\"Hah! He REALLY likes you! That's rare!\"",
+            "bonus": "+5 Luck"
+        },
+        {
+            "action": "*Björn tolerates the petting with dignity*",
+            "gro": "\"He accepts you! That's high praise from a bear!\"",
+            "bonus": "+3 Luck"
+        },
+        {
+            "action": "*Björn sneezes and goes back to sleep*",
+            "gro": "\"Ha! You bored him! That means he trusts you!\"",
+            "bonus": "+1 Luck"
+        }
+    ],
+    "gro.farewell": [
+        "\"Skål! May your lines never freeze!\"",
+        "\"Stay warm out there! The ice is unforgiving!\"",
+        "\"Come back soon! Björn will miss you!\"",
+        "\"The old gods watch over you, fisher!\"",
+        "\"May the wyrm leave you in peace!\""
+    ],
+    "fisherman.greetings.hero": [
+        "Ahoy there, hero of the seas! Your kindness is legendary!",
+        "The guardian spirits speak well of you, friend!",
+        "Ah, the protector returns! The waters are blessed by your presence!",
+        "Welcome, champion! The guardians celebrate your mercy!",
+        "The ancient ones smile upon you, noble fisher!",
+    ],
+    "fisherman.greetings.friend": [
+        "Ahoy there, young angler!",
+        "Greetings, friend! Beautiful day for fishing, eh?",
+        "Ah, a fellow fisher! Come, sit a spell.",
+        "Welcome to my humble fishing spot.",
+        "The water speaks to those patient enough to listen.",
+    ],
+    "fisherman.greetings.neutral": [
+        "Well, well… another fisher visits my spot.",
+        "Oh. It's you again.",
+        "Back already?",
+        "Hmm. Hello.",
+    ],
+    "fisherman.greetings.wary": [
+        "*The old man eyes you warily* ...What do you want?",
+        "I heard what you did. The guardians won't forget.",
+        "*Doesn't look up from his fishing* ...You again.",
+        "Word travels fast on these waters. Your deeds have been noted.",
+    ],
+    "fisherman.greetings.hostile": [
+        "*The old man's face hardens* Slayer. What brings you here?",
+        "The water recoils from your presence... and so do I.",
+        "*Spits* Executioner. Your hands are stained with ancient blood.",
+        "The guardians cry out in their graves. What more do you want?",
+        "*Looks away in disgust* Monster hunter. I have nothing to say to you.",
+    ],
+    "fisherman.farewell.hero": [
+        "\"May the ancient spirits guide your path, hero. You honor us all.\"",
+        "\"The guardians are in your debt. Safe travels, protector.\"",
+        "\"Tight lines, champion. The waters sing of your compassion.\"",
+        "\"Go with the blessings of the deep. You've earned them.\"",
+    ],
+    "fisherman.farewell.friend": [
+        "\"Tight lines, friend. May the waters be kind to you.\"",
+        "\"Be safe out there. The guardians remember kindness.\"",
+        "\"Come back anytime. These old bones enjoy the company.\"",
+        "\"Fish well, and respect the waters. They're watching.\"",
+    ],
+    "fisherman.farewell.neutral": [
+        "\"...Be careful out there.\"",
+        "\"The waters are watching. Always watching.\"",
+        "\"*Nods curtly* Safe travels.\"",
+    ],
+    "fisherman.farewell.wary": [
+        "\"The guardians don't forget. Think on that.\"",
+        "\"*Turns back to fishing without another word*\"",
+        "\"Every action has consequences, fisher. Remember that.\"",
+    ],
+    "fisherman.farewell.hostile": [
+        "\"*Doesn't look at you* Just... go.\"",
+        "\"The blood on your hands won't wash off. Ever.\"",
+        "\"*Whispers* May the drowned ones haunt your dreams...\"",
+        "\"*Cold silence*\"",
+    ],
+    "marina.greetings": [
+        "\"Welcome, fisher. What'll it be?\"",
+        "\"Heard you've been making waves out there.\"",
+        "\"The waters have been... restless lately.\"",
+        "\"You have the look of someone who's seen things.\"",
+    ],
+    "sailor.tales": [
+        ("\"Saw something in the deep once. Bigger than any ship.\"",
+         "\"It looked at me... and I knew it was older than the ocean itself.\""),
+        ("\"The Kraken? Oh, it's real alright.\"",
+         "\"But it's not the monster they say. It's... protecting something.\""),
+        ("\"I sailed with Redbeard once, before he turned pirate.\"",
+         "\"Good man, till the sea took his family. Changed him, it did.\""),
+        ("\"The waters are all connected, you know.\"",
+         "\"What you do in one place ripples everywhere else.\""),
+    ],
+    "widow.lines": [
+        ("\"My husband used to fish these waters.\"",
+         "\"Never came back from the deep. They say the guardian took him.\"",
+         "\"But I know better. He went down there willingly. Looking for answers.\""),
+        ("\"This island has always been special.\"",
+         "\"The waters choose who comes here. You didn't find this place.\"",
+         "\"It found you.\""),
+        ("\"Be kind to the waters, and they'll be kind to you.\"",
+         "\"Be cruel, and... well.\"",
+         "\"Some debts can only be paid in salt and tears.\""),
+    ],
+}
@@ -0,0 +1,1689 @@
+# NPC conversations and NPC shops - imported the first time you talk to someone
+import random
+import time
+from colorama import Fore, Style
+
+from fishgame import (
+    ITEMS,
+    Fish,
+    get_key,
+    get_random_fact,
+)
+from fishgame_content.bundle import get_bundle
+from fishgame_content.fish import fish_table
+
+
+def npc_lines(key):
+    """A pool of NPC lines (see npc_lines.py), from the content bundle if built"""
+    bundle = get_bundle()
+    if bundle is not None and bundle.has_section("npc_lines"):
+        return bundle.lookup("npc_lines", key)
+    from fishgame_content.npc_lines import NPC_LINES
+    return NPC_LINES[key]
+
+
+def interact_with_pirate_captain(game):
+    """Talk to Captain Redbeard after sparing the pirate ship"""
+    while True:
+        game.clear_screen()
+
+        pirate_art = """
+        🏴‍☠️ Captain Redbeard - The Crimson Tide 🏴‍☠️
+
+                 ___
+               _/   \\_
+              / | @ @|\\
+             |  |  >  ||     "Freedom or death!"
+              \\ | === |/
+               \\|_____|
+                |     |
+               _|_____|_
+              /   ⚓⚓   \\
+             |  CAPTAIN  |
+             |  REDBEARD |
+              \\__________/
+        """
+
+        print(Fore.RED + pirate_art + Style.RESET_ALL)
+        print()
+
+        # Karma-based greeting
+        if random.random() < 0.3:
+            if game.karma >= 50:
+                greetings = npc_lines("pirate.greetings.hero")
+                print(Fore.GREEN + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= 10:
+                greetings = npc_lines("pirate.greetings.friend")
+                print(Fore.CYAN + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= -10:
+                greetings = npc_lines("pirate.greetings.neutral")
+                print(Fore.WHITE + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= -50:
+                greetings = npc_lines("pirate.greetings.wary")
+                print(Fore.YELLOW + random.choice(greetings) + Style.RESET_ALL)
+            else:
+                greetings = npc_lines("pirate.greetings.hostile")
+                print(Fore.RED + random.choice(greetings) + Style.RESET_ALL)
+            print()
+
+        print(Fore.YELLOW + "What would you like to discuss?" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Ask about AquaTech Industries" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Ask about the rebellion" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Ask about pirate life" + Style.RESET_ALL)
+        print(Fore.WHITE + "4. Get a gift from the captain" + Style.RESET_ALL)
+        print(Fore.CYAN + "5. Ask about his connection to the ocean" + Style.RESET_ALL)
+        print(Fore.CYAN + "6. Ask what he knows about the Guardians" + Style.RESET_ALL)
+        print(Fore.CYAN + "7. Ask about AquaTech's true intentions" + Style.RESET_ALL)
+        print(Fore.CYAN + "8. Ask about the Fisher prophecy" + Style.RESET_ALL)
+        print(Fore.LIGHTBLACK_EX + "9. Leave" + Style.RESET_ALL)
+        print()
+
+        choice = input(Fore.CYAN + "Your choice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"AquaTech... those corporate scoundrels.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"They claim they're 'managing the seas responsibly.'\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But we know the truth - they're plunderin' everything!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Overfishing, pollution, drivin' out the guardians...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"We were fishermen once, honest folk.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But when they seized our ancestral waters...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"We became pirates. Rebels. Defenders of the free seas!\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '2':
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"The rebellion grows stronger every day!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Ships from all corners join our cause.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Even some of the guardians ye spared have blessed us.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Together, we'll break AquaTech's stranglehold!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The seas belong to all, not just the highest bidder!\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '3':
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Aye, the pirate life! Freedom on the open water!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"No corporate overlords tellin' us what to do.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"We fish where we want, sail where we please.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"It's dangerous, sure. But it's OURS.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Every sunrise on deck is worth the risk!\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '4':
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+
+            # Check if already received gift
+            if game.received_pirate_gift:
+                print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+                print(Fore.WHITE + "\"Ye already got yer share of the booty, matey!\"" + Style.RESET_ALL)
+                time.sleep(1)
+                print(Fore.WHITE + "\"Can't be givin' away all our treasure now, can we?\"" + Style.RESET_ALL)
+                time.sleep(1.5)
+                print(Fore.YELLOW + "\"But yer always welcome aboard the Crimson Tide!\"" + Style.RESET_ALL)
+                time.sleep(1.5)
+            else:
+                # Give reward based on karma
+                if game.karma >= 3:
+                    reward = random.randint(200, 500)
+                    game.money += reward
+                    print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+                    print(Fore.WHITE + "\"Ye've proven yerself a true friend of the rebellion!\"" + Style.RESET_ALL)
+                    time.sleep(1)
+                    print(Fore.YELLOW + f"\"Take this - {reward} gold pieces from our latest raid!\"" + Style.RESET_ALL)
+                    print(Fore.GREEN + f"+${reward} received!" + Style.RESET_ALL)
+                    game.received_pirate_gift = True
+                else:
+                    reward = random.randint(50, 150)
+                    game.money += reward
+                    print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+                    print(Fore.WHITE + "\"Here, have some coin for the road, mate!\"" + Style.RESET_ALL)
+                    print(Fore.GREEN + f"+${reward} received!" + Style.RESET_ALL)
+                    game.received_pirate_gift = True
+
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '5':
+            # New dialogue: About the ocean
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Ye want to know why I'm still here? After all these years?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*He gazes out at the endless sea*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Truth is... I should've died centuries ago.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Lost in a storm off the Arctic coast. Ship went down. Crew too.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"But the ocean... it wasn't finished with me.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Woke up on these waters, ship intact, crew alive again.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Or... somethin' like alive.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Touches his chest*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Don't got a heartbeat no more. Haven't for... longer than I remember.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The ocean keeps us here. Sailin' forever.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Waitin' for somethin'. Someone.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"I think... maybe that someone was you.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Grins*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"The sea don't let go of those it has use for.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Question is... what's it got planned for ye?\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '6':
+            # New dialogue: About the Guardians
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"The Guardians? Aye, I've met most of 'em.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Been sailin' long enough to see things most folk call myth.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The River Guardian? That one's as old as rivers themselves.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Remembers when humans first built settlements near water.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Every scar on its hide is a broken promise. A betrayal.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Sighs*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Nessie though... that one breaks my heart.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"It's not a monster. It's grief. Pure concentrated sorrow.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Lost everything it protected, centuries ago.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Now it just... lashes out. Doesn't know what else to do.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"And the Kraken... nobody understands what it's really doin' down there.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Holdin' somethin' back. Somethin' that wants through.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Leans closer*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Ye spare these guardians, ye're not just showin' mercy.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Ye're healin' wounds older than nations.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The ocean notices. The ocean remembers.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '7':
+            # New dialogue: About AquaTech's true intentions
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"AquaTech... they started with good intentions.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"No lie. They wanted to feed a growin' world.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But somewhere along the way...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Efficiency became more important than ecology.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Profit more valuable than preservation.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Slams fist on the rail*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"They don't see the ocean as alive!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"Just a resource to be managed. Optimized. EXPLOITED.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Their deep-sea drills? Getting closer to the rift.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The one the Kraken guards.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"They don't know what they're about to unleash.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Or maybe... maybe they do, and they don't care.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Voice drops*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"There's rumors of a final weapon. A Megalodon Mech.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Designed to harvest EVERYTHING.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"If they deploy that thing...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"The ocean as we know it... ends.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"That's why we fight. That's why we rebel.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Because someone has to stand against the tide of greed.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '8':
+            # New dialogue: About the prophecy
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Ah, the prophecy. Ye heard about that, have ye?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The elders on Hub Island whisper it to every new Fisher.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Recites from memory*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"'A Fisher will come who will decide the fate of all waters.'\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"'They will either save the seas or doom them forever.'\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Most think it means one person makes one big choice.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But I've sailed long enough to know better.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"It's not one choice. It's every choice.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Every guardian spared or killed.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Every alliance forged or broken.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Every moment ye choose mercy over violence.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Eyes gleam with ancient knowledge*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"The prophecy's already in motion.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"And from what I've seen... ye might actually be the one.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The Fisher who unites the waters instead of conquerin' them.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Voice darkens*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"Or... the one who breaks 'em forever.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Ocean's watchin' ye, friend. Every move ye make.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The waters remember. And they're takin' notes.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '9':
+            # Leave - karma-based farewell
+            game.clear_screen()
+            print(Fore.RED + pirate_art + Style.RESET_ALL)
+            print()
+            print(Fore.RED + "Captain Redbeard:" + Style.RESET_ALL)
+
+            if game.karma >= 50:
+                farewell = npc_lines("pirate.farewell.hero")
+                print(Fore.GREEN + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= 10:
+                farewell = npc_lines("pirate.farewell.friend")
+                print(Fore.CYAN + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= -10:
+                farewell = npc_lines("pirate.farewell.neutral")
+                print(Fore.WHITE + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= -50:
+                farewell = npc_lines("pirate.farewell.wary")
+                print(Fore.YELLOW + random.choice(farewell) + Style.RESET_ALL)
+            else:
+                farewell = npc_lines("pirate.farewell.hostile")
+                print(Fore.RED + random.choice(farewell) + Style.RESET_ALL)
+
+            print()
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+            break
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def interact_with_groundskeeper_mactavish(game):
+    """Talk to Old Groundskeeper MacTavish - unlocked after defeating Loch Ness Monster"""
+
+    # Initialize MacTavish quest data if not exists
+    if not hasattr(game, 'mactavish_daily_quest'):
+        game.mactavish_daily_quest = None
+        game.mactavish_quest_progress = 0
+        game.mactavish_last_quest_date = None
+
+    while True:
+        game.clear_screen()
+
+        mactavish_art = """
+
+            🧓 Old Groundskeeper MacTavish 🧓
+
+                    _____
+                  /       \\
+                 |  o   o  |
+                 |    ^    |     "Och aye!"
+                 |  \\___/  |
+                  \\_______/
+                    | | |
+                  __| | |__
+                 |  \\___/  |
+                /    ⚒️⚒️    \\
+               |  GROUNDSKEEPER |
+                \\____________/
+        """
+
+        print(Fore.GREEN + mactavish_art + Style.RESET_ALL)
+        print()
+
+        # Greeting based on karma
+        if random.random() < 0.3:
+            if game.karma >= 50:
+                greetings = npc_lines("mactavish.greetings.hero")
+                print(Fore.LIGHTGREEN_EX + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= 10:
+                greetings = npc_lines("mactavish.greetings.friend")
+                print(Fore.CYAN + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= -10:
+                greetings = npc_lines("mactavish.greetings.neutral")
+                print(Fore.WHITE + random.choice(greetings) + Style.RESET_ALL)
+            else:
+                greetings = npc_lines("mactavish.greetings.hostile")
+                print(Fore.RED + random.choice(greetings) + Style.RESET_ALL)
+            print()
+
+        print(Fore.YELLOW + "What would ye like to discuss?" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Hear a story about Nessie" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Ask about daily quests" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Browse special bait shop" + Style.RESET_ALL)
+        print(Fore.WHITE + "4. Ask about the loch" + Style.RESET_ALL)
+        print(Fore.WHITE + "5. Leave" + Style.RESET_ALL)
+
+        choice = input(Fore.CYAN + "\nChoice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            hear_mactavish_story(game)
+        elif choice == '2':
+            check_mactavish_daily_quest(game)
+        elif choice == '3':
+            browse_mactavish_shop(game)
+        elif choice == '4':
+            mactavish_loch_info(game)
+        elif choice == '5':
+            break
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def hear_mactavish_story(game):
+    """MacTavish tells a random story about Nessie"""
+    stories = npc_lines("mactavish.stories")
+
+    game.clear_screen()
+    print(Fore.CYAN + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+    print(Fore.CYAN + "║      MACTAVISH'S STORIES              ║" + Style.RESET_ALL)
+    print(Fore.CYAN + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+    print()
+    print(Fore.GREEN + random.choice(stories) + Style.RESET_ALL)
+    print()
+    print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+    get_key()
+
+
+def check_mactavish_daily_quest(game):
+    """Check or assign daily quest from MacTavish"""
+    from datetime import datetime
+
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    # Check if we need a new quest
+    if game.mactavish_last_quest_date != today:
+        # Generate new daily quest
+        quest_types = [
+            {'name': 'Clear Debris', 'desc': 'Catch any 5 fish to clear debris from spots', 'type': 'any', 'target': None, 'count': 5, 'reward': 150, 'xp': 100},
+            {'name': 'Invasive Species', 'desc': 'Catch 3 Northern Pike (invasive species)', 'type': 'specific', 'target': 'Northern Pike', 'count': 3, 'reward': 200, 'xp': 150},
+            {'name': 'Water Quality', 'desc': 'Catch 2 Rare or better fish for testing', 'type': 'rare', 'target': None, 'count': 2, 'reward': 250, 'xp': 200},
+        ]
+
+        quest = random.choice(quest_types)
+        game.mactavish_daily_quest = quest
+        game.mactavish_quest_progress = 0
+        game.mactavish_last_quest_date = today
+        game.track_mactavish_quest()
+
+    # Display quest status
+    game.clear_screen()
+    print(Fore.CYAN + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+    print(Fore.CYAN + "║        DAILY QUEST                    ║" + Style.RESET_ALL)
+    print(Fore.CYAN + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+    print()
+    print(Fore.YELLOW + f"Quest: {game.mactavish_daily_quest['name']}" + Style.RESET_ALL)
+    print(Fore.WHITE + f"{game.mactavish_daily_quest['desc']}" + Style.RESET_ALL)
+    print()
+    print(Fore.GREEN + f"Progress: {game.mactavish_quest_progress}/{game.mactavish_daily_quest['count']}" + Style.RESET_ALL)
+    print(Fore.CYAN + f"Reward: ${game.mactavish_daily_quest['reward']} | {game.mactavish_daily_quest['xp']} XP" + Style.RESET_ALL)
+    print()
+
+    if game.mactavish_quest_progress >= game.mactavish_daily_quest['count']:
+        print(Fore.LIGHTGREEN_EX + "✓ QUEST COMPLETE! Return to MacTavish to claim your reward!" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Claim Reward" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Back" + Style.RESET_ALL)
+
+        choice = input(Fore.CYAN + "\nChoice: " + Style.RESET_ALL)
+        if choice == '1':
+            game.money += game.mactavish_daily_quest['reward']
+            game.xp += game.mactavish_daily_quest['xp']
+            print(Fore.GREEN + f"\n✓ Received ${game.mactavish_daily_quest['reward']} and {game.mactavish_daily_quest['xp']} XP!" + Style.RESET_ALL)
+            print(Fore.YELLOW + "\"Och aye! Good work, laddie! Come back tomorrow fer another task!\"" + Style.RESET_ALL)
+            game.mactavish_daily_quest = None
+            game.track_mactavish_quest()
+            time.sleep(2)
+    else:
+        print(Fore.YELLOW + "Complete this quest by fishing around the loch!" + Style.RESET_ALL)
+        print()
+        print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+        get_key()
+
+
+def browse_mactavish_shop(game):
+    """Browse MacTavish's special bait shop"""
+    special_baits = ITEMS.shop("mactavish")
+
+    while True:
+        game.clear_screen()
+        print(Fore.CYAN + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+        print(Fore.CYAN + "║      MACTAVISH'S BAIT SHOP            ║" + Style.RESET_ALL)
+        print(Fore.CYAN + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+        print()
+        print(Fore.GREEN + f"Your Money: ${game.money}" + Style.RESET_ALL)
+        print()
+
+        for i, bait in enumerate(special_baits, 1):
+            owned_str = "✓ Owned" if bait in game.owned_items else f"${bait.price}"
+            print(Fore.YELLOW + f"{i}. {bait.name} - {owned_str}" + Style.RESET_ALL)
+            print(Fore.WHITE + f"   {bait.description}" + Style.RESET_ALL)
+            print(Fore.LIGHTBLACK_EX + f"   XP Bonus: +{bait.bonus_xp}% | Rarity Bonus: +{bait.bonus_rarity}%" + Style.RESET_ALL)
+            print()
+
+        print(Fore.WHITE + "4. Back" + Style.RESET_ALL)
+
+        choice = input(Fore.CYAN + "\nChoice: " + Style.RESET_ALL)
+
+        if choice == '4':
+            break
+        elif choice in ['1', '2', '3']:
+            bait = special_baits[int(choice) - 1]
+            if bait in game.owned_items:
+                print(Fore.YELLOW + "You already own this bait!" + Style.RESET_ALL)
+                time.sleep(1)
+            elif game.money >= bait.price:
+                confirm = input(Fore.YELLOW + f"Buy {bait.name} for ${bait.price}? (Y/N): " + Style.RESET_ALL).lower()
+                if confirm == 'y':
+                    game.money -= bait.price
+                    game.owned_items.add(bait)
+                    print(Fore.GREEN + f"✓ Purchased {bait.name}!" + Style.RESET_ALL)
+                    print(Fore.YELLOW + "\"Aye! This'll bring ye good fortune on the loch!\"" + Style.RESET_ALL)
+                    time.sleep(2)
+            else:
+                print(Fore.RED + "Not enough money!" + Style.RESET_ALL)
+                time.sleep(1)
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def mactavish_loch_info(game):
+    """MacTavish shares wisdom about the loch"""
+    game.clear_screen()
+    print(Fore.CYAN + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+    print(Fore.CYAN + "║         ABOUT THE LOCH                ║" + Style.RESET_ALL)
+    print(Fore.CYAN + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+    print()
+    print(Fore.GREEN + "\"I've been tendin' these waters fer nigh on forty years...\"" + Style.RESET_ALL)
+    print()
+    print(Fore.WHITE + "The loch is ancient, older than any o' us can imagine." + Style.RESET_ALL)
+    print(Fore.WHITE + "It's home to Nessie, the guardian of these waters." + Style.RESET_ALL)
+    print(Fore.WHITE + "Treat her with respect, and ye'll be blessed with bountiful catches." + Style.RESET_ALL)
+    print()
+    print(Fore.YELLOW + "The best fishing is at dawn and dusk, when the mist rolls in." + Style.RESET_ALL)
+    print(Fore.YELLOW + "And if ye ever see strange ripples... that's Nessie sayin' hello!" + Style.RESET_ALL)
+    print()
+    print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+    get_key()
+
+
+def interact_with_dr_holloway(game):
+    """Talk to Dr. Marina Holloway - unlocked after defeating Cthulhu"""
+
+    while True:
+        game.clear_screen()
+
+        holloway_art = """
+
+            🔬 Dr. Marina Holloway 🔬
+
+                    _____
+                  /       \\
+                 |  *   *  |
+                 |    -    |     "Fascinating..."
+                 |  \___/  |
+                  \\_______/
+                    | | |
+                  __| | |__
+                 |  \\___/  |
+                /    🔬🐠    \\
+               | DEEP SEA   |
+               | RESEARCHER |
+                \\___________/
+        """
+
+        print(Fore.CYAN + holloway_art + Style.RESET_ALL)
+        print()
+
+        # Intro message on first encounter
+        if not hasattr(game, 'met_holloway'):
+            game.met_holloway = True
+            print(Fore.LIGHTBLACK_EX + "*Inside a reinforced bathysphere, dim blue lights illuminate strange equipment*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*A woman in a diving suit turns as you approach*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Her eyes are... different. They've seen too much deep*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.CYAN + "Dr. Holloway:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Oh! A visitor. Rare, down here.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Welcome to my research station.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Gestures at tanks full of bioluminescent creatures*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"I study the impossible. The things that shouldn't exist.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But do anyway.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        # Menu
+        print(Fore.YELLOW + "What would you like to discuss?" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Ask about her research" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Ask about AquaTech" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Ask about the Kraken" + Style.RESET_ALL)
+        print(Fore.LIGHTBLACK_EX + "4. Leave" + Style.RESET_ALL)
+        print()
+
+        choice = input(Fore.CYAN + "Your choice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            # About research
+            game.clear_screen()
+            print(Fore.CYAN + holloway_art + Style.RESET_ALL)
+            print()
+            print(Fore.CYAN + "Dr. Holloway:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"My research? It's... complicated.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Officially, I'm cataloging deep-sea biodiversity.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Unofficially...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Pulls out a journal filled with incomprehensible notes*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"I'm documenting proof that consciousness isn't unique to humans.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"These fish... they respond to our thoughts.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Not telepathy. Nothing so simple.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"But when I feel fear, certain species patterns change.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"When I experience joy, different species become active.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The ocean is... aware. Thinking. Feeling.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Just not in any way our science can currently measure.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Laughs bitterly*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"I can't publish this. They'd call me mad.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But I know what I've seen. What I've felt.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '2':
+            # About AquaTech
+            game.clear_screen()
+            print(Fore.CYAN + holloway_art + Style.RESET_ALL)
+            print()
+            print(Fore.CYAN + "Dr. Holloway:" + Style.RESET_ALL)
+            print(Fore.LIGHTBLACK_EX + "*Voice drops to whisper*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"AquaTech funds my research. They don't know what I've really discovered.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Their deep-sea drilling operations...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Pulls up sonar data*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"They're approaching something. Something that's aware of them.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The drilling has awakened... I don't know what to call it.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"An intelligence? A presence? Something ancient?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"It's responding. Communicating. Getting... angry.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Shows readings that make no sense*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"These patterns shouldn't be possible. They violate physics.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"But they're real. And they're getting stronger.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"I've tried warning AquaTech. They think it's equipment malfunction.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"They're going to keep drilling until...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Trails off, staring at the dark water beyond the viewport*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"Until something breaks through.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '3':
+            # About the Kraken
+            game.clear_screen()
+            print(Fore.CYAN + holloway_art + Style.RESET_ALL)
+            print()
+            print(Fore.CYAN + "Dr. Holloway:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"The Kraken? You've seen it?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Intense focus*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"Tell me everything.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*After you describe your encounter*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"I knew it! I KNEW there was a guardian!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Frantically takes notes*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The rift it's guarding... I've detected it on my instruments.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"It's not geological. It's dimensional.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"A thin spot in reality where... something else... presses through.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"The Kraken isn't just a guardian of the ocean.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"It's a guardian of THIS reality.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"If it fails... if AquaTech's drilling weakens it...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Meets your eyes*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"We won't just lose the ocean.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.RED + "\"We'll lose... everything.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '4':
+            # Leave
+            game.clear_screen()
+            print(Fore.CYAN + holloway_art + Style.RESET_ALL)
+            print()
+            print(Fore.CYAN + "Dr. Holloway:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Stay safe down here. The deep doesn't forgive mistakes.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"And... thank you for listening. It's been so long since I could talk to someone.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+            break
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def interact_with_prometheus(game):
+    """Talk to Prometheus the Fire Monk - unlocked after defeating Ifrit"""
+
+    while True:
+        game.clear_screen()
+
+        prometheus_art = """
+
+            🔥 Prometheus - The Fire Monk 🔥
+
+                    _____
+                  /       \\
+                 |  ō   ō  |
+                 |    △    |     "Balance..."
+                 | \_____/  |
+                  \\_______/
+                    |🔥🔥🔥|
+                  __| | | |__
+                 |  \\___/  |
+                /  FIRE &   \\
+               | WATER SAGE |
+                \\___________/
+
+            [A robed figure meditates by the molten shore]
+        """
+
+        print(Fore.LIGHTRED_EX + prometheus_art + Style.RESET_ALL)
+        print()
+
+        # Intro message on first encounter
+        if not hasattr(game, 'met_prometheus'):
+            game.met_prometheus = True
+            print(Fore.LIGHTBLACK_EX + "*Near the volcanic shore, a figure sits in perfect stillness*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Robed in heat-resistant fabric, their face shadowed by a deep hood*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Volcanic glass prayer beads click softly in the superheated air*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.LIGHTRED_EX + "Prometheus:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"...A seeker approaches.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*The monk's eyes open - reflecting firelight that isn't there*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"You freed the Flamebringer. The volcano thanks you.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"And so do I. This lake has known true peace for the first time in millennia.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"I am Prometheus. I study the impossible union...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"Fire and water. Transformation and flow.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Here, where they meet, I meditate on the nature of all things.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        # Menu
+        print(Fore.YELLOW + "What wisdom do you seek?" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Learn about fire fishing" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Ask about the balance of fire and water" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Ask about fishing and life" + Style.RESET_ALL)
+        print(Fore.CYAN + "4. Browse heat-resistant gear" + Style.RESET_ALL)
+        print(Fore.CYAN + "5. Browse volcanic bait" + Style.RESET_ALL)
+        print(Fore.LIGHTBLACK_EX + "6. Meditate and leave" + Style.RESET_ALL)
+        print()
+
+        choice = input(Fore.LIGHTYELLOW_EX + "Your choice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            # Learn about fire fishing
+            game.clear_screen()
+            print(Fore.LIGHTRED_EX + prometheus_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTRED_EX + "Prometheus:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Fire fishing. The ancient art of transformation.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Gestures to the molten lake*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Most see only danger here. Lava that burns. Heat that kills.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But the wise fisher sees opportunity.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"The fish here are not like others. They have adapted.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Their scales are volcanic glass. Their blood runs molten.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"To catch them, you must understand extremes.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Use bait that can survive the heat. Gear that won't melt.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Pulls a glowing fish from the lava with bare hands*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"And most importantly... respect the transformation.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"These waters remember when they were pure magma.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"The fish here are children of that ancient fire.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Fish here with patience. With reverence.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"And the volcanic waters will reward you beyond measure.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '2':
+            # About balance
+            game.clear_screen()
+            print(Fore.LIGHTRED_EX + prometheus_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTRED_EX + "Prometheus:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Fire and water. They seem opposite, yes?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Holds one hand in the lava, the other in a pool of water*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Fire destroys. Water preserves.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Fire transforms. Water shapes.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"But look closer. What is steam?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "*Steam rises around the monk*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"It is both. Neither. The space between.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"This lake exists in that space.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"Hot enough to melt stone, yet still... water.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Life thrives here because it learned the secret:\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"True strength comes not from being one thing or another...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"But from harmonizing seeming opposites.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*The monk smiles serenely*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The Flamebringer understood this. That's why he could be freed.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"He wasn't fire OR the lake. He was the binding between them.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"And when you released him, you restored balance.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '3':
+            # About fishing and life
+            game.clear_screen()
+            print(Fore.LIGHTRED_EX + prometheus_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTRED_EX + "Prometheus:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"You seek wisdom about fishing? Let me tell you a truth.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Casts a line into the lava with impossible calm*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Fishing is not about catching fish.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"It's about understanding the relationship between fisher and water.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"When you cast your line, you're not asserting dominance.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"You're offering partnership. Asking permission.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"The water decides if you are worthy.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Pulls up a magnificent lava carp*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"See? The lake trusts me. Not because I'm strong.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But because I respect it.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"In life, as in fishing, the secret is this:\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"Do not try to control what you cannot control.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Instead, learn to flow with it.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"The fish come when they're ready. The lake gives when it chooses.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"Your only job is to be present. Patient. Respectful.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTRED_EX + "\"That is the way of the true Fisher.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"And that is the way of a meaningful life.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '4':
+            # Browse heat-resistant gear (combat items shop)
+            prometheus_shop_heat_gear(game)
+
+        elif choice == '5':
+            # Browse volcanic bait
+            prometheus_shop_volcanic_bait(game)
+
+        elif choice == '6':
+            # Leave
+            game.clear_screen()
+            print(Fore.LIGHTRED_EX + prometheus_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTRED_EX + "Prometheus:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Go in balance, seeker.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.YELLOW + "\"Remember: Fire transforms, water shapes.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTYELLOW_EX + "\"Be both. Be neither. Be the harmony between.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*The monk closes their eyes and returns to meditation*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+            break
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def prometheus_shop_heat_gear(game):
+    """Prometheus's shop for heat-resistant combat items"""
+    game.clear_screen()
+    print(Fore.LIGHTRED_EX + "═══ 🔥 HEAT-RESISTANT GEAR 🔥 ═══" + Style.RESET_ALL)
+    print(Fore.GREEN + f"💰 Money: ${game.money}" + Style.RESET_ALL)
+    print()
+    print(Fore.YELLOW + "Prometheus: \"Gear forged in volcanic fire. Essential for these waters.\"" + Style.RESET_ALL)
+    print()
+
+    gear = [item for item in ITEMS.shop("prometheus") if item.category != "bait"]
+
+    for i, item in enumerate(gear, 1):
+        owned = item in game.owned_items
+        equipped = "⭐ EQUIPPED" if item == game.equipped_combat_items[item.category] else ""
+
+        owned_str = "✓ Owned" if owned else f"${item.price}"
+        locked = "" if game.level >= item.unlock_level else f"🔒 Lvl{item.unlock_level}"
+        print(f"{i}. {item.name} - {owned_str} {locked} {equipped}")
+        print(f"   {item.description}")
+
+    print()
+    choice = input(Fore.CYAN + "Buy item (number) or 0 to cancel: " + Style.RESET_ALL)
+
+    try:
+        idx = int(choice) - 1
+        if 0 <= idx < len(gear):
+            item = gear[idx]
+
+            if game.level < item.unlock_level:
+                print(Fore.RED + f"Requires level {item.unlock_level}!" + Style.RESET_ALL)
+                time.sleep(1)
+            elif item in game.owned_items:
+                print(Fore.YELLOW + "You already own this item!" + Style.RESET_ALL)
+                time.sleep(1)
+            elif game.money >= item.price:
+                game.money -= item.price
+                game.owned_items.add(item)
+                print(Fore.GREEN + f"Bought {item.name} for ${item.price}!" + Style.RESET_ALL)
+                print(Fore.YELLOW + "Prometheus: \"May it serve you well in battle.\"" + Style.RESET_ALL)
+                time.sleep(2)
+            else:
+                print(Fore.RED + "Not enough money!" + Style.RESET_ALL)
+                time.sleep(1)
+    except ValueError:
+        pass
+
+
+def prometheus_shop_volcanic_bait(game):
+    """Prometheus's shop for volcanic bait"""
+    game.clear_screen()
+    print(Fore.LIGHTRED_EX + "═══ 🔥 VOLCANIC BAIT 🔥 ═══" + Style.RESET_ALL)
+    print(Fore.GREEN + f"💰 Money: ${game.money}" + Style.RESET_ALL)
+    print()
+    print(Fore.YELLOW + "Prometheus: \"Bait that survives the heat. Attracts the rarest volcanic fish.\"" + Style.RESET_ALL)
+    print()
+
+    volcanic_baits = ITEMS.shop("prometheus", "bait")
+
+    for i, bait in enumerate(volcanic_baits, 1):
+        owned = bait in game.owned_items
+        owned_str = "✓ Owned" if owned else f"${bait.price}"
+        equipped = "⭐ EQUIPPED" if game.current_bait == bait else ""
+        print(f"{i}. {bait.name} - {owned_str} {equipped}")
+        print(f"   {bait.description}")
+
+    print()
+    choice = input(Fore.CYAN + "Buy bait (number) or 0 to cancel: " + Style.RESET_ALL)
+
+    try:
+        idx = int(choice) - 1
+        if 0 <= idx < len(volcanic_baits):
+            bait = volcanic_baits[idx]
+            if bait in game.owned_items:
+                print(Fore.YELLOW + "You already own this bait!" + Style.RESET_ALL)
+                time.sleep(1)
+            elif game.money >= bait.price:
+                game.money -= bait.price
+                game.owned_items.add(bait)
+                print(Fore.GREEN + f"Bought {bait.name} for ${bait.price}!" + Style.RESET_ALL)
+                print(Fore.YELLOW + "Prometheus: \"Fish with reverence, and the lake will provide.\"" + Style.RESET_ALL)
+                time.sleep(2)
+            else:
+                print(Fore.RED + "Not enough money!" + Style.RESET_ALL)
+                time.sleep(1)
+    except ValueError:
+        pass
+
+
+def interact_with_gro(game):
+    """Talk to Gro the Ice Fisher - Arctic Waters NPC"""
+
+    while True:
+        game.clear_screen()
+
+        gro_art = """
+
+            🧊 Gro the Ice Fisher 🧊
+
+                   _____
+                 /       \\
+                | □   □  |
+                |    >    |     
+                | \\_____/  |
+                 \\_______/
+                   |     |
+                 __| | | |__
+                |  \\___/  |
+               /  ICE      \\
+              |   FISHER    |
+               \\___________/
+
+           [A hardy woman sits on an ice block, 
+            a massive polar bear snoozing beside her]
+        """
+
+        print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+        print()
+
+        # Intro message on first encounter
+        if not hasattr(game, 'met_gro'):
+            game.met_gro = True
+            game.gro_fish_gifts = 0  # Track how many times polar bear has given fish
+            print(Fore.LIGHTBLACK_EX + "*A stout figure sits on the frozen lake, drilling through thick ice*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Beside her, an enormous polar bear yawns and stretches*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*The woman looks up and grins, weathered face crinkling with warmth*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Hah! Another fisher dares the ice! Welcome, welcome!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"I am Gro Bjornsdottir. Been fishing these waters forty winters now!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLUE_EX + "*The polar bear huffs and waddles over, sniffing you curiously*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Don't mind Björn - he's friendlier than he looks!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"We've survived ice storms, wyrm attacks, and forty years of winter!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTCYAN_EX + "\"The old ways, the old gods - they keep us strong up here.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        # Random chance for polar bear to bring fish (10% chance per interaction)
+        if random.random() < 0.10 and not hasattr(game, '_bear_gift_this_visit'):
+            game._bear_gift_this_visit = True
+            print()
+            print(Fore.LIGHTBLUE_EX + "*Björn waddles over and drops a frozen fish at your feet!*" + Style.RESET_ALL)
+            time.sleep(1)
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Hah! He likes you! That's his way of saying 'friend'!\"" + Style.RESET_ALL)
+            time.sleep(1)
+
+            # Generate a random arctic fish as gift
+            arctic_fish_pool = [f for f in fish_table("arctic") if f.rarity in ["Common", "Uncommon", "Rare"]]
+            if arctic_fish_pool:
+                gift_fish = random.choice(arctic_fish_pool)
+                generated_fish = Fish(
+                    gift_fish.name,
+                    gift_fish.min_weight,
+                    gift_fish.max_weight,
+                    gift_fish.rarity,
+                    gift_fish.chance,
+                    gift_fish.price,
+                    gift_fish.description,
+                    gift_fish.unlock_level
+                )
+                generated_fish.weight = random.uniform(gift_fish.min_weight, gift_fish.max_weight)
+                game.inventory.append(generated_fish)
+                game.update_encyclopedia(generated_fish)
+                game.gro_fish_gifts += 1
+                print(Fore.GREEN + f"✓ Björn gifted you a {generated_fish.get_display_name()} ({generated_fish.weight:.2f} lbs)!" + Style.RESET_ALL)
+                time.sleep(2)
+            print()
+        else:
+            # Reset flag for next visit
+            if hasattr(game, '_bear_gift_this_visit'):
+                delattr(game, '_bear_gift_this_visit')
+
+        # Menu
+        print(Fore.LIGHTCYAN_EX + "\"What brings you to my ice hole?\"" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Learn about ice fishing" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Hear stories of the old gods" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Ask about survival in the Arctic" + Style.RESET_ALL)
+        print(Fore.WHITE + "4. Ask about ancient catches" + Style.RESET_ALL)
+        print(Fore.CYAN + "5. Browse cold-weather gear" + Style.RESET_ALL)
+        print(Fore.CYAN + "6. Browse ice drills and tools" + Style.RESET_ALL)
+        print(Fore.WHITE + "7. Pet Björn the polar bear" + Style.RESET_ALL)
+        print(Fore.LIGHTBLACK_EX + "8. Leave" + Style.RESET_ALL)
+        print()
+
+        choice = input(Fore.LIGHTCYAN_EX + "Your choice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            # Learn about ice fishing
+            game.clear_screen()
+            print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Ice fishing! The truest test of patience and endurance!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "*Gestures to her ice drill and frozen hole*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"First - you need a good drill. Ice here is thick as castle walls!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Takes strength and time to breach. But the wyrm guards its waters well.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTCYAN_EX + "\"Second - you need WARMTH. Frostbite takes fingers before you notice!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Good furs. Good boots. Respect for the cold.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.CYAN + "\"Third - you need PATIENCE. Fish move slow under ice.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLUE_EX + "*Pulls up a massive frozen fish*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"But when they bite... worth every frozen moment!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTCYAN_EX + "\"And remember - the ice speaks. Listen to it. It warns before it breaks.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '2':
+            # Stories of old gods
+            game.clear_screen()
+            print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+            print()
+
+            stories = npc_lines("gro.stories")
+
+            story = random.choice(stories)
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.CYAN + story["title"] + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            for line in story["lines"]:
+                print(Fore.WHITE + line + Style.RESET_ALL)
+                time.sleep(1.5)
+            print()
+            time.sleep(1)
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '3':
+            # Survival tips
+            game.clear_screen()
+            print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Forty winters I've survived! Let me share what I've learned!\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+
+            tips = npc_lines("gro.tips")
+
+            selected_tips = random.sample(tips, 5)
+            for tip in selected_tips:
+                print(Fore.CYAN + tip + Style.RESET_ALL)
+                time.sleep(1.5)
+
+            print()
+            print(Fore.WHITE + "\"Remember these and you might last forty winters too!\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '4':
+            # Ancient catches
+            game.clear_screen()
+            print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Ancient catches! Oh, the things I've pulled from this ice...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+
+            tales = npc_lines("gro.tales")
+
+            tale = random.choice(tales)
+            print(Fore.LIGHTBLUE_EX + f"📖 The {tale['catch']}" + Style.RESET_ALL)
+            time.sleep(1)
+            print()
+            print(Fore.WHITE + tale["story"] + Style.RESET_ALL)
+            time.sleep(3)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '5':
+            # Browse gear
+            gro_shop_gear(game)
+
+        elif choice == '6':
+            # Browse tools/bait
+            gro_shop_tools(game)
+
+        elif choice == '7':
+            # Pet the bear
+            game.clear_screen()
+            print(Fore.LIGHTCYAN_EX + gro_art + Style.RESET_ALL)
+            print()
+            print(Fore.LIGHTBLUE_EX + "*You carefully approach the massive polar bear*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTBLUE_EX + "*Björn opens one eye and huffs*" + Style.RESET_ALL)
+            time.sleep(1.5)
+
+            bear_reactions = npc_lines("gro.bear_reactions")
+
+            reaction = random.choice(bear_reactions)
+            print(Fore.WHITE + reaction["action"] + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            print(Fore.WHITE + reaction["gro"] + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.GREEN + f"✓ Björn's approval grants you {reaction['bonus']} temporarily!" + Style.RESET_ALL)
+
+            # Small temporary luck boost (could implement this with a timer/flag if desired)
+            game.current_bait.rarity_boost += int(reaction["bonus"].split("+")[1])
+            time.sleep(2)
+            print()
+            input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
+
+        elif choice == '8':
+            # Leave
+            print(Fore.LIGHTCYAN_EX + "Gro:" + Style.RESET_ALL)
+            farewell = random.choice(npc_lines("gro.farewell"))
+            print(Fore.WHITE + farewell + Style.RESET_ALL)
+            time.sleep(1.5)
+            break
+        else:
+            print(Fore.RED + "Invalid choice!" + Style.RESET_ALL)
+            time.sleep(1)
+
+
+def gro_shop_gear(game):
+    """Gro's shop for cold-weather combat items"""
+    while True:
+        game.clear_screen()
+        print(Fore.LIGHTCYAN_EX + "=== GRO'S COLD-WEATHER GEAR ===" + Style.RESET_ALL)
+        print()
+        print(Fore.CYAN + "Gro: \"Gear that's kept me alive forty winters! Won't let you down!\"" + Style.RESET_ALL)
+        print()
+
+        # Filter for cold/defense items
+        cold_items = [item for item in ITEMS.shop("combat_shop", "defense") + ITEMS.shop("combat_shop", "hp")
+                      if item.unlock_level <= game.level]
+
+        for i, item in enumerate(cold_items, 1):
+            owned = "✓ OWNED" if item in game.owned_items else ""
+            print(Fore.WHITE + f"{i}. {item.name} - ${item.price} {owned}" + Style.RESET_ALL)
+            print(Fore.LIGHTBLACK_EX + f"   {item.description}" + Style.RESET_ALL)
+            print()
+
+        print(Fore.LIGHTBLACK_EX + f"0. Leave shop (Money: ${game.money})" + Style.RESET_ALL)
+        print()
+
+        try:
+            choice = int(input(Fore.LIGHTCYAN_EX + "Buy which item? " + Style.RESET_ALL))
+            if choice == 0:
+                break
+            elif 1 <= choice <= len(cold_items):
+                item = cold_items[choice - 1]
+                if item in game.owned_items:
+                    print(Fore.YELLOW + "You already own this item!" + Style.RESET_ALL)
+                    time.sleep(1)
+                elif game.money >= item.price:
+                    game.money -= item.price
+                    game.owned_items.add(item)
+                    print(Fore.GREEN + f"Bought {item.name} for ${item.price}!" + Style.RESET_ALL)
+                    print(Fore.CYAN + "Gro: \"Good choice! That'll keep you alive out there!\"" + Style.RESET_ALL)
+                    time.sleep(2)
+                else:
+                    print(Fore.RED + "Not enough money!" + Style.RESET_ALL)
+                    time.sleep(1)
+        except ValueError:
+            pass
+
+
+def gro_shop_tools(game):
+    """Gro's shop for arctic-specific bait and tools"""
+    while True:
+        game.clear_screen()
+        print(Fore.LIGHTCYAN_EX + "=== GRO'S ICE DRILLS & ARCTIC BAIT ===" + Style.RESET_ALL)
+        print()
+        print(Fore.CYAN + "Gro: \"Special bait for special waters! And tools that won't fail you!\"" + Style.RESET_ALL)
+        print()
+
+        # Show arctic/high-level bait
+        arctic_baits = [bait for bait in ITEMS.shop("bait_shop") if 20 <= bait.unlock_level <= game.level]
+
+        for i, bait in enumerate(arctic_baits, 1):
+            owned = "✓ OWNED" if bait in game.owned_items else ""
+            print(Fore.WHITE + f"{i}. {bait.name} - ${bait.price} {owned}" + Style.RESET_ALL)
+            print(Fore.LIGHTBLACK_EX + f"   {bait.description}" + Style.RESET_ALL)
+            print()
+
+        print(Fore.LIGHTBLACK_EX + f"0. Leave shop (Money: ${game.money})" + Style.RESET_ALL)
+        print()
+
+        try:
+            choice = int(input(Fore.LIGHTCYAN_EX + "Buy which item? " + Style.RESET_ALL))
+            if choice == 0:
+                break
+            elif 1 <= choice <= len(arctic_baits):
+                bait = arctic_baits[choice - 1]
+                if bait in game.owned_items:
+                    print(Fore.YELLOW + "You already own this bait!" + Style.RESET_ALL)
+                    time.sleep(1)
+                elif game.money >= bait.price:
+                    game.money -= bait.price
+                    game.owned_items.add(bait)
+                    print(Fore.GREEN + f"Bought {bait.name} for ${bait.price}!" + Style.RESET_ALL)
+                    print(Fore.CYAN + "Gro: \"That'll bring in the big ones! Fish with courage!\"" + Style.RESET_ALL)
+                    time.sleep(2)
+                else:
+                    print(Fore.RED + "Not enough money!" + Style.RESET_ALL)
+                    time.sleep(1)
+        except ValueError:
+            pass
+
+
+def interact_with_npc_fisherman(game):
+    """Talk to the NPC fisherman and get a random fact"""
+    while True:  # Keep dialog open until player chooses to leave
+        game.clear_screen()
+
+        # Display ASCII art of fisherman
+        fisherman_art = """
+
+            🎣 Old Fisherman by the Lake 🎣
+
+               ,@@@@@@@,
+         ,,,.   ,@@@@@@/@@,  .oo8888o.
+      ,&%%&%&&%,@@@@@/@@@@@@,8888\\88/8o
+     ,%&\\%&&%&&%,@@@\\@@@/@@@88\\88888/88'
+     %&&%&%&/%&&%@@\\@@/ /@@@88888\\88888'
+     %&&%/ %&%%&&@@\\ V /@@' `88\\8 `/88'
+     `&%\\ ` /%&'    |.|        \\ '|8'
+         |o|        | |         | |
+         |.|        | |         | |
+      \\/ ._\\//_/__/  ,\\_//__\\/.  \\_//__/_
+        """
+
+        print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+        print()
+
+        # Karma-based greeting
+        if random.random() < 0.3:
+            if game.karma >= 50:
+                greetings = npc_lines("fisherman.greetings.hero")
+                print(Fore.GREEN + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= 10:
+                greetings = npc_lines("fisherman.greetings.friend")
+                print(Fore.CYAN + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= -10:
+                greetings = npc_lines("fisherman.greetings.neutral")
+                print(Fore.WHITE + random.choice(greetings) + Style.RESET_ALL)
+            elif game.karma >= -50:
+                greetings = npc_lines("fisherman.greetings.wary")
+                print(Fore.YELLOW + random.choice(greetings) + Style.RESET_ALL)
+            else:
+                greetings = npc_lines("fisherman.greetings.hostile")
+                print(Fore.RED + random.choice(greetings) + Style.RESET_ALL)
+            print()
+
+        # Dialog menu
+        print(Fore.YELLOW + "What would you like to talk about?" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "1. Ask for fishing wisdom" + Style.RESET_ALL)
+        print(Fore.WHITE + "2. Ask about the lake" + Style.RESET_ALL)
+        print(Fore.WHITE + "3. Ask about the dangerous creatures" + Style.RESET_ALL)
+        print(Fore.WHITE + "4. Ask about recent troubles" + Style.RESET_ALL)
+        print(Fore.LIGHTBLACK_EX + "5. Leave" + Style.RESET_ALL)
+        print()
+
+        choice = input(Fore.CYAN + "Your choice: " + Style.RESET_ALL)
+
+        if choice == '1':
+            # Random fishing fact/wisdom
+            game.clear_screen()
+            print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+            print()
+            fact = get_random_fact()
+            print(Fore.GREEN + "Old Fisherman:" + Style.RESET_ALL)
+            print(Fore.WHITE + f"\"Did you know? {fact}\"" + Style.RESET_ALL)
+            print()
+            time.sleep(2)
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '2':
+            # Talk about the lake
+            game.clear_screen()
+            print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+            print()
+            print(Fore.GREEN + "Old Fisherman:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"This lake... I've fished here for nigh on fifty years.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"My father fished here, and his father before him.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"The waters run deep, deeper than most folk realize.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"There's old magic here. Ancient things that keep the balance.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '3':
+            # Talk about the guardians/protectors
+            game.clear_screen()
+            print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+            print()
+            print(Fore.GREEN + "Old Fisherman:" + Style.RESET_ALL)
+            print(Fore.WHITE + "\"Ah, you've encountered them, have you?\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"Those great beasts... most call them monsters, threats to be eliminated.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.YELLOW + "\"But they're not monsters at all. They're guardians.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"Each one watches over its domain, keeping the natural order.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"The great serpent in this lake, for instance...\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print(Fore.WHITE + "\"She's been here longer than human memory. Protects the waters from corruption.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.CYAN + "\"But lately... they've been different. Aggressive. Desperate, even.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.CYAN + "\"Something's got them riled up fierce.\"" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '4':
+            # Talk about the corporation
+            game.clear_screen()
+            print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+            print()
+            print(Fore.GREEN + "Old Fisherman:" + Style.RESET_ALL)
+            time.sleep(0.5)
+            print(Fore.WHITE + "*The old man's expression darkens*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.RED + "\"AquaTech Industries.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"Big corporation out of the city. Been sending suits around here for months.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"Want to buy up the lake. 'Development opportunities,' they call it.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.YELLOW + "\"Luxury resorts. Industrial fishing operations. 'Eco-tourism.'\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"Bah! They don't care about this place. Just want to drain it dry.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.CYAN + "\"The guardians know. They can sense it.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.CYAN + "\"That's why they've been so aggressive lately - they're trying to protect their homes.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"AquaTech's been sending 'specialists' to deal with the 'problem wildlife.'\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.WHITE + "\"But those creatures... they're not the problem. Never were.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTYELLOW_EX + "*He sighs heavily*" + Style.RESET_ALL)
+            time.sleep(1.5)
+            print()
+            print(Fore.GREEN + "\"I've been refusing to sell my fishing rights, but I'm just one old man.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print(Fore.GREEN + "\"If they get the lake... everything changes. Forever.\"" + Style.RESET_ALL)
+            time.sleep(2)
+            print()
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+
+        elif choice == '5':
+            # Leave - karma-based farewell
+            game.clear_screen()
+            print(Fore.CYAN + fisherman_art + Style.RESET_ALL)
+            print()
+            print(Fore.GREEN + "Old Fisherman:" + Style.RESET_ALL)
+
+            if game.karma >= 50:
+                farewell = npc_lines("fisherman.farewell.hero")
+                print(Fore.GREEN + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= 10:
+                farewell = npc_lines("fisherman.farewell.friend")
+                print(Fore.CYAN + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= -10:
+                farewell = npc_lines("fisherman.farewell.neutral")
+                print(Fore.WHITE + random.choice(farewell) + Style.RESET_ALL)
+            elif game.karma >= -50:
+                farewell = npc_lines("fisherman.farewell.wary")
+                print(Fore.YELLOW + random.choice(farewell) + Style.RESET_ALL)
+            else:
+                farewell = npc_lines("fisherman.farewell.hostile")
+                print(Fore.RED + random.choice(farewell) + Style.RESET_ALL)
+
+            print()
+            time.sleep(1.5)
+            print(Fore.LIGHTBLACK_EX + "Press any key to continue..." + Style.RESET_ALL)
+            get_key()
+            break
+        else:
+            # Invalid choice - loop again
+            continue
+
+
+def talk_to_pub_npc(game, npc_type):
+    """Talk to a specific pub NPC"""
+    game.clear_screen()
+
+    if npc_type == 'marina':
+        # Marina - Bartender
+        print(Fore.LIGHTYELLOW_EX + "Marina - The Bartender" + Style.RESET_ALL)
+        print()
+        print(Fore.YELLOW + "*A weathered woman with kind eyes wipes down the bar*" + Style.RESET_ALL)
+        time.sleep(1)
+
+        greetings = npc_lines("marina.greetings")
+        print(Fore.WHITE + random.choice(greetings) + Style.RESET_ALL)
+        time.sleep(1.5)
+        print()
+
+        if game.karma >= 50:
+            print(Fore.GREEN + "\"The guardians speak highly of you. Drink's on the house.\"" + Style.RESET_ALL)
+        elif game.karma >= 10:
+            print(Fore.CYAN + "\"I've heard good things about your work with the guardians.\"" + Style.RESET_ALL)
+        elif game.karma <= -50:
+            print(Fore.RED + "\"The waters remember what you've done. Every drop remembers.\"" + Style.RESET_ALL)
+        else:
+            print(Fore.WHITE + "\"Be careful out there. The deep holds more secrets than fish.\"" + Style.RESET_ALL)
+
+    elif npc_type == 'sailor':
+        # Old Salt - Sailor
+        print(Fore.LIGHTCYAN_EX + "Old Salt - The Sailor" + Style.RESET_ALL)
+        print()
+        print(Fore.LIGHTBLACK_EX + "*An ancient sailor nursing a mug, eyes distant*" + Style.RESET_ALL)
+        time.sleep(1)
+
+        sailor_tales = npc_lines("sailor.tales")
+
+        tale = random.choice(sailor_tales)
+        print(Fore.CYAN + tale[0] + Style.RESET_ALL)
+        time.sleep(2)
+        print(Fore.WHITE + tale[1] + Style.RESET_ALL)
+
+    elif npc_type == 'widow':
+        # Elara - Fisher's Widow
+        print(Fore.LIGHTBLUE_EX + "Elara - Fisher's Widow" + Style.RESET_ALL)
+        print()
+        print(Fore.LIGHTBLACK_EX + "*A quiet woman stares into her drink*" + Style.RESET_ALL)
+        time.sleep(1)
+
+        widow_lines = npc_lines("widow.lines")
+
+        lines = random.choice(widow_lines)
+        for line in lines:
+            print(Fore.WHITE + line + Style.RESET_ALL)
+            time.sleep(1.5)
+
+    time.sleep(2)
+    print()
+    input(Fore.LIGHTBLACK_EX + "Press Enter to continue..." + Style.RESET_ALL)
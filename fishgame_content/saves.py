@@ -0,0 +1,734 @@
+# The SQLite save store and the trading desk built on it - imported when the
+# game runs with --saves sqlite (or FISHGAME_SAVES=sqlite)
+#
+# Every player is kept in one SQLite database. Fish, encyclopedia entries,
+# owned and equipped items, boss items, quests and NPC flags are rows in tables
+# of their own. A save writes only what changed since the game was loaded or
+# last saved, and a load leaves the inventory, aquarium and encyclopedia on
+# disk until something uses them.
+import json
+import os
+import threading
+import time
+from colorama import Fore, Style
+
+from fishgame import GAME_VERSION, SAVE_DATABASE, Fish, SaveStore
+
+
+SAVE_DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, updated REAL NOT NULL,
+    version TEXT, strength INTEGER, luck INTEGER, patience INTEGER,
+    difficulty_name TEXT, difficulty_mult REAL, level INTEGER, xp INTEGER, xp_threshold INTEGER,
+    money INTEGER, skill_points INTEGER, karma INTEGER, current_rod TEXT, current_bait TEXT,
+    rod_durability INTEGER, rod_max_durability INTEGER, current_location TEXT, current_weather TEXT,
+    max_hp INTEGER, current_hp INTEGER, playtime_seconds REAL);
+CREATE INDEX IF NOT EXISTS players_by_updated ON players (updated DESC);
+CREATE TABLE IF NOT EXISTS fish (
+    fish_id INTEGER PRIMARY KEY AUTOINCREMENT, player_id INTEGER NOT NULL, place TEXT NOT NULL,
+    name TEXT, min_weight REAL, max_weight REAL, rarity TEXT, rarity_weight REAL, xp_reward INTEGER,
+    real_world_info TEXT, sell_price INTEGER, weight REAL, mutation TEXT, catch_time TEXT);
+CREATE INDEX IF NOT EXISTS fish_by_player ON fish (player_id, place);
+CREATE TABLE IF NOT EXISTS encyclopedia (
+    player_id INTEGER NOT NULL, species TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (player_id, species)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS owned_items (
+    player_id INTEGER NOT NULL, item_id TEXT NOT NULL, PRIMARY KEY (player_id, item_id)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS combat_items (
+    player_id INTEGER NOT NULL, category TEXT NOT NULL, item_id TEXT,
+    PRIMARY KEY (player_id, category)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS boss_items (
+    player_id INTEGER NOT NULL, position INTEGER NOT NULL, item_id TEXT NOT NULL,
+    PRIMARY KEY (player_id, position)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS defeated_bosses (
+    player_id INTEGER NOT NULL, position INTEGER NOT NULL, boss TEXT NOT NULL,
+    PRIMARY KEY (player_id, position)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS quests (
+    player_id INTEGER NOT NULL, position INTEGER NOT NULL, state TEXT NOT NULL, title TEXT, description TEXT,
+    PRIMARY KEY (player_id, position)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS npc_flags (
+    player_id INTEGER NOT NULL, flag TEXT NOT NULL, value TEXT,
+    PRIMARY KEY (player_id, flag)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trades (
+    trade_id TEXT PRIMARY KEY, from_id INTEGER NOT NULL, to_id INTEGER NOT NULL, state TEXT NOT NULL,
+    fish TEXT NOT NULL, money INTEGER NOT NULL, ask_fish TEXT NOT NULL, ask_money INTEGER NOT NULL,
+    created REAL NOT NULL, settled REAL);
+CREATE INDEX IF NOT EXISTS trades_to ON trades (to_id, state);
+CREATE INDEX IF NOT EXISTS trades_from ON trades (from_id, state);
+CREATE TABLE IF NOT EXISTS trade_deliveries (
+    delivery_id INTEGER PRIMARY KEY AUTOINCREMENT, player_id INTEGER NOT NULL, trade_id TEXT NOT NULL,
+    money INTEGER NOT NULL, fish_in TEXT NOT NULL, fish_out TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS trade_deliveries_by_player ON trade_deliveries (player_id);
+"""
+
+
+class SqliteSaveStore(SaveStore):
+    """Every player in one SQLite database, in WAL mode. Each thread gets its
+    own connection, so telnet sessions can save side by side."""
+    name = "sqlite"
+    CORE = ('version', 'difficulty_name', 'difficulty_mult', 'level', 'xp', 'xp_threshold', 'money',
+            'skill_points', 'karma', 'current_rod', 'current_bait', 'rod_durability', 'rod_max_durability',
+            'current_location', 'current_weather', 'max_hp', 'current_hp', 'playtime_seconds')
+    STATS = ('strength', 'luck', 'patience')
+    FISH = ('name', 'min_weight', 'max_weight', 'rarity', 'rarity_weight', 'xp_reward', 'real_world_info',
+            'sell_price', 'weight', 'mutation', 'catch_time')
+    NPC_FLAGS = {'received_pirate_gift': False, 'mactavish_daily_quest': None, 'mactavish_quest_progress': 0,
+                 'mactavish_last_quest_date': None}  # flag -> value when the game never set it
+    CHILD_TABLES = ('fish', 'encyclopedia', 'owned_items', 'combat_items', 'boss_items', 'defeated_bosses',
+                    'quests', 'npc_flags', 'trade_deliveries')
+
+    def __init__(self, path=SAVE_DATABASE):
+        self.path = path
+        self._connections = threading.local()
+
+    def connection(self):
+        db = getattr(self._connections, 'db', None)
+        if db is None:
+            import sqlite3
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SAVE_DATABASE_SCHEMA)
+            self._connections.db = db
+        return db
+
+    def keys(self):
+        return [name for name, in self.connection().execute("SELECT name FROM players ORDER BY updated DESC")]
+
+    def key_for(self, player_name):
+        return player_name
+
+    def slots(self):
+        return [{'key': name, 'name': name, 'level': level, 'version': version or 'Unknown'}
+                for name, level, version in self.connection().execute(
+                    "SELECT name, level, version FROM players ORDER BY updated DESC")]
+
+    # --- reading ---
+    def read(self, key):
+        """The player's save. Inventory, trophy room and encyclopedia come back
+        as loaders; 'save_snapshot' records what was read so the next write
+        can tell what changed."""
+        db = self.connection()
+        columns = ('player_id',) + self.STATS + self.CORE
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute(f"SELECT {', '.join(columns)} FROM players WHERE name = ?", (key,)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            values = dict(zip(columns, row))
+            player_id = values.pop('player_id')
+            snapshot = {'player_id': player_id}
+            snapshot.update(self.read_small_sections(db, player_id))
+            # What was read already includes every settled trade
+            db.execute("DELETE FROM trade_deliveries WHERE player_id = ?", (player_id,))
+        data = {'name': key, 'stats': {stat: values.pop(stat) for stat in self.STATS}}
+        data.update(values)
+
+        data['owned_items'] = list(snapshot['owned_items'])
+        data['boss_inventory'] = list(snapshot['boss_inventory'])
+        data['defeated_bosses'] = list(snapshot['defeated_bosses'])
+        data['equipped_combat_items'] = dict(snapshot['equipped_combat_items'])
+        data['active_quests'] = [{'title': title, 'description': description}
+                                 for state, title, description in snapshot['quests'] if state == 'active']
+        data['completed_quests'] = [{'title': title, 'description': description}
+                                    for state, title, description in snapshot['quests'] if state == 'completed']
+        data.update({flag: json.loads(value) for flag, value in snapshot['npc_flags'].items()})
+
+        data['inventory'] = lambda: self.read_fish(player_id, 'inventory', snapshot)
+        data['trophy_room'] = lambda: self.read_fish(player_id, 'trophy', snapshot)
+        data['encyclopedia'] = lambda: self.read_encyclopedia(player_id, snapshot)
+        data['save_snapshot'] = snapshot
+        return data
+
+    def read_small_sections(self, db, player_id):
+        one = (player_id,)
+        return {
+            'owned_items': [item_id for item_id, in db.execute(
+                "SELECT item_id FROM owned_items WHERE player_id = ? ORDER BY item_id", one)],
+            'equipped_combat_items': dict(db.execute(
+                "SELECT category, item_id FROM combat_items WHERE player_id = ?", one)),
+            'boss_inventory': [item_id for item_id, in db.execute(
+                "SELECT item_id FROM boss_items WHERE player_id = ? ORDER BY position", one)],
+            'defeated_bosses': [boss for boss, in db.execute(
+                "SELECT boss FROM defeated_bosses WHERE player_id = ? ORDER BY position", one)],
+            'quests': [tuple(row) for row in db.execute(
+                "SELECT state, title, description FROM quests WHERE player_id = ? ORDER BY position", one)],
+            'npc_flags': dict(db.execute("SELECT flag, value FROM npc_flags WHERE player_id = ?", one)),
+        }
+
+    def read_fish(self, player_id, place, snapshot):
+        rows = self.connection().execute(
+            f"SELECT fish_id, {', '.join(self.FISH)} FROM fish WHERE player_id = ? AND place = ? ORDER BY fish_id",
+            (player_id, place))
+        known = snapshot.setdefault('fish', {})
+        fish = []
+        for row in rows:
+            known[row[0]] = place
+            data = dict(zip(self.FISH, row[1:]))
+            data['save_id'] = row[0]
+            fish.append(data)
+        return fish
+
+    def read_encyclopedia(self, player_id, snapshot):
+        counts = dict(self.connection().execute(
+            "SELECT species, count FROM encyclopedia WHERE player_id = ?", (player_id,)))
+        snapshot['encyclopedia'] = dict(counts)
+        return counts
+
+    # --- writing ---
+    def write(self, game):
+        """Save in one transaction, touching only what changed since the
+        snapshot. Returns where the save went."""
+        db = self.connection()
+        undo = []
+        try:
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                self.write_game(db, game, undo)
+        except BaseException:
+            self.undo_write(game, undo)
+            raise
+        self.forget_delivered(game)
+        return self.path
+
+    def write_game(self, db, game, undo):
+        """The body of write(), for callers that already hold a transaction.
+        Trades settled since the last write are applied to the game first, so
+        the game and its rows agree when this returns. What the write changes
+        in the snapshot and on fish goes on undo, for undo_write() if the
+        transaction doesn't commit. Returns the player id."""
+        snapshot = game.save_snapshot
+        row = db.execute("SELECT player_id FROM players WHERE name = ?", (game.name,)).fetchone()
+        if row is None:
+            player_id = db.execute("INSERT INTO players (name, updated) VALUES (?, ?)",
+                                   (game.name, time.time())).lastrowid
+        else:
+            player_id = row[0]
+        if snapshot.get('player_id') != player_id:
+            # Not what this game was loaded from (a new character, or a
+            # name taken over): replace everything, as a JSON save would
+            for table in self.CHILD_TABLES:
+                db.execute(f"DELETE FROM {table} WHERE player_id = ?", (player_id,))
+            undo.append(('snapshot', dict(snapshot)))
+            snapshot.clear()
+            snapshot['player_id'] = player_id
+        self.apply_deliveries(db, player_id, game)
+        self.write_core(db, player_id, game)
+        self.write_small_sections(db, player_id, game, snapshot, undo)
+        if not game.is_deferred('encyclopedia'):
+            self.write_encyclopedia(db, player_id, game.encyclopedia.to_dict(), snapshot, undo)
+        self.write_fish(db, player_id, game, snapshot, undo)
+        return player_id
+
+    def undo_write(self, game, undo):
+        """Take back a write's bookkeeping after its transaction rolled back.
+        Deliveries it applied stay applied (see apply_deliveries)."""
+        snapshot = game.save_snapshot
+        known = snapshot.get('fish', {})
+        for change in reversed(undo):
+            if change[0] == 'snapshot':
+                delivered = snapshot.get('delivered')
+                snapshot.clear()
+                snapshot.update(change[1])
+                if delivered is not None:
+                    snapshot['delivered'] = delivered
+                known = snapshot.get('fish', {})
+            elif change[0] == 'section':
+                section, value = change[1:]
+                if value is None:
+                    snapshot.pop(section, None)
+                else:
+                    snapshot[section] = value
+            elif change[0] == 'gone':
+                known[change[1]] = change[2]
+            elif change[0] == 'new':
+                fish, old_id = change[1:]
+                known.pop(fish.save_id, None)
+                if old_id is None:
+                    del fish.save_id
+                else:
+                    fish.save_id = old_id
+
+    def deliver(self, game):
+        """Bring a loaded game up to date with trades settled since its last
+        load or write, without saving anything else"""
+        player_id = game.save_snapshot.get('player_id')
+        if player_id is None:
+            return
+        db = self.connection()
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            self.apply_deliveries(db, player_id, game)
+        self.forget_delivered(game)
+
+    def apply_deliveries(self, db, player_id, game):
+        """A settled trade has already moved the rows and the money in the
+        database; its delivery row carries the same change for the game in
+        memory. Each delivery is applied once: its id stays in the snapshot
+        until the transaction that deletes the row has committed."""
+        snapshot = game.save_snapshot
+        delivered = snapshot.setdefault('delivered', set())
+        rows = db.execute("SELECT delivery_id, money, fish_in, fish_out FROM trade_deliveries "
+                          "WHERE player_id = ? ORDER BY delivery_id", (player_id,)).fetchall()
+        if not rows:
+            return
+        known = snapshot.setdefault('fish', {})
+        for delivery_id, money, fish_in, fish_out in rows:
+            if delivery_id in delivered:
+                continue
+            game.money += money
+            fish_out, fish_in = set(json.loads(fish_out)), json.loads(fish_in)
+            for fish_id in fish_out:
+                known.pop(fish_id, None)
+            if not game.is_deferred('inventory'):
+                # (a deferred inventory reads the moved rows when it loads)
+                if fish_out:
+                    game.inventory[:] = [fish for fish in game.inventory
+                                         if getattr(fish, 'save_id', None) not in fish_out]
+                if fish_in:
+                    for data in self.fish_rows(db, player_id, fish_in):
+                        if data['save_id'] not in known:
+                            game.inventory.append(Fish.from_dict(data))
+                            known[data['save_id']] = 'inventory'
+            delivered.add(delivery_id)
+        db.execute("DELETE FROM trade_deliveries WHERE player_id = ? AND delivery_id <= ?", (player_id, rows[-1][0]))
+
+    def forget_delivered(self, game):
+        """After a commit: the delivery rows are gone, so their ids can go too"""
+        game.save_snapshot.pop('delivered', None)
+
+    def fish_rows(self, db, player_id, fish_ids):
+        """Saved fish of a player's inventory by id, as Fish.from_dict data"""
+        marks = ', '.join('?' * len(fish_ids))
+        rows = db.execute(f"SELECT fish_id, {', '.join(self.FISH)} FROM fish WHERE fish_id IN ({marks}) "
+                          "AND player_id = ? AND place = 'inventory' ORDER BY fish_id", (*fish_ids, player_id))
+        return [dict(zip(self.FISH, row[1:]), save_id=row[0]) for row in rows]
+
+    def write_core(self, db, player_id, game):
+        values = [GAME_VERSION, *(game.stats.get(stat, 0) for stat in self.STATS), game.difficulty_name,
+                  game.difficulty_mult, game.level, game.xp, game.xp_threshold, game.money, game.skill_points,
+                  game.karma, game.current_rod.item_id, game.current_bait.item_id, game.rod_durability,
+                  game.rod_max_durability, game.current_location.name, game.current_weather, game.max_hp,
+                  game.current_hp, game.playtime_seconds]
+        columns = ('version',) + self.STATS + self.CORE[1:]
+        db.execute(f"UPDATE players SET updated = ?, {', '.join(c + ' = ?' for c in columns)} WHERE player_id = ?",
+                   (time.time(), *values, player_id))
+
+    def write_small_sections(self, db, player_id, game, snapshot, undo):
+        """Owned and equipped items, boss items, defeated bosses, quests and NPC
+        flags - each rewritten whole, and only when it changed"""
+        sections = {
+            'owned_items': game.owned_items.to_list(),
+            'equipped_combat_items': {category: item.item_id if item else None
+                                      for category, item in game.equipped_combat_items.items()},
+            'boss_inventory': [item.item_id for item in game.boss_inventory],
+            'defeated_bosses': list(game.defeated_bosses),
+            'quests': [('active', q.title, q.description) for q in game.active_quests]
+                      + [('completed', q.title, q.description) for q in game.completed_quests],
+            'npc_flags': {flag: json.dumps(getattr(game, flag, default)) for flag, default in self.NPC_FLAGS.items()},
+        }
+        writers = {
+            'owned_items': ("owned_items", "INSERT INTO owned_items VALUES (?, ?)",
+                            lambda value: [(player_id, item_id) for item_id in value]),
+            'equipped_combat_items': ("combat_items", "INSERT INTO combat_items VALUES (?, ?, ?)",
+                                      lambda value: [(player_id, c, item_id) for c, item_id in value.items()]),
+            'boss_inventory': ("boss_items", "INSERT INTO boss_items VALUES (?, ?, ?)",
+                               lambda value: [(player_id, i, item_id) for i, item_id in enumerate(value)]),
+            'defeated_bosses': ("defeated_bosses", "INSERT INTO defeated_bosses VALUES (?, ?, ?)",
+                                lambda value: [(player_id, i, boss) for i, boss in enumerate(value)]),
+            'quests': ("quests", "INSERT INTO quests VALUES (?, ?, ?, ?, ?)",
+                       lambda value: [(player_id, i, *quest) for i, quest in enumerate(value)]),
+            'npc_flags': ("npc_flags", "INSERT INTO npc_flags VALUES (?, ?, ?)",
+                          lambda value: [(player_id, flag, v) for flag, v in value.items()]),
+        }
+        for section, value in sections.items():
+            if snapshot.get(section) == value:
+                continue
+            table, insert, rows = writers[section]
+            db.execute(f"DELETE FROM {table} WHERE player_id = ?", (player_id,))
+            db.executemany(insert, rows(value))
+            undo.append(('section', section, snapshot.get(section)))
+            snapshot[section] = value
+
+    def write_encyclopedia(self, db, player_id, counts, snapshot, undo):
+        old = snapshot.get('encyclopedia', {})
+        db.executemany("INSERT OR REPLACE INTO encyclopedia VALUES (?, ?, ?)",
+                       [(player_id, species, count) for species, count in counts.items() if old.get(species) != count])
+        db.executemany("DELETE FROM encyclopedia WHERE player_id = ? AND species = ?",
+                       [(player_id, species) for species in old if species not in counts])
+        undo.append(('section', 'encyclopedia', snapshot.get('encyclopedia')))
+        snapshot['encyclopedia'] = counts
+
+    def write_fish(self, db, player_id, game, snapshot, undo):
+        """Fish remember their row in save_id. A fish still in the same place
+        and in the same order keeps its row; new fish, fish that moved between
+        the inventory and the aquarium and everything after them get a new one
+        (rows are read back in fish_id order), and rows of fish that left are
+        deleted. Sections still deferred are left alone."""
+        known = snapshot.setdefault('fish', {})  # fish_id -> place
+        places = [(place, getattr(game, section)) for place, section in (('inventory', 'inventory'),
+                                                                        ('trophy', 'trophy_room'))
+                  if not game.is_deferred(section)]
+        kept = {}
+        new = []
+        for place, fish_list in places:
+            last = 0
+            for fish in fish_list:
+                fish_id = getattr(fish, 'save_id', None)
+                if last is not None and fish_id is not None and fish_id > last and known.get(fish_id) == place \
+                        and fish_id not in kept:
+                    kept[fish_id] = place
+                    last = fish_id
+                else:
+                    new.append((place, fish))
+                    last = None  # every fish after a new row needs a later row too
+        loaded = {place for place, fish_list in places}
+        gone = [fish_id for fish_id, place in known.items() if place in loaded and fish_id not in kept]
+        db.executemany("DELETE FROM fish WHERE fish_id = ?", [(fish_id,) for fish_id in gone])
+        for fish_id in gone:
+            undo.append(('gone', fish_id, known.pop(fish_id)))
+        if not new:
+            return
+        # The write lock is held, so new rows can take the next ids straight
+        # away and go in with one executemany. AUTOINCREMENT's sequence keeps
+        # ids of deleted rows from coming back.
+        next_id = db.execute("SELECT MAX(COALESCE((SELECT MAX(fish_id) FROM fish), 0), "
+                             "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'fish'), 0)) + 1").fetchone()[0]
+        rows = []
+        for fish_id, (place, fish) in enumerate(new, next_id):
+            data = fish.to_dict()
+            undo.append(('new', fish, getattr(fish, 'save_id', None)))
+            fish.save_id = fish_id
+            known[fish_id] = place
+            rows.append((fish_id, player_id, place, *(data[field] for field in self.FISH)))
+        db.executemany(f"INSERT INTO fish (fish_id, player_id, place, {', '.join(self.FISH)}) "
+                       f"VALUES ({', '.join('?' * (len(self.FISH) + 3))})", rows)
+
+    # --- tools ---
+    def import_from(self, store):
+        """Copy every save of another store into this one. Returns how many"""
+        copied = 0
+        for key in store.keys():
+            try:
+                data = store.read(key)
+            except (OSError, ValueError, KeyError):
+                continue
+            from fishgame import Game
+            game = Game()
+            game.apply_save_data(data)
+            game.save_snapshot = {}
+            self.write(game)
+            copied += 1
+        return copied
+
+
+# ===== TRADING =====
+# Players trade inventory fish and money in two steps. An offer puts the
+# offered fish and money in escrow; the other player then accepts it (and pays
+# what was asked) or declines it, or the offerer takes it back. Every step is
+# one SQLite transaction in the save store, so a trade either happens for both
+# players or not at all. Steps are safe to retry: an offer is keyed by its
+# trade id, and accepting or cancelling a trade twice does nothing the second
+# time. Fish are identified by their row in the store (Fish.save_id).
+
+
+class TradeError(Exception):
+    """A trade step that can't go ahead - the message says why, for the player"""
+
+
+class Trades:
+    """The trade desk of a SqliteSaveStore"""
+    STATES = ('offered', 'accepted', 'declined', 'cancelled')
+
+    def __init__(self, store):
+        self.store = store
+
+    def offer(self, game, to_name, fish=(), money=0, ask_fish=(), ask_money=0, trade_id=None):
+        """Offer inventory fish (Fish objects) and money to another player for
+        some of their fish (ids) and money. Returns the trade id - pass it
+        again to retry an offer whose outcome is unknown."""
+        trade_id = trade_id or os.urandom(8).hex()
+        fish, ask_fish = list(fish), [int(fish_id) for fish_id in ask_fish]
+        if money < 0 or ask_money < 0:
+            raise TradeError("Money in a trade can't be negative.")
+        if not (fish or money or ask_fish or ask_money):
+            raise TradeError("There's nothing in this trade.")
+        self.run(game, self.offer_step, to_name, fish, money, ask_fish, ask_money, trade_id)
+        return trade_id
+
+    def accept(self, game, trade_id):
+        """Take an offer made to this player: the asked fish and money go to
+        the offerer, the offered ones to this player. Returns the trade."""
+        return self.run(game, self.accept_step, trade_id)
+
+    def cancel(self, game, trade_id):
+        """Take back an offer (the offerer) or decline it (the other player).
+        The escrowed fish and money go back to the offerer. Returns the trade."""
+        return self.run(game, self.cancel_step, trade_id)
+
+    def run(self, game, step, *args):
+        """One trade step in one transaction. The game is saved first, so its
+        fish have ids and the step checks what the player really has. A
+        refused step rolls back to just after that save."""
+        db = self.store.connection()
+        undo = []
+        refused = None
+        try:
+            with db:
+                db.execute("BEGIN IMMEDIATE")
+                player_id = self.store.write_game(db, game, undo)
+                db.execute("SAVEPOINT trade_step")
+                try:
+                    result = step(db, player_id, game, *args)
+                except TradeError as e:
+                    db.execute("ROLLBACK TO trade_step")
+                    refused = e
+        except BaseException:
+            self.store.undo_write(game, undo)
+            raise
+        self.store.forget_delivered(game)
+        if refused is not None:
+            raise refused
+        self.store.deliver(game)  # this player's side of the step
+        return result
+
+    # --- steps, inside run()'s transaction ---
+    def offer_step(self, db, player_id, game, to_name, fish, money, ask_fish, ask_money, trade_id):
+        trade = self.find(db, trade_id)
+        if trade is not None:
+            if trade['from_id'] != player_id:
+                raise TradeError("That trade id is already taken.")
+            return trade  # a retry of an offer that went through
+        to_id = self.player_id(db, to_name)
+        if to_id is None or to_id == player_id:
+            raise TradeError(f"There's no other player called {to_name}.")
+        inventory = {id(f) for f in game.inventory}
+        fish_ids = [getattr(f, 'save_id', None) for f in fish]
+        if any(id(f) not in inventory for f in fish) or len(set(fish_ids)) != len(fish_ids):
+            raise TradeError("You can only offer fish from your inventory, once each.")
+        if game.money < money:
+            raise TradeError(f"You only have ${game.money}.")
+        if not self.move_fish(db, fish_ids, player_id, 'inventory', player_id, 'escrow'):
+            raise TradeError("You no longer have all of those fish.")
+        db.execute("UPDATE players SET money = money - ? WHERE player_id = ?", (money, player_id))
+        db.execute("INSERT INTO trades VALUES (?, ?, ?, 'offered', ?, ?, ?, ?, ?, NULL)",
+                   (trade_id, player_id, to_id, json.dumps(fish_ids), money, json.dumps(ask_fish), ask_money,
+                    time.time()))
+        self.add_delivery(db, player_id, trade_id, -money, fish_out=fish_ids)
+        return self.find(db, trade_id)
+
+    def accept_step(self, db, player_id, game, trade_id):
+        trade = self.find(db, trade_id)
+        if trade is None or trade['to_id'] != player_id:
+            raise TradeError("There's no such offer for you.")
+        if trade['state'] == 'accepted':
+            return trade  # a retry of an accept that went through
+        if trade['state'] != 'offered':
+            raise TradeError(f"That offer was {trade['state']}.")
+        if game.money < trade['ask_money']:
+            raise TradeError(f"They want ${trade['ask_money']} and you only have ${game.money}.")
+        from_id = trade['from_id']
+        if not self.move_fish(db, trade['ask_fish'], player_id, 'inventory', from_id, 'inventory'):
+            raise TradeError("You no longer have all of the fish they asked for.")
+        if not self.move_fish(db, trade['fish'], from_id, 'escrow', player_id, 'inventory'):
+            raise TradeError("That offer is no longer valid.")
+        db.execute("UPDATE players SET money = money + ? WHERE player_id = ?",
+                   (trade['money'] - trade['ask_money'], player_id))
+        db.execute("UPDATE players SET money = money + ? WHERE player_id = ?", (trade['ask_money'], from_id))
+        self.settle(db, trade, 'accepted')
+        self.add_delivery(db, player_id, trade_id, trade['money'] - trade['ask_money'],
+                          fish_in=trade['fish'], fish_out=trade['ask_fish'])
+        self.add_delivery(db, from_id, trade_id, trade['ask_money'], fish_in=trade['ask_fish'])
+        return trade
+
+    def cancel_step(self, db, player_id, game, trade_id):
+        trade = self.find(db, trade_id)
+        if trade is None or player_id not in (trade['from_id'], trade['to_id']):
+            raise TradeError("There's no such trade of yours.")
+        if trade['state'] in ('cancelled', 'declined'):
+            return trade  # a retry
+        if trade['state'] != 'offered':
+            raise TradeError(f"That trade was already {trade['state']}.")
+        from_id = trade['from_id']
+        # The offerer's fish can only have left escrow if a new character
+        # took over the name; whatever is still there goes back
+        self.move_fish(db, trade['fish'], from_id, 'escrow', from_id, 'inventory')
+        db.execute("UPDATE players SET money = money + ? WHERE player_id = ?", (trade['money'], from_id))
+        self.settle(db, trade, 'cancelled' if player_id == from_id else 'declined')
+        self.add_delivery(db, from_id, trade_id, trade['money'], fish_in=trade['fish'])
+        return trade
+
+    def pending(self, game):
+        """Open offers to and from this player, oldest first: dicts with
+        trade_id, direction ('in' or 'out'), other (player name), fish and
+        ask_fish (Fish.from_dict data), money and ask_money"""
+        player_id = game.save_snapshot.get('player_id')
+        if player_id is None:
+            return []
+        db = self.store.connection()
+        rows = db.execute(
+            "SELECT t.trade_id, t.from_id, p.name, t.fish, t.money, t.ask_fish, t.ask_money FROM trades t "
+            "JOIN players p ON p.player_id = CASE WHEN t.from_id = ? THEN t.to_id ELSE t.from_id END "
+            "WHERE t.state = 'offered' AND (t.from_id = ? OR t.to_id = ?) ORDER BY t.created",
+            (player_id, player_id, player_id)).fetchall()
+        offers = []
+        for trade_id, from_id, other, fish, money, ask_fish, ask_money in rows:
+            fish, ask_fish = json.loads(fish), json.loads(ask_fish)
+            offers.append({'trade_id': trade_id, 'direction': 'out' if from_id == player_id else 'in',
+                           'other': other, 'money': money, 'ask_money': ask_money,
+                           'fish': self.describe(db, fish), 'ask_fish': self.describe(db, ask_fish)})
+        return offers
+
+    def inventory_of(self, name, limit=20):
+        """Another player's most valuable saved inventory fish, as
+        Fish.from_dict data - what an offer can ask for"""
+        db = self.store.connection()
+        player_id = self.player_id(db, name)
+        if player_id is None:
+            return []
+        rows = db.execute(f"SELECT fish_id, {', '.join(SqliteSaveStore.FISH)} FROM fish "
+                          "WHERE player_id = ? AND place = 'inventory' ORDER BY sell_price DESC LIMIT ?",
+                          (player_id, limit))
+        return [dict(zip(SqliteSaveStore.FISH, row[1:]), save_id=row[0]) for row in rows]
+
+    # --- helpers ---
+    def find(self, db, trade_id):
+        row = db.execute("SELECT trade_id, from_id, to_id, state, fish, money, ask_fish, ask_money "
+                         "FROM trades WHERE trade_id = ?", (trade_id,)).fetchone()
+        if row is None:
+            return None
+        trade = dict(zip(('trade_id', 'from_id', 'to_id', 'state', 'fish', 'money', 'ask_fish', 'ask_money'), row))
+        trade['fish'], trade['ask_fish'] = json.loads(trade['fish']), json.loads(trade['ask_fish'])
+        return trade
+
+    def player_id(self, db, name):
+        row = db.execute("SELECT player_id FROM players WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def move_fish(self, db, fish_ids, from_id, from_place, to_id, to_place):
+        """Move fish rows between players or places. True only if every one
+        of them was where it was expected to be."""
+        if not fish_ids:
+            return True
+        if None in fish_ids:
+            return False
+        marks = ', '.join('?' * len(fish_ids))
+        moved = db.execute(f"UPDATE fish SET player_id = ?, place = ? WHERE fish_id IN ({marks}) "
+                           "AND player_id = ? AND place = ?", (to_id, to_place, *fish_ids, from_id, from_place))
+        return moved.rowcount == len(fish_ids)
+
+    def settle(self, db, trade, state):
+        db.execute("UPDATE trades SET state = ?, settled = ? WHERE trade_id = ?", (state, time.time(), trade['trade_id']))
+        trade['state'] = state
+
+    def add_delivery(self, db, player_id, trade_id, money, fish_in=(), fish_out=()):
+        db.execute("INSERT INTO trade_deliveries (player_id, trade_id, money, fish_in, fish_out) VALUES (?, ?, ?, ?, ?)",
+                   (player_id, trade_id, money, json.dumps(list(fish_in)), json.dumps(list(fish_out))))
+
+    def describe(self, db, fish_ids):
+        if not fish_ids:
+            return []
+        marks = ', '.join('?' * len(fish_ids))
+        rows = db.execute(f"SELECT fish_id, {', '.join(SqliteSaveStore.FISH)} FROM fish WHERE fish_id IN ({marks})",
+                          fish_ids)
+        return [dict(zip(SqliteSaveStore.FISH, row[1:]), save_id=row[0]) for row in rows]
+
+
+def visit_trading_post(game, store):
+    """The trading post screen: open offers to and from the player, new offers"""
+    trades = Trades(store)
+    game.update_playtime()
+    store.write(game)  # so your fish have ids and trades settled meanwhile arrive
+
+    while True:
+        game.clear_screen()
+        print(Fore.LIGHTCYAN_EX + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+        print(Fore.LIGHTCYAN_EX + "║          🤝 TRADING POST 🤝            ║" + Style.RESET_ALL)
+        print(Fore.LIGHTCYAN_EX + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+        print(Fore.GREEN + f"Money: ${game.money}   Fish in inventory: {len(game.inventory)}" + Style.RESET_ALL)
+        print()
+        offers = trades.pending(game)
+        if not offers:
+            print(Fore.LIGHTBLACK_EX + "  No open offers." + Style.RESET_ALL)
+        for i, offer in enumerate(offers, 1):
+            if offer['direction'] == 'in':
+                print(Fore.WHITE + f"{i}. From {offer['other']}: {describe_trade_side(offer['fish'], offer['money'])}"
+                      f" for {describe_trade_side(offer['ask_fish'], offer['ask_money'])}" + Style.RESET_ALL)
+            else:
+                print(Fore.LIGHTBLACK_EX + f"{i}. To {offer['other']}: {describe_trade_side(offer['fish'], offer['money'])}"
+                      f" for {describe_trade_side(offer['ask_fish'], offer['ask_money'])}" + Style.RESET_ALL)
+        print()
+        print(Fore.WHITE + "[number] Open an offer | [N]ew offer | [Q]uit" + Style.RESET_ALL)
+        choice = input(Fore.CYAN + "\nChoice: " + Style.RESET_ALL).strip().lower()
+        try:
+            if choice == 'n':
+                make_trade_offer(game, trades)
+            elif choice.isdigit() and 1 <= int(choice) <= len(offers):
+                answer_trade_offer(game, trades, offers[int(choice) - 1])
+            elif choice in ('q', ''):
+                return
+        except TradeError as e:
+            print(Fore.RED + str(e) + Style.RESET_ALL)
+            time.sleep(2)
+
+
+def describe_trade_side(fish, money):
+    parts = [str(Fish.from_dict(data)) for data in fish]
+    if money:
+        parts.append(f"${money}")
+    return ", ".join(parts) or "nothing"
+
+
+def make_trade_offer(game, trades):
+    other = input(Fore.CYAN + "Trade with (player name): " + Style.RESET_ALL).strip()
+    if not other:
+        return
+    mine = sorted(game.inventory, key=lambda fish: fish.sell_price, reverse=True)[:20]
+    print(Fore.CYAN + "\nYour most valuable fish:" + Style.RESET_ALL)
+    for i, fish in enumerate(mine, 1):
+        print(f"  {i}. {fish} - ${fish.sell_price}")
+    offered = pick_trade_fish(mine, "Fish to offer (e.g. 1,3 - blank for none): ")
+    money = ask_trade_money("Money to offer: $")
+    theirs = trades.inventory_of(other)
+    if theirs:
+        print(Fore.CYAN + f"\n{other}'s most valuable fish:" + Style.RESET_ALL)
+        for i, data in enumerate(theirs, 1):
+            print(f"  {i}. {Fish.from_dict(data)} - ${data['sell_price']}")
+    asked = pick_trade_fish(theirs, "Fish to ask for (e.g. 2 - blank for none): ")
+    ask_money = ask_trade_money("Money to ask for: $")
+    trades.offer(game, other, offered, money, [data['save_id'] for data in asked], ask_money)
+    print(Fore.GREEN + f"Offer sent to {other}! Your fish and money are held until they answer." + Style.RESET_ALL)
+    time.sleep(1.5)
+
+
+def pick_trade_fish(choices, prompt):
+    picked = []
+    for part in input(Fore.CYAN + prompt + Style.RESET_ALL).replace(' ', '').split(','):
+        if part.isdigit() and 1 <= int(part) <= len(choices) and choices[int(part) - 1] not in picked:
+            picked.append(choices[int(part) - 1])
+    return picked
+
+
+def ask_trade_money(prompt):
+    answer = input(Fore.CYAN + prompt + Style.RESET_ALL).strip()
+    return int(answer) if answer.isdigit() else 0
+
+
+def answer_trade_offer(game, trades, offer):
+    if offer['direction'] == 'in':
+        choice = input(Fore.CYAN + "[A]ccept, [D]ecline or [B]ack: " + Style.RESET_ALL).strip().lower()
+        if choice == 'a':
+            trades.accept(game, offer['trade_id'])
+            print(Fore.GREEN + f"Trade with {offer['other']} done!" + Style.RESET_ALL)
+        elif choice == 'd':
+            trades.cancel(game, offer['trade_id'])
+            print(Fore.YELLOW + f"Declined {offer['other']}'s offer." + Style.RESET_ALL)
+        else:
+            return
+    else:
+        choice = input(Fore.CYAN + "[C]ancel this offer or [B]ack: " + Style.RESET_ALL).strip().lower()
+        if choice != 'c':
+            return
+        trades.cancel(game, offer['trade_id'])
+        print(Fore.YELLOW + "Offer withdrawn - your fish and money are back." + Style.RESET_ALL)
+    time.sleep(1.5)
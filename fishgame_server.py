@@ -0,0 +1,1072 @@
+# Telnet host - many players in one process, one asyncio loop for every socket
+# Usage: python fishgame_server.py [--host 127.0.0.1] [--port 2323] [--max-sessions 2000]
+#                                  [--spectate-port 2324] [--raid BOSS [--raid-hp-mult 50]]
+#        then: telnet 127.0.0.1 2323
+#
+# Every connection gets its own game. Sockets, telnet negotiation and output
+# backpressure live on one asyncio loop. The game itself is plain blocking
+# code (input(), get_key(), print(), time.sleep()), so each session runs it on
+# a small worker thread, and the server routes those calls to the session
+# that made them. Only one session runs game code at a time: a FIFO run token
+# is handed on whenever a session waits for its player, sleeps, waits for its
+# output to drain or uses up its time slice, so one busy session can't starve
+# the others, and a thousand idle ones cost nothing but memory.
+#
+# With --spectate-port, anyone can watch a live session: connect to that port
+# and pick a game. Each frame a watched game draws is diffed against the last
+# one once, and the same bytes go to every spectator.
+#
+# With --raid, players can also join a world-boss raid: one boss from the
+# roster, one HP pool, everybody attacking it at once (see WORLD BOSS RAID).
+import argparse
+import asyncio
+import builtins
+import codecs
+import os
+import random
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from colorama import Fore, Style
+
+import fishgame
+
+# Telnet commands and options (RFC 854, 857, 858)
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+ECHO, SGA, LINEMODE = 1, 3, 34
+# Character mode: we echo, nobody sends go-aheads, no line editing in the client
+NEGOTIATION = bytes([IAC, WILL, ECHO, IAC, WILL, SGA, IAC, DO, SGA, IAC, DONT, LINEMODE])
+
+TIME_SLICE = 0.02  # seconds of game code before a session yields to the next one
+FLUSH_BYTES = 16 * 1024  # buffered output is sent at this size, or when the session blocks
+HIGH_WATER = 64 * 1024  # unsent bytes per session before its game thread waits
+SESSION_STACK_SIZE = 512 * 1024
+SPECTATOR_HIGH_WATER = 32 * 1024  # a spectator this far behind skips frames until it catches up
+FAN_OUT_BATCH = 64  # spectator writes per loop iteration
+SPECTATOR_FRAME_INTERVAL = 0.05  # spectators get at most 20 frames a second, however fast the game draws
+
+
+class SessionClosed(BaseException):
+    """Raised inside a session's game thread when its player disconnects.
+    A BaseException so the game's own `except Exception` blocks let it through."""
+
+
+class TelnetParser:
+    """Turns raw telnet bytes into typed characters.
+    Commands are dropped, Enter (CR LF, CR NUL or LF) becomes a single '\\r'."""
+    def __init__(self):
+        self.state = "data"
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self.after_cr = False
+
+    def feed(self, data):
+        plain = bytearray()
+        for byte in data:
+            if self.state == "data":
+                if byte == IAC:
+                    self.state = "iac"
+                elif self.after_cr and byte in (0, 10):
+                    self.after_cr = False
+                else:
+                    self.after_cr = byte == 13
+                    plain.append(13 if byte == 10 else byte)
+            elif self.state == "iac":
+                if byte == IAC:
+                    plain.append(IAC)
+                    self.state = "data"
+                elif byte in (DO, DONT, WILL, WONT):
+                    self.state = "option"
+                elif byte == SB:
+                    self.state = "sb"
+                else:
+                    self.state = "data"
+            elif self.state == "option":
+                self.state = "data"
+            elif self.state == "sb":
+                if byte == IAC:
+                    self.state = "sb_iac"
+            elif self.state == "sb_iac":
+                self.state = "data" if byte == SE else "sb"
+        return self.decoder.decode(bytes(plain))
+
+
+class RunToken:
+    """Only the holder runs game code. Released tokens go straight to the
+    longest waiting session, so sessions take turns in arrival order."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiting = deque()
+        self.holder = None
+
+    def acquire(self, session):
+        with self.lock:
+            if self.holder is None:
+                self.holder = session
+                return
+            session.turn.clear()
+            self.waiting.append(session)
+        session.turn.wait()
+
+    def release(self):
+        with self.lock:
+            if self.waiting:
+                self.holder = self.waiting.popleft()
+                self.holder.turn.set()
+            else:
+                self.holder = None
+
+
+class Session:
+    """One connected player. The game thread calls write/input/get_key/...;
+    the loop calls feed/pause/resume/close."""
+    def __init__(self, number, loop, transport, token, play):
+        self.number = number
+        self.loop = loop
+        self.transport = transport
+        self.token = token
+        self.play = play
+        self.turn = threading.Event()
+        self.cond = threading.Condition()
+        self.inbox = deque()
+        self.out = []
+        self.out_size = 0
+        self.unsent = 0
+        self.paused = False
+        self.closed = False
+        self.slice_start = 0.0
+        self.broadcast = None  # Set once somebody watches this session
+        self.thread = threading.Thread(target=self.run, name=f"session-{number}", daemon=True)
+
+    # --- loop side ---
+    def feed(self, chars):
+        with self.cond:
+            self.inbox.extend(chars)
+            self.cond.notify_all()
+
+    def pause(self):
+        with self.cond:
+            self.paused = True
+
+    def resume(self):
+        with self.cond:
+            self.paused = False
+            self.cond.notify_all()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def send(self, data):
+        if not self.transport.is_closing():
+            self.transport.write(data)
+        with self.cond:
+            self.unsent -= len(data)
+            self.cond.notify_all()
+
+    def push(self, text, data):
+        """Output that isn't the game's own (the raid status), already encoded
+        as data. Counted like the game's output and shown to spectators too;
+        dropped while the player isn't reading, as a newer one follows."""
+        with self.cond:
+            if self.closed or self.paused or self.unsent > HIGH_WATER:
+                return
+            self.unsent += len(data)
+        if self.broadcast is not None:
+            self.broadcast.feed(text)
+        self.send(data)
+
+    # --- game thread side ---
+    def run(self):
+        SESSIONS.current = self
+        self.token.acquire(self)
+        self.slice_start = time.perf_counter()
+        try:
+            self.play()
+        except (SessionClosed, SystemExit):
+            pass
+        except Exception:
+            traceback.print_exc(file=sys.__stderr__)
+            try:
+                self.write("\nSomething went wrong - the session has ended.\n")
+            except SessionClosed:
+                pass
+        finally:
+            try:
+                self.flush()
+            except SessionClosed:
+                pass
+            self.token.release()
+            self.loop.call_soon_threadsafe(self.transport.close)
+            if self.broadcast is not None:
+                self.broadcast.end()
+
+    def check_open(self):
+        if self.closed:
+            raise SessionClosed()
+
+    def blocked(self, wait):
+        """Give the run token away while wait() blocks, then queue for it again"""
+        self.token.release()
+        try:
+            return wait()
+        finally:
+            self.token.acquire(self)
+            self.slice_start = time.perf_counter()
+
+    def write(self, text):
+        self.check_open()
+        if self.broadcast is not None:
+            self.broadcast.feed(text)
+        self.out.append(text.replace("\n", "\r\n"))
+        self.out_size += len(text)
+        if self.out_size >= FLUSH_BYTES:
+            self.flush()
+        self.check_slice()
+
+    def check_slice(self):
+        """Hand the run token on once this session has used up its time slice"""
+        if time.perf_counter() - self.slice_start > TIME_SLICE:
+            self.flush()
+            self.blocked(lambda: None)
+
+    def flush(self):
+        if self.out:
+            data = "".join(self.out).encode("utf-8")
+            self.out = []
+            self.out_size = 0
+            if self.paused or self.unsent > HIGH_WATER:
+                self.blocked(self.wait_for_room)
+            with self.cond:
+                self.check_open()
+                self.unsent += len(data)
+            self.loop.call_soon_threadsafe(self.send, data)
+
+    def wait_for_room(self):
+        with self.cond:
+            self.cond.wait_for(lambda: not (self.paused or self.unsent > HIGH_WATER) or self.closed)
+
+    def echo(self, text):
+        """Send straight away - used while the game waits for a line"""
+        data = text.encode("utf-8")
+        with self.cond:
+            self.unsent += len(data)
+        self.loop.call_soon_threadsafe(self.send, data)
+
+    def next_char(self, timeout=None):
+        """Next typed character, or None after timeout. Runs without the token."""
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.inbox or self.closed, timeout):
+                return None
+            self.check_open()
+            return self.inbox.popleft()
+
+    def input(self, prompt=""):
+        self.write(prompt)
+        self.flush()
+        return self.blocked(self.read_line)
+
+    def read_line(self):
+        line = []
+        while True:
+            ch = self.next_char()
+            if ch == "\r":
+                self.echo("\r\n")
+                return "".join(line)
+            if ch in ("\x7f", "\x08"):
+                if line:
+                    line.pop()
+                    self.echo("\b \b")
+            elif ch in ("\x03", "\x04"):
+                raise SessionClosed()
+            elif ch.isprintable():
+                line.append(ch)
+                self.echo(ch)
+
+    def get_key(self):
+        self.flush()
+        return self.blocked(self.next_char).lower()
+
+    def poll_key(self, timeout=0):
+        self.flush()
+        with self.cond:
+            if self.inbox:
+                return self.inbox.popleft()
+        if not timeout:
+            return None
+        return self.blocked(lambda: self.next_char(timeout))
+
+    def sleep(self, seconds):
+        self.flush()
+        if seconds > 0:
+            self.blocked(lambda: self.wait_closed(seconds))
+        self.check_open()
+
+    def wait_closed(self, seconds):
+        with self.cond:
+            self.cond.wait_for(lambda: self.closed, seconds)
+
+
+# ===== ROUTING =====
+# The game calls print(), input(), get_key(), time.sleep() and os.system('clear')
+# directly. After install() those go to the calling thread's session, and
+# behave as before anywhere else (the server's own console).
+class SessionLocal(threading.local):
+    current = None
+
+
+SESSIONS = SessionLocal()
+
+
+class RoutedStdout:
+    def __init__(self, real):
+        self.real = real
+
+    def write(self, text):
+        session = SESSIONS.current
+        if session is None:
+            return self.real.write(text)
+        session.write(text)
+        return len(text)
+
+    def flush(self):
+        session = SESSIONS.current
+        if session is None:
+            self.real.flush()
+        else:
+            session.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+
+def install_routing():
+    real_input = builtins.input
+    real_sleep = time.sleep
+    real_system = os.system
+    real_get_key = fishgame.get_key
+    real_poll_key = fishgame.poll_key
+
+    def routed_input(prompt=""):
+        session = SESSIONS.current
+        if session is None:
+            return real_input(prompt)
+        session.check_slice()
+        return session.input(str(prompt))
+
+    def routed_sleep(seconds):
+        session = SESSIONS.current
+        if session is None:
+            return real_sleep(seconds)
+        session.check_slice()
+        return session.sleep(seconds)
+
+    def routed_system(command):
+        session = SESSIONS.current
+        if session is None or command not in ('clear', 'cls'):
+            return real_system(command)
+        session.write(CLEAR_SCREEN)
+        return 0
+
+    def routed_get_key():
+        session = SESSIONS.current
+        if session is None:
+            return real_get_key()
+        session.check_slice()
+        return session.get_key()
+
+    def routed_poll_key(timeout=0):
+        session = SESSIONS.current
+        if session is None:
+            return real_poll_key(timeout)
+        session.check_slice()
+        return session.poll_key(timeout)
+
+    sys.stdout = RoutedStdout(sys.stdout)
+    builtins.input = routed_input
+    time.sleep = routed_sleep
+    os.system = routed_system
+    fishgame.poll_key = routed_poll_key
+    # Content modules import get_key by name, so load them now and patch each copy
+    from fishgame_content import bosses, leaderboards, library, npcs  # noqa: F401
+    for name, module in list(sys.modules.items()):
+        if (name == "fishgame" or name.startswith("fishgame_content")) and getattr(module, "get_key", None) is real_get_key:
+            module.get_key = routed_get_key
+
+
+# ===== SPECTATORS =====
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+# A new frame starts whenever the game clears the screen or homes the cursor to redraw
+NEW_FRAME = re.compile(r"\x1b\[2J|\x1b\[H")
+
+
+class ScreenDiffer:
+    """The screen as a spectator sees it, one string per line. The game's
+    output is fed in as it is written; diff() returns the escape codes that
+    turn the last published screen into the current one."""
+    def __init__(self):
+        self.lines = [""]
+        self.shown = ()
+
+    def feed(self, text):
+        for number, part in enumerate(NEW_FRAME.split(text)):
+            if number:
+                self.lines = [""]
+            rows = part.split("\n")
+            rows[0] = self.lines.pop() + rows[0]
+            for row in rows:
+                # Animations redraw a line after '\r' - only the last pass is visible
+                self.lines.append(row[row.rfind("\r") + 1:])
+
+    def diff(self):
+        current = tuple(self.lines)
+        shown = self.shown
+        out = []
+        for row, line in enumerate(current):
+            if row >= len(shown) or shown[row] != line:
+                out.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+        if len(current) < len(shown):
+            out.append(f"\x1b[{len(current) + 1};1H\x1b[J")
+        self.shown = current
+        return "".join(out)
+
+    def keyframe(self):
+        """The whole last published screen, for new or recovering spectators"""
+        return CLEAR_SCREEN + "".join(f"\x1b[{row + 1};1H{line}" for row, line in enumerate(self.shown))
+
+
+class Broadcast:
+    """One watched game. The game's thread only feeds its output in; the loop
+    publishes at most every SPECTATOR_FRAME_INTERVAL, diffing and encoding each
+    frame once and writing the same bytes to every spectator. Frames drawn in
+    between are folded into the next diff, so neither the game's cost nor the
+    loop's grows with how fast the game draws."""
+    def __init__(self, loop, title):
+        self.loop = loop
+        self.title = title
+        self.screen = ScreenDiffer()
+        self.lock = threading.Lock()
+        self.scheduled = False
+        self.watchers = set()
+        self.frames = 0
+        self.dropped = 0
+
+    def feed(self, text):
+        with self.lock:
+            self.screen.feed(text)
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.loop.call_soon_threadsafe(self.loop.call_later, SPECTATOR_FRAME_INTERVAL, self.publish)
+
+    def keyframe(self):
+        with self.lock:
+            return self.screen.keyframe().encode("utf-8")
+
+    def end(self):
+        self.loop.call_soon_threadsafe(self.close_all)
+
+    # --- loop side ---
+    def publish(self):
+        with self.lock:
+            self.scheduled = False
+            data = self.screen.diff().encode("utf-8")
+        if data:
+            self.frames += 1
+            self.fan_out(data)
+
+    def fan_out(self, data, watchers=None, start=0):
+        """Write one frame to every spectator, FAN_OUT_BATCH at a time so the
+        players' own input and output get a turn in between"""
+        if watchers is None:
+            watchers = list(self.watchers)
+        for watcher in watchers[start:start + FAN_OUT_BATCH]:
+            if watcher.behind:
+                self.dropped += 1
+            else:
+                watcher.transport.write(data)
+        if start + FAN_OUT_BATCH < len(watchers):
+            self.loop.call_soon(self.fan_out, data, watchers, start + FAN_OUT_BATCH)
+
+    def close_all(self):
+        for watcher in list(self.watchers):
+            watcher.transport.write(b"\r\n\r\n*** The game has ended ***\r\n")
+            watcher.transport.close()
+
+
+class SpectatorProtocol(asyncio.Protocol):
+    """Lists the live games, then shows the chosen one until it ends or [Q]"""
+    def __init__(self, host):
+        self.host = host
+        self.parser = TelnetParser()
+        self.transport = None
+        self.broadcast = None
+        self.behind = False
+        self.typed = ""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=SPECTATOR_HIGH_WATER)
+        transport.write(NEGOTIATION)
+        games = self.host.watchable()
+        if not games:
+            transport.write(b"No games are being played right now.\r\n")
+            transport.close()
+        elif len(games) == 1:
+            self.watch(games[0])
+        else:
+            lines = ["Live games:"] + [f"  {number}. {title}" for number, title in enumerate(self.host.titles(games), 1)]
+            transport.write(("\r\n".join(lines) + "\r\nWatch which game? ").encode("utf-8"))
+
+    def watch(self, game):
+        self.broadcast = self.host.broadcast_for(game)
+        self.broadcast.watchers.add(self)
+        self.transport.write(self.broadcast.keyframe())
+
+    def data_received(self, data):
+        for ch in self.parser.feed(data):
+            if self.broadcast is not None:
+                if ch.lower() == "q":
+                    self.transport.close()
+                continue
+            if ch == "\r":
+                games = self.host.watchable()
+                if self.typed.isdigit() and 1 <= int(self.typed) <= len(games):
+                    self.watch(games[int(self.typed) - 1])
+                else:
+                    self.typed = ""
+                    self.transport.write(b"\r\nWatch which game? ")
+            elif ch.isdigit():
+                self.typed += ch
+                self.transport.write(ch.encode())
+
+    def pause_writing(self):
+        # Too far behind: stop sending diffs rather than queue them up
+        self.behind = True
+
+    def resume_writing(self):
+        # Caught up - the next frames are diffs against a fresh keyframe
+        if self.behind and self.broadcast is not None:
+            self.behind = False
+            self.transport.write(self.broadcast.keyframe())
+
+    def connection_lost(self, exc):
+        if self.broadcast is not None:
+            self.broadcast.watchers.discard(self)
+
+
+class BroadcastStdout:
+    """stdout for a local game with --broadcast: the player's terminal still
+    gets everything, and a copy goes to the broadcast"""
+    def __init__(self, real, broadcast):
+        self.real = real
+        self.broadcast = broadcast
+
+    def write(self, text):
+        self.broadcast.feed(text)
+        return self.real.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+
+class LocalHost:
+    """Spectator side of a single local game"""
+    def __init__(self, broadcast):
+        self.broadcast = broadcast
+
+    def watchable(self):
+        return [self.broadcast]
+
+    def titles(self, games):
+        return [game.title for game in games]
+
+    def broadcast_for(self, game):
+        return game
+
+
+def broadcast_local(port, address="127.0.0.1"):
+    """Let spectators watch this process's own game (fishgame.py --broadcast).
+    The spectator server runs on a background thread; returns the bound port."""
+    loop = asyncio.new_event_loop()
+    broadcast = Broadcast(loop, "Local game")
+    host = LocalHost(broadcast)
+    started = threading.Event()
+    bound = []
+
+    def run():
+        asyncio.set_event_loop(loop)
+        server = loop.run_until_complete(loop.create_server(lambda: SpectatorProtocol(host), address, port))
+        bound.append(server.sockets[0].getsockname()[1])
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="fishgame-broadcast", daemon=True).start()
+    started.wait(5)
+
+    real_system = os.system
+
+    def system(command):
+        if command in ('clear', 'cls'):
+            broadcast.feed(CLEAR_SCREEN)
+        return real_system(command)
+
+    sys.stdout = BroadcastStdout(sys.stdout, broadcast)
+    os.system = system
+    return bound[0] if bound else None
+
+
+# ===== WORLD BOSS RAID =====
+# With --raid, one boss from the roster gets a single HP pool that everybody
+# who joins attacks at the same time. Hits add to one damage counter: game code
+# only runs under the run token, so the loop's tally is the only other party on
+# its lock. RAID_TICK times a second the loop drains the counter, takes the
+# total off the boss with BossState.lose_hp, and writes the raid's status (HP,
+# phase, the boss's current attack, top damage) to the top rows of every
+# raider's screen. The status is encoded once per tick.
+RAID_TICK = 0.1  # seconds between damage tallies and status updates
+RAID_PHASES = 3  # each phase unlocks more of the boss's attacks, the last one all of them
+RAID_ATTACK_INTERVAL = 12.0  # seconds the boss keeps one attack in phase 1, less later on
+RAID_KNOCKOUT = 5.0  # seconds a knocked-out raider waits before getting back up
+RAID_RESPAWN = 30.0  # seconds before a defeated world boss comes back
+RAID_STATUS_ROWS = 4  # rows at the top of a raider's screen kept for the live status
+RAID_LEADERS = 5
+RAID_HP_BAR = 40
+RAID_XP = 300
+RAID_MONEY = 500
+
+
+def minutes(seconds):
+    return f"{int(seconds) // 60}m{int(seconds) % 60:02d}s"
+
+
+class DamageCounter:
+    """The raid's damage since the last tick. Hits add to it; the tick takes
+    everything out at once."""
+    __slots__ = ('lock', 'damage', 'hits', 'by_raider', 'closed')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.damage = 0
+        self.hits = 0
+        self.by_raider = {}
+        self.closed = False
+
+    def add(self, raider, amount):
+        with self.lock:
+            if self.closed:
+                return False
+            self.damage += amount
+            self.hits += 1
+            self.by_raider[raider] = self.by_raider.get(raider, 0) + amount
+            return True
+
+    def drain(self, close=False):
+        """(damage, hits, damage per raider) since the last drain. After
+        close=True the counter turns every later hit away."""
+        with self.lock:
+            taken = (self.damage, self.hits, self.by_raider)
+            self.damage = 0
+            self.hits = 0
+            self.by_raider = {}
+            self.closed = self.closed or close
+        return taken
+
+
+class RaidStatus:
+    """The raid as of one tick. Never changed after it is built, so game
+    threads read whichever one is current without a lock."""
+    __slots__ = ('number', 'name', 'hp', 'max_hp', 'phase', 'attack', 'raiders', 'leaders',
+                 'defeated', 'elapsed', 'standings')
+
+    def __init__(self, number, name, hp, max_hp, phase, attack, raiders, leaders,
+                 defeated=False, elapsed=0.0, standings=()):
+        self.number = number
+        self.name = name
+        self.hp = hp
+        self.max_hp = max_hp
+        self.phase = phase
+        self.attack = attack
+        self.raiders = raiders
+        self.leaders = leaders  # [(raider, damage)], most damage first
+        self.defeated = defeated
+        self.elapsed = elapsed
+        self.standings = standings  # every raider, most damage first - once defeated
+
+    def lines(self):
+        filled = self.hp * RAID_HP_BAR // self.max_hp
+        if self.defeated:
+            now = Fore.GREEN + f"DEFEATED after {minutes(self.elapsed)}! It returns in {RAID_RESPAWN:.0f}s"
+        else:
+            now = Fore.YELLOW + f"Now using: {self.attack.name}" + Fore.LIGHTBLACK_EX + f" - {self.attack.description}"
+        leaders = " | ".join(f"{name} {damage}" for (number, name), damage in self.leaders)
+        return [
+            Fore.RED + f"🌍 WORLD BOSS: {self.name}" + Fore.WHITE + f"   Phase {self.phase}/{RAID_PHASES}   {self.raiders} raiders",
+            Fore.RED + f"HP: {'█' * filled}{'░' * (RAID_HP_BAR - filled)} {self.hp}/{self.max_hp}",
+            now,
+            Fore.CYAN + f"Top damage: {leaders or '-'}",
+        ]
+
+    def render(self):
+        """The status drawn over the top rows, leaving the cursor where it was"""
+        rows = "".join(f"\x1b[{row};1H{line}{Style.RESET_ALL}\x1b[K" for row, line in enumerate(self.lines(), 1))
+        return "\x1b7" + rows + "\x1b8"
+
+
+class WorldBoss:
+    """The raid: one BossState shared by every raider. hit() runs on the
+    raiders' game threads; everything else runs on the loop."""
+    def __init__(self, definition, hp_mult=1.0):
+        self.definition = definition
+        self.hp_mult = hp_mult
+        self.loop = None
+        self.raiders = {}  # session -> player name
+        self.number = 0
+        self.start()
+
+    def start(self):
+        self.counter = DamageCounter()
+        self.state = fishgame.BossState(self.definition, hp_mult=self.hp_mult)
+        self.totals = {}  # (session number, name) -> damage
+        self.damage = 0
+        self.hits = 0
+        self.started = time.monotonic()
+        self.ended = None
+        self.attack = self.definition.attacks[0]
+        self.attack_until = self.started + RAID_ATTACK_INTERVAL
+        self.number += 1
+        self.status = self.build_status()
+
+    def run(self, loop):
+        """Tick every RAID_TICK seconds from now on, on a fixed schedule"""
+        self.loop = loop
+        next_tick = loop.time()
+
+        def step():
+            nonlocal next_tick
+            self.tick()
+            next_tick = max(next_tick + RAID_TICK, loop.time())
+            loop.call_at(next_tick, step)
+        step()
+
+    # --- game thread side ---
+    def join(self, session, name):
+        self.loop.call_soon_threadsafe(self.raiders.__setitem__, session, name)
+
+    def leave(self, session):
+        self.loop.call_soon_threadsafe(self.raiders.pop, session, None)
+
+    def hit(self, session, raider, damage, number):
+        """One attack with BossState.take_damage's defense rule. Returns the
+        damage dealt, or None when the boss this raider fought is already down."""
+        counter = self.counter
+        if number != self.number:
+            return None
+        actual = self.state.damage_after_defense(damage)
+        if not counter.add(raider, actual):
+            return None
+        return actual
+
+    # --- loop side ---
+    def collect(self, close=False):
+        damage, hits, by_raider = self.counter.drain(close)
+        for raider, amount in by_raider.items():
+            self.totals[raider] = self.totals.get(raider, 0) + amount
+        self.damage += damage
+        self.hits += hits
+        return damage
+
+    def tick(self):
+        if self.ended is None:
+            self.state.lose_hp(self.collect())
+            now = time.monotonic()
+            if self.state.hp == 0:
+                # Hits that slipped in since the drain still count; later ones are turned away
+                self.collect(close=True)
+                self.ended = now
+                print(f"World boss {self.state.name} defeated in {now - self.started:.1f}s by "
+                      f"{len(self.totals)} raiders: {self.damage} damage in {self.hits} hits", flush=True)
+                self.loop.call_later(RAID_RESPAWN, self.start)
+            elif now >= self.attack_until:
+                phase = self.phase()
+                unlocked = self.definition.attacks[:max(1, len(self.definition.attacks) * phase // RAID_PHASES)]
+                self.attack = random.choice(unlocked)
+                self.attack_until = now + RAID_ATTACK_INTERVAL / phase
+        self.status = self.build_status()
+        self.send_status()
+
+    def phase(self):
+        lost = 1 - self.state.hp / self.state.max_hp
+        return min(RAID_PHASES, 1 + int(lost * RAID_PHASES))
+
+    def build_status(self):
+        ranked = sorted(self.totals.items(), key=lambda item: -item[1])
+        ended = self.ended is not None
+        return RaidStatus(
+            self.number, self.state.name, self.state.hp, self.state.max_hp, self.phase(), self.attack,
+            len(self.raiders), ranked[:RAID_LEADERS], defeated=ended,
+            elapsed=(self.ended if ended else time.monotonic()) - self.started,
+            standings=tuple(raider for raider, damage in ranked) if ended else (),
+        )
+
+    def send_status(self):
+        if not self.raiders:
+            return
+        text = self.status.render()
+        data = text.encode("utf-8")
+        for session in self.raiders:
+            # A raider who isn't reading just misses this update - the next one replaces it
+            session.push(text, data)
+
+
+def raid_lobby(raid):
+    """Shown before the title screen while a raid is on.
+    Returns the Game joining the raid, or None to play normally."""
+    status = raid.status
+    os.system('clear')
+    print(Fore.RED + "╔═══════════════════════════════════════╗" + Style.RESET_ALL)
+    print(Fore.RED + "║     🌍 A WORLD BOSS HAS RISEN! 🌍     ║" + Style.RESET_ALL)
+    print(Fore.RED + "╚═══════════════════════════════════════╝" + Style.RESET_ALL)
+    print()
+    print(Fore.YELLOW + f"{status.name} - {status.hp}/{status.max_hp} HP, {status.raiders} raiders fighting" + Style.RESET_ALL)
+    print()
+    print(Fore.GREEN + "1. Join the raid with a new character" + Style.RESET_ALL)
+    print(Fore.GREEN + "2. Join the raid with a saved character" + Style.RESET_ALL)
+    print(Fore.GREEN + "3. Play the normal game" + Style.RESET_ALL)
+
+    choice = input(Fore.CYAN + "\nChoose an option: " + Style.RESET_ALL)
+    if choice == '1':
+        name, stats, difficulty_name, difficulty_mult = fishgame.create_character()
+        return fishgame.Game({'name': name, 'stats': stats, 'difficulty_name': difficulty_name,
+                              'difficulty_mult': difficulty_mult})
+    if choice == '2':
+        game = fishgame.Game()
+        if game.load_game():
+            return game
+    return None
+
+
+def raid_key(raid, number):
+    """The raider's next key, or None once the boss they are fighting is down"""
+    while True:
+        key = fishgame.poll_key(RAID_TICK * 5)
+        if key:
+            return key.lower()
+        status = raid.status
+        if status.number != number or status.defeated:
+            return None
+
+
+def raid_fight(game, raid):
+    """One player's side of the raid, on their session's game thread. The top
+    RAID_STATUS_ROWS rows belong to the raid's status; the rest of the screen
+    scrolls below them."""
+    session = SESSIONS.current
+    raider = (session.number, game.name)
+    strength = game.stats['strength']
+    number = raid.status.number
+    game.current_hp = game.max_hp
+    dealt = 0
+    raid.join(session, game.name)
+    try:
+        while True:
+            status = raid.status
+            if status.number != number or status.defeated:
+                break
+            sys.stdout.write(CLEAR_SCREEN + status.render() + f"\x1b[{RAID_STATUS_ROWS + 1};r"
+                             + f"\x1b[{RAID_STATUS_ROWS + 2};1H")
+            print(Fore.GREEN + f"{game.name}  HP: {game.current_hp}/{game.max_hp}  Your damage: {dealt}" + Style.RESET_ALL)
+            print()
+            print(Fore.WHITE + "[F]ight | [L]eave the raid" + Style.RESET_ALL)
+
+            key = raid_key(raid, number)
+            if key is None or key == 'l':
+                break
+            if key != 'f':
+                continue
+
+            # The solo fight's damage path, but the hit goes to the shared pool
+            damage_multiplier = fishgame.undertale_attack_minigame(strength, game.difficulty_name)
+            base_damage = random.randint(15, 25) + (strength * 2) + game.get_attack_bonus()
+            actual_damage = raid.hit(session, raider, int(base_damage * damage_multiplier), number)
+            if actual_damage is None:
+                print(Fore.YELLOW + f"{status.name} is already down!" + Style.RESET_ALL)
+                time.sleep(1)
+                break
+            dealt += actual_damage
+            print(Fore.YELLOW + f"You dealt {actual_damage} damage!" + Style.RESET_ALL)
+            time.sleep(0.5)
+
+            # The boss answers with whatever attack the whole raid is facing
+            attack = raid.status.attack
+            print()
+            print(Fore.RED + f"{status.name} uses {attack.name}!" + Style.RESET_ALL)
+            print(Fore.LIGHTBLACK_EX + attack.description + Style.RESET_ALL)
+            time.sleep(1)
+            try:
+                damage_taken = int(attack.execute() * raid.state.damage_mult)
+            except (ValueError, IndexError):
+                damage_taken = attack.damage_range[1]  # A fumbled answer: the attack lands in full
+            if damage_taken > 0 and not getattr(game, 'god_mode', False):
+                damage_taken = max(1, damage_taken - game.get_defense_bonus())
+                game.current_hp -= damage_taken
+                print(Fore.RED + f"You took {damage_taken} damage!" + Style.RESET_ALL)
+                time.sleep(0.5)
+            if game.current_hp <= 0:
+                print(Fore.RED + f"You were knocked out! Back on your feet in {RAID_KNOCKOUT:.0f}s..." + Style.RESET_ALL)
+                time.sleep(RAID_KNOCKOUT)
+                game.current_hp = game.max_hp
+    finally:
+        raid.leave(session)
+        sys.stdout.write("\x1b[r")
+
+    status = raid.status
+    os.system('clear')
+    if status.number == number and status.defeated and dealt:
+        rank = status.standings.index(raider) + 1 if raider in status.standings else len(status.standings)
+        print(Fore.GREEN + f"🌍 {status.name} has fallen after {minutes(status.elapsed)}!" + Style.RESET_ALL)
+        print(Fore.YELLOW + f"You dealt {dealt} damage - #{rank} of {len(status.standings)} raiders." + Style.RESET_ALL)
+        game.gain_xp(RAID_XP)
+        game.money += RAID_MONEY
+        print(Fore.GREEN + f"You earned ${RAID_MONEY}." + Style.RESET_ALL)
+        game.autosave("world boss")
+    else:
+        print(Fore.YELLOW + f"You leave the raid having dealt {dealt} damage." + Style.RESET_ALL)
+    input(Fore.LIGHTBLACK_EX + "\nPress Enter to continue..." + Style.RESET_ALL)
+
+
+# ===== SERVER =====
+class Host:
+    """Shared server state: the run token, the live sessions and the raid, if any"""
+    def __init__(self, max_sessions=2000, raid=None):
+        self.max_sessions = max_sessions
+        self.token = RunToken()
+        self.sessions = set()
+        self.started = 0
+        self.raid = raid
+
+    def play(self):
+        """What a session runs: the normal title screen and menus, after the
+        raid lobby while a raid is on"""
+        if self.raid is not None:
+            game = raid_lobby(self.raid)
+            if game is not None:
+                raid_fight(game, self.raid)
+                game.start_game()
+                return
+        fishgame.main_menu()
+
+    def watchable(self):
+        return sorted((session for session in self.sessions if not session.closed), key=lambda session: session.number)
+
+    def titles(self, sessions):
+        return [f"Session {session.number}"
+                + (f" ({len(session.broadcast.watchers)} watching)" if session.broadcast else "")
+                for session in sessions]
+
+    def broadcast_for(self, session):
+        """Called on the loop. The session starts feeding a Broadcast from its next write"""
+        if session.broadcast is None:
+            session.broadcast = Broadcast(session.loop, f"Session {session.number}")
+        return session.broadcast
+
+
+class TelnetProtocol(asyncio.Protocol):
+    def __init__(self, host):
+        self.host = host
+        self.parser = TelnetParser()
+        self.session = None
+
+    def connection_made(self, transport):
+        if len(self.host.sessions) >= self.host.max_sessions:
+            transport.write(b"The server is full, try again later.\r\n")
+            transport.close()
+            return
+        transport.set_write_buffer_limits(high=HIGH_WATER)
+        transport.write(NEGOTIATION)
+        self.host.started += 1
+        self.session = Session(self.host.started, asyncio.get_running_loop(), transport,
+                               self.host.token, self.host.play)
+        self.host.sessions.add(self.session)
+        self.session.thread.start()
+
+    def data_received(self, data):
+        if self.session is not None:
+            chars = self.parser.feed(data)
+            if chars:
+                self.session.feed(chars)
+
+    def pause_writing(self):
+        self.session.pause()
+
+    def resume_writing(self):
+        self.session.resume()
+
+    def connection_lost(self, exc):
+        if self.session is not None:
+            self.session.close()
+            self.host.sessions.discard(self.session)
+
+
+async def serve(host, address, port, spectate_port=None):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: TelnetProtocol(host), address, port, backlog=1024)
+    bound_port = server.sockets[0].getsockname()[1]
+    print(f"Fishing Game telnet server on {address}:{bound_port} (max {host.max_sessions} sessions)", flush=True)
+    if spectate_port is not None:
+        spectators = await loop.create_server(lambda: SpectatorProtocol(host), address, spectate_port, backlog=1024)
+        print(f"Spectators: telnet {address} {spectators.sockets[0].getsockname()[1]}", flush=True)
+    if host.raid is not None:
+        host.raid.run(loop)
+        print(f"World boss raid: {host.raid.state.name} ({host.raid.state.max_hp} HP)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host many Fishing Game sessions over telnet")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: local only)")
+    parser.add_argument("--port", type=int, default=2323, help="0 picks a free port")
+    parser.add_argument("--max-sessions", type=int, default=2000)
+    parser.add_argument("--no-intro", action="store_true", help="skip the animated title for every session")
+    parser.add_argument("--spectate-port", type=int, default=None, metavar="PORT",
+                        help="also let people watch live sessions on this port")
+    parser.add_argument("--raid", default=None, metavar="BOSS",
+                        help="run a world-boss raid against this boss (name or slug, e.g. kraken)")
+    parser.add_argument("--raid-hp-mult", type=float, default=50.0,
+                        help="the raid boss's HP as a multiple of its normal HP")
+    parser.add_argument("--saves", choices=("json", "sqlite"), default=None,
+                        help=f"one JSON file per player (default) or every player in {fishgame.SAVE_DATABASE}")
+    args = parser.parse_args()
+
+    threading.stack_size(SESSION_STACK_SIZE)
+    fishgame.AUDIO.use_backend(fishgame.NullAudioBackend())
+    if args.saves:
+        fishgame.SAVES = fishgame.save_store(args.saves)
+    if args.no_intro:
+        fishgame.show_intro = lambda: None
+    install_routing()
+
+    raid = None
+    if args.raid:
+        from fishgame_content import bosses
+        wanted = fishgame.item_slug(args.raid)
+        matches = [boss for boss in bosses.BOSS_ROSTER if wanted in fishgame.item_slug(boss.name)]
+        if not matches:
+            parser.error(f"no boss called {args.raid!r} - pick one of: "
+                         + ", ".join(fishgame.item_slug(boss.name) for boss in bosses.BOSS_ROSTER))
+        raid = WorldBoss(matches[0], hp_mult=args.raid_hp_mult)
+
+    host = Host(args.max_sessions, raid)
+    try:
+        asyncio.run(serve(host, args.host, args.port, args.spectate_port))
+    except KeyboardInterrupt:
+        print(f"\nStopped ({len(host.sessions)} sessions were connected)")
+
+
+if __name__ == "__main__":
+    main()